@@ -1,11 +1,14 @@
 from agno.agent import Agent
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import tempfile
 import numpy as np
 import soundfile as sf
 from typing import Any, Dict, List, Optional, Tuple
 from utils.load_api_keys import load_api_key
+from utils.tts_cache import cached_tts
 from openai import OpenAI
 from scipy import signal
 
@@ -18,6 +21,8 @@ DEFAULT_VOICE_MAP = {1: "alloy", 2: "nova"}
 TTS_MODEL = "gpt-4o-mini-tts"
 INTRO_MUSIC_FILE = os.path.join(PODCAST_MUSIC_FOLDER, "intro_audio.mp3")
 OUTRO_MUSIC_FILE = os.path.join(PODCAST_MUSIC_FOLDER, "intro_audio.mp3")
+TTS_PCM_SAMPLE_RATE = 24000
+DEFAULT_TTS_CONCURRENCY = 4
 
 
 def resample_audio_scipy(audio, original_sr, target_sr):
@@ -102,6 +107,167 @@ def resample_audio(audio, orig_sr, target_sr):
         return audio
 
 
+def resolve_voice(speaker_id: int, voice_map: Dict[int, str] = None) -> str:
+    voice_map = voice_map or DEFAULT_VOICE_MAP
+    voice = voice_map.get(speaker_id)
+    if not voice:
+        if speaker_id in OPENAI_VOICES:
+            voice = OPENAI_VOICES[speaker_id]
+        else:
+            voice = next(iter(voice_map.values()), "alloy")
+        print(f"No voice mapping for speaker {speaker_id}, using {voice}")
+    return voice
+
+
+def decode_tts_audio(audio_data: bytes, response_format: str = "pcm") -> Optional[Tuple[np.ndarray, int]]:
+    """Decode a TTS response body in memory into mono int16 samples and their sample rate."""
+    if response_format == "pcm":
+        usable = len(audio_data) - len(audio_data) % 2
+        return np.frombuffer(audio_data[:usable], dtype="<i2"), TTS_PCM_SAMPLE_RATE
+    with sf.SoundFile(io.BytesIO(audio_data)) as audio_file:
+        samples = audio_file.read(dtype="int16", always_2d=True)
+        samplerate = audio_file.samplerate
+    if samples.shape[1] > 1:
+        return samples.mean(axis=1).astype(np.int16), samplerate
+    return samples[:, 0], samplerate
+
+
+def synthesize_segment(
+    client: OpenAI,
+    text: str,
+    speaker_id: int,
+    voice_map: Dict[int, str] = None,
+    model: str = TTS_MODEL,
+    response_format: str = "pcm",
+    language_code: str = "en",
+) -> Optional[Tuple[np.ndarray, int]]:
+    if not text.strip():
+        print("Empty text provided, skipping TTS generation")
+        return None
+    voice = resolve_voice(speaker_id, voice_map)
+
+    def synthesize():
+        try:
+            response = client.audio.speech.create(model=model, voice=voice, input=text, response_format=response_format)
+            audio_data = response.content
+            if not audio_data:
+                print("OpenAI TTS returned empty response")
+                return None
+            return decode_tts_audio(audio_data, response_format)
+        except Exception as e:
+            print(f"OpenAI TTS API error for speaker {speaker_id}: {e}")
+            return None
+
+    return cached_tts("openai", voice, language_code, text, synthesize, model=model, dtype=np.int16)
+
+
+def synthesize_segments_concurrent(
+    client: OpenAI,
+    entries: List[Tuple[int, str]],
+    voice_map: Dict[int, str] = None,
+    model: str = TTS_MODEL,
+    max_workers: int = DEFAULT_TTS_CONCURRENCY,
+    response_format: str = "pcm",
+    language_code: str = "en",
+) -> List[Optional[Tuple[np.ndarray, int]]]:
+    """Synthesize (speaker_id, text) entries with bounded parallelism, returning results in script order."""
+    if not entries:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(entries)))) as executor:
+        futures = [
+            executor.submit(synthesize_segment, client, text, speaker_id, voice_map, model, response_format, language_code)
+            for speaker_id, text in entries
+        ]
+        return [future.result() for future in futures]
+
+
+def load_music(path: str, sampling_rate: int) -> Optional[np.ndarray]:
+    if not os.path.exists(path):
+        return None
+    music, music_sr = sf.read(path, dtype="float32")
+    print(f"Loaded music {path}: {len(music) / music_sr:.1f} seconds")
+    if music.ndim == 2:
+        music = np.mean(music, axis=1)
+    if music_sr != sampling_rate:
+        music = resample_audio_scipy(music, music_sr, sampling_rate).astype(np.float32)
+    return music
+
+
+def write_podcast_stream(
+    output_path: str,
+    segments: List[np.ndarray],
+    sampling_rate: int,
+    silence_duration: float,
+    intro_music: Optional[np.ndarray] = None,
+    outro_music: Optional[np.ndarray] = None,
+) -> None:
+    """Stream int16 dialog segments to the output file one at a time, peak-normalized like combine_audio_segments."""
+    peak = max((int(np.abs(segment.astype(np.int32)).max()) for segment in segments if segment.size), default=0)
+    scale = 0.95 / peak if peak > 0 else 1.0 / 32768
+    silence = create_silence_audio(silence_duration, sampling_rate)
+    with sf.SoundFile(output_path, "w", samplerate=sampling_rate, channels=1) as output_file:
+        if intro_music is not None:
+            output_file.write(intro_music)
+        for i, segment in enumerate(segments):
+            output_file.write(segment.astype(np.float32) * np.float32(scale))
+            if i < len(segments) - 1:
+                output_file.write(silence)
+        if outro_music is not None:
+            output_file.write(outro_music)
+
+
+def get_entry_fields(entry: Any) -> Tuple[int, str]:
+    if hasattr(entry, "speaker"):
+        return entry.speaker, entry.text
+    return entry["speaker"], entry["text"]
+
+
+def create_podcast_concurrent(
+    client: OpenAI,
+    entries: List[Any],
+    output_path: str,
+    silence_duration: float,
+    voice_map: Dict[int, str],
+    model: str,
+    max_workers: int = DEFAULT_TTS_CONCURRENCY,
+    language_code: str = "en",
+) -> Optional[str]:
+    dialog = [get_entry_fields(entry) for entry in entries]
+    print(f"Synthesizing {len(dialog)} script entries with up to {max_workers} parallel requests")
+    results = synthesize_segments_concurrent(client, dialog, voice_map=voice_map, model=model, max_workers=max_workers, language_code=language_code)
+    sampling_rate = next((result[1] for result in results if result), None)
+    if sampling_rate is None:
+        print("No audio segments were generated")
+        return None
+    segments = []
+    for i, result in enumerate(results):
+        if not result:
+            print(f"Failed to generate audio for entry {i + 1}")
+            continue
+        segment_audio, segment_rate = result
+        if segment_rate != sampling_rate:
+            resampled = resample_audio_scipy(segment_audio.astype(np.float32), segment_rate, sampling_rate)
+            segment_audio = np.clip(resampled, -32768, 32767).astype(np.int16)
+        segments.append(segment_audio)
+    try:
+        intro_music = load_music(INTRO_MUSIC_FILE, sampling_rate)
+        outro_music = load_music(OUTRO_MUSIC_FILE, sampling_rate)
+    except Exception as e:
+        print(f"Could not add intro/outro music: {e}")
+        intro_music = outro_music = None
+    print(f"Writing {len(segments)} audio segments to {output_path}")
+    try:
+        write_podcast_stream(output_path, segments, sampling_rate, silence_duration, intro_music, outro_music)
+    except Exception as e:
+        print(f"Failed to write audio file: {e}")
+        return None
+    if not os.path.exists(output_path):
+        print(f"Failed to create audio file at {output_path}")
+        return None
+    print(f"Audio file created: {output_path} ({os.path.getsize(output_path) / 1024:.1f} KB)")
+    return output_path
+
+
 def text_to_speech_openai(
     client: OpenAI,
     text: str,
@@ -112,14 +278,7 @@ def text_to_speech_openai(
     if not text.strip():
         print("Empty text provided, skipping TTS generation")
         return None
-    voice_map = voice_map or DEFAULT_VOICE_MAP
-    voice = voice_map.get(speaker_id)
-    if not voice:
-        if speaker_id in OPENAI_VOICES:
-            voice = OPENAI_VOICES[speaker_id]
-        else:
-            voice = next(iter(voice_map.values()), "alloy")
-        print(f"No voice mapping for speaker {speaker_id}, using {voice}")
+    voice = resolve_voice(speaker_id, voice_map)
     try:
         print(f"Generating TTS for speaker {speaker_id} using voice '{voice}'")
         response = client.audio.speech.create(
@@ -159,6 +318,8 @@ def create_podcast(
     silence_duration: float = 0.7,
     voice_map: Dict[int, str] = None,
     model: str = TTS_MODEL,
+    concurrent: bool = True,
+    max_workers: int = DEFAULT_TTS_CONCURRENCY,
 ) -> Optional[str]:
     if tts_engine.lower() != "openai":
         print(f"Only OpenAI TTS engine is available in this standalone version. Requested: {tts_engine}")
@@ -189,21 +350,29 @@ def create_podcast(
     else:
         entries = script
 
+    if concurrent:
+        return create_podcast_concurrent(
+            client, entries, output_path, silence_duration, voice_map, model_to_use, max_workers=max_workers, language_code=language_code
+        )
+
     print(f"Processing {len(entries)} script entries")
     for i, entry in enumerate(entries):
-        if hasattr(entry, "speaker"):
-            speaker_id = entry.speaker
-            entry_text = entry.text
-        else:
-            speaker_id = entry["speaker"]
-            entry_text = entry["text"]
+        speaker_id, entry_text = get_entry_fields(entry)
         print(f"Processing entry {i + 1}/{len(entries)}: Speaker {speaker_id}")
-        result = text_to_speech_openai(
-            client=client,
-            text=entry_text,
-            speaker_id=speaker_id,
-            voice_map=voice_map,
+        result = cached_tts(
+            "openai",
+            resolve_voice(speaker_id, voice_map),
+            language_code,
+            entry_text,
+            lambda: text_to_speech_openai(
+                client=client,
+                text=entry_text,
+                speaker_id=speaker_id,
+                voice_map=voice_map,
+                model=model_to_use,
+            ),
             model=model_to_use,
+            dtype=np.float32,
         )
         if result:
             segment_audio, segment_rate = result
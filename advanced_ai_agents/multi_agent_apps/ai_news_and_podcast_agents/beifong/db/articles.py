@@ -177,6 +177,41 @@ def update_article_status(tracking_db_path, article_id, results=None, success=Fa
         return cursor.rowcount
 
 
+def ensure_analysis_cache_table(tracking_db_path):
+    with db_connection(tracking_db_path) as conn:
+        conn.execute("""
+        CREATE TABLE IF NOT EXISTS article_analysis_cache (
+            content_hash TEXT NOT NULL,
+            model TEXT NOT NULL,
+            result TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            PRIMARY KEY (content_hash, model)
+        )
+        """)
+        conn.commit()
+
+
+def get_cached_analyses(tracking_db_path, content_hashes, model):
+    if not content_hashes:
+        return {}
+    hashes = list(content_hashes)
+    placeholders = ",".join(["?"] * len(hashes))
+    query = f"""
+    SELECT content_hash, result FROM article_analysis_cache
+    WHERE model = ? AND content_hash IN ({placeholders})
+    """
+    rows = execute_query(tracking_db_path, query, [model] + hashes, fetch=True)
+    return {row["content_hash"]: json.loads(row["result"]) for row in rows}
+
+
+def store_cached_analysis(tracking_db_path, content_hash, model, results):
+    query = """
+    INSERT OR REPLACE INTO article_analysis_cache (content_hash, model, result, created_at)
+    VALUES (?, ?, ?, ?)
+    """
+    return execute_query(tracking_db_path, query, (content_hash, model, json.dumps(results), datetime.now().isoformat()))
+
+
 def get_articles_by_date_range(tracking_db_path, start_date=None, end_date=None, limit=None, offset=0):
     query_parts = [
         "SELECT ca.id, ca.feed_id, ca.source_id, ca.title, ca.url, ca.published_date,",
@@ -0,0 +1,97 @@
+import asyncio
+import os
+import sqlite3
+from contextlib import asynccontextmanager
+import aiosqlite
+from .connection import BUSY_TIMEOUT_MS, PRAGMAS, STATEMENT_CACHE_SIZE
+
+DEFAULT_POOL_SIZE = 4
+
+
+class AsyncConnectionPool:
+    def __init__(self, db_path, size=DEFAULT_POOL_SIZE):
+        self.db_path = db_path
+        self.size = size
+        self._idle = asyncio.Queue()
+        self._created = 0
+        self._create_lock = asyncio.Lock()
+        self._connections = []
+
+    async def _open(self):
+        conn = await aiosqlite.connect(self.db_path, timeout=BUSY_TIMEOUT_MS / 1000, cached_statements=STATEMENT_CACHE_SIZE)
+        conn.row_factory = sqlite3.Row
+        for pragma in PRAGMAS:
+            await conn.execute(pragma)
+        self._connections.append(conn)
+        return conn
+
+    async def acquire(self):
+        if self._idle.empty() and self._created < self.size:
+            async with self._create_lock:
+                if self._created < self.size:
+                    self._created += 1
+                    try:
+                        return await self._open()
+                    except Exception:
+                        self._created -= 1
+                        raise
+        return await self._idle.get()
+
+    async def release(self, conn):
+        if conn.in_transaction:
+            await conn.rollback()
+        self._idle.put_nowait(conn)
+
+    async def close(self):
+        for conn in self._connections:
+            await conn.close()
+        self._connections = []
+        self._created = 0
+        self._idle = asyncio.Queue()
+
+
+_pools = {}
+
+
+def get_async_pool(db_path, size=DEFAULT_POOL_SIZE):
+    key = (os.path.abspath(db_path), id(asyncio.get_running_loop()))
+    pool = _pools.get(key)
+    if pool is None:
+        pool = _pools[key] = AsyncConnectionPool(db_path, size=size)
+    return pool
+
+
+async def close_async_pools():
+    loop_id = id(asyncio.get_running_loop())
+    for key in [key for key in _pools if key[1] == loop_id]:
+        await _pools.pop(key).close()
+
+
+@asynccontextmanager
+async def async_db_connection(db_path):
+    pool = get_async_pool(db_path)
+    conn = await pool.acquire()
+    try:
+        yield conn
+    finally:
+        await pool.release(conn)
+
+
+async def async_execute_query(db_path, query, params=(), fetch=False, fetch_one=False):
+    async with async_db_connection(db_path) as conn:
+        cursor = await conn.execute(query, params)
+        if fetch_one:
+            result = await cursor.fetchone()
+            return dict(result) if result else None
+        elif fetch:
+            return [dict(row) for row in await cursor.fetchall()]
+        else:
+            await conn.commit()
+            return cursor.lastrowid
+
+
+async def async_execute_many(db_path, query, params_list):
+    async with async_db_connection(db_path) as conn:
+        cursor = await conn.executemany(query, params_list)
+        await conn.commit()
+        return cursor.rowcount
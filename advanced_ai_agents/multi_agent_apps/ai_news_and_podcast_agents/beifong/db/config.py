@@ -15,6 +15,7 @@ DEFAULT_DB_PATHS = {
     "internal_sessions_db": "databases/internal_sessions.db",
     "social_media_db": "databases/social_media.db",
     "slack_sessions_db": "databases/slack_sessions.db",
+    "tts_cache_db": "databases/tts_cache/index.db",
 }
 
 
@@ -64,6 +65,10 @@ def get_browser_session_path():
 def get_slack_sessions_db_path():
     return get_db_path("slack_sessions_db")
 
+
+def get_tts_cache_db_path():
+    return get_db_path("tts_cache_db")
+
 DB_PATH = "databases"
 PODCAST_DIR = "podcasts"
 PODCAST_IMG_DIR = PODCAST_DIR + "/images"
@@ -1,15 +1,64 @@
+import os
 import sqlite3
+import threading
 from contextlib import contextmanager
 
+BUSY_TIMEOUT_MS = 30000
+STATEMENT_CACHE_SIZE = 256
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16000",
+)
+
+_local = threading.local()
+
+
+def _connection_key(db_path):
+    return os.path.abspath(db_path)
+
+
+def _open_connection(db_path):
+    conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT_MS / 1000, cached_statements=STATEMENT_CACHE_SIZE)
+    conn.row_factory = sqlite3.Row
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def get_connection(db_path):
+    pool = getattr(_local, "connections", None)
+    if pool is None:
+        pool = _local.connections = {}
+        _local.depth = {}
+    key = _connection_key(db_path)
+    conn = pool.get(key)
+    if conn is None:
+        conn = _open_connection(db_path)
+        pool[key] = conn
+    return conn
+
+
+def close_connections():
+    for conn in getattr(_local, "connections", {}).values():
+        conn.close()
+    _local.connections = {}
+    _local.depth = {}
+
 
 @contextmanager
 def db_connection(db_path):
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
+    conn = get_connection(db_path)
+    key = _connection_key(db_path)
+    _local.depth[key] = _local.depth.get(key, 0) + 1
     try:
         yield conn
     finally:
-        conn.close()
+        _local.depth[key] -= 1
+        if _local.depth[key] == 0 and conn.in_transaction:
+            conn.rollback()
 
 
 def execute_query(db_path, query, params=(), fetch=False, fetch_one=False):
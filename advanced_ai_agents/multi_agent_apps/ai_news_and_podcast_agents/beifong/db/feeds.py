@@ -51,6 +51,64 @@ def update_feed_tracking(tracking_db_path, feed_id, etag, modified, entry_hash):
     return execute_query(tracking_db_path, query, params)
 
 
+def get_feed_tracking_infos(tracking_db_path, feed_ids):
+    if not feed_ids:
+        return {}
+    placeholders = ",".join(["?"] * len(feed_ids))
+    query = f"SELECT * FROM feed_tracking WHERE feed_id IN ({placeholders})"
+    rows = execute_query(tracking_db_path, query, list(feed_ids), fetch=True)
+    return {row["feed_id"]: row for row in rows}
+
+
+def update_feed_tracking_bulk(tracking_db_path, updates):
+    if not updates:
+        return 0
+    now = datetime.now().isoformat()
+    with db_connection(tracking_db_path) as conn:
+        conn.executemany(
+            """
+        UPDATE feed_tracking 
+        SET last_processed = ?, last_etag = ?, last_modified = ?, entry_hash = ?
+        WHERE feed_id = ?
+        """,
+            [(now, etag, modified, entry_hash, feed_id) for feed_id, etag, modified, entry_hash in updates],
+        )
+        conn.commit()
+    return len(updates)
+
+
+def store_feed_entries_bulk(tracking_db_path, feed_entries):
+    rows = []
+    for feed_id, source_id, entries in feed_entries:
+        for entry in entries:
+            rows.append(
+                (
+                    feed_id,
+                    source_id,
+                    entry.get("entry_id", ""),
+                    entry.get("title", ""),
+                    entry.get("link", ""),
+                    entry.get("published_date", datetime.now().isoformat()),
+                    entry.get("content", ""),
+                    entry.get("summary", ""),
+                )
+            )
+    if not rows:
+        return 0
+    with db_connection(tracking_db_path) as conn:
+        before = conn.total_changes
+        conn.executemany(
+            """
+        INSERT OR IGNORE INTO feed_entries 
+        (feed_id, source_id, entry_id, title, link, published_date, content, summary)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            rows,
+        )
+        conn.commit()
+        return conn.total_changes - before
+
+
 def store_feed_entries(tracking_db_path, feed_id, source_id, entries):
     count = 0
     with db_connection(tracking_db_path) as conn:
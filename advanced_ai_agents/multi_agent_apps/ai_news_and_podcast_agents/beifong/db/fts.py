@@ -0,0 +1,104 @@
+import re
+
+ARTICLES_FTS_TABLE = "crawled_articles_fts"
+POSTS_FTS_TABLE = "posts_fts"
+
+ARTICLES_FTS_SCHEMA = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {ARTICLES_FTS_TABLE} USING fts5(
+        title, summary, content,
+        content='crawled_articles', content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS crawled_articles_fts_insert AFTER INSERT ON crawled_articles BEGIN
+        INSERT INTO {ARTICLES_FTS_TABLE}(rowid, title, summary, content)
+        VALUES (new.id, new.title, new.summary, new.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS crawled_articles_fts_delete AFTER DELETE ON crawled_articles BEGIN
+        INSERT INTO {ARTICLES_FTS_TABLE}({ARTICLES_FTS_TABLE}, rowid, title, summary, content)
+        VALUES ('delete', old.id, old.title, old.summary, old.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS crawled_articles_fts_update AFTER UPDATE OF title, summary, content ON crawled_articles BEGIN
+        INSERT INTO {ARTICLES_FTS_TABLE}({ARTICLES_FTS_TABLE}, rowid, title, summary, content)
+        VALUES ('delete', old.id, old.title, old.summary, old.content);
+        INSERT INTO {ARTICLES_FTS_TABLE}(rowid, title, summary, content)
+        VALUES (new.id, new.title, new.summary, new.content);
+    END
+    """,
+]
+
+POSTS_FTS_SCHEMA = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {POSTS_FTS_TABLE} USING fts5(
+        post_text, user_display_name, user_handle,
+        content='posts', content_rowid='rowid',
+        tokenize='porter unicode61'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS posts_fts_insert AFTER INSERT ON posts BEGIN
+        INSERT INTO {POSTS_FTS_TABLE}(rowid, post_text, user_display_name, user_handle)
+        VALUES (new.rowid, new.post_text, new.user_display_name, new.user_handle);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS posts_fts_delete AFTER DELETE ON posts BEGIN
+        INSERT INTO {POSTS_FTS_TABLE}({POSTS_FTS_TABLE}, rowid, post_text, user_display_name, user_handle)
+        VALUES ('delete', old.rowid, old.post_text, old.user_display_name, old.user_handle);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS posts_fts_update AFTER UPDATE OF post_text, user_display_name, user_handle ON posts BEGIN
+        INSERT INTO {POSTS_FTS_TABLE}({POSTS_FTS_TABLE}, rowid, post_text, user_display_name, user_handle)
+        VALUES ('delete', old.rowid, old.post_text, old.user_display_name, old.user_handle);
+        INSERT INTO {POSTS_FTS_TABLE}(rowid, post_text, user_display_name, user_handle)
+        VALUES (new.rowid, new.post_text, new.user_display_name, new.user_handle);
+    END
+    """,
+]
+
+
+def fts_table_exists(cursor, table_name):
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table_name,))
+    return cursor.fetchone() is not None
+
+
+def ensure_fts(cursor, table_name, schema):
+    """Create an FTS5 index with its sync triggers, backfilling it the first time it is created."""
+    existed = fts_table_exists(cursor, table_name)
+    for statement in schema:
+        cursor.execute(statement)
+    if not existed:
+        cursor.execute(f"INSERT INTO {table_name}({table_name}) VALUES ('rebuild')")
+    return not existed
+
+
+def ensure_articles_fts(cursor):
+    return ensure_fts(cursor, ARTICLES_FTS_TABLE, ARTICLES_FTS_SCHEMA)
+
+
+def ensure_posts_fts(cursor):
+    return ensure_fts(cursor, POSTS_FTS_TABLE, POSTS_FTS_SCHEMA)
+
+
+def to_fts_query(terms, columns=None):
+    """Turn free-text search terms into a safe FTS5 MATCH expression, OR-ing one phrase per term."""
+    if isinstance(terms, str):
+        terms = [terms]
+    phrases = []
+    for term in terms:
+        words = re.findall(r"\w+", term or "")
+        if words:
+            phrases.append('"' + " ".join(words) + '"')
+    if not phrases:
+        return None
+    query = " OR ".join(phrases)
+    if columns:
+        return "{" + " ".join(columns) + "} : (" + query + ")"
+    return query
@@ -0,0 +1,212 @@
+POST_DAILY_STATS_TABLE = "post_daily_stats"
+POST_USER_DAILY_TABLE = "post_user_daily"
+POST_CATEGORY_DAILY_TABLE = "post_category_daily"
+POST_TAG_DAILY_TABLE = "post_tag_daily"
+
+# every post is counted twice: under its day and under this all-time bucket, so unfiltered dashboards read one row per key
+ALL_TIME = "all"
+SENTIMENTS = ["positive", "negative", "neutral", "critical"]
+ENGAGEMENT_COLUMNS = [
+    ("engagement_reply_count", "replies"),
+    ("engagement_retweet_count", "retweets"),
+    ("engagement_like_count", "likes"),
+    ("engagement_bookmark_count", "bookmarks"),
+    ("engagement_view_count", "views"),
+]
+DIMENSION_COLUMNS = ["post_timestamp", "platform", "user_handle", "sentiment", "categories", "tags"]
+
+_SENTIMENT_COLUMNS = ", ".join(f"{sentiment}_count INTEGER NOT NULL DEFAULT 0" for sentiment in SENTIMENTS)
+
+POST_ROLLUP_TABLES = [
+    f"""
+    CREATE TABLE IF NOT EXISTS {POST_DAILY_STATS_TABLE} (
+        day TEXT NOT NULL,
+        platform TEXT NOT NULL,
+        sentiment TEXT NOT NULL,
+        post_count INTEGER NOT NULL DEFAULT 0,
+        {", ".join(f"{name}_sum INTEGER NOT NULL DEFAULT 0" for _, name in ENGAGEMENT_COLUMNS)},
+        {", ".join(f"max_{name} INTEGER NOT NULL DEFAULT 0" for _, name in ENGAGEMENT_COLUMNS)},
+        PRIMARY KEY (day, platform, sentiment)
+    ) WITHOUT ROWID
+    """,
+    f"""
+    CREATE TABLE IF NOT EXISTS {POST_USER_DAILY_TABLE} (
+        day TEXT NOT NULL,
+        platform TEXT NOT NULL,
+        user_handle TEXT NOT NULL,
+        user_display_name TEXT,
+        post_count INTEGER NOT NULL DEFAULT 0,
+        {_SENTIMENT_COLUMNS},
+        PRIMARY KEY (day, platform, user_handle)
+    ) WITHOUT ROWID
+    """,
+    f"""
+    CREATE TABLE IF NOT EXISTS {POST_CATEGORY_DAILY_TABLE} (
+        day TEXT NOT NULL,
+        category TEXT NOT NULL,
+        post_count INTEGER NOT NULL DEFAULT 0,
+        {_SENTIMENT_COLUMNS},
+        PRIMARY KEY (day, category)
+    ) WITHOUT ROWID
+    """,
+    f"""
+    CREATE TABLE IF NOT EXISTS {POST_TAG_DAILY_TABLE} (
+        day TEXT NOT NULL,
+        tag TEXT NOT NULL,
+        post_count INTEGER NOT NULL DEFAULT 0,
+        {_SENTIMENT_COLUMNS},
+        PRIMARY KEY (day, tag)
+    ) WITHOUT ROWID
+    """,
+]
+
+
+def _days(row):
+    return [f"COALESCE(date({row}.post_timestamp), '')", f"'{ALL_TIME}'"]
+
+
+def _json_list(expression):
+    return f"json_each(CASE WHEN json_valid({expression}) THEN {expression} ELSE '[]' END)"
+
+
+def _sentiment_values(row, sign):
+    return ", ".join(f"{sign} * ({row}.sentiment IS '{sentiment}')" for sentiment in SENTIMENTS)
+
+
+def _sentiment_updates():
+    return ", ".join(f"{sentiment}_count = {sentiment}_count + excluded.{sentiment}_count" for sentiment in SENTIMENTS)
+
+
+def _rollup_statements(row, sign):
+    """Upserts that add (sign 1) or remove (sign -1) one post row's contribution to every rollup."""
+    sentiment = f"COALESCE({row}.sentiment, '')"
+    sentiment_columns = ", ".join(f"{sentiment}_count" for sentiment in SENTIMENTS)
+    values = ", ".join(f"{sign} * COALESCE({row}.{column}, 0)" for column, _ in ENGAGEMENT_COLUMNS)
+    maxima = ", ".join(f"COALESCE({row}.{column}, 0)" for column, _ in ENGAGEMENT_COLUMNS)
+    sums = ", ".join(f"{name}_sum = {name}_sum + excluded.{name}_sum" for _, name in ENGAGEMENT_COLUMNS)
+    maxes = ", ".join(f"max_{name} = MAX(max_{name}, excluded.max_{name})" for _, name in ENGAGEMENT_COLUMNS)
+    statements = []
+    for day in _days(row):
+        statements.append(f"""
+        INSERT INTO {POST_DAILY_STATS_TABLE} (day, platform, sentiment, post_count,
+            {", ".join(f"{name}_sum" for _, name in ENGAGEMENT_COLUMNS)}, {", ".join(f"max_{name}" for _, name in ENGAGEMENT_COLUMNS)})
+        VALUES ({day}, COALESCE({row}.platform, ''), {sentiment}, {sign}, {values}, {maxima})
+        ON CONFLICT (day, platform, sentiment) DO UPDATE SET post_count = post_count + excluded.post_count, {sums}, {maxes};
+        """)
+        statements.append(f"""
+        INSERT INTO {POST_USER_DAILY_TABLE} (day, platform, user_handle, user_display_name, post_count, {sentiment_columns})
+        SELECT {day}, COALESCE({row}.platform, ''), {row}.user_handle, {row}.user_display_name, {sign}, {_sentiment_values(row, sign)}
+        WHERE {row}.user_handle IS NOT NULL
+        ON CONFLICT (day, platform, user_handle) DO UPDATE SET
+            post_count = post_count + excluded.post_count, {_sentiment_updates()},
+            user_display_name = CASE WHEN excluded.post_count > 0 THEN COALESCE(excluded.user_display_name, user_display_name)
+                                     ELSE user_display_name END;
+        """)
+        for table, key, column in ((POST_CATEGORY_DAILY_TABLE, "category", "categories"), (POST_TAG_DAILY_TABLE, "tag", "tags")):
+            statements.append(f"""
+            INSERT INTO {table} (day, {key}, post_count, {sentiment_columns})
+            SELECT {day}, value, {sign}, {_sentiment_values(row, sign)} FROM {_json_list(f"{row}.{column}")}
+            WHERE value IS NOT NULL
+            ON CONFLICT (day, {key}) DO UPDATE SET post_count = post_count + excluded.post_count, {_sentiment_updates()};
+            """)
+    return "".join(statements)
+
+
+def _engagement_statements():
+    statements = []
+    for day in _days("new"):
+        statements.append(f"""
+        UPDATE {POST_DAILY_STATS_TABLE} SET
+            {", ".join(f"{name}_sum = {name}_sum + COALESCE(new.{column}, 0) - COALESCE(old.{column}, 0)" for column, name in ENGAGEMENT_COLUMNS)},
+            {", ".join(f"max_{name} = MAX(max_{name}, COALESCE(new.{column}, 0))" for column, name in ENGAGEMENT_COLUMNS)}
+        WHERE day = {day} AND platform = COALESCE(new.platform, '') AND sentiment = COALESCE(new.sentiment, '');
+        """)
+    return "".join(statements)
+
+
+_DIMENSIONS_CHANGED = " OR ".join(f"old.{column} IS NOT new.{column}" for column in DIMENSION_COLUMNS)
+
+POST_ROLLUP_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS posts_rollup_insert AFTER INSERT ON posts BEGIN
+        {_rollup_statements("new", 1)}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS posts_rollup_delete AFTER DELETE ON posts BEGIN
+        {_rollup_statements("old", -1)}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS posts_rollup_update AFTER UPDATE ON posts WHEN {_DIMENSIONS_CHANGED} BEGIN
+        {_rollup_statements("old", -1)}
+        {_rollup_statements("new", 1)}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS posts_rollup_engagement
+    AFTER UPDATE OF {", ".join(column for column, _ in ENGAGEMENT_COLUMNS)} ON posts WHEN NOT ({_DIMENSIONS_CHANGED}) BEGIN
+        {_engagement_statements()}
+    END
+    """,
+]
+
+
+def _backfill_statements():
+    sentiment_sums = ", ".join(f"SUM(p.sentiment IS '{sentiment}')" for sentiment in SENTIMENTS)
+    statements = []
+    for day in _days("p"):
+        statements.append(f"""
+        INSERT INTO {POST_DAILY_STATS_TABLE}
+        SELECT {day}, COALESCE(p.platform, ''), COALESCE(p.sentiment, ''), COUNT(*),
+            {", ".join(f"SUM(COALESCE(p.{column}, 0))" for column, _ in ENGAGEMENT_COLUMNS)},
+            {", ".join(f"MAX(COALESCE(p.{column}, 0))" for column, _ in ENGAGEMENT_COLUMNS)}
+        FROM posts p GROUP BY 1, 2, 3
+        """)
+        statements.append(f"""
+        INSERT INTO {POST_USER_DAILY_TABLE}
+        SELECT {day}, COALESCE(p.platform, ''), p.user_handle, MAX(p.user_display_name), COUNT(*), {sentiment_sums}
+        FROM posts p WHERE p.user_handle IS NOT NULL GROUP BY 1, 2, 3
+        """)
+        for table, column in ((POST_CATEGORY_DAILY_TABLE, "categories"), (POST_TAG_DAILY_TABLE, "tags")):
+            statements.append(f"""
+            INSERT INTO {table}
+            SELECT {day}, j.value, COUNT(*), {sentiment_sums}
+            FROM posts p, {_json_list(f"p.{column}")} j WHERE j.value IS NOT NULL GROUP BY 1, 2
+            """)
+    return statements
+
+
+def ensure_post_rollups(cursor):
+    """Create the daily post rollups and the triggers that keep them in step with posts, backfilling them the first time."""
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (POST_DAILY_STATS_TABLE,))
+    existed = cursor.fetchone() is not None
+    for statement in POST_ROLLUP_TABLES + POST_ROLLUP_TRIGGERS:
+        cursor.execute(statement)
+    if not existed:
+        for statement in _backfill_statements():
+            cursor.execute(statement)
+    return not existed
+
+
+def rollup_date_filter(date_from, date_to, params, column="day"):
+    """Day-granularity range filter over a rollup table, reading the all-time bucket when no range is given."""
+    if not date_from and not date_to:
+        return f"AND {column} = '{ALL_TIME}'"
+    clauses = [f"AND {column} NOT IN ('', '{ALL_TIME}')"]
+    if date_from:
+        clauses.append(f"AND {column} >= date(?)")
+        params.append(date_from)
+    if date_to:
+        clauses.append(f"AND {column} <= date(?)")
+        params.append(date_to)
+    return " ".join(clauses)
+
+
+def sentiment_sums():
+    return ",\n".join(f"SUM({sentiment}_count) AS {sentiment}_count" for sentiment in SENTIMENTS)
+
+
+def sentiment_breakdown():
+    """Pivot of the sentiment-keyed post_daily_stats rows into per-sentiment counts."""
+    return ",\n".join(f"SUM(CASE WHEN sentiment = '{sentiment}' THEN post_count ELSE 0 END) AS {sentiment}_count" for sentiment in SENTIMENTS)
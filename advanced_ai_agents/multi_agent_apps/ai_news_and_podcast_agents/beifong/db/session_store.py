@@ -0,0 +1,217 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import orjson
+from db.connection import db_connection
+
+DEFAULT_COMPACT_EVERY = 20
+DEFAULT_CACHE_SIZE = 64
+
+
+def encode(value: Any) -> bytes:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+
+def dumps(value: Any) -> str:
+    return encode(value).decode("utf-8")
+
+
+def loads(text) -> Any:
+    return orjson.loads(text)
+
+
+def _escape(key) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _changed(old, new) -> bool:
+    return type(old) is not type(new) or old != new
+
+
+def make_patch(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """RFC 6902 operations turning old into new. Objects are diffed key by key, lists that only grew become appends."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            elif _changed(old[key], value):
+                ops.extend(make_patch(old[key], value, child))
+        return ops
+    if isinstance(old, list) and isinstance(new, list) and len(old) < len(new) and not _changed(old, new[: len(old)]):
+        return [{"op": "add", "path": f"{path}/-", "value": value} for value in new[len(old) :]]
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(doc: Any, ops: List[Dict[str, Any]]) -> Any:
+    for op in ops:
+        if op["path"] == "":
+            doc = op.get("value")
+            continue
+        tokens = [_unescape(token) for token in op["path"].split("/")[1:]]
+        parent = doc
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+        if isinstance(parent, list):
+            if op["op"] == "remove":
+                del parent[int(last)]
+            elif last == "-":
+                parent.append(op["value"])
+            elif op["op"] == "add":
+                parent.insert(int(last), op["value"])
+            else:
+                parent[int(last)] = op["value"]
+        elif op["op"] == "remove":
+            del parent[last]
+        else:
+            parent[last] = op["value"]
+    return doc
+
+
+def ensure_delta_schema(conn, table: str) -> None:
+    columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})").fetchall()]
+    if "version" not in columns:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+    if "base_version" not in columns:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN base_version INTEGER NOT NULL DEFAULT 0")
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {table}_deltas (
+            session_id TEXT NOT NULL,
+            version INTEGER NOT NULL,
+            patch TEXT NOT NULL,
+            PRIMARY KEY (session_id, version)
+        )
+    """)
+
+
+class SessionStateStore:
+    """Session state kept as a snapshot plus JSON-patch deltas, compacted every few turns, with hot sessions cached in memory.
+
+    Each save appends only the changed paths. The version column lets other processes sharing the database detect a stale cache.
+    With refresh_timestamp, the timestamp column is an updated-at column and is rewritten on every save, not only the first.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        table: str = "session_state",
+        state_column: str = "state",
+        timestamp_column: str = "created_at",
+        refresh_timestamp: bool = False,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        self.db_path = db_path
+        self.table = table
+        self.state_column = state_column
+        self.timestamp_column = timestamp_column
+        self.refresh_timestamp = refresh_timestamp
+        self.compact_every = compact_every
+        self.cache_size = cache_size
+        self.cache: "OrderedDict[str, dict]" = OrderedDict()
+        self.lock = threading.Lock()
+        with db_connection(db_path) as conn:
+            ensure_delta_schema(conn, table)
+            conn.commit()
+
+    def _remember(self, session_id: str, entry: dict) -> None:
+        with self.lock:
+            self.cache[session_id] = entry
+            self.cache.move_to_end(session_id)
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+    def _load(self, conn, session_id: str) -> Optional[dict]:
+        row = conn.execute(
+            f"SELECT version, base_version, {self.timestamp_column} AS timestamp FROM {self.table} WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        if not row:
+            return None
+        with self.lock:
+            entry = self.cache.get(session_id)
+            if entry and entry["version"] == row["version"]:
+                self.cache.move_to_end(session_id)
+                return entry
+        base = conn.execute(f"SELECT {self.state_column} FROM {self.table} WHERE session_id = ?", (session_id,)).fetchone()[0]
+        try:
+            state = loads(base) if base else {}
+        except ValueError:
+            state = {}
+        deltas = conn.execute(
+            f"SELECT patch FROM {self.table}_deltas WHERE session_id = ? AND version > ? ORDER BY version", (session_id, row["base_version"])
+        )
+        for (patch,) in deltas:
+            state = apply_patch(state, loads(patch))
+        entry = {"version": row["version"], "base_version": row["base_version"], "timestamp": row["timestamp"], "state": state, "data": encode(state)}
+        self._remember(session_id, entry)
+        return entry
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with db_connection(self.db_path) as conn:
+            entry = self._load(conn, session_id)
+        if entry is None:
+            return None
+        return {"session_id": session_id, "state": loads(entry["data"]), self.timestamp_column: entry["timestamp"]}
+
+    def save(self, session_id: str, state: Any) -> None:
+        """Persist state, writing only its difference from the stored version."""
+        data = encode(state)
+        with db_connection(self.db_path) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                entry = self._load(conn, session_id)
+                if entry is None:
+                    timestamp = datetime.now().isoformat()
+                    version, base_version = 0, 0
+                    conn.execute(
+                        f"INSERT INTO {self.table} (session_id, {self.state_column}, {self.timestamp_column}, version, base_version) "
+                        "VALUES (?, ?, ?, 0, 0)",
+                        (session_id, data.decode("utf-8"), timestamp),
+                    )
+                else:
+                    timestamp, version, base_version = entry["timestamp"], entry["version"], entry["base_version"]
+                    touch, touch_params = "", ()
+                    if self.refresh_timestamp:
+                        timestamp = datetime.now().isoformat()
+                        touch, touch_params = f", {self.timestamp_column} = ?", (timestamp,)
+                    patch = make_patch(entry["state"], state)
+                    if patch:
+                        version += 1
+                        if version - base_version >= self.compact_every:
+                            base_version = version
+                            conn.execute(
+                                f"UPDATE {self.table} SET {self.state_column} = ?, version = ?, base_version = ?{touch} WHERE session_id = ?",
+                                (data.decode("utf-8"), version, base_version, *touch_params, session_id),
+                            )
+                            conn.execute(f"DELETE FROM {self.table}_deltas WHERE session_id = ?", (session_id,))
+                        else:
+                            conn.execute(
+                                f"INSERT INTO {self.table}_deltas (session_id, version, patch) VALUES (?, ?, ?)", (session_id, version, dumps(patch))
+                            )
+                            conn.execute(f"UPDATE {self.table} SET version = ?{touch} WHERE session_id = ?", (version, *touch_params, session_id))
+                    elif touch:
+                        conn.execute(f"UPDATE {self.table} SET {self.timestamp_column} = ? WHERE session_id = ?", (timestamp, session_id))
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        self._remember(session_id, {"version": version, "base_version": base_version, "timestamp": timestamp, "state": loads(data), "data": data})
+
+    def delete(self, session_id: str) -> bool:
+        with db_connection(self.db_path) as conn:
+            deleted = conn.execute(f"DELETE FROM {self.table} WHERE session_id = ?", (session_id,)).rowcount
+            conn.execute(f"DELETE FROM {self.table}_deltas WHERE session_id = ?", (session_id,))
+            conn.commit()
+        with self.lock:
+            self.cache.pop(session_id, None)
+        return deleted > 0
@@ -2,6 +2,8 @@ import os
 import re
 import sqlite3
 import asyncio
+import threading
+import time
 import aiohttp
 import json
 from concurrent.futures import ThreadPoolExecutor
@@ -11,6 +13,8 @@ from dotenv import load_dotenv
 from typing import Dict, List
 from datetime import datetime
 from db.config import get_slack_sessions_db_path
+from db.session_store import SessionStateStore, loads
+from services.task_events import TaskCompletionListener
 
 load_dotenv()
 
@@ -20,7 +24,16 @@ app = App(token=os.environ["SLACK_BOT_TOKEN"])
 API_BASE_URL = os.environ.get("API_BASE_URL", "http://localhost:7000")
 executor = ThreadPoolExecutor(max_workers=10)
 active_sessions: Dict[str, Dict] = {}
+# every in-flight task is awaited on this one loop, woken by the workers' completion events
+event_loop = asyncio.new_event_loop()
+threading.Thread(target=event_loop.run_forever, name="slack-completion-loop", daemon=True).start()
+completion_listener = TaskCompletionListener()
+COMPLETION_WAIT_SEC = 30
+STATUS_LONG_POLL_SEC = 25
+FALLBACK_POLL_SEC = 3
+MAX_WAIT_SEC = 180
 DB_PATH = get_slack_sessions_db_path()
+state_store = None
 
 
 def send_error_message(thread_key: str, error_message: str):
@@ -50,6 +63,8 @@ def init_db():
     """)
     conn.commit()
     conn.close()
+    global state_store
+    state_store = SessionStateStore(DB_PATH, table="session_state", state_column="state_data", timestamp_column="updated_at", refresh_timestamp=True)
 
 
 def save_session_mapping(thread_key: str, session_id: str, channel_id: str, user_id: str = None):
@@ -76,32 +91,21 @@ def get_session_info(thread_key: str):
 
 
 def save_session_state(session_id: str, state_data):
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
     if isinstance(state_data, str):
-        json_data = state_data
-    else:
-        json_data = json.dumps(state_data)
-    cursor.execute(
-        "INSERT OR REPLACE INTO session_state (session_id, state_data, updated_at) VALUES (?, ?, ?)",
-        (session_id, json_data, datetime.now().isoformat()),
-    )
-    conn.commit()
-    conn.close()
+        try:
+            state_data = loads(state_data)
+        except ValueError:
+            return
+    state_store.save(session_id, state_data)
 
 
 def get_session_state(session_id: str):
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    cursor.execute("SELECT state_data FROM session_state WHERE session_id = ?", (session_id,))
-    result = cursor.fetchone()
-    conn.close()
-    if result:
-        try:
-            return json.loads(result[0])
-        except:
-            return {}
-    return {}
+    try:
+        session = state_store.get(session_id)
+    except Exception as e:
+        print(f"Error loading session state: {e}")
+        return {}
+    return session["state"] if session and isinstance(session["state"], dict) else {}
 
 
 class PodcastAgentClient:
@@ -131,12 +135,14 @@ class PodcastAgentClient:
             print(f"API chat error: {e}")
             raise
 
-    async def check_status(self, session_id: str, task_id=None):
+    async def check_status(self, session_id: str, task_id=None, wait=None):
         try:
             async with aiohttp.ClientSession(timeout=self.timeout) as session:
                 payload = {"session_id": session_id}
                 if task_id:
                     payload["task_id"] = task_id
+                if wait:
+                    payload["wait"] = wait
                 async with session.post(f"{self.base_url}/api/podcast-agent/status", json=payload) as resp:
                     resp.raise_for_status()
                     return await resp.json()
@@ -167,50 +173,61 @@ async def get_or_create_session(thread_key: str, channel_id: str, user_id: str =
         return session_info[0]
 
 
-def run_async_in_thread(coro):
-    def run():
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(coro)
-        finally:
-            loop.close()
+def run_on_event_loop(coro):
+    return asyncio.run_coroutine_threadsafe(coro, event_loop)
 
-    future = executor.submit(run)
-    return future
 
+async def run_in_worker(coro):
+    """Slack's client is blocking, so message sends run on the executor instead of stalling the shared loop."""
+    return await asyncio.get_running_loop().run_in_executor(executor, asyncio.run, coro)
 
-async def poll_for_completion(session_id: str, thread_key: str, task_id=None):
-    print(f"Starting polling for session: {session_id}, task: {task_id}")
-    max_polls = 60
-    poll_count = 0
-    active_sessions[session_id] = {
-        "thread_key": thread_key,
-        "task_id": task_id,
-        "start_time": datetime.now(),
-    }
+
+async def next_status(session_id: str, task_id=None):
+    try:
+        event = await completion_listener.wait_for(session_id, task_id, timeout=COMPLETION_WAIT_SEC)
+    except Exception as e:
+        print(f"Completion events unavailable, long-polling status instead: {e}")
+        started = time.monotonic()
+        status_response = await api_client.check_status(session_id, task_id, wait=STATUS_LONG_POLL_SEC)
+        if status_response.get("is_processing", True):
+            await asyncio.sleep(max(0, FALLBACK_POLL_SEC - (time.monotonic() - started)))
+        return status_response
+    if event and event.get("state") == "SUCCESS":
+        result = event.get("result")
+        if isinstance(result, dict) and result.get("session_id") == session_id and not result.get("is_processing"):
+            return result
+    return await api_client.check_status(session_id, task_id)
+
+
+async def wait_for_completion(session_id: str, thread_key: str, task_id=None):
+    print(f"Waiting for completion of session: {session_id}, task: {task_id}")
+    started = time.monotonic()
+    next_progress = started + COMPLETION_WAIT_SEC
     try:
-        while poll_count < max_polls:
+        while time.monotonic() - started < MAX_WAIT_SEC:
             try:
-                status_response = await api_client.check_status(session_id, task_id)
+                status_response = await next_status(session_id, task_id)
                 if status_response.get("session_state"):
                     save_session_state(session_id, status_response.get("session_state"))
                 if not status_response.get("is_processing", True):
-                    await send_completion_message(thread_key, status_response)
+                    await run_in_worker(send_completion_message(thread_key, status_response))
                     break
-                if poll_count % 10 == 0 and poll_count > 0:
+                if time.monotonic() >= next_progress:
+                    next_progress += COMPLETION_WAIT_SEC
                     process_type = status_response.get("process_type", "request")
-                    await send_slack_message(
-                        thread_key,
-                        f"🔄 Still processing {process_type}... ({poll_count * 3}s elapsed)",
+                    await run_in_worker(
+                        send_slack_message(
+                            thread_key,
+                            f"🔄 Still processing {process_type}... ({time.monotonic() - started:.0f}s elapsed)",
+                        )
                     )
-                await asyncio.sleep(3)
-                poll_count += 1
             except Exception as e:
-                print(f"Polling error: {e}")
-                await send_slack_message(
-                    thread_key,
-                    "❌ Something went wrong while processing your request. Please try again.",
+                print(f"Error waiting for completion: {e}")
+                await run_in_worker(
+                    send_slack_message(
+                        thread_key,
+                        "❌ Something went wrong while processing your request. Please try again.",
+                    )
                 )
                 break
     finally:
@@ -218,16 +235,16 @@ async def poll_for_completion(session_id: str, thread_key: str, task_id=None):
             del active_sessions[session_id]
 
 
-def start_background_polling(session_id: str, thread_key: str, task_id=None):
+def start_completion_watch(session_id: str, thread_key: str, task_id=None):
     if session_id in active_sessions:
-        print(f"Replacing existing poll for session: {session_id}")
-    future = run_async_in_thread(poll_for_completion(session_id, thread_key, task_id))
-    active_sessions[session_id] = {
+        print(f"Replacing existing watch for session: {session_id}")
+    session = {
         "thread_key": thread_key,
         "task_id": task_id,
-        "future": future,
         "start_time": datetime.now(),
     }
+    active_sessions[session_id] = session
+    session["future"] = run_on_event_loop(wait_for_completion(session_id, thread_key, task_id))
 
 
 async def send_completion_message(thread_key: str, status_response):
@@ -834,7 +851,7 @@ async def process_source_confirmation(thread_key: str, message: str):
         chat_response = await api_client.chat(session_id, message)
         if chat_response.get("is_processing"):
             task_id = chat_response.get("task_id")
-            start_background_polling(session_id, thread_key, task_id)
+            start_completion_watch(session_id, thread_key, task_id)
         else:
             response_text = chat_response.get("response", "Selection processed!")
             await send_slack_message(thread_key, response_text)
@@ -1060,7 +1077,7 @@ async def process_approval_action(body, approval_message: str):
         chat_response = await api_client.chat(session_id, approval_message)
         if chat_response.get("is_processing"):
             task_id = chat_response.get("task_id")
-            start_background_polling(session_id, thread_key, task_id)
+            start_completion_watch(session_id, thread_key, task_id)
         else:
             response_text = chat_response.get("response", "Approved! Processing next step...")
             await send_slack_message(thread_key, response_text)
@@ -1193,7 +1210,7 @@ async def handle_user_message(
                 say(text=response_text)
         if chat_response.get("is_processing"):
             task_id = chat_response.get("task_id")
-            start_background_polling(session_id, thread_key, task_id)
+            start_completion_watch(session_id, thread_key, task_id)
             processing_msg = "🔄 Processing your request... This may take a moment."
             if not is_dm and not is_mention:
                 say(text=processing_msg, thread_ts=thread_key)
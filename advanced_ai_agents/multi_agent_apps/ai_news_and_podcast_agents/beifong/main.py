@@ -8,6 +8,7 @@ import aiofiles
 from contextlib import asynccontextmanager
 from routers import article_router, podcast_router, source_router, task_router, podcast_config_router, async_podcast_agent_router, social_media_router
 from services.db_init import init_databases
+from db.async_connection import close_async_pools
 from dotenv import load_dotenv
 
 
@@ -33,6 +34,7 @@ async def lifespan(app: FastAPI):
     print("Application startup complete!")
     yield
     print("Shutting down application...")
+    await close_async_pools()
     print("Shutdown complete")
 
 
@@ -1,15 +1,48 @@
 import json
 import time
 import random
+import asyncio
+import hashlib
 import argparse
 from bs4 import BeautifulSoup
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI, RateLimitError
 from db.config import get_tracking_db_path
-from db.articles import get_unprocessed_articles, update_article_status
+from db.articles import (
+    get_unprocessed_articles,
+    update_article_status,
+    ensure_analysis_cache_table,
+    get_cached_analyses,
+    store_cached_analysis,
+)
 from utils.load_api_keys import load_api_key
 
 WEB_PAGE_ANALYSE_MODEL = "gpt-4o"
 MODEL_INSTRUCTION = "You are a helpful assistant that analyzes articles and extracts structured information."
+PACKED_ANALYSIS_SCHEMA = {
+    "name": "article_analyses",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "articles": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "integer"},
+                        "categories": {"type": "array", "items": {"type": "string"}},
+                        "summary": {"type": "string"},
+                        "content": {"type": "string"},
+                    },
+                    "required": ["id", "categories", "summary", "content"],
+                    "additionalProperties": False,
+                },
+            }
+        },
+        "required": ["articles"],
+        "additionalProperties": False,
+    },
+}
 
 
 def extract_clean_text(raw_html, max_tokens=8000):
@@ -25,29 +58,21 @@ def extract_clean_text(raw_html, max_tokens=8000):
     return text
 
 
-def process_article_with_ai(client, article, max_tokens=8000):
-    clean_text = extract_clean_text(article["raw_content"], max_tokens)
+def get_article_description(article):
     metadata = article.get("metadata", {})
-    title = article["title"]
-    url = article["url"]
-    description = ""
     if metadata and isinstance(metadata, dict):
         if "description" in metadata:
-            description = metadata["description"]
+            return metadata["description"]
         elif "og" in metadata and "description" in metadata["og"]:
-            description = metadata["og"]["description"]
-    try:
-        response = client.chat.completions.create(
-            model=WEB_PAGE_ANALYSE_MODEL,
-            response_format={"type": "json_object"},
-            messages=[
-                {
-                    "role": "system",
-                    "content": MODEL_INSTRUCTION,
-                },
-                {
-                    "role": "user",
-                    "content": f"""
+            return metadata["og"]["description"]
+    return ""
+
+
+def build_article_prompt(article, clean_text):
+    title = article["title"]
+    url = article["url"]
+    description = get_article_description(article)
+    return f"""
                                 Analyze this article and provide a structured output with three components:
 
                                 1. A list of 3-5 relevant categories for this article
@@ -65,28 +90,250 @@ def process_article_with_ai(client, article, max_tokens=8000):
                                 - categories: an array of 3-5 relevant categories (as strings)
                                 - summary: a 2-3 sentence summary of the article
                                 - content: the cleaned main article content
-                                """,
+                                """
+
+
+def parse_analysis_result(response_json):
+    categories = response_json.get("categories", [])
+    if isinstance(categories, str):
+        categories = [cat.strip() for cat in categories.split(",") if cat.strip()]
+    return {
+        "categories": categories,
+        "summary": response_json.get("summary", ""),
+        "content": response_json.get("content", ""),
+    }
+
+
+def process_article_with_ai(client, article, max_tokens=8000):
+    clean_text = extract_clean_text(article["raw_content"], max_tokens)
+    try:
+        response = client.chat.completions.create(
+            model=WEB_PAGE_ANALYSE_MODEL,
+            response_format={"type": "json_object"},
+            messages=[
+                {
+                    "role": "system",
+                    "content": MODEL_INSTRUCTION,
+                },
+                {
+                    "role": "user",
+                    "content": build_article_prompt(article, clean_text),
                 },
             ],
             temperature=0.3,
             max_tokens=1500,
         )
         response_json = json.loads(response.choices[0].message.content)
-        categories = response_json.get("categories", [])
-        if isinstance(categories, str):
-            categories = [cat.strip() for cat in categories.split(",") if cat.strip()]
-        results = {
-            "categories": categories,
-            "summary": response_json.get("summary", ""),
-            "content": response_json.get("content", ""),
-        }
-        return results, True, None
+        return parse_analysis_result(response_json), True, None
     except Exception as e:
         error_message = str(e)
         print(f"Error processing article with AI: {error_message}")
         return None, False, error_message
 
 
+class AdaptiveConcurrencyLimiter:
+    def __init__(self, initial=4, minimum=1, maximum=32, increase_every=5):
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase_every = increase_every
+        self.in_flight = 0
+        self.successes = 0
+        self.rate_limited = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def on_success(self):
+        self.successes += 1
+        if self.successes >= self.increase_every and self.limit < self.maximum:
+            self.limit += 1
+            self.successes = 0
+
+    def on_rate_limited(self):
+        self.rate_limited += 1
+        self.successes = 0
+        self.limit = max(self.minimum, self.limit // 2)
+
+
+def hash_article_content(article, clean_text, model=WEB_PAGE_ANALYSE_MODEL):
+    return hashlib.sha256(f"{model}\n{article['title']}\n{clean_text}".encode("utf-8")).hexdigest()
+
+
+def build_packed_prompt(items):
+    sections = []
+    for item in items:
+        article = item["article"]
+        sections.append(
+            f"""Article ID: {article["id"]}
+Article Title: {article["title"]}
+Article URL: {article["url"]}
+Description: {get_article_description(article)}
+
+Article Text:
+{item["clean_text"]}"""
+        )
+    articles_text = "\n\n---\n\n".join(sections)
+    return f"""
+Analyze each of the following {len(items)} articles independently. For every article provide:
+
+1. A list of 3-5 relevant categories for the article
+2. A concise 2-3 sentence summary of the article
+3. The extracted main article content, removing any navigation, ads, or irrelevant elements
+
+{articles_text}
+
+Respond with a JSON object with an "articles" array containing one entry per article, each with its "id" and
+the keys categories, summary and content.
+"""
+
+
+def plan_analysis_requests(items, pack=False, pack_max_articles=5, pack_token_threshold=1500, pack_token_budget=6000):
+    if not pack:
+        return [[item] for item in items]
+    requests = []
+    current = []
+    current_tokens = 0
+    for item in sorted(items, key=lambda item: item["tokens"]):
+        if item["tokens"] > pack_token_threshold:
+            requests.append([item])
+            continue
+        if current and (len(current) >= pack_max_articles or current_tokens + item["tokens"] > pack_token_budget):
+            requests.append(current)
+            current = []
+            current_tokens = 0
+        current.append(item)
+        current_tokens += item["tokens"]
+    if current:
+        requests.append(current)
+    return requests
+
+
+async def request_analysis(client, limiter, items, model=WEB_PAGE_ANALYSE_MODEL, max_retries=6):
+    if len(items) == 1:
+        messages = [
+            {"role": "system", "content": MODEL_INSTRUCTION},
+            {"role": "user", "content": build_article_prompt(items[0]["article"], items[0]["clean_text"])},
+        ]
+        response_format = {"type": "json_object"}
+        max_tokens = 1500
+    else:
+        messages = [
+            {"role": "system", "content": MODEL_INSTRUCTION},
+            {"role": "user", "content": build_packed_prompt(items)},
+        ]
+        response_format = {"type": "json_schema", "json_schema": PACKED_ANALYSIS_SCHEMA}
+        max_tokens = 1500 * len(items)
+    for attempt in range(max_retries):
+        retry_after = None
+        async with limiter:
+            try:
+                response = await client.chat.completions.create(
+                    model=model,
+                    response_format=response_format,
+                    messages=messages,
+                    temperature=0.3,
+                    max_tokens=max_tokens,
+                )
+            except RateLimitError as e:
+                limiter.on_rate_limited()
+                response = None
+                retry_after = e.response.headers.get("retry-after") if e.response is not None else None
+        if response is not None:
+            limiter.on_success()
+            response_json = json.loads(response.choices[0].message.content)
+            if len(items) == 1:
+                return {items[0]["article"]["id"]: parse_analysis_result(response_json)}
+            return {entry.get("id"): parse_analysis_result(entry) for entry in response_json.get("articles", [])}
+        delay = float(retry_after) if retry_after else 2**attempt
+        await asyncio.sleep(delay + random.uniform(0, 0.5))
+    raise RuntimeError(f"Rate limited after {max_retries} attempts")
+
+
+async def analyze_articles_async(
+    tracking_db_path=None,
+    openai_api_key=None,
+    batch_size=50,
+    initial_concurrency=4,
+    max_concurrency=16,
+    pack=False,
+    pack_max_articles=5,
+    pack_token_threshold=1500,
+    max_tokens=8000,
+    model=WEB_PAGE_ANALYSE_MODEL,
+):
+    if tracking_db_path is None:
+        tracking_db_path = get_tracking_db_path()
+    if openai_api_key is None:
+        raise ValueError("OpenAI API key is required")
+    ensure_analysis_cache_table(tracking_db_path)
+    articles = get_unprocessed_articles(tracking_db_path, limit=batch_size)
+    stats = {"total_articles": len(articles), "success_count": 0, "failed_count": 0, "cached_count": 0, "llm_requests": 0, "rate_limited": 0}
+    if not articles:
+        return stats
+    items_by_hash = {}
+    for article in articles:
+        clean_text = extract_clean_text(article["raw_content"] or "", max_tokens)
+        content_hash = hash_article_content(article, clean_text, model)
+        items_by_hash.setdefault(content_hash, []).append({"article": article, "clean_text": clean_text, "hash": content_hash, "tokens": len(clean_text) / 4})
+    cached = get_cached_analyses(tracking_db_path, items_by_hash.keys(), model)
+
+    def record(item, results, error_message=None):
+        success = results is not None
+        for duplicate in items_by_hash[item["hash"]]:
+            update_article_status(tracking_db_path, duplicate["article"]["id"], results, success, error_message)
+            stats["success_count" if success else "failed_count"] += 1
+
+    pending = []
+    for content_hash, items in items_by_hash.items():
+        if content_hash in cached:
+            record(items[0], cached[content_hash])
+            stats["cached_count"] += len(items)
+        else:
+            pending.append(items[0])
+    requests = plan_analysis_requests(pending, pack=pack, pack_max_articles=pack_max_articles, pack_token_threshold=pack_token_threshold)
+    print(f"Analyzing {len(pending)} unique articles in {len(requests)} requests ({stats['cached_count']} served from cache)")
+    limiter = AdaptiveConcurrencyLimiter(initial=initial_concurrency, maximum=max_concurrency)
+    client = AsyncOpenAI(api_key=openai_api_key, max_retries=0)
+
+    async def run(items):
+        stats["llm_requests"] += 1
+        try:
+            results_by_id = await request_analysis(client, limiter, items, model=model)
+        except Exception as e:
+            print(f"Error processing articles with AI: {str(e)}")
+            for item in items:
+                record(item, None, str(e))
+            return
+        for item in items:
+            results = results_by_id.get(item["article"]["id"])
+            if results is None:
+                record(item, None, "Article missing from analysis response")
+                continue
+            store_cached_analysis(tracking_db_path, item["hash"], model, results)
+            record(item, results)
+
+    try:
+        await asyncio.gather(*(run(items) for items in requests))
+    finally:
+        await client.close()
+    stats["rate_limited"] = limiter.rate_limited
+    return stats
+
+
+def analyze_articles_concurrent(tracking_db_path=None, openai_api_key=None, **kwargs):
+    return asyncio.run(analyze_articles_async(tracking_db_path=tracking_db_path, openai_api_key=openai_api_key, **kwargs))
+
+
 def analyze_articles(tracking_db_path=None, openai_api_key=None, batch_size=5, delay_range=(1, 3)):
     if tracking_db_path is None:
         tracking_db_path = get_tracking_db_path()
@@ -131,6 +378,9 @@ def analyze_in_batches(
     batch_size=20,
     total_batches=1,
     delay_between_batches=10,
+    concurrent=False,
+    max_concurrency=16,
+    pack=False,
 ):
     if tracking_db_path is None:
         tracking_db_path = get_tracking_db_path()
@@ -139,11 +389,20 @@ def analyze_in_batches(
     total_stats = {"total_articles": 0, "success_count": 0, "failed_count": 0}
     for i in range(total_batches):
         print(f"\nProcessing batch {i + 1}/{total_batches}")
-        batch_stats = analyze_articles(
-            tracking_db_path=tracking_db_path,
-            openai_api_key=openai_api_key,
-            batch_size=batch_size,
-        )
+        if concurrent:
+            batch_stats = analyze_articles_concurrent(
+                tracking_db_path=tracking_db_path,
+                openai_api_key=openai_api_key,
+                batch_size=batch_size,
+                max_concurrency=max_concurrency,
+                pack=pack,
+            )
+        else:
+            batch_stats = analyze_articles(
+                tracking_db_path=tracking_db_path,
+                openai_api_key=openai_api_key,
+                batch_size=batch_size,
+            )
         total_stats["total_articles"] += batch_stats["total_articles"]
         total_stats["success_count"] += batch_stats["success_count"]
         total_stats["failed_count"] += batch_stats["failed_count"]
@@ -162,8 +421,8 @@ def parse_arguments():
     parser.add_argument(
         "--batch_size",
         type=int,
-        default=10,
-        help="Number of articles to process in each batch",
+        default=None,
+        help="Number of articles to process in each batch (default: 50 concurrent, 10 sequential)",
     )
     parser.add_argument(
         "--total_batches",
@@ -171,6 +430,9 @@ def parse_arguments():
         default=1,
         help="Total number of batches to process",
     )
+    parser.add_argument("--sequential", action="store_true", help="Analyze one article at a time (legacy mode)")
+    parser.add_argument("--concurrency", type=int, default=16, help="Maximum concurrent LLM requests in concurrent mode")
+    parser.add_argument("--pack", action="store_true", help="Pack several short articles into one structured-output request")
     return parser.parse_args()
 
 
@@ -182,7 +444,10 @@ if __name__ == "__main__":
         exit(1)
     stats = analyze_in_batches(
         openai_api_key=api_key,
-        batch_size=args.batch_size,
+        batch_size=args.batch_size or (10 if args.sequential else 50),
         total_batches=args.total_batches,
+        concurrent=not args.sequential,
+        max_concurrency=args.concurrency,
+        pack=args.pack,
     )
     print_stats(stats)
@@ -1,13 +1,22 @@
 import time
 import argparse
+import contextvars
 import random
+import hashlib
+from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import numpy as np
+import tiktoken
 from openai import OpenAI
 from db.config import get_tracking_db_path
 from db.connection import db_connection, execute_query
 from utils.load_api_keys import load_api_key
 
 EMBEDDING_MODEL = "text-embedding-3-small"
+MAX_TOKENS_PER_INPUT = 8191
+MAX_TOKENS_PER_REQUEST = 250000
+MAX_INPUTS_PER_REQUEST = 512
 
 def create_embedding_table(tracking_db_path):
     with db_connection(tracking_db_path) as conn:
@@ -41,6 +50,15 @@ def create_embedding_table(tracking_db_path):
             print("Article embeddings table created successfully.")
         else:
             print("Article embeddings table already exists.")
+        cursor.execute("PRAGMA table_info(article_embeddings)")
+        columns = [col[1] for col in cursor.fetchall()]
+        if "content_hash" not in columns:
+            cursor.execute("ALTER TABLE article_embeddings ADD COLUMN content_hash TEXT")
+        cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_article_embeddings_content_hash 
+        ON article_embeddings(content_hash, embedding_model)
+        """)
+        conn.commit()
 
 
 def get_articles_without_embeddings(tracking_db_path, limit=20):
@@ -104,16 +122,15 @@ def prepare_article_text(article):
     return full_text
 
 
-def store_embedding(tracking_db_path, article_id, embedding, model):
-    from datetime import datetime
+def store_embedding(tracking_db_path, article_id, embedding, model, content_hash=None):
     import sqlite3
     embedding_blob = np.array(embedding, dtype=np.float32).tobytes()
     query = """
     INSERT INTO article_embeddings 
-    (article_id, embedding, embedding_model, created_at, in_faiss_index)
-    VALUES (?, ?, ?, ?, 0)
+    (article_id, embedding, embedding_model, created_at, in_faiss_index, content_hash)
+    VALUES (?, ?, ?, ?, 0, ?)
     """
-    params = (article_id, embedding_blob, model, datetime.now().isoformat())
+    params = (article_id, embedding_blob, model, datetime.now().isoformat(), content_hash)
     try:
         execute_query(tracking_db_path, query, params)
         return True
@@ -125,6 +142,151 @@ def store_embedding(tracking_db_path, article_id, embedding, model):
         return False
 
 
+@lru_cache(maxsize=1)
+def get_tokenizer():
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        print(f"Tokenizer unavailable, estimating token counts from text length: {str(e)}")
+        return None
+
+
+def hash_article_text(text, model=EMBEDDING_MODEL):
+    return hashlib.sha256(f"{model}\n{text}".encode("utf-8")).hexdigest()
+
+
+def truncate_to_token_limit(text, max_tokens=MAX_TOKENS_PER_INPUT):
+    tokenizer = get_tokenizer()
+    if tokenizer is None:
+        max_chars = max_tokens * 3
+        return text[:max_chars], len(text[:max_chars]) // 3 + 1
+    tokens = tokenizer.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text, len(tokens)
+    return tokenizer.decode(tokens[:max_tokens]), max_tokens
+
+
+def get_embeddings_by_hash(tracking_db_path, content_hashes, model=EMBEDDING_MODEL):
+    if not content_hashes:
+        return {}
+    found = {}
+    hashes = list(content_hashes)
+    for start in range(0, len(hashes), 500):
+        chunk = hashes[start : start + 500]
+        placeholders = ",".join(["?"] * len(chunk))
+        query = f"""
+        SELECT content_hash, embedding FROM article_embeddings
+        WHERE embedding_model = ? AND content_hash IN ({placeholders})
+        """
+        for row in execute_query(tracking_db_path, query, [model] + chunk, fetch=True):
+            found[row["content_hash"]] = row["embedding"]
+    return found
+
+
+def pack_embedding_requests(items, max_tokens=MAX_TOKENS_PER_REQUEST, max_inputs=MAX_INPUTS_PER_REQUEST):
+    batches = []
+    current = []
+    current_tokens = 0
+    for item in items:
+        if current and (current_tokens + item["tokens"] > max_tokens or len(current) >= max_inputs):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+        current.append(item)
+        current_tokens += item["tokens"]
+    if current:
+        batches.append(current)
+    return batches
+
+
+def generate_embeddings_batch(client, texts, model=EMBEDDING_MODEL, max_retries=3):
+    for attempt in range(max_retries):
+        try:
+            response = client.embeddings.create(input=texts, model=model)
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+        except Exception as e:
+            print(f"Error generating embeddings batch (attempt {attempt + 1}/{max_retries}): {str(e)}")
+            if attempt < max_retries - 1:
+                time.sleep(2**attempt + random.random())
+    return None
+
+
+def store_embeddings_bulk(tracking_db_path, rows):
+    if not rows:
+        return 0
+    created_at = datetime.now().isoformat()
+    with db_connection(tracking_db_path) as conn:
+        conn.executemany(
+            """
+        INSERT INTO article_embeddings 
+        (article_id, embedding, embedding_model, created_at, in_faiss_index, content_hash)
+        VALUES (?, ?, ?, ?, 0, ?)
+        """,
+            [(article_id, blob, model, created_at, content_hash) for article_id, blob, model, content_hash in rows],
+        )
+        conn.commit()
+    return len(rows)
+
+
+def process_articles_for_embedding_batched(
+    tracking_db_path=None,
+    openai_api_key=None,
+    batch_size=500,
+    max_tokens_per_request=MAX_TOKENS_PER_REQUEST,
+    max_inputs_per_request=MAX_INPUTS_PER_REQUEST,
+    max_concurrent_requests=4,
+    model=EMBEDDING_MODEL,
+):
+    if tracking_db_path is None:
+        tracking_db_path = get_tracking_db_path()
+    if openai_api_key is None:
+        raise ValueError("OpenAI API key is required")
+    create_embedding_table(tracking_db_path)
+    client = OpenAI(api_key=openai_api_key)
+    articles = get_articles_without_embeddings(tracking_db_path, limit=batch_size)
+    if not articles:
+        print("No articles found that need embeddings")
+        return {"total_articles": 0, "success_count": 0, "failed_count": 0, "reused_count": 0, "api_requests": 0}
+    mark_articles_as_processing(tracking_db_path, [article["id"] for article in articles])
+    stats = {"total_articles": len(articles), "success_count": 0, "failed_count": 0, "reused_count": 0, "api_requests": 0}
+    articles_by_hash = {}
+    for article in articles:
+        content_hash = hash_article_text(prepare_article_text(article), model)
+        articles_by_hash.setdefault(content_hash, []).append(article)
+    existing = get_embeddings_by_hash(tracking_db_path, articles_by_hash.keys(), model)
+    rows = []
+    pending = []
+    for content_hash, hash_articles in articles_by_hash.items():
+        if content_hash in existing:
+            rows.extend((article["id"], existing[content_hash], model, content_hash) for article in hash_articles)
+            stats["reused_count"] += len(hash_articles)
+            continue
+        text, tokens = truncate_to_token_limit(prepare_article_text(hash_articles[0]))
+        pending.append({"hash": content_hash, "text": text, "tokens": tokens})
+        stats["reused_count"] += len(hash_articles) - 1
+    requests = pack_embedding_requests(pending, max_tokens=max_tokens_per_request, max_inputs=max_inputs_per_request)
+    print(f"Embedding {len(pending)} unique texts for {len(articles)} articles in {len(requests)} requests")
+    with ThreadPoolExecutor(max_workers=max_concurrent_requests) as executor:
+        # Copy the context per request so output from the workers lands in the pipeline stage's log.
+        futures = {
+            executor.submit(contextvars.copy_context().run, generate_embeddings_batch, client, [item["text"] for item in batch], model): batch
+            for batch in requests
+        }
+        for future in as_completed(futures):
+            batch = futures[future]
+            stats["api_requests"] += 1
+            embeddings = future.result()
+            if not embeddings or len(embeddings) != len(batch):
+                stats["failed_count"] += sum(len(articles_by_hash[item["hash"]]) for item in batch)
+                continue
+            for item, embedding in zip(batch, embeddings):
+                blob = np.array(embedding, dtype=np.float32).tobytes()
+                rows.extend((article["id"], blob, model, item["hash"]) for article in articles_by_hash[item["hash"]])
+    stored = store_embeddings_bulk(tracking_db_path, rows)
+    stats["success_count"] = stored
+    return stats
+
+
 def process_articles_for_embedding(tracking_db_path=None, openai_api_key=None, batch_size=20, delay_range=(1, 3)):
     if tracking_db_path is None:
         tracking_db_path = get_tracking_db_path()
@@ -146,7 +308,7 @@ def process_articles_for_embedding(tracking_db_path=None, openai_api_key=None, b
             text = prepare_article_text(article)
             embedding, model = generate_embedding(client, text)
             if embedding:
-                success = store_embedding(tracking_db_path, article_id, embedding, model)
+                success = store_embedding(tracking_db_path, article_id, embedding, model, hash_article_text(text, model))
                 if success:
                     print(f"Successfully stored embedding for article {article_id}")
                     stats["success_count"] += 1
@@ -178,9 +340,11 @@ def parse_arguments():
     parser.add_argument(
         "--batch_size",
         type=int,
-        default=20,
-        help="Number of articles to process in each batch",
+        default=None,
+        help="Number of articles to process in each batch (default: 500 batched, 20 sequential)",
     )
+    parser.add_argument("--sequential", action="store_true", help="Embed one article per request (legacy mode)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Maximum concurrent embedding requests in batched mode")
     return parser.parse_args()
 
 
@@ -190,6 +354,8 @@ def process_in_batches(
     batch_size=20,
     total_batches=1,
     delay_between_batches=10,
+    batched=True,
+    max_concurrent_requests=4,
 ):
     if tracking_db_path is None:
         tracking_db_path = get_tracking_db_path()
@@ -198,11 +364,19 @@ def process_in_batches(
     total_stats = {"total_articles": 0, "success_count": 0, "failed_count": 0}
     for i in range(total_batches):
         print(f"\nProcessing batch {i + 1}/{total_batches}")
-        batch_stats = process_articles_for_embedding(
-            tracking_db_path=tracking_db_path,
-            openai_api_key=openai_api_key,
-            batch_size=batch_size,
-        )
+        if batched:
+            batch_stats = process_articles_for_embedding_batched(
+                tracking_db_path=tracking_db_path,
+                openai_api_key=openai_api_key,
+                batch_size=batch_size,
+                max_concurrent_requests=max_concurrent_requests,
+            )
+        else:
+            batch_stats = process_articles_for_embedding(
+                tracking_db_path=tracking_db_path,
+                openai_api_key=openai_api_key,
+                batch_size=batch_size,
+            )
         total_stats["total_articles"] += batch_stats["total_articles"]
         total_stats["success_count"] += batch_stats["success_count"]
         total_stats["failed_count"] += batch_stats["failed_count"]
@@ -223,7 +397,9 @@ if __name__ == "__main__":
         exit(1)
     stats = process_in_batches(
         openai_api_key=api_key,
-        batch_size=args.batch_size,
+        batch_size=args.batch_size or (20 if args.sequential else 500),
         total_batches=3,
+        batched=not args.sequential,
+        max_concurrent_requests=args.concurrency,
     )
     print_stats(stats)
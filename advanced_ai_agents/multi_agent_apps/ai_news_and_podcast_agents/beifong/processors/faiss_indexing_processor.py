@@ -7,7 +7,57 @@ from db.config import get_tracking_db_path, get_faiss_db_path
 from db.connection import db_connection, execute_query
 
 
-def initialize_faiss_index(dimension=1536, index_path=None, index_type="hnsw", n_list=100):
+def get_training_embeddings(tracking_db_path, dimension, limit=50000):
+    query = """
+    SELECT embedding FROM article_embeddings
+    ORDER BY RANDOM()
+    LIMIT ?
+    """
+    rows = execute_query(tracking_db_path, query, (limit,), fetch=True)
+    vectors = [np.frombuffer(row["embedding"], dtype=np.float32) for row in rows]
+    vectors = [vector for vector in vectors if vector.shape[0] == dimension]
+    if not vectors:
+        return np.empty((0, dimension), dtype=np.float32)
+    return np.vstack(vectors).astype(np.float32)
+
+
+def is_id_mapped(index):
+    return isinstance(index, (faiss.IndexIDMap, faiss.IndexIDMap2))
+
+
+def create_trained_index(dimension, index_type, n_list, train_vectors):
+    if index_type in ("ivfflat", "ivfpq") and len(train_vectors) < n_list:
+        print(f"Only {len(train_vectors)} embeddings available to train {n_list} clusters, using a flat index until the corpus grows")
+        return faiss.IndexFlatL2(dimension), "flat"
+    if index_type == "ivfpq" and len(train_vectors) < 256:
+        print("Not enough embeddings to train PQ codebooks, using IVF Flat instead")
+        index_type = "ivfflat"
+    if index_type == "flat":
+        return faiss.IndexFlatL2(dimension), index_type
+    if index_type == "hnsw":
+        m = 32
+        ef_construction = 100
+        index = faiss.IndexHNSWFlat(dimension, m)
+        index.hnsw.efConstruction = ef_construction
+        index.hnsw.efSearch = 64
+        return index, index_type
+    if index_type not in ("ivfflat", "ivfpq"):
+        print(f"Unknown index type '{index_type}', falling back to IVF Flat")
+        index_type = "ivfflat"
+    quantizer = faiss.IndexFlatL2(dimension)
+    if index_type == "ivfpq":
+        m = 16
+        bits = 8
+        index = faiss.IndexIVFPQ(quantizer, dimension, n_list, m, bits)
+    else:
+        index = faiss.IndexIVFFlat(quantizer, dimension, n_list)
+    print(f"Training {index_type} index on {len(train_vectors)} article embeddings...")
+    index.train(train_vectors)
+    index.nprobe = max(1, min(10, n_list // 10))
+    return index, index_type
+
+
+def initialize_faiss_index(dimension=1536, index_path=None, index_type="hnsw", n_list=100, tracking_db_path=None):
     if index_path and os.path.exists(index_path):
         print(f"Loading existing FAISS index from {index_path}")
         try:
@@ -18,46 +68,11 @@ def initialize_faiss_index(dimension=1536, index_path=None, index_type="hnsw", n
             print(f"Error loading FAISS index: {str(e)}")
             print("Creating a new index instead")
     print(f"Creating new FAISS index with dimension {dimension}, type: {index_type}")
-    if index_type == "flat":
-        return faiss.IndexFlatL2(dimension)
-
-    elif index_type == "ivfflat":
-        quantizer = faiss.IndexFlatL2(dimension)
-        index = faiss.IndexIVFFlat(quantizer, dimension, n_list)
-        print("Training IVF index with random vectors...")
-        train_size = max(10000, n_list * 10)
-        train_vectors = np.random.random((train_size, dimension)).astype(np.float32)
-        index.train(train_vectors)
-        index.nprobe = min(10, n_list // 10)
-        return index
-    elif index_type == "ivfpq":
-        quantizer = faiss.IndexFlatL2(dimension)
-        m = 16
-        bits = 8
-        index = faiss.IndexIVFPQ(quantizer, dimension, n_list, m, bits)
-        print("Training IVF-PQ index with random vectors...")
-        train_size = max(10000, n_list * 10)
-        train_vectors = np.random.random((train_size, dimension)).astype(np.float32)
-        index.train(train_vectors)
-        index.nprobe = min(10, n_list // 10)
-        return index
-    elif index_type == "hnsw":
-        m = 32
-        ef_construction = 100
-        index = faiss.IndexHNSWFlat(dimension, m)
-        index.hnsw.efConstruction = ef_construction
-        index.hnsw.efSearch = 64
-        return index
-    else:
-        print(f"Unknown index type '{index_type}', falling back to IVF Flat")
-        quantizer = faiss.IndexFlatL2(dimension)
-        index = faiss.IndexIVFFlat(quantizer, dimension, n_list)
-        print("Training IVF index with random vectors...")
-        train_size = max(10000, n_list * 10)
-        train_vectors = np.random.random((train_size, dimension)).astype(np.float32)
-        index.train(train_vectors)
-        index.nprobe = min(10, n_list // 10)
-        return index
+    train_vectors = np.empty((0, dimension), dtype=np.float32)
+    if index_type in ("ivfflat", "ivfpq") and tracking_db_path:
+        train_vectors = get_training_embeddings(tracking_db_path, dimension, limit=max(10000, n_list * 39))
+    index, _ = create_trained_index(dimension, index_type, n_list, train_vectors)
+    return faiss.IndexIDMap2(index)
 
 
 def save_faiss_index(index, index_path):
@@ -78,7 +93,9 @@ def save_id_mapping(id_map, mapping_path):
     try:
         mapping_dir = os.path.dirname(mapping_path)
         os.makedirs(mapping_dir, exist_ok=True)
-        np.save(mapping_path, np.array(id_map))
+        temp_path = f"{mapping_path}.tmp.npy"
+        np.save(temp_path, np.array(id_map))
+        os.replace(temp_path, mapping_path)
         print(f"ID mapping saved to {mapping_path}")
         return True
     except Exception as e:
@@ -152,9 +169,12 @@ def add_embeddings_to_index(embeddings_data, faiss_index, id_map):
         return 0, []
     try:
         embeddings_array = np.vstack(embeddings).astype(np.float32)
-        faiss_index.add(embeddings_array)
-        for article_id in article_ids:
-            id_map.append(article_id)
+        if is_id_mapped(faiss_index):
+            faiss_index.add_with_ids(embeddings_array, np.array(article_ids, dtype=np.int64))
+        else:
+            faiss_index.add(embeddings_array)
+            for article_id in article_ids:
+                id_map.append(article_id)
         print(f"Added {len(embeddings)} embeddings to FAISS index")
         return len(embeddings), embedding_ids
     except Exception as e:
@@ -162,6 +182,14 @@ def add_embeddings_to_index(embeddings_data, faiss_index, id_map):
         return 0, []
 
 
+def reset_faiss_index(tracking_db_path, index_path, mapping_path):
+    for path in (index_path, mapping_path):
+        if path and os.path.exists(path):
+            os.remove(path)
+    execute_query(tracking_db_path, "UPDATE article_embeddings SET in_faiss_index = 0")
+    print("Cleared FAISS index, all embeddings will be re-indexed")
+
+
 def process_embeddings_for_indexing(
     tracking_db_path=None,
     index_path=None,
@@ -207,15 +235,18 @@ def process_embeddings_for_indexing(
         }
     embedding_dimension = len(np.frombuffer(sample["embedding"], dtype=np.float32))
     print(f"Detected embedding dimension: {embedding_dimension}")
-    faiss_index = initialize_faiss_index(dimension=embedding_dimension, index_path=index_path, index_type=index_type, n_list=n_list)
+    faiss_index = initialize_faiss_index(
+        dimension=embedding_dimension, index_path=index_path, index_type=index_type, n_list=n_list, tracking_db_path=tracking_db_path
+    )
     embeddings_data = get_embeddings_not_in_index(tracking_db_path, limit=batch_size)
     if not embeddings_data:
         print("No new embeddings to add to the index")
         return {"processed": 0, "added": 0, "errors": 0, "total_vectors": faiss_index.ntotal, "status": "no_new_embeddings"}
     added_count, embedding_ids = add_embeddings_to_index(embeddings_data, faiss_index, id_map)
     if added_count > 0:
+        if not is_id_mapped(faiss_index):
+            save_id_mapping(id_map, mapping_path)
         save_faiss_index(faiss_index, index_path)
-        save_id_mapping(id_map, mapping_path)
         marked_count = mark_embeddings_as_indexed(tracking_db_path, embedding_ids)
         print(f"Marked {marked_count} embeddings as indexed in the database")
     stats = {
@@ -321,6 +352,11 @@ def parse_arguments():
         default=5,
         help="Total number of batches to process",
     )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Drop the existing index and rebuild it, training centroids on the stored article embeddings",
+    )
     return parser.parse_args()
 
 
@@ -329,6 +365,8 @@ if __name__ == "__main__":
     index_path, mapping_path = get_faiss_db_path()
     index_path = args.index_path or index_path
     mapping_path = args.mapping_path or mapping_path
+    if args.rebuild:
+        reset_faiss_index(get_tracking_db_path(), index_path, mapping_path)
     stats = process_in_batches(
         batch_size=args.batch_size,
         index_path=index_path,
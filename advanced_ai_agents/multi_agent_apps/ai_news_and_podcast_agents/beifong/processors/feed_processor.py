@@ -1,6 +1,8 @@
 import time
 import random
+import argparse
 from utils.rss_feed_parser import get_feed_data
+from utils.async_feed_fetcher import fetch_feeds_sync
 from db.config import get_sources_db_path, get_tracking_db_path
 from db.feeds import (
     get_active_feeds,
@@ -9,6 +11,9 @@ from db.feeds import (
     update_feed_tracking,
     store_feed_entries,
     update_tracking_info,
+    get_feed_tracking_infos,
+    store_feed_entries_bulk,
+    update_feed_tracking_bulk,
 )
 
 
@@ -75,6 +80,74 @@ def fetch_and_process_feeds(sources_db_path=None, tracking_db_path=None, delay_b
     return stats
 
 
+def fetch_and_process_feeds_async(
+    sources_db_path=None,
+    tracking_db_path=None,
+    batch_size=500,
+    concurrency=50,
+    per_host_limit=2,
+    per_host_interval=1.0,
+    timeout=20,
+):
+    if sources_db_path is None:
+        sources_db_path = get_sources_db_path()
+    if tracking_db_path is None:
+        tracking_db_path = get_tracking_db_path()
+    total_feeds = count_active_feeds(sources_db_path)
+    stats = {
+        "total_feeds": total_feeds,
+        "processed_feeds": 0,
+        "new_entries": 0,
+        "unchanged_feeds": 0,
+        "failed_feeds": 0,
+    }
+    offset = 0
+    while offset < total_feeds:
+        feeds = get_active_feeds(sources_db_path, limit=batch_size, offset=offset)
+        if not feeds:
+            break
+        update_tracking_info(tracking_db_path, feeds)
+        tracking_infos = get_feed_tracking_infos(tracking_db_path, [feed["id"] for feed in feeds])
+        results = fetch_feeds_sync(
+            feeds,
+            tracking_infos,
+            concurrency=concurrency,
+            per_host_limit=per_host_limit,
+            per_host_interval=per_host_interval,
+            timeout=timeout,
+        )
+        feed_entries = []
+        tracking_updates = []
+        for feed, feed_data in results:
+            feed_url = feed["feed_url"]
+            if isinstance(feed_data, Exception):
+                print(f"Error processing feed {feed_url}: {str(feed_data)}")
+                stats["failed_feeds"] += 1
+                continue
+            if not feed_data["is_rss_feed"]:
+                print(f"Feed {feed_url} is not a valid RSS feed")
+                stats["failed_feeds"] += 1
+                continue
+            if feed_data["status"] == 304:
+                stats["unchanged_feeds"] += 1
+                continue
+            last_hash = tracking_infos.get(feed["id"], {}).get("entry_hash")
+            current_hash = feed_data["current_hash"]
+            if last_hash and current_hash == last_hash:
+                stats["unchanged_feeds"] += 1
+                continue
+            if feed_data["parsed_entries"]:
+                feed_entries.append((feed["id"], feed["source_id"], feed_data["parsed_entries"]))
+            tracking_updates.append((feed["id"], feed_data["etag"], feed_data["modified"], current_hash))
+            stats["processed_feeds"] += 1
+        new_entries = store_feed_entries_bulk(tracking_db_path, feed_entries)
+        update_feed_tracking_bulk(tracking_db_path, tracking_updates)
+        stats["new_entries"] += new_entries
+        print(f"Batch at offset {offset}: {len(results)} feeds fetched, {new_entries} new entries stored")
+        offset += batch_size
+    return stats
+
+
 def print_stats(stats):
     print("\nFeed Processing Statistics:")
     print(f"Total feeds: {stats['total_feeds']}")
@@ -85,5 +158,18 @@ def print_stats(stats):
 
 
 if __name__ == "__main__":
-    stats = fetch_and_process_feeds()
+    parser = argparse.ArgumentParser(description="Fetch and process RSS feeds")
+    parser.add_argument("--sequential", action="store_true", help="Fetch feeds one at a time (legacy mode)")
+    parser.add_argument("--concurrency", type=int, default=50, help="Maximum concurrent feed fetches")
+    parser.add_argument("--per-host-limit", type=int, default=2, help="Maximum concurrent requests per host")
+    parser.add_argument("--per-host-interval", type=float, default=1.0, help="Minimum seconds between requests to the same host")
+    args = parser.parse_args()
+    if args.sequential:
+        stats = fetch_and_process_feeds()
+    else:
+        stats = fetch_and_process_feeds_async(
+            concurrency=args.concurrency,
+            per_host_limit=args.per_host_limit,
+            per_host_interval=args.per_host_interval,
+        )
     print_stats(stats)
@@ -1,7 +1,9 @@
+import argparse
 from db.config import get_tracking_db_path
 from db.feeds import get_uncrawled_entries
 from db.articles import store_crawled_article, update_entry_status
 from utils.crawl_url import get_web_data
+from utils.async_crawler import crawl_urls_sync, MAX_RESPONSE_BYTES
 
 
 def crawl_pending_entries(tracking_db_path=None, batch_size=20, delay_range=(1, 3), max_attempts=3):
@@ -45,6 +47,60 @@ def crawl_pending_entries(tracking_db_path=None, batch_size=20, delay_range=(1,
     return stats
 
 
+def crawl_pending_entries_concurrent(
+    tracking_db_path=None,
+    batch_size=200,
+    max_attempts=3,
+    concurrency=32,
+    per_host_limit=2,
+    per_host_interval=1.0,
+    max_bytes=MAX_RESPONSE_BYTES,
+):
+    if tracking_db_path is None:
+        tracking_db_path = get_tracking_db_path()
+    entries = get_uncrawled_entries(tracking_db_path, limit=batch_size, max_attempts=max_attempts)
+    stats = {
+        "total_entries": len(entries),
+        "success_count": 0,
+        "failed_count": 0,
+        "skipped_count": 0,
+    }
+    crawlable = []
+    for entry in entries:
+        if not entry["link"] or entry["link"].strip() == "":
+            update_entry_status(tracking_db_path, entry["id"], "skipped")
+            stats["skipped_count"] += 1
+        else:
+            crawlable.append(entry)
+    results = crawl_urls_sync(
+        crawlable,
+        concurrency=concurrency,
+        per_host_limit=per_host_limit,
+        per_host_interval=per_host_interval,
+        max_bytes=max_bytes,
+    )
+    for entry, web_data in results:
+        url = entry["link"]
+        if isinstance(web_data, Exception):
+            print(f"Error crawling {url}: {str(web_data)}")
+            update_entry_status(tracking_db_path, entry["id"], "failed")
+            stats["failed_count"] += 1
+            continue
+        if not web_data or not web_data["raw_html"]:
+            print(f"No content retrieved for {url}")
+            update_entry_status(tracking_db_path, entry["id"], "failed")
+            stats["failed_count"] += 1
+            continue
+        if store_crawled_article(tracking_db_path, entry, web_data["raw_html"], web_data["metadata"]):
+            update_entry_status(tracking_db_path, entry["id"], "success")
+            stats["success_count"] += 1
+        else:
+            update_entry_status(tracking_db_path, entry["id"], "failed")
+            stats["failed_count"] += 1
+            print(f"Failed to store: {url} (likely duplicate)")
+    return stats
+
+
 def print_stats(stats):
     print("\nCrawl Statistics:")
     print(f"Total entries processed: {stats['total_entries']}")
@@ -53,7 +109,7 @@ def print_stats(stats):
     print(f"Skipped (no URL): {stats['skipped_count']}")
 
 
-def crawl_in_batches(tracking_db_path=None, batch_size=20, total_batches=5, delay_between_batches=10):
+def crawl_in_batches(tracking_db_path=None, batch_size=20, total_batches=5, delay_between_batches=10, concurrent=False, concurrency=32):
     if tracking_db_path is None:
         tracking_db_path = get_tracking_db_path()
     total_stats = {
@@ -64,7 +120,10 @@ def crawl_in_batches(tracking_db_path=None, batch_size=20, total_batches=5, dela
     }
     for i in range(total_batches):
         print(f"\nProcessing batch {i + 1}/{total_batches}")
-        batch_stats = crawl_pending_entries(tracking_db_path=tracking_db_path, batch_size=batch_size)
+        if concurrent:
+            batch_stats = crawl_pending_entries_concurrent(tracking_db_path=tracking_db_path, batch_size=batch_size, concurrency=concurrency)
+        else:
+            batch_stats = crawl_pending_entries(tracking_db_path=tracking_db_path, batch_size=batch_size)
         total_stats["total_entries"] += batch_stats["total_entries"]
         total_stats["success_count"] += batch_stats["success_count"]
         total_stats["failed_count"] += batch_stats["failed_count"]
@@ -78,5 +137,12 @@ def crawl_in_batches(tracking_db_path=None, batch_size=20, total_batches=5, dela
 
 
 if __name__ == "__main__":
-    stats = crawl_in_batches(batch_size=20, total_batches=50)
+    parser = argparse.ArgumentParser(description="Crawl pending feed entries")
+    parser.add_argument("--sequential", action="store_true", help="Crawl one URL at a time and store the full body HTML (legacy mode)")
+    parser.add_argument("--concurrency", type=int, default=32, help="Maximum concurrent requests in concurrent mode")
+    args = parser.parse_args()
+    if args.sequential:
+        stats = crawl_in_batches(batch_size=20, total_batches=50)
+    else:
+        stats = crawl_in_batches(batch_size=200, total_batches=5, concurrent=True, concurrency=args.concurrency)
     print_stats(stats)
@@ -29,6 +29,7 @@ class ChatResponse(BaseModel):
 class StatusRequest(BaseModel):
     session_id: str
     task_id: Optional[str] = None  
+    wait: Optional[float] = None
 
 
 @router.post("/session")
@@ -1,7 +1,9 @@
+import argparse
 import os
 import time
 import signal
 import subprocess
+import threading
 from datetime import datetime
 import traceback
 from concurrent.futures import ThreadPoolExecutor
@@ -11,12 +13,15 @@ from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from db.config import get_tasks_db_path
 from db.connection import db_connection
 from db.tasks import (
+    get_all_tasks,
     get_pending_tasks,
     update_task_last_run,
     update_task_execution,
 )
+from utils.pipeline_dag import DEFAULT_LOG_MAX_CHARS, CappedLog, PipelineScheduler, build_default_stages
 
 running = True
+pipeline = None
 MAX_WORKERS = 5
 DEFAULT_TASK_TIMEOUT = 3600
 
@@ -56,7 +61,7 @@ def cleanup_stuck_tasks():
         print(f"ERROR: {traceback.format_exc()}")
 
 
-def execute_task(task_id, command):
+def start_task_execution(task_id):
     tasks_db_path = get_tasks_db_path()
     with db_connection(tasks_db_path) as conn:
         conn.execute("BEGIN EXCLUSIVE TRANSACTION")
@@ -74,7 +79,7 @@ def execute_task(task_id, command):
             if is_running:
                 print(f"WARNING: Task {task_id} is already running, skipping this execution")
                 conn.commit()
-                return
+                return None
             cursor.execute(
                 """
                 INSERT INTO task_executions 
@@ -87,40 +92,73 @@ def execute_task(task_id, command):
             conn.commit()
             if not execution_id:
                 print(f"ERROR: Failed to create execution record for task {task_id}")
-                return
+                return None
+            return execution_id
         except Exception as e:
             conn.rollback()
             print(f"ERROR: Transaction error for task {task_id}: {str(e)}")
-            return
+            return None
+
+
+def finish_task_execution(task_id, execution_id, status, error_message=None, output=None):
+    tasks_db_path = get_tasks_db_path()
+    update_task_execution(tasks_db_path, execution_id, status, error_message, output)
+    timestamp = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+    update_task_last_run(tasks_db_path, task_id, timestamp)
+
+
+def run_command(command, timeout=DEFAULT_TASK_TIMEOUT, log_max_chars=DEFAULT_LOG_MAX_CHARS, prefix=None):
+    """Run a shell command, streaming its combined output to the console and into a size-capped log."""
+    log = CappedLog(log_max_chars)
+    process = subprocess.Popen(
+        command,
+        shell=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    )
+
+    def pump():
+        for line in process.stdout:
+            log.write(line)
+            if prefix:
+                print(f"[{prefix}] {line}", end="")
+
+    reader = threading.Thread(target=pump, daemon=True)
+    reader.start()
+    try:
+        returncode = process.wait(timeout=timeout)
+        timed_out = False
+    except subprocess.TimeoutExpired:
+        process.kill()
+        returncode = process.wait()
+        timed_out = True
+    reader.join(timeout=5)
+    return returncode, timed_out, log.getvalue()
+
+
+def execute_task(task_id, command):
+    tasks_db_path = get_tasks_db_path()
+    execution_id = start_task_execution(task_id)
+    if not execution_id:
+        return
     print(f"INFO: Starting task {task_id}: {command}")
     try:
-        process = subprocess.Popen(
-            command,
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-        try:
-            stdout, stderr = process.communicate(timeout=DEFAULT_TASK_TIMEOUT)
-            if process.returncode == 0:
-                status = "success"
-                error_message = None
-                print(f"INFO: Task {task_id} completed successfully")
-            else:
-                status = "failed"
-                error_message = stderr if stderr else f"Process exited with code {process.returncode}"
-                print(f"ERROR: Task {task_id} failed: {error_message}")
-        except subprocess.TimeoutExpired:
-            process.kill()
-            stdout, stderr = process.communicate()
+        returncode, timed_out, output = run_command(command, prefix=f"task {task_id}")
+        if timed_out:
             status = "failed"
             error_message = f"Task timed out after {DEFAULT_TASK_TIMEOUT} seconds"
             print(f"ERROR: Task {task_id} timed out")
-        output = f"STDOUT:\n{stdout}\n\nSTDERR:\n{stderr}" if stderr else stdout
-        update_task_execution(tasks_db_path, execution_id, status, error_message, output)
-        timestamp = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
-        update_task_last_run(tasks_db_path, task_id, timestamp)
+        elif returncode == 0:
+            status = "success"
+            error_message = None
+            print(f"INFO: Task {task_id} completed successfully")
+        else:
+            status = "failed"
+            error_message = f"Process exited with code {returncode}\n{output[-2000:]}"
+            print(f"ERROR: Task {task_id} failed with exit code {returncode}")
+        finish_task_execution(task_id, execution_id, status, error_message, output)
     except Exception as e:
         print(f"ERROR: Error executing task {task_id}: {str(e)}")
         error_message = traceback.format_exc()
@@ -129,11 +167,49 @@ def execute_task(task_id, command):
         update_task_last_run(tasks_db_path, task_id, timestamp)
 
 
+def frequency_to_seconds(frequency, frequency_unit):
+    multipliers = {"minutes": 60, "hours": 3600, "days": 86400}
+    return int(frequency) * multipliers.get(frequency_unit, 1)
+
+
+def configure_pipeline(pipeline):
+    """Bind enabled tasks whose command matches a pipeline stage to that stage, returning the task ids it now owns."""
+    tasks_db_path = get_tasks_db_path()
+    tasks_by_command = {}
+    for task in get_all_tasks(tasks_db_path):
+        tasks_by_command.setdefault(task["command"].strip(), task)
+    owned = set()
+    for stage in pipeline.stages.values():
+        task = tasks_by_command.get(stage.command)
+        stage.enabled = task is not None
+        stage.task_id = task["id"] if task else None
+        stage.interval = frequency_to_seconds(task["frequency"], task["frequency_unit"]) if task else None
+        if task:
+            owned.add(task["id"])
+    return owned
+
+
+def create_pipeline(max_workers=MAX_WORKERS):
+    pipeline = PipelineScheduler(
+        build_default_stages(),
+        max_workers=max_workers,
+        start_execution=lambda stage: start_task_execution(stage.task_id),
+        finish_execution=lambda stage, execution_id, status, error_message, output: finish_task_execution(
+            stage.task_id, execution_id, "failed" if status == "failed" else "success", error_message, output
+        ),
+    )
+    configure_pipeline(pipeline)
+    return pipeline
+
+
 def check_for_tasks():
     tasks_db_path = get_tasks_db_path()
     try:
         print("DEBUG: Checking for pending tasks...")
         pending_tasks = get_pending_tasks(tasks_db_path)
+        if pipeline is not None:
+            owned = configure_pipeline(pipeline)
+            pending_tasks = [task for task in pending_tasks if task["id"] not in owned]
         if not pending_tasks:
             print("DEBUG: No pending tasks found")
             return
@@ -169,12 +245,20 @@ def signal_handler(sig, frame):
 
 
 def main():
-    global running
+    global running, pipeline
+    parser = argparse.ArgumentParser(description="Run scheduled beifong tasks")
+    parser.add_argument("--legacy", action="store_true", help="Run every task as a subprocess on its fixed interval (no pipeline DAG)")
+    args = parser.parse_args()
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     print("INFO: Starting task scheduler")
     tasks_db_path = get_tasks_db_path()
     cleanup_stuck_tasks()
+    if not args.legacy:
+        pipeline = create_pipeline()
+        pipeline.start()
+        enabled = [stage.name for stage in pipeline.stages.values() if stage.enabled]
+        print(f"INFO: Pipeline stages running in-process: {', '.join(enabled) if enabled else 'none'}")
     scheduler_dir = os.path.dirname(tasks_db_path)
     os.makedirs(scheduler_dir, exist_ok=True)
     scheduler_db_path = os.path.join(scheduler_dir, "scheduler.sqlite")
@@ -198,6 +282,8 @@ def main():
         print("INFO: Scheduler interrupted")
     finally:
         scheduler.shutdown()
+        if pipeline is not None:
+            pipeline.stop()
         print("INFO: Scheduler shutdown complete")
 
 
@@ -2,6 +2,7 @@ from typing import List, Optional, Dict, Any
 from fastapi import HTTPException
 import json
 from services.db_service import tracking_db, sources_db
+from db.fts import to_fts_query
 from models.article_schemas import Article, PaginatedArticles
 
 
@@ -52,10 +53,10 @@ class ArticleService:
             if date_to:
                 query_parts.append("AND datetime(ca.published_date) <= datetime(?)")
                 query_params.append(date_to)
-            if search:
-                query_parts.append("AND (ca.title LIKE ? OR ca.summary LIKE ?)")
-                search_param = f"%{search}%"
-                query_params.extend([search_param, search_param])
+            fts_query = to_fts_query(search, columns=["title", "summary"]) if search else None
+            if fts_query:
+                query_parts.append("AND ca.id IN (SELECT rowid FROM crawled_articles_fts WHERE crawled_articles_fts MATCH ?)")
+                query_params.append(fts_query)
             count_query = " ".join(query_parts).replace(
                 "SELECT ca.id, ca.title, ca.url, ca.published_date, ca.summary, ca.feed_id",
                 "SELECT COUNT(*)",
@@ -11,9 +11,12 @@ from db.agent_config_v2 import PODCAST_DIR, PODCAST_AUIDO_DIR, PODCAST_IMG_DIR,
 from services.celery_tasks import agent_chat
 from dotenv import load_dotenv
 from services.internal_session_service import SessionService
+from services.task_events import TaskCompletionListener
 
 load_dotenv()
 
+MAX_STATUS_WAIT_SEC = 25
+
 
 class PodcastAgentService:
     def __init__(self):
@@ -27,6 +30,7 @@ class PodcastAgentService:
         self.redis_db = int(os.environ.get("REDIS_DB", 0))
         self.redis_pool = ConnectionPool.from_url(f"redis://{self.redis_host}:{self.redis_port}/{self.redis_db + 1}", max_connections=10)
         self.redis = Redis(connection_pool=self.redis_pool)
+        self.completion_listener = TaskCompletionListener(self.redis)
 
     async def get_active_task(self, session_id):
         try:
@@ -124,7 +128,16 @@ class PodcastAgentService:
             task_id = getattr(request, "task_id", None)
             if task_id:
                 task = agent_chat.AsyncResult(task_id)
-                if task.state == "PENDING" or task.state == "STARTED":
+                state, result = task.state, None
+                wait = min(float(getattr(request, "wait", None) or 0), MAX_STATUS_WAIT_SEC)
+                if wait > 0 and state in ("PENDING", "STARTED"):
+                    event = await self.wait_for_completion(request.session_id, task_id, wait)
+                    if event:
+                        state, result = event["state"], event["result"]
+                    browser_recording_path = self._browser_recording(request.session_id)
+                if result is None and state not in ("PENDING", "STARTED"):
+                    result = task.result
+                if state == "PENDING" or state == "STARTED":
                     return {
                         "session_id": request.session_id,
                         "response": "Your request is still being processed.",
@@ -135,8 +148,7 @@ class PodcastAgentService:
                         "task_id": task_id,
                         "browser_recording_path": browser_recording_path,
                     }
-                elif task.state == "SUCCESS":
-                    result = task.result
+                elif state == "SUCCESS":
                     if result and isinstance(result, dict):
                         if result.get("session_id") != request.session_id:
                             return {
@@ -149,7 +161,7 @@ class PodcastAgentService:
                             }
                         return result
                 else:
-                    error_info = str(task.result) if task.result else f"Task failed with state: {task.state}"
+                    error_info = str(result) if result else f"Task failed with state: {state}"
                     return {
                         "session_id": request.session_id,
                         "response": f"Error processing request: {error_info}",
@@ -173,6 +185,13 @@ class PodcastAgentService:
                 },
             )
 
+    async def wait_for_completion(self, session_id, task_id, timeout):
+        try:
+            return await self.completion_listener.wait_for(session_id, task_id, timeout)
+        except Exception as e:
+            print(f"Error waiting for task completion: {e}")
+            return None
+
     async def get_session_state(self, session_id):
         try:
             db_path = get_agent_session_db_path()
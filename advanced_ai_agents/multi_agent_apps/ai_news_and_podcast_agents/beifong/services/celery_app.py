@@ -4,6 +4,7 @@ import os
 import time
 import json
 from dotenv import load_dotenv
+from services.task_events import publish_task_completion
 
 
 load_dotenv()
@@ -52,8 +53,9 @@ class SessionLockedTask(Task):
             lock_data = {"timestamp": time.time(), "task_id": self.request.id if hasattr(self, "request") else None}
             redis_client.set(f"lock_info:{session_id}", json.dumps(lock_data), ex=REDIS_LOCK_INFO_EXP_TIME_SEC)
 
+        task_id = self.request.id if hasattr(self, "request") else None
         if not acquired:
-            return {
+            result = {
                 "error": "Session busy",
                 "response": "This session is already processing a message. Please wait.",
                 "session_id": session_id,
@@ -62,9 +64,24 @@ class SessionLockedTask(Task):
                 "is_processing": True,
                 "process_type": "chat",
             }
+            self.announce_completion(session_id, task_id, result)
+            return result
 
+        result, state = None, "FAILURE"
         try:
-            return super().__call__(*args, **kwargs)
+            result = super().__call__(*args, **kwargs)
+            state = "SUCCESS"
+            return result
+        except Exception as e:
+            result = str(e)
+            raise
         finally:
             redis_client.delete(lock_key)
             redis_client.delete(f"lock_info:{session_id}")
+            self.announce_completion(session_id, task_id, result, state)
+
+    def announce_completion(self, session_id, task_id, result, state="SUCCESS"):
+        try:
+            publish_task_completion(redis_client, session_id, task_id, result, state)
+        except Exception as e:
+            print(f"Error publishing task completion: {e}")
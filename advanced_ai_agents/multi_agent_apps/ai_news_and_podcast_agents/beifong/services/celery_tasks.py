@@ -5,6 +5,7 @@ import os
 from dotenv import load_dotenv
 from services.celery_app import app, SessionLockedTask
 from db.config import get_agent_session_db_path
+from db.session_store import dumps
 from db.agent_config_v2 import (
     AGENT_DESCRIPTION,
     AGENT_INSTRUCTIONS,
@@ -19,7 +20,6 @@ from tools.user_source_selection import user_source_selection_run
 from tools.session_state_manager import update_language, update_chat_title, mark_session_finished
 from agents.image_generate_agent import image_generation_agent_run
 from agents.audio_generate_agent import audio_generate_agent_run
-import json
 
 load_dotenv()
 
@@ -69,7 +69,7 @@ def agent_chat(self, session_id, message):
             "session_id": session_id,
             "response": response.content,
             "stage": _agent.session_state.get("stage", "unknown"),
-            "session_state": json.dumps(session_state),
+            "session_state": dumps(session_state),
             "is_processing": False,
             "process_type": None,
         }
@@ -5,6 +5,9 @@ import time
 from contextlib import contextmanager
 from concurrent.futures import ThreadPoolExecutor
 from services.db_service import get_db_path
+from db.fts import ensure_articles_fts, ensure_posts_fts
+from db.session_store import ensure_delta_schema
+from db.rollups import ensure_post_rollups
 
 
 @contextmanager
@@ -148,9 +151,22 @@ def init_tracking_db():
             embedding_model TEXT NOT NULL,
             created_at TEXT NOT NULL,
             in_faiss_index INTEGER DEFAULT 0,
+            content_hash TEXT,
             FOREIGN KEY (article_id) REFERENCES crawled_articles(id)
         )
         """)
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS article_analysis_cache (
+            content_hash TEXT NOT NULL,
+            model TEXT NOT NULL,
+            result TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            PRIMARY KEY (content_hash, model)
+        )
+        """)
+        cursor.execute("PRAGMA table_info(article_embeddings)")
+        if "content_hash" not in [col[1] for col in cursor.fetchall()]:
+            cursor.execute("ALTER TABLE article_embeddings ADD COLUMN content_hash TEXT")
         indexes = [
             "CREATE INDEX IF NOT EXISTS idx_feed_entries_feed_id ON feed_entries(feed_id)",
             "CREATE INDEX IF NOT EXISTS idx_feed_entries_link ON feed_entries(link)",
@@ -164,9 +180,12 @@ def init_tracking_db():
             "CREATE INDEX IF NOT EXISTS idx_article_embeddings_article_id ON article_embeddings(article_id)",
             "CREATE INDEX IF NOT EXISTS idx_article_embeddings_in_faiss ON article_embeddings(in_faiss_index)",
             "CREATE INDEX IF NOT EXISTS idx_crawled_articles_embedding_status ON crawled_articles(embedding_status)",
+            "CREATE INDEX IF NOT EXISTS idx_article_embeddings_content_hash ON article_embeddings(content_hash, embedding_model)",
         ]
         for index_sql in indexes:
             cursor.execute(index_sql)
+        if ensure_articles_fts(cursor):
+            print("Built full-text index for crawled articles")
         conn.commit()
     elapsed = time.time() - start_time
     print(f"Tracking database initialized in {elapsed:.3f}s")
@@ -292,6 +311,7 @@ def init_internal_sessions_db():
         )
         """)
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_session_state_session_id ON session_state(session_id)")
+        ensure_delta_schema(conn, "session_state")
         conn.commit()
     elapsed = time.time() - start_time
     print(f"Internal sessions database initialized in {elapsed:.3f}s")
@@ -339,6 +359,10 @@ def init_social_media_db():
         ]
         for index_sql in indexes:
             cursor.execute(index_sql)
+        if ensure_posts_fts(cursor):
+            print("Built full-text index for social media posts")
+        if ensure_post_rollups(cursor):
+            print("Built daily analytics rollups for social media posts")
         conn.commit()
     elapsed = time.time() - start_time
     print(f"Social media database initialized in {elapsed:.3f}s")
@@ -1,22 +1,8 @@
 import os
 from typing import Dict, List, Any, Tuple, Union
 from fastapi import HTTPException
-from contextlib import contextmanager
-import sqlite3
 from db.config import get_db_path
-
-
-@contextmanager
-def db_connection(db_path: str):
-    """Context manager for database connections."""
-    if not os.path.exists(db_path):
-        raise HTTPException(status_code=404, detail=f"Database {db_path} not found. Initialize the database first.")
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    try:
-        yield conn
-    finally:
-        conn.close()
+from db.async_connection import async_execute_query, async_execute_many
 
 
 class DatabaseService:
@@ -36,18 +22,8 @@ class DatabaseService:
     ) -> Union[List[Dict[str, Any]], Dict[str, Any], int]:
         """Execute a query with error handling for FastAPI."""
         try:
-            with db_connection(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-
-                if fetch_one:
-                    result = cursor.fetchone()
-                    return dict(result) if result else None
-                elif fetch:
-                    return [dict(row) for row in cursor.fetchall()]
-                else:
-                    conn.commit()
-                    return cursor.lastrowid
+            self._check_exists()
+            return await async_execute_query(self.db_path, query, params, fetch=fetch, fetch_one=fetch_one)
         except Exception as e:
             if isinstance(e, HTTPException):
                 raise e
@@ -56,16 +32,17 @@ class DatabaseService:
     async def execute_write_many(self, query: str, params_list: List[Tuple]) -> int:
         """Execute multiple write operations in a single transaction."""
         try:
-            with db_connection(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.executemany(query, params_list)
-                conn.commit()
-                return cursor.rowcount
+            self._check_exists()
+            return await async_execute_many(self.db_path, query, params_list)
         except Exception as e:
             if isinstance(e, HTTPException):
                 raise e
             raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
+    def _check_exists(self):
+        """Raise a 404 if the database file has not been initialized."""
+        if not os.path.exists(self.db_path):
+            raise HTTPException(status_code=404, detail=f"Database {self.db_path} not found. Initialize the database first.")
 
 
 sources_db = DatabaseService(db_name="sources_db")
@@ -0,0 +1,98 @@
+import os
+import threading
+import time
+from typing import List, Optional, Tuple
+import numpy as np
+import faiss
+from db.config import get_faiss_db_path
+
+
+class FaissIndexService:
+    """Long-lived, memory-mapped FAISS index that hot-reloads when the indexer swaps files."""
+
+    def __init__(self, index_path: Optional[str] = None, mapping_path: Optional[str] = None, check_interval: float = 2.0):
+        default_index_path, default_mapping_path = get_faiss_db_path()
+        self.index_path = index_path or default_index_path
+        self.mapping_path = mapping_path or default_mapping_path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._state = None
+        self._signature = None
+        self._last_check = 0.0
+
+    def _file_signature(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(self.index_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _read_index(self):
+        try:
+            return faiss.read_index(self.index_path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+        except RuntimeError:
+            return faiss.read_index(self.index_path)
+
+    def _load(self, signature: Tuple[int, int, int]) -> None:
+        index = self._read_index()
+        id_map = None
+        if not isinstance(index, (faiss.IndexIDMap, faiss.IndexIDMap2)):
+            if not os.path.exists(self.mapping_path):
+                raise FileNotFoundError(f"ID mapping not found at {self.mapping_path}")
+            id_map = np.load(self.mapping_path, mmap_mode="r")
+        self._state = (index, id_map)
+        self._signature = signature
+        print(f"Loaded FAISS index from {self.index_path} with {index.ntotal} vectors")
+
+    def is_available(self) -> bool:
+        return self._file_signature() is not None
+
+    def _current(self):
+        now = time.monotonic()
+        if self._state is not None and now - self._last_check < self.check_interval:
+            return self._state
+        with self._lock:
+            self._last_check = now
+            signature = self._file_signature()
+            if signature is None:
+                if self._state is None:
+                    raise FileNotFoundError(f"FAISS index not found at {self.index_path}")
+                return self._state
+            if signature != self._signature:
+                self._load(signature)
+            return self._state
+
+    def get_index(self):
+        """Return the current index, reloading it if the file on disk was replaced."""
+        return self._current()[0]
+
+    def search(self, query_vector: np.ndarray, top_k: int = 20, nprobe: Optional[int] = None, ef: Optional[int] = None) -> List[Tuple[int, float]]:
+        """Search the index and return (article_id, distance) pairs ordered by distance."""
+        index, id_map = self._current()
+        if nprobe is not None or ef is not None:
+            params = faiss.ParameterSpace()
+            if nprobe is not None:
+                try:
+                    params.set_index_parameter(index, "nprobe", nprobe)
+                except RuntimeError:
+                    pass
+            if ef is not None:
+                try:
+                    params.set_index_parameter(index, "efSearch", ef)
+                except RuntimeError:
+                    pass
+        query = np.ascontiguousarray(query_vector, dtype=np.float32).reshape(1, -1)
+        distances, labels = index.search(query, top_k)
+        results = []
+        for distance, label in zip(distances[0], labels[0]):
+            if label < 0:
+                continue
+            if id_map is not None:
+                if label >= len(id_map):
+                    continue
+                label = id_map[label]
+            results.append((int(label), float(distance)))
+        return results
+
+
+faiss_index_service = FaissIndexService()
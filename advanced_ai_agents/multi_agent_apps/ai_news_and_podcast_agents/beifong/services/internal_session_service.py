@@ -1,10 +1,10 @@
 from typing import Optional, Dict, Any
 from fastapi import HTTPException
-import json
-from datetime import datetime
+import sqlite3
+import threading
 from db.config import get_db_path
 from db.agent_config_v2 import INITIAL_SESSION_STATE
-import sqlite3
+from db.session_store import SessionStateStore
 from contextlib import contextmanager
 
 
@@ -20,30 +20,28 @@ def get_db_connection(db_name: str):
         conn.close()
 
 
+_session_store = None
+_session_store_lock = threading.Lock()
+
+
+def get_session_store() -> SessionStateStore:
+    global _session_store
+    with _session_store_lock:
+        if _session_store is None:
+            _session_store = SessionStateStore(get_db_path("internal_sessions_db"))
+        return _session_store
+
+
 class SessionService:
     """Service for managing internal session operations."""
 
     @staticmethod
     def get_session(session_id: str) -> Dict[str, Any]:
         try:
-            with get_db_connection("internal_sessions_db") as conn:
-                cursor = conn.cursor()
-                query = """
-                SELECT session_id, state, created_at
-                FROM session_state
-                WHERE session_id = ?
-                """
-                cursor.execute(query, (session_id,))
-                session = cursor.fetchone()
-                if not session:
-                    return SessionService._initialize_session(session_id)
-                session_dict = dict(session)
-                if session_dict.get("state"):
-                    try:
-                        session_dict["state"] = json.loads(session_dict["state"])
-                    except json.JSONDecodeError:
-                        session_dict["state"] = {}
-                return session_dict
+            session = get_session_store().get(session_id)
+            if not session:
+                return SessionService._initialize_session(session_id)
+            return session
         except Exception as e:
             if isinstance(e, HTTPException):
                 raise e
@@ -52,38 +50,16 @@ class SessionService:
     @staticmethod
     def _initialize_session(session_id: str) -> Dict[str, Any]:
         try:
-            with get_db_connection("internal_sessions_db") as conn:
-                cursor = conn.cursor()
-                state_json = json.dumps(INITIAL_SESSION_STATE)
-                insert_query = """
-                INSERT INTO session_state (session_id, state, created_at)
-                VALUES (?, ?, ?)
-                """
-                current_time = datetime.now().isoformat()
-                cursor.execute(insert_query, (session_id, state_json, current_time))
-                conn.commit()
-                return {"session_id": session_id, "state": INITIAL_SESSION_STATE, "created_at": current_time}
+            store = get_session_store()
+            store.save(session_id, INITIAL_SESSION_STATE)
+            return store.get(session_id)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error initializing session: {str(e)}")
 
     @staticmethod
     def save_session(session_id: str, state: Dict[str, Any]) -> Dict[str, Any]:
         try:
-            state_json = json.dumps(state)
-            with get_db_connection("internal_sessions_db") as conn:
-                cursor = conn.cursor()
-                conn.execute("BEGIN IMMEDIATE")
-                existing_query = "SELECT session_id FROM session_state WHERE session_id = ?"
-                cursor.execute(existing_query, (session_id,))
-                existing_session = cursor.fetchone()
-                if existing_session:
-                    update_query = "UPDATE session_state SET state = ? WHERE session_id = ?"
-                    cursor.execute(update_query, (state_json, session_id))
-                else:
-                    insert_query = "INSERT INTO session_state (session_id, state, created_at) VALUES (?, ?, ?)"
-                    current_time = datetime.now().isoformat()
-                    cursor.execute(insert_query, (session_id, state_json, current_time))
-                conn.commit()
+            get_session_store().save(session_id, state)
             return SessionService.get_session(session_id)
         except Exception as e:
             if isinstance(e, HTTPException):
@@ -93,17 +69,9 @@ class SessionService:
     @staticmethod
     def delete_session(session_id: str) -> Dict[str, str]:
         try:
-            with get_db_connection("internal_sessions_db") as conn:
-                cursor = conn.cursor()
-                existing_query = "SELECT session_id FROM session_state WHERE session_id = ?"
-                cursor.execute(existing_query, (session_id,))
-                existing_session = cursor.fetchone()
-                if not existing_session:
-                    raise HTTPException(status_code=404, detail="Session not found")
-                delete_query = "DELETE FROM session_state WHERE session_id = ?"
-                cursor.execute(delete_query, (session_id,))
-                conn.commit()
-                return {"message": f"Session with ID {session_id} successfully deleted"}
+            if not get_session_store().delete(session_id):
+                raise HTTPException(status_code=404, detail="Session not found")
+            return {"message": f"Session with ID {session_id} successfully deleted"}
         except Exception as e:
             if isinstance(e, HTTPException):
                 raise e
@@ -2,6 +2,8 @@ import json
 from typing import List, Optional, Dict, Any
 from fastapi import HTTPException
 from services.db_service import social_media_db
+from db.fts import to_fts_query
+from db.rollups import rollup_date_filter, sentiment_breakdown, sentiment_sums
 from models.social_media_schemas import PaginatedPosts, Post
 from datetime import datetime, timedelta
 
@@ -47,10 +49,10 @@ class SocialMediaService:
             if date_to:
                 query_parts.append("AND datetime(post_timestamp) <= datetime(?)")
                 query_params.append(date_to)
-            if search:
-                query_parts.append("AND (post_text LIKE ? OR user_display_name LIKE ? OR user_handle LIKE ?)")
-                search_param = f"%{search}%"
-                query_params.extend([search_param, search_param, search_param])
+            fts_query = to_fts_query(search) if search else None
+            if fts_query:
+                query_parts.append("AND rowid IN (SELECT rowid FROM posts_fts WHERE posts_fts MATCH ?)")
+                query_params.append(fts_query)
             count_query = " ".join(query_parts).replace("SELECT *", "SELECT COUNT(*)")
             total_posts = await social_media_db.execute_query(count_query, tuple(query_params), fetch=True, fetch_one=True)
             total_count = total_posts.get("COUNT(*)", 0) if total_posts else 0
@@ -147,23 +149,14 @@ class SocialMediaService:
     async def get_sentiments(self, date_from: Optional[str] = None, date_to: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get sentiment distribution with post counts."""
         try:
-            query_parts = [
-                """
-                SELECT 
-                    sentiment, COUNT(*) as post_count 
-                FROM posts 
-                WHERE sentiment IS NOT NULL
-                """
-            ]
             params = []
-            if date_from:
-                query_parts.append("AND datetime(post_timestamp) >= datetime(?)")
-                params.append(date_from)
-            if date_to:
-                query_parts.append("AND datetime(post_timestamp) <= datetime(?)")
-                params.append(date_to)
-            query_parts.append("GROUP BY sentiment ORDER BY post_count DESC")
-            query = " ".join(query_parts)
+            date_filter = rollup_date_filter(date_from, date_to, params)
+            query = f"""
+                SELECT sentiment, SUM(post_count) as post_count
+                FROM post_daily_stats
+                WHERE sentiment <> '' {date_filter}
+                GROUP BY sentiment HAVING post_count > 0 ORDER BY post_count DESC
+            """
             return await social_media_db.execute_query(query, tuple(params), fetch=True)
         except Exception as e:
             if isinstance(e, HTTPException):
@@ -178,18 +171,17 @@ class SocialMediaService:
         date_to: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Get top users by post count."""
-        query_parts = ["SELECT user_handle, user_display_name, COUNT(*) as post_count", "FROM posts", "WHERE user_handle IS NOT NULL"]
+        query_parts = [
+            "SELECT user_handle, MAX(user_display_name) as user_display_name, SUM(post_count) as post_count",
+            "FROM post_user_daily",
+            "WHERE 1=1",
+        ]
         params = []
         if platform:
             query_parts.append("AND platform = ?")
             params.append(platform)
-        if date_from:
-            query_parts.append("AND datetime(post_timestamp) >= datetime(?)")
-            params.append(date_from)
-        if date_to:
-            query_parts.append("AND datetime(post_timestamp) <= datetime(?)")
-            params.append(date_to)
-        query_parts.extend(["GROUP BY user_handle", "ORDER BY post_count DESC", "LIMIT ?"])
+        query_parts.append(rollup_date_filter(date_from, date_to, params))
+        query_parts.extend(["GROUP BY user_handle", "HAVING post_count > 0", "ORDER BY post_count DESC", "LIMIT ?"])
         params.append(limit)
         query = " ".join(query_parts)
         return await social_media_db.execute_query(query, tuple(params), fetch=True)
@@ -197,29 +189,15 @@ class SocialMediaService:
     async def get_categories(self, date_from: Optional[str] = None, date_to: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get all categories with post counts."""
         try:
-            query_parts = ["SELECT categories FROM posts WHERE categories IS NOT NULL"]
             params = []
-            if date_from:
-                query_parts.append("AND datetime(post_timestamp) >= datetime(?)")
-                params.append(date_from)
-            if date_to:
-                query_parts.append("AND datetime(post_timestamp) <= datetime(?)")
-                params.append(date_to) 
-            query = " ".join(query_parts)
-            result = await social_media_db.execute_query(query, tuple(params), fetch=True)
-            category_counts = {}
-            for row in result:
-                if row.get("categories"):
-                    try:
-                        categories = json.loads(row["categories"])
-                        for category in categories:
-                            if category in category_counts:
-                                category_counts[category] += 1
-                            else:
-                                category_counts[category] = 1
-                    except json.JSONDecodeError:
-                        pass
-            return [{"category": category, "post_count": count} for category, count in sorted(category_counts.items(), key=lambda x: x[1], reverse=True)]
+            date_filter = rollup_date_filter(date_from, date_to, params)
+            query = f"""
+                SELECT category, SUM(post_count) as post_count
+                FROM post_category_daily
+                WHERE 1=1 {date_filter}
+                GROUP BY category HAVING post_count > 0 ORDER BY post_count DESC
+            """
+            return await social_media_db.execute_query(query, tuple(params), fetch=True)
         except Exception as e:
             if isinstance(e, HTTPException):
                 raise e
@@ -235,30 +213,22 @@ class SocialMediaService:
         """Get users with their sentiment breakdown."""
         try:
             query_parts = [
-                """
+                f"""
                 SELECT 
                     user_handle, 
-                    user_display_name,
-                    COUNT(*) as total_posts,
-                    SUM(CASE WHEN sentiment = 'positive' THEN 1 ELSE 0 END) as positive_count,
-                    SUM(CASE WHEN sentiment = 'negative' THEN 1 ELSE 0 END) as negative_count,
-                    SUM(CASE WHEN sentiment = 'neutral' THEN 1 ELSE 0 END) as neutral_count,
-                    SUM(CASE WHEN sentiment = 'critical' THEN 1 ELSE 0 END) as critical_count
-                FROM posts
-                WHERE user_handle IS NOT NULL
+                    MAX(user_display_name) as user_display_name,
+                    SUM(post_count) as total_posts,
+                    {sentiment_sums()}
+                FROM post_user_daily
+                WHERE 1=1
                 """
             ]
             params = []
             if platform:
                 query_parts.append("AND platform = ?")
                 params.append(platform)
-            if date_from:
-                query_parts.append("AND datetime(post_timestamp) >= datetime(?)")
-                params.append(date_from)
-            if date_to:
-                query_parts.append("AND datetime(post_timestamp) <= datetime(?)")
-                params.append(date_to)
-            query_parts.extend(["GROUP BY user_handle, user_display_name", "ORDER BY total_posts DESC", "LIMIT ?"])
+            query_parts.append(rollup_date_filter(date_from, date_to, params))
+            query_parts.extend(["GROUP BY user_handle", "HAVING total_posts > 0", "ORDER BY total_posts DESC", "LIMIT ?"])
             params.append(limit)
             query = " ".join(query_parts)
             result = await social_media_db.execute_query(query, tuple(params), fetch=True)
@@ -277,42 +247,19 @@ class SocialMediaService:
     async def get_category_sentiment(self, date_from: Optional[str] = None, date_to: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get sentiment distribution by category."""
         try:
-            date_filter = ""
             params = []
-            if date_from or date_to:
-                date_filter = "WHERE "
-                if date_from:
-                    date_filter += "datetime(p.post_timestamp) >= datetime(?)"
-                    params.append(date_from)
-                    if date_to:
-                        date_filter += " AND "
-                if date_to:
-                    date_filter += "datetime(p.post_timestamp) <= datetime(?)"
-                    params.append(date_to)
+            date_filter = rollup_date_filter(date_from, date_to, params)
             query = f"""
-            WITH category_data AS (
-                SELECT 
-                    json_each.value as category,
-                    sentiment,
-                    COUNT(*) as count
-                FROM 
-                    posts p,
-                    json_each(p.categories)
-                {date_filter}
-                GROUP BY 
-                    json_each.value, sentiment
-            )
             SELECT 
                 category,
-                SUM(count) as total_count,
-                SUM(CASE WHEN sentiment = 'positive' THEN count ELSE 0 END) as positive_count,
-                SUM(CASE WHEN sentiment = 'negative' THEN count ELSE 0 END) as negative_count,
-                SUM(CASE WHEN sentiment = 'neutral' THEN count ELSE 0 END) as neutral_count,
-                SUM(CASE WHEN sentiment = 'critical' THEN count ELSE 0 END) as critical_count
+                SUM(post_count) as total_count,
+                {sentiment_sums()}
             FROM 
-                category_data
+                post_category_daily
+            WHERE 1=1 {date_filter}
             GROUP BY 
                 category
+            HAVING total_count > 0
             ORDER BY 
                 total_count DESC
             """
@@ -337,49 +284,24 @@ class SocialMediaService:
     ) -> List[Dict[str, Any]]:
         """Get trending topics with sentiment breakdown."""
         try:
-            query_parts = [
-                """
-                WITH topic_data AS (
-                    SELECT 
-                        json_each.value as topic,
-                        sentiment,
-                        COUNT(*) as count
-                    FROM 
-                        posts,
-                        json_each(posts.tags)
-                    WHERE tags IS NOT NULL
-                """
-            ]
             params = []
-            if date_from:
-                query_parts.append("AND datetime(post_timestamp) >= datetime(?)")
-                params.append(date_from)
-            if date_to:
-                query_parts.append("AND datetime(post_timestamp) <= datetime(?)")
-                params.append(date_to)  
-            query_parts.append(
-                """
-                GROUP BY 
-                    json_each.value, sentiment
-                )
+            date_filter = rollup_date_filter(date_from, date_to, params)
+            query = f"""
                 SELECT 
-                    topic,
-                    SUM(count) as total_count,
-                    SUM(CASE WHEN sentiment = 'positive' THEN count ELSE 0 END) as positive_count,
-                    SUM(CASE WHEN sentiment = 'negative' THEN count ELSE 0 END) as negative_count,
-                    SUM(CASE WHEN sentiment = 'neutral' THEN count ELSE 0 END) as neutral_count,
-                    SUM(CASE WHEN sentiment = 'critical' THEN count ELSE 0 END) as critical_count
+                    tag as topic,
+                    SUM(post_count) as total_count,
+                    {sentiment_sums()}
                 FROM 
-                    topic_data
+                    post_tag_daily
+                WHERE 1=1 {date_filter}
                 GROUP BY 
-                    topic
+                    tag
+                HAVING total_count > 0
                 ORDER BY 
                     total_count DESC
                 LIMIT ?
-                """
-            )
+            """
             params.append(limit)
-            query = " ".join(query_parts)
             result = await social_media_db.execute_query(query, tuple(params), fetch=True)
             for topic in result:
                 total = topic["total_count"]
@@ -401,54 +323,44 @@ class SocialMediaService:
     ) -> List[Dict[str, Any]]:
         """Get sentiment trends over time."""
         try:
-            date_range_query = ""
             if date_from and date_to:
-                date_range_query = f"""
-                WITH RECURSIVE date_range(date) AS (
-                    SELECT date('{date_from}')
-                    UNION ALL
-                    SELECT date(date, '+1 day')
-                    FROM date_range
-                    WHERE date < date('{date_to}')
-                )
-                SELECT date as post_date FROM date_range
-                """
+                params = [date_from, date_to]
             else:
-                days_ago = (datetime.now() - timedelta(days=30)).isoformat()
-                date_range_query = f"""
-                WITH RECURSIVE date_range(date) AS (
-                    SELECT date('{days_ago}')
+                params = [(datetime.now() - timedelta(days=30)).isoformat(), "now"]
+            platform_filter = ""
+            if platform:
+                platform_filter = "AND platform = ?"
+                params.append(platform)
+            query = f"""
+                WITH RECURSIVE dates(post_date, end_date) AS (
+                    SELECT date(?), date(?)
                     UNION ALL
-                    SELECT date(date, '+1 day')
-                    FROM date_range
-                    WHERE date < date('now')
-                )
-                SELECT date as post_date FROM date_range
-                """
-            query_parts = [
-                f"""
-                WITH dates AS (
-                    {date_range_query}
+                    SELECT date(post_date, '+1 day'), end_date
+                    FROM dates
+                    WHERE post_date < end_date
+                ),
+                daily AS (
+                    SELECT
+                        day,
+                        {sentiment_breakdown()},
+                        SUM(post_count) as total_count
+                    FROM post_daily_stats
+                    WHERE day >= (SELECT MIN(post_date) FROM dates) AND day <= (SELECT MAX(post_date) FROM dates) {platform_filter}
+                    GROUP BY day
                 )
                 SELECT 
                     dates.post_date,
-                    COALESCE(SUM(CASE WHEN sentiment = 'positive' THEN 1 ELSE 0 END), 0) as positive_count,
-                    COALESCE(SUM(CASE WHEN sentiment = 'negative' THEN 1 ELSE 0 END), 0) as negative_count,
-                    COALESCE(SUM(CASE WHEN sentiment = 'neutral' THEN 1 ELSE 0 END), 0) as neutral_count,
-                    COALESCE(SUM(CASE WHEN sentiment = 'critical' THEN 1 ELSE 0 END), 0) as critical_count,
-                    COUNT(posts.post_id) as total_count
+                    COALESCE(daily.positive_count, 0) as positive_count,
+                    COALESCE(daily.negative_count, 0) as negative_count,
+                    COALESCE(daily.neutral_count, 0) as neutral_count,
+                    COALESCE(daily.critical_count, 0) as critical_count,
+                    COALESCE(daily.total_count, 0) as total_count
                 FROM 
                     dates
                 LEFT JOIN 
-                    posts ON date(posts.post_timestamp) = dates.post_date
-                """
-            ]
-            params = []
-            if platform:
-                query_parts.append("AND posts.platform = ?")
-                params.append(platform)
-            query_parts.append("GROUP BY dates.post_date ORDER BY dates.post_date")
-            query = " ".join(query_parts)
+                    daily ON daily.day = dates.post_date
+                ORDER BY dates.post_date
+            """
             result = await social_media_db.execute_query(query, tuple(params), fetch=True)
             for day in result:
                 total = day["total_count"]
@@ -535,40 +447,31 @@ class SocialMediaService:
     ) -> Dict[str, Any]:
         """Get overall engagement statistics."""
         try:
-            query_parts = [
-                """
-                SELECT 
-                    AVG(COALESCE(engagement_reply_count, 0)) as avg_replies,
-                    AVG(COALESCE(engagement_retweet_count, 0)) as avg_retweets,
-                    AVG(COALESCE(engagement_like_count, 0)) as avg_likes,
-                    AVG(COALESCE(engagement_bookmark_count, 0)) as avg_bookmarks,
-                    AVG(COALESCE(engagement_view_count, 0)) as avg_views,
-                    MAX(COALESCE(engagement_reply_count, 0)) as max_replies,
-                    MAX(COALESCE(engagement_retweet_count, 0)) as max_retweets,
-                    MAX(COALESCE(engagement_like_count, 0)) as max_likes,
-                    MAX(COALESCE(engagement_bookmark_count, 0)) as max_bookmarks,
-                    MAX(COALESCE(engagement_view_count, 0)) as max_views,
-                    COUNT(*) as total_posts,
-                    COUNT(DISTINCT user_handle) as unique_authors
-                FROM posts
-                WHERE 1=1
-                """
-            ]
             params = []
-            if date_from:
-                query_parts.append("AND datetime(post_timestamp) >= datetime(?)")
-                params.append(date_from)
-            if date_to:
-                query_parts.append("AND datetime(post_timestamp) <= datetime(?)")
-                params.append(date_to)
-            query = " ".join(query_parts)
-            result = await social_media_db.execute_query(query, tuple(params), fetch=True, fetch_one=True)
+            date_filter = rollup_date_filter(date_from, date_to, params)
+            query = f"""
+                SELECT 
+                    CAST(SUM(replies_sum) AS REAL) / SUM(post_count) as avg_replies,
+                    CAST(SUM(retweets_sum) AS REAL) / SUM(post_count) as avg_retweets,
+                    CAST(SUM(likes_sum) AS REAL) / SUM(post_count) as avg_likes,
+                    CAST(SUM(bookmarks_sum) AS REAL) / SUM(post_count) as avg_bookmarks,
+                    CAST(SUM(views_sum) AS REAL) / SUM(post_count) as avg_views,
+                    MAX(max_replies) as max_replies,
+                    MAX(max_retweets) as max_retweets,
+                    MAX(max_likes) as max_likes,
+                    MAX(max_bookmarks) as max_bookmarks,
+                    MAX(max_views) as max_views,
+                    COALESCE(SUM(post_count), 0) as total_posts,
+                    (SELECT COUNT(DISTINCT user_handle) FROM post_user_daily WHERE post_count > 0 {date_filter}) as unique_authors
+                FROM post_daily_stats
+                WHERE post_count > 0 {date_filter}
+            """
+            result = await social_media_db.execute_query(query, tuple(params + params), fetch=True, fetch_one=True)
             if not result:
                 return {"avg_engagement": 0, "total_posts": 0, "unique_authors": 0}
             result_dict = dict(result)
-            # AVG()/MAX() over zero matching rows return NULL (the inner COALESCE
-            # only guards per-row NULLs, not an empty set), while COUNT(*) is 0 —
-            # so the `if not result` guard above never fires and summing None would
+            # SUM()/MAX() over zero matching rollup rows return NULL, so the
+            # `if not result` guard above never fires and summing None would
             # 500. Coalesce the aggregates to 0 for an empty range.
             for _key in ("avg_replies", "avg_retweets", "avg_likes", "avg_bookmarks", "avg_views",
                          "max_replies", "max_retweets", "max_likes", "max_bookmarks", "max_views"):
@@ -577,27 +480,19 @@ class SocialMediaService:
             result_dict["avg_engagement"] = (
                 result_dict["avg_replies"] + result_dict["avg_retweets"] + result_dict["avg_likes"] + result_dict["avg_bookmarks"]
             )
-            platform_query_parts = [
-                """
-                SELECT 
-                    platform, 
-                    COUNT(*) as post_count
-                FROM posts
-                WHERE 1=1
-                """
-            ]
-            if date_from:
-                platform_query_parts.append("AND datetime(post_timestamp) >= datetime(?)")
-            if date_to:
-                platform_query_parts.append("AND datetime(post_timestamp) <= datetime(?)")
-            platform_query_parts.extend([
-                "GROUP BY platform",
-                "ORDER BY post_count DESC",
-                "LIMIT 10"
-            ])
             platforms = await social_media_db.execute_query(
-                " ".join(platform_query_parts), 
-                tuple(params), 
+                f"""
+                SELECT 
+                    NULLIF(platform, '') as platform, 
+                    SUM(post_count) as post_count
+                FROM post_daily_stats
+                WHERE 1=1 {date_filter}
+                GROUP BY platform
+                HAVING post_count > 0
+                ORDER BY post_count DESC
+                LIMIT 10
+                """,
+                tuple(params),
                 fetch=True
             )
             result_dict["platforms"] = platforms
@@ -0,0 +1,111 @@
+import asyncio
+import json
+import os
+from typing import Dict, Optional
+
+CHANNEL_PREFIX = "task_done:"
+RESULT_KEY_PREFIX = "task_result:"
+RESULT_TTL_SEC = 60 * 5
+
+
+def completion_channel(session_id: str) -> str:
+    return f"{CHANNEL_PREFIX}{session_id}"
+
+
+def result_key(task_id: str) -> str:
+    return f"{RESULT_KEY_PREFIX}{task_id}"
+
+
+def create_async_redis():
+    from redis.asyncio import Redis
+
+    host = os.environ.get("REDIS_HOST", "localhost")
+    port = int(os.environ.get("REDIS_PORT", 6379))
+    db = int(os.environ.get("REDIS_DB", 0))
+    return Redis(host=host, port=port, db=db + 1)
+
+
+def publish_task_completion(redis_client, session_id: str, task_id: Optional[str], result, state: str = "SUCCESS") -> None:
+    """Announce a finished session task. The result is also kept briefly under its task id for subscribers that arrive late."""
+    payload = json.dumps({"session_id": session_id, "task_id": task_id, "state": state, "result": result}, default=str)
+    if task_id:
+        redis_client.set(result_key(task_id), payload, ex=RESULT_TTL_SEC)
+    redis_client.publish(completion_channel(session_id), payload)
+
+
+class TaskCompletionListener:
+    """One pattern subscription per event loop that wakes every coroutine waiting on a session's task."""
+
+    def __init__(self, redis_client=None):
+        self.redis = redis_client
+        self.pubsub = None
+        self.reader = None
+        self.waiters: Dict[str, Dict[asyncio.Future, Optional[str]]] = {}
+        self.start_lock = None
+
+    async def start(self) -> None:
+        if self.reader and not self.reader.done():
+            return
+        if self.start_lock is None:
+            self.start_lock = asyncio.Lock()
+        async with self.start_lock:
+            if self.reader and not self.reader.done():
+                return
+            if self.redis is None:
+                self.redis = create_async_redis()
+            self.pubsub = self.redis.pubsub()
+            await self.pubsub.psubscribe(f"{CHANNEL_PREFIX}*")
+            self.reader = asyncio.create_task(self._read())
+
+    async def _read(self) -> None:
+        try:
+            async for message in self.pubsub.listen():
+                if message.get("type") != "pmessage":
+                    continue
+                try:
+                    self._resolve(json.loads(message["data"]))
+                except (ValueError, TypeError, KeyError) as e:
+                    print(f"Ignoring malformed task completion event: {e}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Task completion subscription lost: {e}")
+            for futures in self.waiters.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def _resolve(self, payload: dict) -> None:
+        for future, task_id in list(self.waiters.get(payload["session_id"], {}).items()):
+            if not future.done() and (task_id is None or task_id == payload.get("task_id")):
+                future.set_result(payload)
+
+    async def wait_for(self, session_id: str, task_id: Optional[str] = None, timeout: float = 30.0) -> Optional[dict]:
+        """Return the completion event for the session (and task, if given), or None when nothing arrives within timeout."""
+        await self.start()
+        future = asyncio.get_running_loop().create_future()
+        self.waiters.setdefault(session_id, {})[future] = task_id
+        try:
+            if task_id:
+                finished = await self.redis.get(result_key(task_id))
+                if finished:
+                    return json.loads(finished)
+            try:
+                return await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                return None
+        finally:
+            waiters = self.waiters.get(session_id, {})
+            waiters.pop(future, None)
+            if not waiters:
+                self.waiters.pop(session_id, None)
+
+    async def close(self) -> None:
+        if self.reader:
+            self.reader.cancel()
+            try:
+                await self.reader
+            except (asyncio.CancelledError, Exception):
+                pass
+        if self.pubsub is not None:
+            await self.pubsub.close()
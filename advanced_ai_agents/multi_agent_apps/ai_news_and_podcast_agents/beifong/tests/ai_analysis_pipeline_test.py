@@ -0,0 +1,145 @@
+import argparse
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class MockLLMHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    latency = 0.5
+    capacity = 8
+    in_flight = 0
+    requests = 0
+    rejected = 0
+    lock = threading.Lock()
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        with self.lock:
+            MockLLMHandler.requests += 1
+            if MockLLMHandler.in_flight >= self.capacity:
+                MockLLMHandler.rejected += 1
+                self._send_json(429, {"error": {"message": "Rate limit reached", "type": "rate_limit_exceeded"}}, {"retry-after": "0.5"})
+                return
+            MockLLMHandler.in_flight += 1
+        try:
+            prompt = payload["messages"][-1]["content"]
+            time.sleep(self.latency + len(prompt) / 200000)
+            analysis = {"categories": ["technology", "ai"], "summary": "A synthetic summary.", "content": "Synthetic content."}
+            ids = re.findall(r"Article ID: (\d+)", prompt)
+            content = {"articles": [dict(analysis, id=int(article_id)) for article_id in ids]} if ids else analysis
+            self._send_json(
+                200,
+                {
+                    "id": "chatcmpl-mock",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": payload["model"],
+                    "choices": [{"index": 0, "message": {"role": "assistant", "content": json.dumps(content)}, "finish_reason": "stop"}],
+                    "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+                },
+            )
+        finally:
+            with self.lock:
+                MockLLMHandler.in_flight -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_mock_llm(latency, capacity):
+    MockLLMHandler.latency = latency
+    MockLLMHandler.capacity = capacity
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockLLMHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+
+def seed_articles(tracking_db_path, count, prefix, long_ratio=0.3):
+    rows = []
+    for i in range(count):
+        paragraphs = 400 if i % 10 < long_ratio * 10 else 20
+        body = "".join(f"<p>Paragraph {p} of article {prefix}-{i}.</p>" for p in range(paragraphs))
+        rows.append((f"{prefix} article {i}", f"http://example.com/{prefix}/{i}", f"<article>{body}</article>", "{}"))
+    with sqlite3.connect(tracking_db_path) as conn:
+        conn.executemany(
+            "INSERT INTO crawled_articles (title, url, raw_content, metadata, published_date) VALUES (?, ?, ?, ?, datetime('now'))",
+            rows,
+        )
+        conn.commit()
+
+
+def requeue(tracking_db_path):
+    with sqlite3.connect(tracking_db_path) as conn:
+        conn.execute("UPDATE crawled_articles SET processed = 0, ai_status = 'pending', ai_attempts = 0")
+        conn.commit()
+
+
+def reset_counters():
+    MockLLMHandler.requests = 0
+    MockLLMHandler.rejected = 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the concurrent AI analysis pipeline against a mock LLM server")
+    parser.add_argument("--articles", type=int, default=200, help="Articles analyzed in concurrent mode")
+    parser.add_argument("--sequential_articles", type=int, default=10, help="Articles analyzed in sequential mode")
+    parser.add_argument("--latency", type=float, default=0.5, help="Mock completion latency in seconds")
+    parser.add_argument("--capacity", type=int, default=8, help="Concurrent requests the mock server accepts before returning 429")
+    parser.add_argument("--concurrency", type=int, default=32, help="Maximum client concurrency")
+    args = parser.parse_args()
+
+    server, base_url = start_mock_llm(args.latency, args.capacity)
+    os.environ["OPENAI_BASE_URL"] = base_url
+    work_dir = tempfile.mkdtemp(prefix="beifong_analysis_bench_")
+    os.environ["TRACKING_DB_PATH"] = os.path.join(work_dir, "feed_tracking.db")
+    from services.db_init import init_tracking_db
+    from processors.ai_analysis_processor import analyze_articles, analyze_articles_concurrent
+
+    tracking_db_path = os.environ["TRACKING_DB_PATH"]
+    init_tracking_db()
+    seed_articles(tracking_db_path, args.sequential_articles, "seq")
+    start = time.time()
+    stats = analyze_articles(tracking_db_path, "sk-fake", batch_size=args.sequential_articles, delay_range=(0, 0))
+    seq_rate = stats["success_count"] / (time.time() - start)
+    print(f"\nSequential: {seq_rate:.2f} articles/s")
+
+    with sqlite3.connect(tracking_db_path) as conn:
+        conn.execute("DELETE FROM crawled_articles")
+        conn.commit()
+    seed_articles(tracking_db_path, args.articles, "con")
+    for label, kwargs in [("concurrent", {}), ("cached rerun", {}), ("packed", {"pack": True})]:
+        if label == "packed":
+            with sqlite3.connect(tracking_db_path) as conn:
+                conn.execute("DELETE FROM article_analysis_cache")
+                conn.commit()
+        requeue(tracking_db_path)
+        reset_counters()
+        start = time.time()
+        stats = analyze_articles_concurrent(tracking_db_path, "sk-fake", batch_size=args.articles, max_concurrency=args.concurrency, **kwargs)
+        elapsed = time.time() - start
+        print(
+            f"{label:<13} {stats['success_count'] / elapsed:7.2f} articles/s  "
+            f"({stats['llm_requests']} LLM requests, {MockLLMHandler.rejected} rejected with 429, {stats['cached_count']} cached)"
+        )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import argparse
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<title>Story {page_id}</title>
+<meta name="description" content="Description of story {page_id}">
+<meta property="og:title" content="Story {page_id}">
+<meta name="twitter:card" content="summary">
+<style>{style}</style>
+<script>{script}</script>
+</head>
+<body>
+<header><nav>{nav}</nav></header>
+<aside>{aside}</aside>
+<article>
+<h1>Story {page_id}</h1>
+{paragraphs}
+</article>
+<footer>{nav}</footer>
+<script>{script}</script>
+</body>
+</html>
+"""
+
+
+def build_page(page_id, paragraphs):
+    nav = "".join(f'<a href="/section/{i}">Section {i}</a>' for i in range(200))
+    return PAGE_TEMPLATE.format(
+        page_id=page_id,
+        style=".x{color:red}" * 2000,
+        script="var tracking = {};" * 3000,
+        nav=nav,
+        aside="<div class='ad'>Advertisement</div>" * 100,
+        paragraphs="\n".join(f"<p>Paragraph {i} of story {page_id} with <b>some</b> useful text.</p>" for i in range(paragraphs)),
+    ).encode()
+
+
+class SiteHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    pages = {}
+    latency = 0.1
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        body = self.pages.get(self.path.rsplit("/", 1)[-1])
+        if body is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fixture_site(num_pages, paragraphs, latency):
+    SiteHandler.pages = {str(i): build_page(i, paragraphs) for i in range(num_pages)}
+    SiteHandler.latency = latency
+    server = ThreadingHTTPServer(("0.0.0.0", 0), SiteHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, server.server_address[1]
+
+
+def seed_entries(tracking_db_path, num_pages, port, num_hosts, prefix):
+    with sqlite3.connect(tracking_db_path) as conn:
+        conn.executemany(
+            "INSERT INTO feed_entries (feed_id, source_id, entry_id, title, link, published_date) VALUES (1, 1, ?, ?, ?, datetime('now'))",
+            [(f"{prefix}-{i}", f"Story {i}", f"http://127.0.0.{1 + i % num_hosts}:{port}/{prefix}/{i}") for i in range(num_pages)],
+        )
+        conn.commit()
+
+
+def stored_bytes(tracking_db_path, prefix):
+    with sqlite3.connect(tracking_db_path) as conn:
+        row = conn.execute("SELECT COUNT(*), SUM(LENGTH(raw_content)) FROM crawled_articles WHERE url LIKE ?", (f"%/{prefix}/%",)).fetchone()
+    return row[0], row[1] or 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the concurrent URL crawler against a local fixture site")
+    parser.add_argument("--pages", type=int, default=400, help="Pages crawled in concurrent mode")
+    parser.add_argument("--sequential_pages", type=int, default=40, help="Pages crawled in sequential mode")
+    parser.add_argument("--paragraphs", type=int, default=60, help="Paragraphs per article")
+    parser.add_argument("--hosts", type=int, default=20, help="Number of distinct loopback hosts")
+    parser.add_argument("--latency", type=float, default=0.1, help="Simulated server latency in seconds")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent requests")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="beifong_crawl_bench_")
+    os.environ["TRACKING_DB_PATH"] = os.path.join(work_dir, "feed_tracking.db")
+    from services.db_init import init_tracking_db
+    from processors.url_processor import crawl_pending_entries, crawl_pending_entries_concurrent
+
+    tracking_db_path = os.environ["TRACKING_DB_PATH"]
+    init_tracking_db()
+    server, port = start_fixture_site(max(args.pages, args.sequential_pages), args.paragraphs, args.latency)
+
+    seed_entries(tracking_db_path, args.sequential_pages, port, args.hosts, "seq")
+    start = time.time()
+    stats = crawl_pending_entries(tracking_db_path, batch_size=args.sequential_pages)
+    seq_elapsed = time.time() - start
+    seq_rate = stats["success_count"] / seq_elapsed
+    seq_count, seq_bytes = stored_bytes(tracking_db_path, "seq")
+
+    seed_entries(tracking_db_path, args.pages, port, args.hosts, "con")
+    start = time.time()
+    stats = crawl_pending_entries_concurrent(tracking_db_path, batch_size=args.pages, concurrency=args.concurrency, per_host_interval=0.0)
+    con_elapsed = time.time() - start
+    con_rate = stats["success_count"] / con_elapsed
+    con_count, con_bytes = stored_bytes(tracking_db_path, "con")
+
+    print(f"\nSequential: {seq_count} pages in {seq_elapsed:.2f}s ({seq_rate:.1f} pages/s), {seq_bytes / max(seq_count, 1) / 1024:.1f} KB stored per article")
+    print(f"Concurrent: {con_count} pages in {con_elapsed:.2f}s ({con_rate:.1f} pages/s), {con_bytes / max(con_count, 1) / 1024:.1f} KB stored per article")
+    print(f"Throughput: {con_rate / seq_rate:.1f}x, storage: {seq_bytes / max(seq_count, 1) / max(con_bytes / max(con_count, 1), 1):.1f}x smaller")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
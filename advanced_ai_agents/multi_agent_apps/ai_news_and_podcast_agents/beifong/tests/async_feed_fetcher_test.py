@@ -0,0 +1,159 @@
+import argparse
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FEED_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+<channel>
+<title>Synthetic feed {feed_id}</title>
+<link>http://example.com/{feed_id}</link>
+<description>Synthetic benchmark feed</description>
+{items}
+</channel>
+</rss>
+"""
+ITEM_TEMPLATE = """<item>
+<title>Feed {feed_id} story {item_id}</title>
+<link>http://example.com/{feed_id}/story/{item_id}</link>
+<guid>feed-{feed_id}-story-{item_id}</guid>
+<pubDate>Mon, 06 Jan 2025 10:{minute:02d}:00 GMT</pubDate>
+<description>Body of story {item_id} from synthetic feed {feed_id}.</description>
+</item>"""
+
+
+def build_feed(feed_id, items_per_feed):
+    items = "\n".join(ITEM_TEMPLATE.format(feed_id=feed_id, item_id=i, minute=i % 60) for i in range(items_per_feed))
+    return FEED_TEMPLATE.format(feed_id=feed_id, items=items).encode()
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    feeds = {}
+    chunked_feeds = set()
+    write_chunk_size = 50_000
+
+    def do_GET(self):
+        feed_id = self.path.rsplit("/", 1)[-1].replace(".xml", "")
+        body = self.feeds.get(feed_id)
+        if body is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", "Mon, 06 Jan 2025 10:00:00 GMT")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if feed_id not in self.chunked_feeds:
+            self.wfile.write(body)
+            return
+        for start in range(0, len(body), self.write_chunk_size):
+            self.wfile.write(body[start:start + self.write_chunk_size])
+            self.wfile.flush()
+            time.sleep(0.01)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fixture_server(num_feeds, items_per_feed):
+    FeedHandler.feeds = {str(i): build_feed(i, items_per_feed) for i in range(num_feeds)}
+    server = ThreadingHTTPServer(("0.0.0.0", 0), FeedHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, server.server_address[1]
+
+
+def check_multi_chunk_feed(port, items):
+    from utils.async_feed_fetcher import fetch_feeds_sync
+
+    FeedHandler.feeds["large"] = build_feed("large", items)
+    FeedHandler.chunked_feeds.add("large")
+    feed = {"id": -1, "feed_url": f"http://127.0.0.1:{port}/feeds/large.xml"}
+    [(_, result)] = fetch_feeds_sync([feed], {}, per_host_interval=0.0)
+    if isinstance(result, Exception):
+        raise result
+    size = len(FeedHandler.feeds["large"])
+    parsed = len(result["parsed_entries"] or [])
+    assert parsed == items, f"multi-chunk feed truncated: {parsed}/{items} entries from {size} bytes"
+    print(f"Multi-chunk feed: {parsed}/{items} entries from {size:,} bytes sent in {FeedHandler.write_chunk_size:,}-byte writes")
+
+
+def seed_sources(sources_db_path, num_feeds, port, num_hosts):
+    with sqlite3.connect(sources_db_path) as conn:
+        conn.execute("INSERT INTO sources (id, name, is_active) VALUES (1, 'Synthetic', 1)")
+        conn.executemany(
+            "INSERT INTO source_feeds (source_id, feed_url, feed_type, is_active) VALUES (1, ?, 'rss', 1)",
+            [(f"http://127.0.0.{1 + i % num_hosts}:{port}/feeds/{i}.xml",) for i in range(num_feeds)],
+        )
+        conn.commit()
+
+
+def run_sequential_sample(sources_db_path, sample_size):
+    from db.feeds import get_active_feeds
+    from utils.rss_feed_parser import get_feed_data
+
+    feeds = get_active_feeds(sources_db_path, limit=sample_size)
+    start = time.time()
+    for feed in feeds:
+        get_feed_data(feed["feed_url"])
+    return (time.time() - start) / max(len(feeds), 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the async feed fetcher against a local fixture server")
+    parser.add_argument("--feeds", type=int, default=3000, help="Number of synthetic feeds")
+    parser.add_argument("--items", type=int, default=20, help="Items per feed")
+    parser.add_argument("--hosts", type=int, default=50, help="Number of distinct loopback hosts")
+    parser.add_argument("--concurrency", type=int, default=100, help="Async worker count")
+    parser.add_argument("--large-items", type=int, default=4000, help="Items in the feed served in many small writes")
+    parser.add_argument("--sample", type=int, default=100, help="Feeds fetched sequentially for the baseline")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="beifong_feed_bench_")
+    os.environ["SOURCES_DB_PATH"] = os.path.join(work_dir, "sources.db")
+    os.environ["TRACKING_DB_PATH"] = os.path.join(work_dir, "feed_tracking.db")
+    from services.db_init import init_sources_db, init_tracking_db
+    from processors.feed_processor import fetch_and_process_feeds_async, print_stats
+
+    init_sources_db()
+    init_tracking_db()
+    server, port = start_fixture_server(args.feeds, args.items)
+    seed_sources(os.environ["SOURCES_DB_PATH"], args.feeds, port, args.hosts)
+    print(f"Serving {args.feeds} feeds on port {port} across {args.hosts} hosts")
+    check_multi_chunk_feed(port, args.large_items)
+
+    per_feed = run_sequential_sample(os.environ["SOURCES_DB_PATH"], args.sample)
+    print(f"\nSequential baseline: {per_feed * 1000:.1f} ms/feed (excluding the 1-2s politeness sleep)")
+    print(f"Projected sequential cycle: {per_feed * args.feeds:.1f}s fetch + {1.5 * args.feeds:.0f}s sleeps")
+
+    for label in ["cold", "warm (conditional GET)"]:
+        start = time.time()
+        stats = fetch_and_process_feeds_async(
+            sources_db_path=os.environ["SOURCES_DB_PATH"],
+            tracking_db_path=os.environ["TRACKING_DB_PATH"],
+            concurrency=args.concurrency,
+            per_host_interval=0.0,
+        )
+        elapsed = time.time() - start
+        print(f"\nAsync {label} cycle: {elapsed:.2f}s ({args.feeds / elapsed:.0f} feeds/s)")
+        print_stats(stats)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import argparse
+import asyncio
+import os
+import sqlite3
+import tempfile
+import time
+from db.connection import execute_query, close_connections
+from db.async_connection import async_execute_query, close_async_pools
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS feed_entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    feed_id INTEGER,
+    title TEXT,
+    link TEXT UNIQUE
+)
+"""
+INSERT_SQL = "INSERT INTO feed_entries (feed_id, title, link) VALUES (?, ?, ?)"
+SELECT_SQL = "SELECT id, feed_id, title, link FROM feed_entries WHERE id = ?"
+
+
+def legacy_execute_query(db_path, query, params=(), fetch=False, fetch_one=False):
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        cursor = conn.cursor()
+        cursor.execute(query, params)
+        if fetch_one:
+            result = cursor.fetchone()
+            return dict(result) if result else None
+        elif fetch:
+            return [dict(row) for row in cursor.fetchall()]
+        else:
+            conn.commit()
+            return cursor.lastrowid
+    finally:
+        conn.close()
+
+
+def create_db(work_dir, name):
+    db_path = os.path.join(work_dir, name)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(SCHEMA)
+    return db_path
+
+
+def bench_sync(label, helper, db_path, rows):
+    start = time.perf_counter()
+    for i in range(rows):
+        helper(db_path, INSERT_SQL, (i % 100, f"title {i}", f"http://example.com/{label}/{i}"))
+    insert_rate = rows / (time.perf_counter() - start)
+    start = time.perf_counter()
+    for i in range(rows):
+        helper(db_path, SELECT_SQL, (i + 1,), fetch=True, fetch_one=True)
+    select_rate = rows / (time.perf_counter() - start)
+    print(f"{label:<8} insert {insert_rate:>9.0f} rows/s   select {select_rate:>9.0f} rows/s")
+    return insert_rate, select_rate
+
+
+async def bench_async(db_path, rows, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(query, params, **kwargs):
+        async with semaphore:
+            return await async_execute_query(db_path, query, params, **kwargs)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run(INSERT_SQL, (i % 100, f"title {i}", f"http://example.com/async/{i}")) for i in range(rows)))
+    insert_rate = rows / (time.perf_counter() - start)
+    start = time.perf_counter()
+    await asyncio.gather(*(run(SELECT_SQL, (i + 1,), fetch=True, fetch_one=True) for i in range(rows)))
+    select_rate = rows / (time.perf_counter() - start)
+    await close_async_pools()
+    print(f"{'async':<8} insert {insert_rate:>9.0f} rows/s   select {select_rate:>9.0f} rows/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmark the pooled SQLite helpers against per-call connections")
+    parser.add_argument("--rows", type=int, default=5000, help="Rows inserted and selected per helper")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent async queries")
+    args = parser.parse_args()
+    work_dir = tempfile.mkdtemp(prefix="beifong_db_bench_")
+    legacy_insert, legacy_select = bench_sync("legacy", legacy_execute_query, create_db(work_dir, "legacy.db"), args.rows)
+    pooled_insert, pooled_select = bench_sync("pooled", execute_query, create_db(work_dir, "pooled.db"), args.rows)
+    close_connections()
+    asyncio.run(bench_async(create_db(work_dir, "async.db"), args.rows, args.concurrency))
+    print(f"\nPooled speedup: insert {pooled_insert / legacy_insert:.1f}x, select {pooled_select / legacy_select:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+
+
+class FakeEmbeddingsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    dimension = 1536
+    latency = 0.15
+    per_input_latency = 0.001
+    request_count = 0
+    input_count = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length))
+        inputs = payload["input"] if isinstance(payload["input"], list) else [payload["input"]]
+        with self.lock:
+            FakeEmbeddingsHandler.request_count += 1
+            FakeEmbeddingsHandler.input_count += len(inputs)
+        time.sleep(self.latency + self.per_input_latency * len(inputs))
+        data = []
+        for i, text in enumerate(inputs):
+            seed = int(hashlib.md5(str(text).encode()).hexdigest()[:8], 16)
+            vector = np.random.default_rng(seed).random(self.dimension, dtype=np.float32)
+            data.append({"object": "embedding", "index": i, "embedding": vector.tolist()})
+        body = json.dumps(
+            {"object": "list", "data": data, "model": payload["model"], "usage": {"prompt_tokens": 0, "total_tokens": 0}}
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fake_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeEmbeddingsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+
+def seed_articles(tracking_db_path, num_articles, duplicate_ratio):
+    unique = max(1, int(num_articles * (1 - duplicate_ratio)))
+    rows = []
+    for i in range(num_articles):
+        story = i % unique
+        rows.append(
+            (
+                f"Syndicated story {story}",
+                f"http://example.com/article/{i}",
+                f"Summary of story {story}. " * 5,
+                f"Full text of story {story}. " * 200,
+            )
+        )
+    with sqlite3.connect(tracking_db_path) as conn:
+        conn.executemany(
+            """
+            INSERT INTO crawled_articles (title, url, summary, content, processed, ai_status, published_date)
+            VALUES (?, ?, ?, ?, 1, 'success', datetime('now'))
+            """,
+            rows,
+        )
+        conn.commit()
+
+
+def reset_embeddings(tracking_db_path):
+    with sqlite3.connect(tracking_db_path) as conn:
+        conn.execute("DELETE FROM article_embeddings")
+        conn.commit()
+
+
+def reset_counters():
+    FakeEmbeddingsHandler.request_count = 0
+    FakeEmbeddingsHandler.input_count = 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched embedding generation against a fake embeddings server")
+    parser.add_argument("--articles", type=int, default=1000, help="Number of synthetic articles")
+    parser.add_argument("--duplicates", type=float, default=0.2, help="Fraction of syndicated duplicates")
+    parser.add_argument("--sequential_sample", type=int, default=50, help="Articles embedded in sequential mode")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent embedding requests")
+    args = parser.parse_args()
+
+    server, base_url = start_fake_server()
+    os.environ["OPENAI_BASE_URL"] = base_url
+    work_dir = tempfile.mkdtemp(prefix="beifong_embedding_bench_")
+    os.environ["TRACKING_DB_PATH"] = os.path.join(work_dir, "feed_tracking.db")
+    from services.db_init import init_tracking_db
+    from processors.embedding_processor import process_articles_for_embedding, process_articles_for_embedding_batched
+
+    tracking_db_path = os.environ["TRACKING_DB_PATH"]
+    init_tracking_db()
+    seed_articles(tracking_db_path, args.articles, args.duplicates)
+
+    reset_counters()
+    start = time.time()
+    stats = process_articles_for_embedding(tracking_db_path, "sk-fake", batch_size=args.sequential_sample, delay_range=(0, 0))
+    elapsed = time.time() - start
+    sequential_rate = stats["success_count"] / elapsed
+    print(f"Sequential: {stats['success_count']} articles in {elapsed:.2f}s ({sequential_rate:.1f} articles/s, {FakeEmbeddingsHandler.request_count} requests)")
+
+    reset_embeddings(tracking_db_path)
+    reset_counters()
+    start = time.time()
+    stats = process_articles_for_embedding_batched(tracking_db_path, "sk-fake", batch_size=args.articles, max_concurrent_requests=args.concurrency)
+    elapsed = time.time() - start
+    print(
+        f"Batched:    {stats['success_count']} articles in {elapsed:.2f}s ({stats['success_count'] / elapsed:.1f} articles/s, "
+        f"{FakeEmbeddingsHandler.request_count} requests, {FakeEmbeddingsHandler.input_count} inputs, {stats['reused_count']} reused)"
+    )
+    print(f"Speedup: {stats['success_count'] / elapsed / sequential_rate:.1f}x")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import argparse
+import os
+import tempfile
+import time
+import numpy as np
+import faiss
+from processors.faiss_indexing_processor import create_trained_index, save_faiss_index, save_id_mapping
+from services.faiss_index_service import FaissIndexService
+
+
+def build_corpus(num_vectors, dimension, num_topics=256, seed=42):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(num_topics, dimension)).astype(np.float32)
+    assignments = rng.integers(0, num_topics, size=num_vectors)
+    vectors = centers[assignments] + 0.3 * rng.normal(size=(num_vectors, dimension)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors.astype(np.float32)
+
+
+def legacy_query(index_path, mapping_path, query, top_k):
+    index = faiss.read_index(index_path)
+    id_map = np.load(mapping_path).tolist()
+    distances, indices = index.search(query, top_k)
+    return [id_map[i] for i in indices[0] if 0 <= i < len(id_map)]
+
+
+def timed(fn, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return np.median(timings), np.percentile(timings, 95)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-query index loading with the long-lived FAISS index service")
+    parser.add_argument("--vectors", type=int, default=100000, help="Number of synthetic article embeddings")
+    parser.add_argument("--dimension", type=int, default=1536, help="Embedding dimension")
+    parser.add_argument("--index_type", choices=["flat", "ivfflat", "ivfpq", "hnsw"], default="ivfflat")
+    parser.add_argument("--n_list", type=int, default=1024, help="Number of IVF clusters")
+    parser.add_argument("--queries", type=int, default=50, help="Number of timed queries")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="beifong_faiss_bench_")
+    legacy_index_path = os.path.join(work_dir, "legacy.faiss")
+    legacy_mapping_path = os.path.join(work_dir, "legacy_map.npy")
+    service_index_path = os.path.join(work_dir, "article_index.faiss")
+    vectors = build_corpus(args.vectors, args.dimension)
+    article_ids = np.arange(1, args.vectors + 1, dtype=np.int64) * 7
+    queries = vectors[np.random.default_rng(7).integers(0, args.vectors, size=args.queries)]
+
+    start = time.time()
+    base, index_type = create_trained_index(args.dimension, args.index_type, args.n_list, vectors[: max(10000, args.n_list * 39)])
+    legacy_index = faiss.clone_index(base)
+    legacy_index.add(vectors)
+    save_faiss_index(legacy_index, legacy_index_path)
+    save_id_mapping(article_ids.tolist(), legacy_mapping_path)
+    id_mapped = faiss.IndexIDMap2(base)
+    id_mapped.add_with_ids(vectors, article_ids)
+    save_faiss_index(id_mapped, service_index_path)
+    print(f"Built {index_type} indexes over {args.vectors} vectors in {time.time() - start:.1f}s")
+
+    service = FaissIndexService(index_path=service_index_path, mapping_path=legacy_mapping_path)
+    service.search(queries[0], 10)
+    query_iter = iter(np.tile(queries, (2, 1)))
+    legacy_median, legacy_p95 = timed(lambda: legacy_query(legacy_index_path, legacy_mapping_path, next(query_iter)[None, :], 10), args.queries)
+    service_median, service_p95 = timed(lambda: service.search(next(query_iter), 10), args.queries)
+    print(f"\nPer-query load + search: median {legacy_median:.2f} ms, p95 {legacy_p95:.2f} ms")
+    print(f"Index service search:    median {service_median:.2f} ms, p95 {service_p95:.2f} ms")
+
+    top = service.search(queries[0], 1)
+    print(f"\nTop hit article id {top[0][0]} is stored in the index (no id map file needed)")
+    previous_index = service.get_index()
+    save_faiss_index(id_mapped, service_index_path)
+    time.sleep(service.check_interval)
+    service.search(queries[0], 1)
+    assert service.get_index() is not previous_index, "index was not reloaded after swap"
+    print("Hot reload after atomic swap verified")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+TOPIC_WORDS = (
+    "market model chip startup funding regulation climate energy battery robot vaccine election court privacy "
+    "satellite launch quantum network security breach merger layoffs inflation housing transit drought wildfire "
+    "semiconductor datacenter open source language agent benchmark earnings guidance tariff supply chain"
+).split()
+FILLER_WORDS = [f"word{i}" for i in range(20000)]
+QUERIES = ["quantum", "supply chain", "datacenter", "wildfire drought", "zebrafish"]
+
+
+def random_text(rng, words, topic_rate=0.01):
+    return " ".join(rng.choice(TOPIC_WORDS) if rng.random() < topic_rate else rng.choice(FILLER_WORDS) for _ in range(words))
+
+
+def build_corpus(tracking_db_path, rows, seed=13):
+    rng = random.Random(seed)
+    batch = []
+    with sqlite3.connect(tracking_db_path) as conn:
+        for i in range(rows):
+            batch.append(
+                (
+                    f"{random_text(rng, 8)} {i}",
+                    f"http://example.com/{i}",
+                    random_text(rng, 30),
+                    random_text(rng, 120),
+                )
+            )
+            if len(batch) == 10000:
+                conn.executemany(
+                    "INSERT INTO crawled_articles (title, url, summary, content, processed, ai_status, published_date) "
+                    "VALUES (?, ?, ?, ?, 1, 'success', datetime('now'))",
+                    batch,
+                )
+                batch = []
+        if batch:
+            conn.executemany(
+                "INSERT INTO crawled_articles (title, url, summary, content, processed, ai_status, published_date) "
+                "VALUES (?, ?, ?, ?, 1, 'success', datetime('now'))",
+                batch,
+            )
+        conn.commit()
+
+
+def timed(fn, repeats=3):
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare LIKE and FTS5 article search on a synthetic corpus")
+    parser.add_argument("--rows", type=int, default=1000000, help="Number of synthetic articles")
+    parser.add_argument("--limit", type=int, default=3, help="Results per query")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="beifong_fts_bench_")
+    os.environ["TRACKING_DB_PATH"] = os.path.join(work_dir, "feed_tracking.db")
+    from services.db_init import init_tracking_db
+    from tools.search_articles import execute_like_search, execute_fts_search
+    from db.fts import to_fts_query
+
+    tracking_db_path = os.environ["TRACKING_DB_PATH"]
+    init_tracking_db()
+    start = time.time()
+    build_corpus(tracking_db_path, args.rows)
+    print(f"Inserted {args.rows} articles (FTS maintained by triggers) in {time.time() - start:.1f}s")
+
+    conn = sqlite3.connect(tracking_db_path)
+    conn.row_factory = sqlite3.Row
+    print(f"\n{'query':<20}{'LIKE ms':>12}{'FTS5 ms':>12}{'speedup':>10}")
+    for query in QUERIES:
+        like_ms, _ = timed(lambda: execute_like_search(conn, [query], args.limit))
+        fts_ms, results = timed(lambda: execute_fts_search(conn, to_fts_query([query]), args.limit))
+        print(f"{query:<20}{like_ms:>12.1f}{fts_ms:>12.1f}{like_ms / max(fts_ms, 0.001):>9.0f}x")
+    if results:
+        print(f"\nSample snippet: {results[0]['snippet']}")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
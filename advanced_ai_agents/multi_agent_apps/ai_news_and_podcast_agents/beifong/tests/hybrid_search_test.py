@@ -0,0 +1,142 @@
+import argparse
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+import faiss
+
+TOPICS = [
+    "semiconductor", "vaccine", "wildfire", "election", "quantum", "satellite", "tariff", "robotics",
+    "cryptocurrency", "drought", "antitrust", "datacenter", "earthquake", "battery", "privacy", "football",
+]
+DIMENSION = 256
+
+
+def topic_vector(topic_index):
+    vector = np.random.default_rng(1000 + topic_index).standard_normal(DIMENSION).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def article_vector(topic_index, article_id, noise):
+    vector = topic_vector(topic_index) + noise * np.random.default_rng(article_id).standard_normal(DIMENSION).astype(np.float32) / np.sqrt(DIMENSION)
+    return vector / np.linalg.norm(vector)
+
+
+class FakeEmbeddingsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    latency = 0.3
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length))
+        inputs = payload["input"] if isinstance(payload["input"], list) else [payload["input"]]
+        time.sleep(self.latency)
+        data = []
+        for i, text in enumerate(inputs):
+            topic_index = next((t for t, topic in enumerate(TOPICS) if topic in str(text).lower()), 0)
+            data.append({"object": "embedding", "index": i, "embedding": topic_vector(topic_index).tolist()})
+        body = json.dumps({"object": "list", "data": data, "model": payload["model"], "usage": {"prompt_tokens": 0, "total_tokens": 0}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fake_server(latency):
+    FakeEmbeddingsHandler.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeEmbeddingsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+
+def build_corpus(tracking_db_path, sources_db_path, index_path, num_articles, noise):
+    with sqlite3.connect(sources_db_path) as conn:
+        conn.executemany("INSERT INTO sources (id, name) VALUES (?, ?)", [(i + 1, f"Source {i + 1}") for i in range(20)])
+        conn.commit()
+    rows = []
+    for i in range(num_articles):
+        topic = TOPICS[i % len(TOPICS)]
+        # Only a third of the articles mention their topic keyword, the rest are paraphrased and only reachable semantically
+        mention = topic if i % 3 == 0 else "the sector"
+        rows.append((i + 1, f"Report {i} on {mention}", f"http://example.com/{i}", f"Analysts discuss {mention} news.", f"Coverage of {mention} today.", i % 20 + 1))
+    with sqlite3.connect(tracking_db_path) as conn:
+        conn.executemany(
+            """
+            INSERT INTO crawled_articles (id, title, url, summary, content, source_id, processed, ai_status, published_date)
+            VALUES (?, ?, ?, ?, ?, ?, 1, 'success', datetime('now'))
+            """,
+            rows,
+        )
+        conn.commit()
+    vectors = np.stack([article_vector(i % len(TOPICS), i + 1, noise) for i in range(num_articles)])
+    index = faiss.IndexIDMap2(faiss.IndexFlatL2(DIMENSION))
+    index.add_with_ids(vectors, np.arange(1, num_articles + 1, dtype=np.int64))
+    faiss.write_index(index, index_path)
+
+
+def count_results(response):
+    if "Found" not in response or "[" not in response:
+        return 0, []
+    items, _ = json.JSONDecoder().raw_decode(response[response.index("[") :])
+    return len(items), items
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the hybrid RRF tool with separate embedding and keyword tool calls")
+    parser.add_argument("--articles", type=int, default=5000, help="Number of synthetic articles")
+    parser.add_argument("--noise", type=float, default=0.8, help="Spread of article embeddings around their topic")
+    parser.add_argument("--latency", type=float, default=0.3, help="Simulated embedding API latency in seconds")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="beifong_hybrid_bench_")
+    os.environ["TRACKING_DB_PATH"] = os.path.join(work_dir, "feed_tracking.db")
+    os.environ["SOURCES_DB_PATH"] = os.path.join(work_dir, "sources.db")
+    os.environ["FAISS_INDEX_DB_PATH"] = os.path.join(work_dir, "article_index.faiss")
+    os.environ["FAISS_MAPPING_FILE_PATH"] = os.path.join(work_dir, "article_id_map.npy")
+    os.environ["OPENAI_API_KEY"] = "test-key"
+    server, base_url = start_fake_server(args.latency)
+    os.environ["OPENAI_BASE_URL"] = base_url
+    from services.db_init import init_sources_db, init_tracking_db
+    from tools.embedding_search import embedding_search
+    from tools.search_articles import search_articles
+    from tools.hybrid_search import hybrid_search
+
+    init_sources_db()
+    init_tracking_db()
+    build_corpus(os.environ["TRACKING_DB_PATH"], os.environ["SOURCES_DB_PATH"], os.environ["FAISS_INDEX_DB_PATH"], args.articles, args.noise)
+    hybrid_search(None, "warm up")
+
+    legacy_time = hybrid_time = 0.0
+    legacy_relevant = hybrid_relevant = 0
+    for topic in TOPICS:
+        query = f"latest {topic} developments"
+        start = time.perf_counter()
+        semantic_count, semantic_items = count_results(embedding_search(None, query))
+        keyword_count, keyword_items = count_results(search_articles(None, [topic]))
+        legacy_time += time.perf_counter() - start
+        legacy_ids = {item["id"] for item in semantic_items + keyword_items}
+        legacy_relevant += sum(1 for article_id in legacy_ids if TOPICS[(article_id - 1) % len(TOPICS)] == topic)
+
+        start = time.perf_counter()
+        hybrid_count, hybrid_items = count_results(hybrid_search(None, query))
+        hybrid_time += time.perf_counter() - start
+        hybrid_relevant += sum(1 for item in hybrid_items if TOPICS[(item["id"] - 1) % len(TOPICS)] == topic)
+        assert all(item["source_name"].startswith("Source") for item in hybrid_items), "source names were not joined"
+
+    queries = len(TOPICS)
+    print(f"\nSeparate tools (2 calls): {legacy_time / queries * 1000:.0f} ms per topic, {legacy_relevant / queries:.1f} relevant articles kept")
+    print(f"Hybrid tool (1 call):     {hybrid_time / queries * 1000:.0f} ms per topic, {hybrid_relevant / queries:.1f} relevant articles kept")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+import argparse
+import contextvars
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from utils.pipeline_dag import PipelineScheduler, PipelineStage
+
+STAGES = ["feed_processor", "url_crawler", "ai_analyzer", "embedding_processor", "faiss_indexer"]
+
+
+def measure_spawn_cost():
+    start = time.time()
+    subprocess.run([sys.executable, "-c", "import numpy, faiss, openai"], check=False, capture_output=True)
+    return time.time() - start
+
+
+class SimulatedPipeline:
+    """Articles move through a stage column in SQLite; stage k advances rows from k - 1 to k."""
+
+    def __init__(self, db_path, work_time, articles_per_feed_run, log_lines):
+        self.db_path = db_path
+        self.work_time = work_time
+        self.articles_per_feed_run = articles_per_feed_run
+        self.log_lines = log_lines
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY, stage INTEGER, published REAL, searchable REAL)")
+
+    def publish(self):
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany("INSERT INTO items (stage, published) VALUES (0, ?)", [(time.time(),)] * self.articles_per_feed_run)
+
+    def run(self, stage_index, echo=True):
+        if echo:
+            for i in range(self.log_lines):
+                print(f"processing record {i} in stage {STAGES[stage_index]}")
+            # Like the embedding processor, part of the work runs on threads the stage starts itself.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                executor.submit(contextvars.copy_context().run, print, f"worker thread finished in stage {STAGES[stage_index]}").result()
+        time.sleep(self.work_time)
+        with sqlite3.connect(self.db_path) as conn:
+            if stage_index == len(STAGES) - 1:
+                moved = conn.execute("UPDATE items SET stage = ?, searchable = ? WHERE stage = ?", (stage_index, time.time(), stage_index - 1)).rowcount
+            else:
+                moved = conn.execute("UPDATE items SET stage = ? WHERE stage = ?", (stage_index, stage_index - 1)).rowcount
+        return {"moved": moved}
+
+    def backlog(self, stage_index):
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM items WHERE stage = ?", (stage_index - 1,)).fetchone()[0]
+
+    def freshness(self):
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute("SELECT searchable - published FROM items WHERE searchable IS NOT NULL").fetchall()
+        return [row[0] for row in rows]
+
+
+def run_legacy(sim, duration, interval, spawn_cost):
+    stop = threading.Event()
+
+    def worker(stage_index, phase):
+        if stop.wait(phase):
+            return
+        while not stop.is_set():
+            time.sleep(spawn_cost)
+            if stage_index == 0:
+                sim.publish()
+            else:
+                sim.run(stage_index, echo=False)
+            stop.wait(interval)
+
+    threads = [threading.Thread(target=worker, args=(i, interval * i / len(STAGES)), daemon=True) for i in range(len(STAGES))]
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+
+def run_dag(sim, duration, interval):
+    def make_run(stage_index):
+        def run():
+            if stage_index == 0:
+                sim.publish()
+                return {"published": sim.articles_per_feed_run}
+            return sim.run(stage_index)
+
+        return run
+
+    stages = []
+    for i, name in enumerate(STAGES):
+        backlog = None if i == 0 else (lambda index=i: sim.backlog(index))
+        stages.append(PipelineStage(name, name, make_run(i), backlog, downstream=STAGES[i + 1 : i + 2]))
+    stages[0].interval = interval
+    logs = []
+    missing = []
+
+    def finish(stage, execution_id, status, error_message, output):
+        logs.append(len(output))
+        if stage.name != STAGES[0] and f"worker thread finished in stage {stage.name}" not in output:
+            missing.append(stage.name)
+
+    scheduler = PipelineScheduler(stages, poll_interval=interval, log_max_chars=16 * 1024, start_execution=lambda stage: 1, finish_execution=finish)
+    scheduler.start()
+    time.sleep(duration)
+    scheduler.stop()
+    assert not missing, f"worker thread output missing from {len(missing)} stage logs: {sorted(set(missing))}"
+    return logs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare publish-to-searchable latency of fixed-interval subprocess tasks and the pipeline DAG")
+    parser.add_argument("--interval", type=float, default=6.0, help="Task interval in seconds (stands in for the 1-minute polling period)")
+    parser.add_argument("--duration", type=float, default=40.0, help="Seconds to run each scheduler")
+    parser.add_argument("--work_time", type=float, default=0.2, help="Seconds of work per stage run")
+    parser.add_argument("--articles", type=int, default=20, help="Articles published per feed run")
+    parser.add_argument("--log_lines", type=int, default=5000, help="Lines printed per stage run")
+    args = parser.parse_args()
+
+    spawn_cost = measure_spawn_cost()
+    print(f"Subprocess interpreter start + imports: {spawn_cost:.2f}s per task run")
+    work_dir = tempfile.mkdtemp(prefix="beifong_dag_bench_")
+
+    legacy = SimulatedPipeline(os.path.join(work_dir, "legacy.db"), args.work_time, args.articles, args.log_lines)
+    run_legacy(legacy, args.duration, args.interval, spawn_cost)
+    dag = SimulatedPipeline(os.path.join(work_dir, "dag.db"), args.work_time, args.articles, args.log_lines)
+    real_stdout = sys.stdout
+    with open(os.devnull, "w") as devnull:
+        sys.stdout = devnull
+        try:
+            log_sizes = run_dag(dag, args.duration, args.interval)
+        finally:
+            sys.stdout = real_stdout
+
+    legacy_latency = legacy.freshness()
+    dag_latency = dag.freshness()
+    print(f"\nFixed-interval tasks: {len(legacy_latency)} articles searchable, median freshness {statistics.median(legacy_latency):.2f}s")
+    print(f"Pipeline DAG:         {len(dag_latency)} articles searchable, median freshness {statistics.median(dag_latency):.2f}s")
+    print(f"Freshness improvement: {statistics.median(legacy_latency) / statistics.median(dag_latency):.1f}x")
+    print(f"Largest stored stage log: {max(log_sizes) / 1024:.1f} KB (capped at 16 KB, uncapped run output ~{args.log_lines * 40 / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import argparse
+import json
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from db.session_store import SessionStateStore
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS session_state (
+    session_id TEXT PRIMARY KEY,
+    state JSON,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+def legacy_get(db_path, session_id):
+    conn = sqlite3.connect(db_path)
+    try:
+        row = conn.execute("SELECT session_id, state, created_at FROM session_state WHERE session_id = ?", (session_id,)).fetchone()
+        return {"session_id": row[0], "state": json.loads(row[1]), "created_at": row[2]}
+    finally:
+        conn.close()
+
+
+def legacy_save(db_path, session_id, state):
+    state_json = json.dumps(state)
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        if conn.execute("SELECT session_id FROM session_state WHERE session_id = ?", (session_id,)).fetchone():
+            conn.execute("UPDATE session_state SET state = ? WHERE session_id = ?", (state_json, session_id))
+        else:
+            conn.execute(
+                "INSERT INTO session_state (session_id, state, created_at) VALUES (?, ?, ?)", (session_id, state_json, datetime.now().isoformat())
+            )
+        conn.commit()
+    finally:
+        conn.close()
+    return legacy_get(db_path, session_id)
+
+
+def paragraph(rng, words):
+    return " ".join(f"word{rng.randrange(5000)}" for _ in range(words))
+
+
+def play_turn(state, turn, rng):
+    """One agent turn (not timed): new search results, an occasional script rewrite, and small UI flags."""
+    state["stage"] = ["search", "scraping", "script", "banner", "audio"][turn % 5]
+    state["show_sources_for_selection"] = turn % 3 == 0
+    state.setdefault("search_results", []).extend(
+        {"id": f"{turn}-{i}", "title": paragraph(rng, 8), "url": f"https://example.com/{turn}/{i}", "description": paragraph(rng, 120)}
+        for i in range(10)
+    )
+    if turn % 4 == 0:
+        state["generated_script"] = {"title": paragraph(rng, 6), "sections": [{"type": "dialog", "text": paragraph(rng, 300)} for _ in range(8)]}
+    state["last_turn"] = turn
+
+
+def run(label, get, save, turns, seed):
+    rng = random.Random(seed)
+    latencies = []
+    state = get()["state"]
+    for turn in range(turns):
+        start = time.perf_counter()
+        state = get()["state"]
+        loaded = time.perf_counter()
+        play_turn(state, turn, rng)
+        saving = time.perf_counter()
+        state = save(state)["state"]
+        latencies.append(loaded - start + time.perf_counter() - saving)
+    size = len(json.dumps(state)) / 1024
+    early, late = statistics.median(latencies[:10]) * 1000, statistics.median(latencies[-10:]) * 1000
+    print(f"{label:<13} state {size:>7.0f} KB  turn latency first 10: {early:>6.2f} ms  last 10: {late:>6.2f} ms")
+    return state, late
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare full-state rewrites with delta-persisted session state over a long session")
+    parser.add_argument("--turns", type=int, default=205, help="Chat turns in the session (not a multiple of --compact_every, so the cold read replays deltas)")
+    parser.add_argument("--compact_every", type=int, default=20, help="Deltas between snapshot compactions")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="beifong_session_bench_")
+    legacy_db = os.path.join(work_dir, "legacy.db")
+    with sqlite3.connect(legacy_db) as conn:
+        conn.execute(SCHEMA)
+    legacy_save(legacy_db, "s1", {"stage": "welcome"})
+    legacy_state, legacy_late = run(
+        "full rewrite", lambda: legacy_get(legacy_db, "s1"), lambda state: legacy_save(legacy_db, "s1", state), args.turns, seed=7
+    )
+
+    delta_db = os.path.join(work_dir, "delta.db")
+    with sqlite3.connect(delta_db) as conn:
+        conn.execute(SCHEMA)
+    store = SessionStateStore(delta_db, compact_every=args.compact_every)
+    store.save("s1", {"stage": "welcome"})
+
+    def save(state):
+        store.save("s1", state)
+        return store.get("s1")
+
+    delta_state, delta_late = run("delta store", lambda: store.get("s1"), save, args.turns, seed=7)
+
+    assert delta_state == legacy_state, "delta store diverged from the full rewrite"
+    with sqlite3.connect(delta_db) as conn:
+        pending = conn.execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(patch)), 0) FROM session_state_deltas").fetchone()
+    assert pending[0] > 0, "no deltas pending at the end of the session; the cold read would only load the snapshot"
+    cold = SessionStateStore(delta_db).get("s1")["state"]
+    assert cold == legacy_state, "replaying snapshot + deltas from disk diverged"
+    print(f"\nCold read matches; {pending[0]} deltas ({pending[1] / 1024:.0f} KB) pending compaction")
+    print(f"Late-session turn latency: {legacy_late / delta_late:.1f}x lower")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+import argparse
+import glob
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+from tools.social.db import PostBuffer, create_connection, process_post_data, setup_database, update_posts_with_analysis
+from tools.social.fb_post_extractor import normalize_facebook_posts_batch, parse_facebook_posts
+from tools.social.fb_scraper import contains_facebook_posts, process_facebook_graphql_response
+
+METRICS = ["engagement_reply_count", "engagement_retweet_count", "engagement_like_count", "engagement_bookmark_count", "engagement_view_count"]
+
+
+def legacy_check_and_store_post(conn, post_data):
+    """The previous per-post path: a SELECT, then an INSERT or a metrics UPDATE, each with its own commit."""
+    post_id = post_data.get("post_id")
+    if not post_id or post_data.get("is_ad", False):
+        return False
+    data = process_post_data(post_data)
+    existing_post = conn.execute("SELECT * FROM posts WHERE post_id = ?", (post_id,)).fetchone()
+    if not existing_post:
+        conn.execute(f"INSERT INTO posts ({', '.join(data)}) VALUES ({', '.join('?' * len(data))})", list(data.values()))
+        conn.commit()
+        return bool(data.get("post_text"))
+    changes = {metric: data[metric] for metric in METRICS if metric in data and data[metric] != existing_post[metric]}
+    if changes:
+        set_sql = ", ".join(f"{metric} = ?" for metric in changes) + ", updated_at = CURRENT_TIMESTAMP"
+        conn.execute(f"UPDATE posts SET {set_sql} WHERE post_id = ?", list(changes.values()) + [post_id])
+        conn.commit()
+    return False
+
+
+def legacy_update_posts_with_analysis(conn, post_ids, analysis_results):
+    analysis_by_id = {analysis["post_id"]: analysis for analysis in analysis_results}
+    for post_id in post_ids:
+        if post_id in analysis_by_id:
+            analysis = analysis_by_id[post_id]
+            conn.execute(
+                "UPDATE posts SET sentiment = ?, categories = ?, tags = ?, analysis_reasoning = ?, updated_at = CURRENT_TIMESTAMP WHERE post_id = ?",
+                (analysis["sentiment"], json.dumps(analysis["categories"]), json.dumps(analysis["tags"]), analysis["reasoning"], post_id),
+            )
+    conn.commit()
+
+
+def story_node(post_id, rng, metrics):
+    handle = f"page{rng.randrange(200)}"
+    return {
+        "__typename": "Story",
+        "post_id": post_id,
+        "id": f"story-{post_id}",
+        "creation_time": int((datetime(2025, 1, 1) + timedelta(minutes=int(post_id))).timestamp()),
+        "message": {"text": f"Post {post_id} from {handle} about topic{rng.randrange(50)}"},
+        "actors": [{"name": handle.title(), "id": handle, "url": f"https://www.facebook.com/{handle}"}],
+        "comet_sections": {
+            "feedback": {
+                "story": {
+                    "story_ufi_container": {
+                        "story": {
+                            "feedback_context": {
+                                "feedback_target_with_context": {
+                                    "comet_ufi_summary_and_actions_renderer": {
+                                        "feedback": {"i18n_reaction_count": str(metrics[0]), "i18n_share_count": str(metrics[1])}
+                                    },
+                                    "comment_rendering_instance": {"comments": {"total_count": metrics[2]}},
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        },
+    }
+
+
+def synthetic_crawls(crawls, posts_per_crawl, stories_per_response, churn, seed):
+    """GraphQL news-feed responses for repeated crawls: mostly the same posts again, a share with new metrics, and some new posts."""
+    rng = random.Random(seed)
+    metrics = {}
+    next_id = 1
+    result = []
+    for crawl in range(crawls):
+        live = list(metrics)
+        rng.shuffle(live)
+        post_ids = live[: posts_per_crawl - posts_per_crawl // 5] if crawl else []
+        while len(post_ids) < posts_per_crawl:
+            post_ids.append(str(next_id))
+            metrics[str(next_id)] = [rng.randrange(500), rng.randrange(50), rng.randrange(80)]
+            next_id += 1
+        for post_id in post_ids:
+            if rng.random() < churn:
+                metrics[post_id] = [value + rng.randrange(1, 20) for value in metrics[post_id]]
+        responses = []
+        for start in range(0, len(post_ids), stories_per_response):
+            batch = post_ids[start : start + stories_per_response]
+            edges = [{"node": story_node(post_id, random.Random(post_id), metrics[post_id])} for post_id in batch]
+            responses.append(json.dumps({"data": {"viewer": {"news_feed": {"edges": edges}}}}))
+        result.append(responses)
+    return result
+
+
+def captured_crawls(directory):
+    """Captured GraphQL response bodies, one file per response, grouped into crawls by sub-directory."""
+    crawls = []
+    for crawl_dir in sorted(glob.glob(os.path.join(directory, "*"))):
+        if os.path.isdir(crawl_dir):
+            crawls.append([open(path, encoding="utf-8").read() for path in sorted(glob.glob(os.path.join(crawl_dir, "*")))])
+    return crawls
+
+
+def fake_analysis(posts):
+    return [{"post_id": post["post_id"], "sentiment": "neutral", "categories": ["news"], "tags": ["replay"], "reasoning": "replay"} for post in posts]
+
+
+def replay_legacy(conn, crawls):
+    for responses in crawls:
+        seen_post_ids = set()
+        queue = []
+        for response_text in responses:
+            for line in response_text.split("\n"):
+                if not line.strip():
+                    continue
+                json_obj = json.loads(line)
+                if not contains_facebook_posts(json_obj):
+                    continue
+                for post_data in normalize_facebook_posts_batch(parse_facebook_posts(json_obj)):
+                    if post_data["post_id"] in seen_post_ids:
+                        continue
+                    seen_post_ids.add(post_data["post_id"])
+                    if legacy_check_and_store_post(conn, post_data) and post_data.get("post_text"):
+                        queue.append(post_data)
+        legacy_update_posts_with_analysis(conn, [post["post_id"] for post in queue], fake_analysis(queue))
+
+
+def replay_batched(conn, crawls, batch_size):
+    for responses in crawls:
+        seen_post_ids = set()
+        queue, queue_post_ids = [], []
+        post_buffer = PostBuffer(conn, batch_size)
+        for response_text in responses:
+            process_facebook_graphql_response(response_text, seen_post_ids, queue, queue_post_ids, post_buffer)
+        queue.extend(post_buffer.flush())
+        queue_post_ids = [post["post_id"] for post in queue]
+        update_posts_with_analysis(conn, queue_post_ids, fake_analysis(queue))
+
+
+def run(label, replay, db_path, crawls):
+    conn = create_connection(db_path)
+    setup_database(conn)
+    start = time.perf_counter()
+    replay(conn, crawls)
+    elapsed = time.perf_counter() - start
+    posts = sum(len(json.loads(line)["data"]["viewer"]["news_feed"]["edges"]) for responses in crawls for line in responses if line.strip())
+    print(f"{label:<16} {elapsed:>7.2f}s  {posts / elapsed:>9.0f} posts/s  rows written {conn.total_changes:>8}")
+    columns = ", ".join(column for column in ["post_id", "user_handle", "post_text", "sentiment", "categories"] + METRICS)
+    rows = [tuple(row) for row in conn.execute(f"SELECT {columns} FROM posts ORDER BY post_id")]
+    stats = [tuple(row) for row in conn.execute("SELECT * FROM post_daily_stats ORDER BY 1, 2, 3")]
+    conn.close()
+    return elapsed, rows, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay Facebook GraphQL crawls through the per-post and the batched upsert ingestion paths")
+    parser.add_argument("--payloads", help="Directory of captured crawls (sub-directory per crawl, one response body per file); synthetic if omitted")
+    parser.add_argument("--crawls", type=int, default=20, help="Synthetic crawls to replay")
+    parser.add_argument("--posts", type=int, default=1000, help="Posts per synthetic crawl")
+    parser.add_argument("--stories_per_response", type=int, default=10, help="Stories in each synthetic GraphQL response")
+    parser.add_argument("--batch_size", type=int, default=100, help="Posts buffered per upsert")
+    parser.add_argument("--churn", type=float, default=0.1, help="Share of re-seen posts whose metrics changed since the last crawl")
+    args = parser.parse_args()
+
+    crawls = captured_crawls(args.payloads) if args.payloads else synthetic_crawls(args.crawls, args.posts, args.stories_per_response, args.churn, 5)
+    work_dir = tempfile.mkdtemp(prefix="beifong_ingest_bench_")
+    legacy_time, legacy_rows, legacy_stats = run("per-post", replay_legacy, os.path.join(work_dir, "legacy.db"), crawls)
+    batched_time, batched_rows, batched_stats = run(
+        "batched upsert", lambda conn, crawls: replay_batched(conn, crawls, args.batch_size), os.path.join(work_dir, "batched.db"), crawls
+    )
+
+    assert batched_rows == legacy_rows, "batched ingestion stored different posts"
+    assert batched_stats == legacy_stats, "batched ingestion produced different rollups"
+    with sqlite3.connect(os.path.join(work_dir, "batched.db")) as conn:
+        stored = conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+    print(f"\nBoth paths stored the same {stored} posts; batched replay is {legacy_time / batched_time:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
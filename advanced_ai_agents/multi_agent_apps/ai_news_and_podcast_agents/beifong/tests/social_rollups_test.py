@@ -0,0 +1,195 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+SENTIMENTS = ["positive", "negative", "neutral", "critical", None]
+
+
+def posts_schema():
+    from tools.social.db import setup_database
+
+    conn = sqlite3.connect(":memory:")
+    setup_database(conn)
+    return conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'posts'").fetchone()[0]
+
+
+def make_post(i, rng, start, days, users, categories, tags):
+    sentiment = rng.choice(SENTIMENTS)
+    return {
+        "post_id": f"post{i}",
+        "platform": rng.choice(["x.com", "facebook.com"]),
+        "user_handle": f"user{rng.randrange(users)}",
+        "user_display_name": f"User {i % users}",
+        "post_timestamp": (start + timedelta(days=rng.randrange(days), seconds=rng.randrange(86400))).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+        "post_text": f"post number {i}",
+        "engagement_reply_count": rng.randrange(50),
+        "engagement_retweet_count": rng.randrange(100),
+        "engagement_like_count": rng.randrange(1000),
+        "engagement_bookmark_count": rng.randrange(20),
+        "engagement_view_count": rng.randrange(100000),
+        "sentiment": sentiment,
+        "categories": json.dumps(rng.sample(categories, rng.randint(1, 3))) if sentiment else None,
+        "tags": json.dumps(rng.sample(tags, rng.randint(0, 4))) if sentiment else None,
+    }
+
+
+def bulk_load(db_path, count, rng, start, days, users, categories, tags):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(posts_schema())
+        columns = list(make_post(0, random.Random(0), start, days, users, categories, tags))
+        sql = f"INSERT INTO posts ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+        batch = []
+        for i in range(count):
+            post = make_post(i, rng, start, days, users, categories, tags)
+            batch.append([post[column] for column in columns])
+            if len(batch) == 50000:
+                conn.executemany(sql, batch)
+                batch = []
+        conn.executemany(sql, batch)
+
+
+def legacy_categories(conn):
+    category_counts = {}
+    for (categories,) in conn.execute("SELECT categories FROM posts WHERE categories IS NOT NULL"):
+        for category in json.loads(categories):
+            category_counts[category] = category_counts.get(category, 0) + 1
+    return category_counts
+
+
+LEGACY_QUERIES = {
+    "sentiments": "SELECT sentiment, COUNT(*) as post_count FROM posts WHERE sentiment IS NOT NULL GROUP BY sentiment",
+    "top_users": """
+        SELECT user_handle, COUNT(*) as post_count FROM posts WHERE user_handle IS NOT NULL GROUP BY user_handle ORDER BY post_count DESC LIMIT 10
+    """,
+    "category_sentiment": """
+        WITH category_data AS (
+            SELECT json_each.value as category, sentiment, COUNT(*) as count FROM posts p, json_each(p.categories) GROUP BY json_each.value, sentiment
+        )
+        SELECT category, SUM(count) as total_count, SUM(CASE WHEN sentiment = 'positive' THEN count ELSE 0 END) as positive_count
+        FROM category_data GROUP BY category ORDER BY total_count DESC
+    """,
+    "trending_topics": """
+        WITH topic_data AS (
+            SELECT json_each.value as topic, sentiment, COUNT(*) as count FROM posts, json_each(posts.tags) WHERE tags IS NOT NULL
+            GROUP BY json_each.value, sentiment
+        )
+        SELECT topic, SUM(count) as total_count FROM topic_data GROUP BY topic ORDER BY total_count DESC LIMIT 10
+    """,
+    "engagement_stats": """
+        SELECT AVG(COALESCE(engagement_like_count, 0)) as avg_likes, MAX(COALESCE(engagement_view_count, 0)) as max_views,
+               COUNT(*) as total_posts, COUNT(DISTINCT user_handle) as unique_authors
+        FROM posts
+    """,
+}
+
+
+def timed(fn, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return result, statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare dashboard queries over raw posts with the incrementally maintained daily rollups")
+    parser.add_argument("--posts", type=int, default=200_000, help="Posts in the database")
+    parser.add_argument("--days", type=int, default=90, help="Days the posts are spread over")
+    parser.add_argument("--incremental", type=int, default=2000, help="Posts stored and analyzed through tools.social.db after the backfill")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per endpoint")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="beifong_rollup_bench_")
+    db_path = os.path.join(work_dir, "social_media.db")
+    os.environ["SOCIAL_MEDIA_DB_PATH"] = db_path
+    from db.async_connection import close_async_pools
+    from db.rollups import ensure_post_rollups
+    from services.social_media_service import social_media_service
+    from tools.social.db import check_and_store_post, create_connection, update_posts_with_analysis
+
+    rng = random.Random(11)
+    start = datetime.now() - timedelta(days=args.days - 1)
+    categories = [f"category{i}" for i in range(30)]
+    tags = [f"tag{i}" for i in range(300)]
+    began = time.time()
+    bulk_load(db_path, args.posts, rng, start, args.days, 5000, categories, tags)
+    print(f"Loaded {args.posts:,} posts in {time.time() - began:.1f}s")
+
+    with sqlite3.connect(db_path) as conn:
+        began = time.time()
+        ensure_post_rollups(conn.cursor())
+        conn.commit()
+        print(f"Backfilled rollups in {time.time() - began:.1f}s")
+
+    conn = create_connection(db_path)
+    began = time.time()
+    for i in range(args.posts, args.posts + args.incremental):
+        post = make_post(i, rng, start, args.days, 5000, categories, tags)
+        analysis = {"post_id": post["post_id"], "sentiment": post.pop("sentiment"), "reasoning": "benchmark"}
+        analysis["categories"] = json.loads(post.pop("categories") or "[]")
+        analysis["tags"] = json.loads(post.pop("tags") or "[]")
+        check_and_store_post(conn, post)
+        update_posts_with_analysis(conn, [post["post_id"]], [analysis])
+    elapsed = time.time() - began
+    print(f"Stored and analyzed {args.incremental} more posts in {elapsed:.1f}s ({elapsed / args.incremental * 1000:.2f} ms/post)")
+
+    print(f"\n{'endpoint':<20} {'raw posts':>12} {'rollups':>10}")
+    legacy = {}
+    for name, query in LEGACY_QUERIES.items():
+        legacy[name], elapsed = timed(lambda: conn.execute(query).fetchall(), args.repeats)
+        legacy[name + "_ms"] = elapsed
+    legacy["categories"], legacy["categories_ms"] = timed(lambda: legacy_categories(conn), args.repeats)
+
+    async def run_endpoints():
+        results = {}
+        calls = {
+            "sentiments": lambda: social_media_service.get_sentiments(),
+            "top_users": lambda: social_media_service.get_top_users(limit=10),
+            "categories": lambda: social_media_service.get_categories(),
+            "category_sentiment": lambda: social_media_service.get_category_sentiment(),
+            "trending_topics": lambda: social_media_service.get_trending_topics(limit=10),
+            "engagement_stats": lambda: social_media_service.get_engagement_stats(),
+            "sentiment_over_time": lambda: social_media_service.get_sentiment_over_time(
+                date_from=start.strftime("%Y-%m-%d"), date_to=(start + timedelta(days=args.days)).strftime("%Y-%m-%d")
+            ),
+        }
+        for name, call in calls.items():
+            times = []
+            for _ in range(args.repeats):
+                began = time.perf_counter()
+                results[name] = await call()
+                times.append(time.perf_counter() - began)
+            results[name + "_ms"] = statistics.median(times) * 1000
+        await close_async_pools()
+        return results
+
+    rollup = asyncio.run(run_endpoints())
+    for name in ["sentiments", "top_users", "categories", "category_sentiment", "trending_topics", "engagement_stats"]:
+        print(f"{name:<20} {legacy[name + '_ms']:>10.1f}ms {rollup[name + '_ms']:>8.2f}ms")
+    print(f"{'sentiment_over_time':<20} {'':>12} {rollup['sentiment_over_time_ms']:>8.2f}ms")
+
+    assert {row[0]: row[1] for row in legacy["sentiments"]} == {row["sentiment"]: row["post_count"] for row in rollup["sentiments"]}
+    assert legacy["categories"] == {row["category"]: row["post_count"] for row in rollup["categories"]}
+    assert {row[0]: (row[1], row[2]) for row in legacy["category_sentiment"]} == {
+        row["category"]: (row["total_count"], row["positive_count"]) for row in rollup["category_sentiment"]
+    }
+    assert [row[1] for row in legacy["top_users"]] == [row["post_count"] for row in rollup["top_users"]]
+    assert [row[1] for row in legacy["trending_topics"]] == [row["total_count"] for row in rollup["trending_topics"]]
+    stats, engagement = legacy["engagement_stats"][0], rollup["engagement_stats"]
+    assert (stats[2], stats[3], stats[1]) == (engagement["total_posts"], engagement["unique_authors"], engagement["max_views"])
+    assert abs(stats[0] - engagement["avg_likes"]) < 1e-6
+    assert sum(day["total_count"] for day in rollup["sentiment_over_time"]) == args.posts + args.incremental
+    print("\nRollup results match the raw-posts queries")
+
+
+if __name__ == "__main__":
+    main()
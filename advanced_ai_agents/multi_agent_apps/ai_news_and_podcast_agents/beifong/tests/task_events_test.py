@@ -0,0 +1,304 @@
+import argparse
+import asyncio
+import contextlib
+import io
+import fnmatch
+import json
+import os
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+import aiohttp
+from services.task_events import TaskCompletionListener, publish_task_completion
+
+
+class FakeRedisBroker:
+    """In-process stand-in for the Redis commands the completion channel uses: GET/SET and pattern pub/sub."""
+
+    def __init__(self):
+        self.values = {}
+        self.subscribers = []
+        self.lock = threading.Lock()
+        self.commands = 0
+
+    def set(self, key, value):
+        with self.lock:
+            self.commands += 1
+            self.values[key] = value.encode("utf-8") if isinstance(value, str) else value
+
+    def get(self, key):
+        with self.lock:
+            self.commands += 1
+            return self.values.get(key)
+
+    def publish(self, channel, data):
+        data = data.encode("utf-8") if isinstance(data, str) else data
+        with self.lock:
+            self.commands += 1
+            subscribers = list(self.subscribers)
+        for loop, queue, pattern in subscribers:
+            if fnmatch.fnmatchcase(channel, pattern):
+                message = {"type": "pmessage", "pattern": pattern, "channel": channel, "data": data}
+                loop.call_soon_threadsafe(queue.put_nowait, message)
+
+
+class FakeRedis:
+    """Synchronous client, as used by the Celery worker."""
+
+    def __init__(self, broker):
+        self.broker = broker
+
+    def set(self, key, value, ex=None):
+        self.broker.set(key, value)
+
+    def publish(self, channel, data):
+        self.broker.publish(channel, data)
+
+
+class FakePubSub:
+    def __init__(self, broker):
+        self.broker = broker
+        self.queue = asyncio.Queue()
+        self.entries = []
+
+    async def psubscribe(self, pattern):
+        entry = (asyncio.get_running_loop(), self.queue, pattern)
+        self.entries.append(entry)
+        with self.broker.lock:
+            self.broker.subscribers.append(entry)
+
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+
+    async def close(self):
+        with self.broker.lock:
+            for entry in self.entries:
+                self.broker.subscribers.remove(entry)
+
+
+class FakeAsyncRedis:
+    def __init__(self, broker):
+        self.broker = broker
+
+    async def get(self, key):
+        return self.broker.get(key)
+
+    def pubsub(self):
+        return FakePubSub(self.broker)
+
+
+class StatusHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    done_at = {}
+    request_count = 0
+    requests_by_session = {}
+    long_polls = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        session_id = payload["session_id"]
+        with self.lock:
+            StatusHandler.request_count += 1
+            StatusHandler.requests_by_session[session_id] = StatusHandler.requests_by_session.get(session_id, 0) + 1
+            if payload.get("wait"):
+                StatusHandler.long_polls += 1
+        finished = time.time() >= self.done_at[session_id]
+        body = json.dumps({"session_id": session_id, "is_processing": not finished, "response": "done" if finished else ""}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_status_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StatusHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+async def check_status(url, session_id):
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
+        async with session.post(f"{url}/api/podcast-agent/status", json={"session_id": session_id}) as resp:
+            return await resp.json()
+
+
+def client_threads():
+    """Live threads, leaving out the fixture server's per-request handlers."""
+    return sum(1 for thread in threading.enumerate() if "process_request_thread" not in thread.name)
+
+
+class ThreadSampler:
+    def __init__(self):
+        self.peak = client_threads()
+        self.stop = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def run(self):
+        while not self.stop.wait(0.05):
+            self.peak = max(self.peak, client_threads())
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop.set()
+        self.thread.join()
+
+
+def run_polling(sessions, url, poll_interval, workers, max_polls):
+    """The old Slack flow: each session gets an executor thread with its own event loop that polls the status endpoint."""
+    notified = {}
+
+    async def poll(session_id):
+        for _ in range(max_polls):
+            status = await check_status(url, session_id)
+            if not status["is_processing"]:
+                notified[session_id] = time.time()
+                return
+            await asyncio.sleep(poll_interval)
+
+    def run(session_id):
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(poll(session_id))
+        finally:
+            loop.close()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for session_id in sessions:
+            executor.submit(run, session_id)
+    return notified
+
+
+def load_slack_chat():
+    """Import the real Slack bot module; App is patched so importing it does not verify a token with Slack."""
+    os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-test")
+    with mock.patch("slack_bolt.App"):
+        from integrations.slack import chat
+    return chat
+
+
+def run_events(chat, sessions, url, time_scale):
+    """The new flow, driven through the bot's own start_completion_watch -> wait_for_completion -> next_status.
+
+    Only the edges are replaced: Redis is the in-process broker, the status API is the fixture server, and Slack sends are recorded.
+    """
+    broker = FakeRedisBroker()
+    completions = {}
+    messages = []
+    listener = TaskCompletionListener(FakeAsyncRedis(broker))
+
+    def publisher():
+        for done_at, session_id in sorted((done_at, session_id) for session_id, done_at in StatusHandler.done_at.items()):
+            time.sleep(max(0, done_at - time.time()))
+            publish_task_completion(FakeRedis(broker), session_id, f"task-{session_id}", {"session_id": session_id, "is_processing": False})
+
+    async def send_completion_message(thread_key, status_response):
+        completions.setdefault(thread_key, []).append(time.time())
+
+    async def send_slack_message(thread_key, text, *args, **kwargs):
+        messages.append((thread_key, text))
+
+    # The bot logs every wait; keep the benchmark output readable.
+    with contextlib.redirect_stdout(io.StringIO()), mock.patch.multiple(
+        chat,
+        completion_listener=listener,
+        api_client=chat.PodcastAgentClient(url),
+        send_completion_message=send_completion_message,
+        send_slack_message=send_slack_message,
+        COMPLETION_WAIT_SEC=30 * time_scale,
+        FALLBACK_POLL_SEC=3 * time_scale,
+        MAX_WAIT_SEC=180 * time_scale,
+    ):
+        thread = threading.Thread(target=publisher, daemon=True)
+        thread.start()
+        futures = []
+        for session_id in sessions:
+            chat.start_completion_watch(session_id, session_id, f"task-{session_id}")
+            futures.append(chat.active_sessions[session_id]["future"])
+        for future in futures:
+            future.result(timeout=180 * time_scale + 30)
+        chat.run_on_event_loop(listener.close()).result(timeout=10)
+        thread.join()
+    return completions, messages, broker.commands
+
+
+def check_event_wakeups(sessions, completions, messages, started, wait_timeout):
+    """Each session gets exactly one completion message, woken by its event rather than by polling the status API."""
+    assert sorted(completions) == sorted(sessions), f"{len(sessions) - len(completions)} sessions were never notified"
+    repeated = [session_id for session_id, sent in completions.items() if len(sent) != 1]
+    assert not repeated, f"{len(repeated)} sessions were notified more than once"
+    assert StatusHandler.long_polls == 0, f"{StatusHandler.long_polls} waits fell back to status long-polling"
+    errors = [text for _, text in messages if not text.startswith("🔄")]
+    assert not errors, f"unexpected Slack messages: {errors[:3]}"
+    # A task that finished well inside the first wait window must be picked up from its event alone.
+    quick = [session_id for session_id in sessions if StatusHandler.done_at[session_id] - started < 0.8 * wait_timeout]
+    polled = [session_id for session_id in quick if StatusHandler.requests_by_session.get(session_id)]
+    assert not polled, f"{len(polled)} of {len(quick)} quick tasks hit the status API instead of being woken by their event"
+    return len(quick)
+
+
+def report(label, notified, http_requests, peak_threads):
+    latencies = [notified[session_id] - StatusHandler.done_at[session_id] for session_id in notified]
+    p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else latencies[0]
+    print(
+        f"{label:<14} notified {len(notified):>4}  median latency {statistics.median(latencies):>6.2f}s  p95 {p95:>6.2f}s  "
+        f"status requests {http_requests:>6}  peak threads {peak_threads:>4}"
+    )
+    return statistics.median(latencies)
+
+
+def schedule(sessions, min_task, max_task, seed):
+    rng = random.Random(seed)
+    now = time.time()
+    StatusHandler.done_at = {session_id: now + rng.uniform(min_task, max_task) for session_id in sessions}
+    StatusHandler.request_count = 0
+    StatusHandler.requests_by_session = {}
+    StatusHandler.long_polls = 0
+    return now
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare status polling with Redis completion events for concurrent podcast sessions")
+    parser.add_argument("--sessions", type=int, default=500, help="Concurrent sessions waiting on a task")
+    parser.add_argument("--min_task", type=float, default=1.0, help="Shortest task duration in seconds")
+    parser.add_argument("--max_task", type=float, default=6.0, help="Longest task duration in seconds")
+    parser.add_argument("--time_scale", type=float, default=0.1, help="Scale applied to the bot's 3s poll, 30s wait and 180s budget")
+    parser.add_argument("--workers", type=int, default=10, help="Executor threads in the Slack bot")
+    args = parser.parse_args()
+
+    server, url = start_status_server()
+    sessions = [f"session-{i}" for i in range(args.sessions)]
+
+    schedule(sessions, args.min_task, args.max_task, seed=1)
+    with ThreadSampler() as sampler:
+        polled = run_polling(sessions, url, 3 * args.time_scale, args.workers, max_polls=60)
+    polling_latency = report("3s polling", polled, StatusHandler.request_count, sampler.peak)
+
+    chat = load_slack_chat()
+    started = schedule(sessions, args.min_task, args.max_task, seed=1)
+    with ThreadSampler() as sampler:
+        completions, messages, redis_commands = run_events(chat, sessions, url, args.time_scale)
+    evented = {session_id: sent[0] for session_id, sent in completions.items()}
+    event_latency = report("pub/sub events", evented, StatusHandler.request_count, sampler.peak)
+    quick = check_event_wakeups(sessions, completions, messages, started, 30 * args.time_scale)
+    print(f"\nOne completion message per session; {quick} tasks inside the wait window needed 0 status requests, 0 fallback long-polls")
+    print(f"Redis commands for {args.sessions} sessions: {redis_commands}")
+    print(f"Median notification latency: {polling_latency / max(event_latency, 1e-6):.0f}x lower")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
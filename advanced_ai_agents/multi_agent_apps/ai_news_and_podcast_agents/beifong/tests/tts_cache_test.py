@@ -0,0 +1,56 @@
+import argparse
+import os
+import tempfile
+import time
+from tests.tts_pipeline_test import FakeSpeechHandler, build_script, start_fake_server
+
+
+def render(label, create_podcast, script, output_path, concurrency):
+    requests_before = FakeSpeechHandler.request_count
+    start = time.time()
+    result = create_podcast(script=script, output_path=output_path, concurrent=True, max_workers=concurrency)
+    elapsed = time.time() - start
+    assert result, f"{label} render produced no audio"
+    requests = FakeSpeechHandler.request_count - requests_before
+    print(f"{label:<24} {elapsed:>7.2f}s  {requests:>4} TTS requests")
+    return elapsed, requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure re-render cost of an edited podcast script with the on-disk TTS cache")
+    parser.add_argument("--minutes", type=float, default=30, help="Podcast length in minutes")
+    parser.add_argument("--seconds_per_line", type=float, default=15, help="Average dialog line length in seconds")
+    parser.add_argument("--edited_lines", type=int, default=3, help="Lines changed between renders")
+    parser.add_argument("--latency", type=float, default=0.2, help="Fixed latency per TTS request in seconds")
+    parser.add_argument("--concurrency", type=int, default=4, help="Parallel TTS requests")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="beifong_tts_cache_bench_")
+    FakeSpeechHandler.latency = args.latency
+    server, base_url = start_fake_server()
+    os.environ["OPENAI_API_KEY"] = "test-key"
+    os.environ["OPENAI_BASE_URL"] = base_url
+    os.environ["TTS_CACHE_DB_PATH"] = os.path.join(work_dir, "tts_cache", "index.db")
+    from agents.audio_generate_agent import create_podcast
+    from utils.tts_cache import TTSCache, get_tts_cache
+
+    script = build_script(args.minutes, args.seconds_per_line)
+    print(f"Rendering {len(script)} dialog lines (~{args.minutes:.0f} min)\n")
+    cold_time, cold_requests = render("cold cache", create_podcast, script, os.path.join(work_dir, "v1.wav"), args.concurrency)
+    edited = [dict(entry) for entry in script]
+    for i in range(args.edited_lines):
+        edited[i * len(edited) // max(args.edited_lines, 1)]["text"] += " revised"
+    warm_time, warm_requests = render("edited script, warm", create_podcast, edited, os.path.join(work_dir, "v2.wav"), args.concurrency)
+    assert warm_requests == args.edited_lines, f"expected {args.edited_lines} cache misses, got {warm_requests}"
+    print(f"\nRe-render: {cold_time / warm_time:.1f}x faster, {cold_requests - warm_requests} of {cold_requests} utterances served from cache")
+
+    cache = get_tts_cache()
+    size = cache.total_bytes()
+    small = TTSCache(index_path=cache.index_path, max_bytes=size // 2)
+    removed = small.evict()
+    print(f"Eviction to {size // 2 / 1024 / 1024:.1f} MB removed {removed} least recently used utterances, cache now {small.total_bytes() / 1024 / 1024:.1f} MB")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+import argparse
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+import soundfile as sf
+
+SAMPLE_RATE = 24000
+
+
+def synthetic_speech(seconds, seed):
+    t = np.arange(int(SAMPLE_RATE * seconds), dtype=np.float32) / SAMPLE_RATE
+    return (0.3 * np.sin(2 * np.pi * (180 + seed % 7 * 20) * t)).astype(np.float32)
+
+
+class FakeSpeechHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    latency = 0.2
+    realtime_factor = 0.02
+    seconds_per_word = 0.4
+    cache = {}
+    request_count = 0
+    lock = threading.Lock()
+
+    def render(self, words, response_format):
+        key = (words, response_format)
+        with self.lock:
+            FakeSpeechHandler.request_count += 1
+            if key not in self.cache:
+                audio = synthetic_speech(words * self.seconds_per_word, words)
+                if response_format == "pcm":
+                    body = (audio * 32767).astype("<i2").tobytes()
+                else:
+                    buffer = io.BytesIO()
+                    sf.write(buffer, audio, SAMPLE_RATE, format=response_format.upper())
+                    body = buffer.getvalue()
+                self.cache[key] = body
+            return self.cache[key]
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length))
+        words = len(payload["input"].split())
+        body = self.render(words, payload.get("response_format", "mp3"))
+        time.sleep(self.latency + self.realtime_factor * words * self.seconds_per_word)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fake_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeSpeechHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+
+def build_script(minutes, seconds_per_line):
+    words_per_line = int(seconds_per_line / FakeSpeechHandler.seconds_per_word)
+    lines = int(minutes * 60 / seconds_per_line)
+    return [{"speaker": 1 + i % 2, "text": f"line{i} " + " ".join(f"word{j}" for j in range(words_per_line - 1 - i % 5))} for i in range(lines)]
+
+
+def run(label, create_podcast, script, output_path, **kwargs):
+    tracemalloc.start()
+    start = time.time()
+    result = create_podcast(script=script, output_path=output_path, **kwargs)
+    elapsed = time.time() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert result, f"{label} run produced no audio"
+    info = sf.info(output_path)
+    print(f"{label:<11} {elapsed:>7.2f}s  peak traced memory {peak / 1024 / 1024:>7.1f} MB  output {info.duration / 60:.1f} min")
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare sequential and concurrent podcast TTS rendering against a fake speech API")
+    parser.add_argument("--minutes", type=float, default=30, help="Podcast length in minutes")
+    parser.add_argument("--seconds_per_line", type=float, default=15, help="Average dialog line length in seconds")
+    parser.add_argument("--latency", type=float, default=0.2, help="Fixed latency per TTS request in seconds")
+    parser.add_argument("--concurrency", type=int, default=4, help="Parallel TTS requests")
+    args = parser.parse_args()
+
+    FakeSpeechHandler.latency = args.latency
+    server, base_url = start_fake_server()
+    os.environ["OPENAI_API_KEY"] = "test-key"
+    os.environ["OPENAI_BASE_URL"] = base_url
+    os.environ["TTS_CACHE_MAX_MB"] = "0"
+    from agents.audio_generate_agent import create_podcast
+
+    script = build_script(args.minutes, args.seconds_per_line)
+    work_dir = tempfile.mkdtemp(prefix="beifong_tts_bench_")
+    print(f"Rendering {len(script)} dialog lines (~{args.minutes:.0f} min)\n")
+    seq_time, seq_peak = run("sequential", create_podcast, script, os.path.join(work_dir, "sequential.wav"), concurrent=False)
+    con_time, con_peak = run(
+        "concurrent", create_podcast, script, os.path.join(work_dir, "concurrent.wav"), concurrent=True, max_workers=args.concurrency
+    )
+    print(f"\nWall time: {seq_time / con_time:.1f}x faster, peak memory: {seq_peak / con_peak:.1f}x lower")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
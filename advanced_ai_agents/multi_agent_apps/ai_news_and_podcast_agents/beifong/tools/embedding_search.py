@@ -1,10 +1,9 @@
 from agno.agent import Agent
-import os
 import numpy as np
-import faiss
 from openai import OpenAI
-from db.config import get_tracking_db_path, get_faiss_db_path, get_sources_db_path
+from db.config import get_tracking_db_path, get_sources_db_path
 from db.connection import execute_query
+from services.faiss_index_service import faiss_index_service
 from utils.load_api_keys import load_api_key
 import traceback
 import json
@@ -24,24 +23,6 @@ def generate_query_embedding(query_text, model=EMBEDDING_MODEL):
         return None, str(e)
 
 
-def load_faiss_index(index_path):
-    if not os.path.exists(index_path):
-        return None, f"FAISS index not found at {index_path}"
-    try:
-        return faiss.read_index(index_path), None
-    except Exception as e:
-        return None, f"Error loading FAISS index: {str(e)}"
-
-
-def load_id_mapping(mapping_path):
-    if not os.path.exists(mapping_path):
-        return None, f"ID mapping not found at {mapping_path}"
-    try:
-        return np.load(mapping_path).tolist(), None
-    except Exception as e:
-        return None, f"Error loading ID mapping: {str(e)}"
-
-
 def get_article_details(tracking_db_path, article_ids):
     if not article_ids:
         return []
@@ -95,31 +76,24 @@ def embedding_search(agent: Agent, prompt: str) -> str:
     """
     print("Embedding Search Input:", prompt)
     tracking_db_path = get_tracking_db_path()
-    index_path, mapping_path = get_faiss_db_path()
     top_k = 20
     similarity_threshold = 0.85
-    if not os.path.exists(index_path) or not os.path.exists(mapping_path):
+    if not faiss_index_service.is_available():
         return "Embedding search not available: index files not found. Continuing with other search methods."
     query_embedding, error = generate_query_embedding(prompt)
     if not query_embedding:
         return f"Semantic search unavailable: {error}. Continuing with other search methods."
     query_vector = np.array([query_embedding]).astype(np.float32)
     try:
-        faiss_index, error = load_faiss_index(index_path)
-        if error:
-            return f"Semantic search unavailable: {error}. Continuing with other search methods."
-        id_map, error = load_id_mapping(mapping_path)
-        if error:
-            return f"Semantic search unavailable: {error}. Continuing with other search methods."
-        distances, indices = faiss_index.search(query_vector, top_k)
+        try:
+            matches = faiss_index_service.search(query_vector, top_k)
+        except Exception as e:
+            return f"Semantic search unavailable: Error loading FAISS index: {str(e)}. Continuing with other search methods."
         results_with_metrics = []
-        for i, idx in enumerate(indices[0]):
-            if idx >= 0 and idx < len(id_map):
-                distance = float(distances[0][i])
-                similarity = float(np.exp(-distance)) if distance > 0 else 0
-                if similarity >= similarity_threshold:
-                    article_id = id_map[idx]
-                    results_with_metrics.append((idx, distance, similarity, article_id))
+        for idx, (article_id, distance) in enumerate(matches):
+            similarity = float(np.exp(-distance)) if distance > 0 else 0
+            if similarity >= similarity_threshold:
+                results_with_metrics.append((idx, distance, similarity, article_id))
         results_with_metrics.sort(key=lambda x: x[2], reverse=True)
         result_article_ids = [item[3] for item in results_with_metrics]
         if not result_article_ids:
@@ -0,0 +1,159 @@
+import json
+import os
+import sqlite3
+import traceback
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Sequence, Tuple
+import numpy as np
+from agno.agent import Agent
+from db.config import get_sources_db_path, get_tracking_db_path
+from db.fts import to_fts_query
+from services.faiss_index_service import faiss_index_service
+from tools.embedding_search import generate_query_embedding
+from tools.search_articles import execute_like_search
+
+RRF_K = 60
+CANDIDATES_PER_RETRIEVER = 30
+MAX_RESULTS = 10
+
+
+def open_readonly(db_path):
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def keyword_ranking(tracking_db_path: str, query: str, limit: int = CANDIDATES_PER_RETRIEVER) -> List[int]:
+    fts_query = to_fts_query(query.split())
+    if not fts_query:
+        return []
+    with closing(open_readonly(tracking_db_path)) as conn:
+        try:
+            cursor = conn.execute(
+                """
+                SELECT rowid FROM crawled_articles_fts
+                WHERE crawled_articles_fts MATCH ?
+                ORDER BY bm25(crawled_articles_fts, 10.0, 5.0, 1.0)
+                LIMIT ?
+                """,
+                (fts_query, limit),
+            )
+            return [row[0] for row in cursor.fetchall()]
+        except sqlite3.OperationalError as e:
+            print(f"Full-text index unavailable, falling back to LIKE search: {e}")
+            return [row["id"] for row in execute_like_search(conn, [query], limit)]
+
+
+def semantic_ranking(query: str, limit: int = CANDIDATES_PER_RETRIEVER) -> List[int]:
+    if not faiss_index_service.is_available():
+        return []
+    query_embedding, error = generate_query_embedding(query)
+    if not query_embedding:
+        print(f"Semantic search unavailable: {error}")
+        return []
+    matches = faiss_index_service.search(np.array([query_embedding], dtype=np.float32), limit)
+    return [int(article_id) for article_id, _ in matches]
+
+
+def reciprocal_rank_fusion(rankings: Dict[str, Sequence[int]], k: int = RRF_K) -> List[Tuple[int, float, List[str]]]:
+    """Fuse ranked id lists into (id, score, retrievers) sorted by descending RRF score."""
+    scores: Dict[int, float] = {}
+    matched_by: Dict[int, List[str]] = {}
+    for name, ranking in rankings.items():
+        seen = set()
+        for rank, article_id in enumerate(ranking, start=1):
+            if article_id in seen:
+                continue
+            seen.add(article_id)
+            scores[article_id] = scores.get(article_id, 0.0) + 1.0 / (k + rank)
+            matched_by.setdefault(article_id, []).append(name)
+    fused = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    return [(article_id, score, matched_by[article_id]) for article_id, score in fused]
+
+
+def get_ranked_article_details(tracking_db_path: str, article_ids: List[int]) -> Dict[int, dict]:
+    """Fetch article rows, categories and source names for all ids in a single query."""
+    if not article_ids:
+        return {}
+    placeholders = ",".join(["?"] * len(article_ids))
+    sources_db_path = get_sources_db_path()
+    with closing(open_readonly(tracking_db_path)) as conn:
+        source_join = ""
+        source_name = "CAST(ca.source_id AS TEXT)"
+        if os.path.exists(sources_db_path):
+            try:
+                conn.execute("ATTACH DATABASE ? AS sources_db", (f"file:{sources_db_path}?mode=ro",))
+                if conn.execute("SELECT 1 FROM sources_db.sqlite_master WHERE type = 'table' AND name = 'sources'").fetchone():
+                    source_join = "LEFT JOIN sources_db.sources s ON s.id = ca.source_id"
+                    source_name = "COALESCE(s.name, CAST(ca.source_id AS TEXT))"
+            except sqlite3.OperationalError as e:
+                print(f"Could not attach sources database: {e}")
+        query = f"""
+            SELECT ca.id, ca.title, ca.url, ca.published_date,
+                   COALESCE(ca.summary, ca.content) as description,
+                   ca.source_id, {source_name} as source_name,
+                   (SELECT GROUP_CONCAT(ac.category_name, '|') FROM article_categories ac WHERE ac.article_id = ca.id) as categories
+            FROM crawled_articles ca
+            {source_join}
+            WHERE ca.id IN ({placeholders}) AND ca.processed = 1
+        """
+        rows = conn.execute(query, article_ids).fetchall()
+    details = {}
+    for row in rows:
+        item = dict(row)
+        item["categories"] = item["categories"].split("|") if item["categories"] else []
+        details[item["id"]] = item
+    return details
+
+
+def hybrid_article_search(query: str, limit: int = MAX_RESULTS, candidates: int = CANDIDATES_PER_RETRIEVER) -> List[dict]:
+    tracking_db_path = get_tracking_db_path()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        keyword_future = executor.submit(keyword_ranking, tracking_db_path, query, candidates)
+        semantic_future = executor.submit(semantic_ranking, query, candidates)
+        rankings = {}
+        for name, future in (("keyword", keyword_future), ("semantic", semantic_future)):
+            try:
+                rankings[name] = future.result()
+            except Exception as e:
+                print(f"{name.capitalize()} retrieval failed: {e}")
+                rankings[name] = []
+    fused = reciprocal_rank_fusion(rankings)
+    details = get_ranked_article_details(tracking_db_path, [article_id for article_id, _, _ in fused])
+    results = []
+    for article_id, score, matched_by in fused:
+        item = details.get(article_id)
+        if not item:
+            continue
+        item["rrf_score"] = round(score, 5)
+        item["matched_by"] = matched_by
+        item["is_scrapping_required"] = False
+        results.append(item)
+        if len(results) >= limit:
+            break
+    return results
+
+
+def hybrid_search(agent: Agent, query: str) -> str:
+    """
+    Search the internal articles database (crawled from the user's preselected rss feeds) using keyword and semantic search together.
+    Keyword (BM25 full-text) and embedding (vector similarity) matches are retrieved in parallel and merged with reciprocal rank fusion,
+    so a single call returns the best internal sources for the topic.
+
+    Args:
+        agent: The Agno agent instance
+        query: The search query or topic
+
+    Returns:
+        Search results
+    """
+    print("Hybrid Search Input:", query)
+    try:
+        results = hybrid_article_search(query)
+    except Exception as e:
+        traceback.print_exc()
+        return f"Internal article search unavailable: {str(e)}. Continuing with other search methods."
+    if not results:
+        return "No relevant articles found in our internal database. Continuing with other search methods."
+    return f"Found {len(results)}, results: {json.dumps(results, indent=2)}"
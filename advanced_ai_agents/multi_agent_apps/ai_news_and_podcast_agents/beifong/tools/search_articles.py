@@ -2,6 +2,7 @@ import sqlite3
 from typing import List, Union
 from agno.agent import Agent
 from db.config import get_tracking_db_path
+from db.fts import to_fts_query
 import json
 
 
@@ -37,6 +38,35 @@ def search_articles(agent: Agent, terms: Union[str, List[str]]) -> str:
 
 
 def execute_simple_search(conn, terms, limit):
+    fts_query = to_fts_query(terms)
+    if not fts_query:
+        return []
+    try:
+        return execute_fts_search(conn, fts_query, limit)
+    except sqlite3.OperationalError as e:
+        print(f"Full-text index unavailable, falling back to LIKE search: {e}")
+        return execute_like_search(conn, terms, limit)
+
+
+def execute_fts_search(conn, fts_query, limit):
+    query = """
+        SELECT ca.id, ca.title, ca.url, ca.published_date,
+               COALESCE(ca.summary, ca.content) as content,
+               ca.source_id, ca.feed_id,
+               snippet(crawled_articles_fts, -1, '[', ']', '...', 24) as snippet,
+               bm25(crawled_articles_fts, 10.0, 5.0, 1.0) as rank
+        FROM crawled_articles_fts
+        JOIN crawled_articles ca ON ca.id = crawled_articles_fts.rowid
+        WHERE crawled_articles_fts MATCH ?
+          AND ca.processed = 1
+        ORDER BY rank
+        LIMIT ?
+    """
+    cursor = conn.execute(query, (fts_query, limit))
+    return [dict(row) for row in cursor.fetchall()]
+
+
+def execute_like_search(conn, terms, limit):
     base_query = """
         SELECT DISTINCT ca.id, ca.title, ca.url, ca.published_date, 
                COALESCE(ca.summary, ca.content) as content,
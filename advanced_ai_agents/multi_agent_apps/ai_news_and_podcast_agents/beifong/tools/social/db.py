@@ -1,5 +1,41 @@
 import sqlite3
 import json
+from db.fts import ensure_posts_fts
+from db.rollups import ensure_post_rollups
+
+POST_COLUMNS = [
+    "post_id",
+    "platform",
+    "user_display_name",
+    "user_handle",
+    "user_profile_pic_url",
+    "post_timestamp",
+    "post_display_time",
+    "post_url",
+    "post_text",
+    "post_mentions",
+    "engagement_reply_count",
+    "engagement_retweet_count",
+    "engagement_like_count",
+    "engagement_bookmark_count",
+    "engagement_view_count",
+    "media",
+    "media_count",
+    "is_ad",
+    "sentiment",
+    "categories",
+    "tags",
+    "analysis_reasoning",
+]
+ENGAGEMENT_METRICS = [
+    "engagement_reply_count",
+    "engagement_retweet_count",
+    "engagement_like_count",
+    "engagement_bookmark_count",
+    "engagement_view_count",
+]
+MAX_QUERY_PARAMS = 500
+DEFAULT_POST_BATCH_SIZE = 100
 
 
 def create_connection(db_file="x_posts.db"):
@@ -43,6 +79,8 @@ def setup_database(conn):
     conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_user_handle ON posts(user_handle)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_post_timestamp ON posts(post_timestamp)")
     conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_sentiment ON posts(sentiment)")
+    ensure_posts_fts(conn.cursor())
+    ensure_post_rollups(conn.cursor())
     conn.commit()
 
 
@@ -70,8 +108,7 @@ def parse_engagement_count(count_str):
 
 def process_post_data(post_data):
     data = post_data.copy()
-    metrics = ["engagement_reply_count", "engagement_retweet_count", "engagement_like_count", "engagement_bookmark_count", "engagement_view_count"]
-    for metric in metrics:
+    for metric in ENGAGEMENT_METRICS:
         if metric in data:
             data[metric] = parse_engagement_count(data[metric])
     if "media" in data and isinstance(data["media"], list):
@@ -85,54 +122,62 @@ def process_post_data(post_data):
     return data
 
 
-def get_post(conn, post_id):
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM posts WHERE post_id = ?", (post_id,))
-    return cursor.fetchone()
-
-
-def insert_post(conn, post_data):
-    data = process_post_data(post_data)
-    columns = ", ".join(data.keys())
-    placeholders = ", ".join(["?"] * len(data))
-    values = list(data.values())
-    sql = f"INSERT INTO posts ({columns}) VALUES ({placeholders})"
-    conn.execute(sql, values)
+# re-scraped posts only refresh metrics the scraper actually read, and rows whose metrics are unchanged are not written at all
+UPSERT_POSTS_SQL = f"""
+INSERT INTO posts ({", ".join(POST_COLUMNS)}) VALUES ({", ".join("?" * len(POST_COLUMNS))})
+ON CONFLICT (post_id) DO UPDATE SET
+    {", ".join(f"{metric} = COALESCE(excluded.{metric}, {metric})" for metric in ENGAGEMENT_METRICS)},
+    updated_at = CURRENT_TIMESTAMP
+WHERE {" OR ".join(f"{metric} IS NOT COALESCE(excluded.{metric}, {metric})" for metric in ENGAGEMENT_METRICS)}
+"""
+
+
+def store_posts(conn, posts):
+    """Upsert a batch of scraped posts in one transaction and return the new ones that have text to analyze."""
+    batch = {}
+    for post_data in posts:
+        post_id = post_data.get("post_id")
+        if not post_id or post_data.get("is_ad", False):
+            continue
+        batch[post_id] = post_data
+    if not batch:
+        return []
+    post_ids = list(batch)
+    existing = set()
+    for start in range(0, len(post_ids), MAX_QUERY_PARAMS):
+        chunk = post_ids[start : start + MAX_QUERY_PARAMS]
+        rows = conn.execute(f"SELECT post_id FROM posts WHERE post_id IN ({', '.join('?' * len(chunk))})", chunk)
+        existing.update(row[0] for row in rows)
+    rows = []
+    for post_data in batch.values():
+        data = process_post_data(post_data)
+        rows.append([data.get(column) for column in POST_COLUMNS])
+    conn.executemany(UPSERT_POSTS_SQL, rows)
     conn.commit()
+    return [post_data for post_id, post_data in batch.items() if post_id not in existing and post_data.get("post_text")]
 
 
 def check_and_store_post(conn, post_data):
-    post_id = post_data.get("post_id")
-    if not post_id:
-        return False
-    if post_data.get("is_ad", False):
-        return False
-    data = process_post_data(post_data)
-    existing_post = get_post(conn, post_id)
-    if not existing_post:
-        needs_analysis = bool(data.get("post_text"))
-        insert_post(conn, data)
-        return needs_analysis
-    else:
-        update_changed_metrics(conn, existing_post, data)
-        return False
-
-
-def update_changed_metrics(conn, existing_post, new_data):
-    metrics = ["engagement_reply_count", "engagement_retweet_count", "engagement_like_count", "engagement_bookmark_count", "engagement_view_count"]
-    changes = {}
-    for metric in metrics:
-        if metric in new_data and metric in existing_post:
-            if new_data[metric] != existing_post[metric]:
-                changes[metric] = new_data[metric]
-    if changes:
-        set_clauses = [f"{metric} = ?" for metric in changes]
-        set_sql = ", ".join(set_clauses)
-        set_sql += ", updated_at = CURRENT_TIMESTAMP"
-        sql = f"UPDATE posts SET {set_sql} WHERE post_id = ?"
-        params = list(changes.values()) + [existing_post["post_id"]]
-        conn.execute(sql, params)
-        conn.commit()
+    return bool(store_posts(conn, [post_data]))
+
+
+class PostBuffer:
+    """Collects parsed posts across scrolls and GraphQL responses and stores them together once batch_size are pending."""
+
+    def __init__(self, conn, batch_size=DEFAULT_POST_BATCH_SIZE):
+        self.conn = conn
+        self.batch_size = batch_size
+        self.pending = []
+
+    def add(self, post_data):
+        self.pending.append(post_data)
+        if len(self.pending) >= self.batch_size:
+            return self.flush()
+        return []
+
+    def flush(self):
+        posts, self.pending = self.pending, []
+        return store_posts(self.conn, posts)
 
 
 def update_posts_with_analysis(conn, post_ids, analysis_results):
@@ -143,19 +188,21 @@ def update_posts_with_analysis(conn, post_ids, analysis_results):
         post_id = analysis.get("post_id")
         if post_id:
             analysis_by_id[post_id] = analysis
+    rows = []
     for post_id in post_ids:
         if post_id in analysis_by_id:
             analysis = analysis_by_id[post_id]
             categories = json.dumps(analysis.get("categories", []))
             tags = json.dumps(analysis.get("tags", []))
-            conn.execute(
-                """UPDATE posts SET 
-                   sentiment = ?, 
-                   categories = ?, 
-                   tags = ?, 
-                   analysis_reasoning = ?,
-                   updated_at = CURRENT_TIMESTAMP 
-                   WHERE post_id = ?""",
-                (analysis.get("sentiment"), categories, tags, analysis.get("reasoning"), post_id),
-            )
-    conn.commit()
\ No newline at end of file
+            rows.append((analysis.get("sentiment"), categories, tags, analysis.get("reasoning"), post_id))
+    conn.executemany(
+        """UPDATE posts SET 
+           sentiment = ?, 
+           categories = ?, 
+           tags = ?, 
+           analysis_reasoning = ?,
+           updated_at = CURRENT_TIMESTAMP 
+           WHERE post_id = ?""",
+        rows,
+    )
+    conn.commit()
@@ -3,7 +3,7 @@ import json
 from tools.social.browser import create_browser_context
 from tools.social.fb_post_extractor import parse_facebook_posts, normalize_facebook_posts_batch
 from tools.social.x_agent import analyze_posts_sentiment
-from tools.social.db import create_connection, setup_database, check_and_store_post, update_posts_with_analysis
+from tools.social.db import create_connection, setup_database, PostBuffer, update_posts_with_analysis
 
 
 def contains_facebook_posts(json_obj):
@@ -26,7 +26,7 @@ def contains_facebook_posts(json_obj):
         return False
 
 
-def process_facebook_graphql_response(response_text, seen_post_ids, analysis_queue, queue_post_ids, conn):
+def process_facebook_graphql_response(response_text, seen_post_ids, analysis_queue, queue_post_ids, post_buffer):
     posts_processed = 0
     if not response_text:
         return posts_processed
@@ -48,10 +48,9 @@ def process_facebook_graphql_response(response_text, seen_post_ids, analysis_que
                         continue
                     seen_post_ids.add(post_id)
                     posts_processed += 1
-                    needs_analysis = check_and_store_post(conn, post_data)
-                    if needs_analysis and post_data.get("post_text"):
-                        analysis_queue.append(post_data)
-                        queue_post_ids.append(post_id)
+                    for new_post in post_buffer.add(post_data):
+                        analysis_queue.append(new_post)
+                        queue_post_ids.append(new_post["post_id"])
         except json.JSONDecodeError:
             continue
         except Exception as e:
@@ -64,6 +63,7 @@ def process_facebook_graphql_response(response_text, seen_post_ids, analysis_que
 def crawl_facebook_feed(target_url="https://facebook.com", db_file="fb_posts.db"):
     conn = create_connection(db_file)
     setup_database(conn)
+    post_buffer = PostBuffer(conn)
     seen_post_ids = set()
     analysis_queue = []
     queue_post_ids = []
@@ -83,7 +83,12 @@ def crawl_facebook_feed(target_url="https://facebook.com", db_file="fb_posts.db"
                 if 'text/html; charset="utf-8"' not in content_type:
                     return
                 response_text = response.text()
-                posts_found = process_facebook_graphql_response(response_text, seen_post_ids, analysis_queue, queue_post_ids, conn)
+                posts_found = process_facebook_graphql_response(response_text, seen_post_ids, analysis_queue, queue_post_ids, post_buffer)
+                # One upsert per GraphQL response, so posts are committed and
+                # queued for analysis as they arrive.
+                for new_post in post_buffer.flush():
+                    analysis_queue.append(new_post)
+                    queue_post_ids.append(new_post["post_id"])
                 if posts_found > 0:
                     post_count += posts_found
                 if len(analysis_queue) >= batch_size:
@@ -115,13 +120,16 @@ def crawl_facebook_feed(target_url="https://facebook.com", db_file="fb_posts.db"
                     break
         except KeyboardInterrupt:
             pass
+        finally:
+            for post_data in post_buffer.flush():
+                analysis_queue.append(post_data)
+                queue_post_ids.append(post_data["post_id"])
+            if analysis_queue:
+                try:
+                    analysis_results = analyze_posts_sentiment(analysis_queue)
+                    update_posts_with_analysis(conn, queue_post_ids, analysis_results)
+                except Exception:
+                    pass
 
-        if analysis_queue:
-            try:
-                analysis_results = analyze_posts_sentiment(analysis_queue)
-                update_posts_with_analysis(conn, queue_post_ids, analysis_results)
-            except Exception:
-                pass
-
-        conn.close()
+            conn.close()
         return post_count
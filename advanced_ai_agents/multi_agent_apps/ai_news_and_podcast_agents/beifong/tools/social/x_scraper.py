@@ -2,7 +2,7 @@ import time
 from tools.social.browser import create_browser_context
 from tools.social.x_post_extractor import x_post_extractor
 from tools.social.x_agent import analyze_posts_sentiment
-from tools.social.db import create_connection, setup_database, check_and_store_post, update_posts_with_analysis
+from tools.social.db import create_connection, setup_database, PostBuffer, update_posts_with_analysis
 
 
 def crawl_x_profile(profile_url, db_file="x_posts.db"):
@@ -11,6 +11,7 @@ def crawl_x_profile(profile_url, db_file="x_posts.db"):
 
     conn = create_connection(db_file)
     setup_database(conn)
+    post_buffer = PostBuffer(conn)
     seen_post_ids = set()
     analysis_queue = []
     queue_post_ids = []
@@ -42,17 +43,20 @@ def crawl_x_profile(profile_url, db_file="x_posts.db"):
                     post_data = x_post_extractor(tweet_html)
 
                     post_id = post_data.get("post_id")
-                    if not post_id or post_data.get("is_ad", False):
+                    if not post_id or post_data.get("is_ad", False) or post_id in seen_post_ids:
                         continue
 
                     seen_post_ids.add(post_id)
                     post_count += 1
+                    for new_post in post_buffer.add(post_data):
+                        analysis_queue.append(new_post)
+                        queue_post_ids.append(new_post["post_id"])
 
-                    needs_analysis = check_and_store_post(conn, post_data)
-
-                    if needs_analysis and post_data.get("post_text"):
-                        analysis_queue.append(post_data)
-                        queue_post_ids.append(post_id)
+                # Store this scroll's posts in one upsert so they are committed
+                # (and queued for analysis) before the next scroll.
+                for new_post in post_buffer.flush():
+                    analysis_queue.append(new_post)
+                    queue_post_ids.append(new_post["post_id"])
 
                 if len(analysis_queue) >= batch_size:
                     analysis_batch = analysis_queue[:batch_size]
@@ -77,15 +81,19 @@ def crawl_x_profile(profile_url, db_file="x_posts.db"):
 
         except KeyboardInterrupt:
             pass
-
-        # Flush any posts still queued (a partial final batch on a normal exit, or
-        # whatever was pending at a KeyboardInterrupt) so they are analyzed instead
-        # of being left with NULL sentiment/categories forever; also close the conn.
-        if analysis_queue:
-            try:
-                analysis_results = analyze_posts_sentiment(analysis_queue)
-                update_posts_with_analysis(conn, queue_post_ids, analysis_results)
-            except Exception:
-                pass
-        conn.close()
-        return post_count
\ No newline at end of file
+        finally:
+            for post_data in post_buffer.flush():
+                analysis_queue.append(post_data)
+                queue_post_ids.append(post_data["post_id"])
+
+            # Flush any posts still queued (a partial final batch on a normal exit, or
+            # whatever was pending at an interrupt or crawl error) so they are analyzed
+            # instead of being left with NULL sentiment/categories forever; also close the conn.
+            if analysis_queue:
+                try:
+                    analysis_results = analyze_posts_sentiment(analysis_queue)
+                    update_posts_with_analysis(conn, queue_post_ids, analysis_results)
+                except Exception:
+                    pass
+            conn.close()
+        return post_count
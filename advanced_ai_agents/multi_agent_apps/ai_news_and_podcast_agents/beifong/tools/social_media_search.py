@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 from contextlib import contextmanager
 from agno.agent import Agent
 from db.config import get_db_path
+from db.fts import to_fts_query
 
 
 @contextmanager
@@ -36,6 +37,9 @@ def social_media_search(agent: Agent, topic: str, limit: int = 10) -> str:
         date_from = (datetime.now() - timedelta(days=days_back)).isoformat()
         with get_social_media_db() as conn:
             cursor = conn.cursor()
+            fts_query = to_fts_query(topic, columns=["post_text", "user_display_name"])
+            if not fts_query:
+                return f"No positive news posts found for '{topic}' in the last {days_back} days."
             sql_query = """
             SELECT 
                 post_id,
@@ -49,12 +53,11 @@ def social_media_search(agent: Agent, topic: str, limit: int = 10) -> str:
                 categories LIKE '%"news"%' 
                 AND sentiment = 'positive'
                 AND datetime(post_timestamp) >= datetime(?)
-                AND (post_text LIKE ? OR user_display_name LIKE ?)
+                AND rowid IN (SELECT rowid FROM posts_fts WHERE posts_fts MATCH ?)
             ORDER BY datetime(post_timestamp) DESC
             LIMIT ?
             """
-            search_term = f"%{topic}%"
-            cursor.execute(sql_query, (date_from, search_term, search_term, limit))
+            cursor.execute(sql_query, (date_from, fts_query, limit))
             rows = cursor.fetchall()
             if not rows:
                 return f"No positive news posts found for '{topic}' in the last {days_back} days."
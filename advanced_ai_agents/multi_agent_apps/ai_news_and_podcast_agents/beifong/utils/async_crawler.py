@@ -0,0 +1,72 @@
+import asyncio
+import random
+from typing import Any, Dict, List, Optional, Tuple
+import aiohttp
+from utils.async_feed_fetcher import HostRateLimiter, read_capped
+from utils.crawl_url import HEADERS, USER_AGENTS, WebData, extract_web_data
+
+MAX_RESPONSE_BYTES = 2 * 1024 * 1024
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+
+async def fetch_web_data(
+    session: aiohttp.ClientSession,
+    limiter: HostRateLimiter,
+    url: str,
+    max_bytes: int = MAX_RESPONSE_BYTES,
+) -> Optional[WebData]:
+    headers = dict(HEADERS)
+    headers["User-Agent"] = random.choice(USER_AGENTS)
+    async with limiter.semaphore(url):
+        await limiter.wait(url)
+        async with session.get(url, headers=headers) as response:
+            response.raise_for_status()
+            content_type = response.headers.get("Content-Type", "").lower()
+            if content_type and not content_type.startswith(HTML_CONTENT_TYPES):
+                return None
+            body = await read_capped(response, max_bytes)
+            charset = response.charset
+    if charset:
+        html = body.decode(charset, errors="replace")
+    else:
+        html = body
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, extract_web_data, html)
+
+
+async def crawl_urls(
+    entries: List[Dict[str, Any]],
+    concurrency: int = 32,
+    per_host_limit: int = 2,
+    per_host_interval: float = 1.0,
+    timeout: float = 15,
+    max_bytes: int = MAX_RESPONSE_BYTES,
+) -> List[Tuple[Dict[str, Any], Any]]:
+    limiter = HostRateLimiter(per_host_limit=per_host_limit, per_host_interval=per_host_interval)
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=per_host_limit, ttl_dns_cache=300, keepalive_timeout=30)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    queue: asyncio.Queue = asyncio.Queue()
+    for entry in entries:
+        queue.put_nowait(entry)
+    results: List[Tuple[Dict[str, Any], Any]] = []
+
+    async def worker(session: aiohttp.ClientSession) -> None:
+        while True:
+            try:
+                entry = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                result = await fetch_web_data(session, limiter, entry["link"], max_bytes=max_bytes)
+            except Exception as e:
+                result = e
+            results.append((entry, result))
+
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout) as session:
+        workers = [asyncio.create_task(worker(session)) for _ in range(min(concurrency, len(entries)))]
+        await asyncio.gather(*workers)
+    return results
+
+
+def crawl_urls_sync(entries, **kwargs):
+    return asyncio.run(crawl_urls(entries, **kwargs))
@@ -0,0 +1,136 @@
+import asyncio
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+import aiohttp
+from utils.crawl_url import USER_AGENTS
+from utils.rss_feed_parser import parse_feed_content
+
+FEED_ACCEPT = "application/rss+xml, application/atom+xml, application/xml;q=0.9, text/xml;q=0.8, */*;q=0.5"
+MAX_FEED_BYTES = 10 * 1024 * 1024
+
+
+class ResponseTooLarge(Exception):
+    pass
+
+
+async def read_capped(response: aiohttp.ClientResponse, max_bytes: int) -> bytes:
+    if response.content_length and response.content_length > max_bytes:
+        raise ResponseTooLarge(f"Content-Length {response.content_length} exceeds {max_bytes} bytes")
+    chunks = []
+    size = 0
+    async for chunk in response.content.iter_chunked(64 * 1024):
+        size += len(chunk)
+        if size > max_bytes:
+            raise ResponseTooLarge(f"Response exceeds {max_bytes} bytes")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+class HostRateLimiter:
+    def __init__(self, per_host_limit: int = 2, per_host_interval: float = 1.0):
+        self.per_host_limit = per_host_limit
+        self.per_host_interval = per_host_interval
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._last_request: Dict[str, float] = {}
+
+    def _host(self, url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def semaphore(self, url: str) -> asyncio.Semaphore:
+        host = self._host(url)
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._semaphores[host]
+
+    async def wait(self, url: str) -> None:
+        host = self._host(url)
+        if host not in self._locks:
+            self._locks[host] = asyncio.Lock()
+        async with self._locks[host]:
+            elapsed = time.monotonic() - self._last_request.get(host, 0.0)
+            if elapsed < self.per_host_interval:
+                await asyncio.sleep(self.per_host_interval - elapsed)
+            self._last_request[host] = time.monotonic()
+
+
+def _conditional_headers(tracking_info: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    headers = {"User-Agent": random.choice(USER_AGENTS), "Accept": FEED_ACCEPT}
+    if not tracking_info:
+        return headers
+    if tracking_info.get("last_etag"):
+        headers["If-None-Match"] = tracking_info["last_etag"]
+    if tracking_info.get("last_modified"):
+        headers["If-Modified-Since"] = str(tracking_info["last_modified"])
+    return headers
+
+
+def _not_modified_result(tracking_info: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    tracking_info = tracking_info or {}
+    return {
+        "parsed_entries": None,
+        "modified": tracking_info.get("last_modified"),
+        "status": 304,
+        "current_hash": tracking_info.get("entry_hash"),
+        "etag": tracking_info.get("last_etag"),
+        "is_rss_feed": True,
+    }
+
+
+async def fetch_feed(
+    session: aiohttp.ClientSession,
+    limiter: HostRateLimiter,
+    feed_url: str,
+    tracking_info: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    async with limiter.semaphore(feed_url):
+        await limiter.wait(feed_url)
+        async with session.get(feed_url, headers=_conditional_headers(tracking_info)) as response:
+            if response.status == 304:
+                return _not_modified_result(tracking_info)
+            response.raise_for_status()
+            content = await read_capped(response, MAX_FEED_BYTES)
+            headers = dict(response.headers)
+            status = response.status
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, parse_feed_content, content, headers, status)
+
+
+async def fetch_feeds(
+    feeds: List[Dict[str, Any]],
+    tracking_infos: Dict[int, Dict[str, Any]],
+    concurrency: int = 50,
+    per_host_limit: int = 2,
+    per_host_interval: float = 1.0,
+    timeout: float = 20,
+) -> List[Tuple[Dict[str, Any], Any]]:
+    limiter = HostRateLimiter(per_host_limit=per_host_limit, per_host_interval=per_host_interval)
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=per_host_limit, ttl_dns_cache=300, keepalive_timeout=30)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    queue: asyncio.Queue = asyncio.Queue()
+    for feed in feeds:
+        queue.put_nowait(feed)
+    results: List[Tuple[Dict[str, Any], Any]] = []
+
+    async def worker(session: aiohttp.ClientSession) -> None:
+        while True:
+            try:
+                feed = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                result = await fetch_feed(session, limiter, feed["feed_url"], tracking_infos.get(feed["id"]))
+            except Exception as e:
+                result = e
+            results.append((feed, result))
+
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout) as session:
+        workers = [asyncio.create_task(worker(session)) for _ in range(min(concurrency, len(feeds)))]
+        await asyncio.gather(*workers)
+    return results
+
+
+def fetch_feeds_sync(feeds, tracking_infos, **kwargs):
+    return asyncio.run(fetch_feeds(feeds, tracking_infos, **kwargs))
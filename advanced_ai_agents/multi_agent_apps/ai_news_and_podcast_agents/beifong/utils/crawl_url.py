@@ -1,7 +1,9 @@
 import requests
 from bs4 import BeautifulSoup
 import random
-from typing import Dict, List, TypedDict
+from typing import Dict, List, TypedDict, Union
+import lxml.html
+from lxml import etree
 
 
 class MetadataDict(TypedDict):
@@ -31,6 +33,9 @@ HEADERS: Dict[str, str] = {
     "Connection": "keep-alive",
     "Upgrade-Insecure-Requests": "1",
 }
+NON_CONTENT_TAGS = ["script", "style", "noscript", "nav", "header", "footer", "aside", "form", "iframe", "svg", "button"]
+BLOCK_TAGS = ["p", "div", "section", "article", "li", "h1", "h2", "h3", "h4", "h5", "h6", "pre", "blockquote", "br", "tr", "figcaption"]
+MAIN_CONTENT_XPATHS = ["//article", "//main", "//*[@role='main']", "//body"]
 
 
 def extract_meta_tags(soup: BeautifulSoup) -> MetadataDict:
@@ -68,3 +73,55 @@ def get_web_data(url: str) -> WebData:
     metadata = extract_meta_tags(soup)
     body = str(soup.find("body"))
     return {"raw_html": body, "metadata": metadata}
+
+
+def extract_meta_tags_from_tree(tree) -> MetadataDict:
+    metadata: MetadataDict = {
+        "title": "",
+        "description": "",
+        "og": {},
+        "twitter": {},
+        "other_meta": {},
+    }
+    title = tree.findtext(".//title")
+    if title:
+        metadata["title"] = title.strip()
+    for meta in tree.iter("meta"):
+        name = (meta.get("name") or "").lower()
+        prop = (meta.get("property") or "").lower()
+        content = meta.get("content") or ""
+        if prop.startswith("og:"):
+            metadata["og"][prop[3:]] = content
+        elif prop.startswith("twitter:") or name.startswith("twitter:"):
+            twitter_key = prop[8:] if prop.startswith("twitter:") else name[8:]
+            metadata["twitter"][twitter_key] = content
+        elif name in ["description", "keywords", "author", "robots", "viewport"]:
+            metadata["other_meta"][name] = content
+            if name == "description":
+                metadata["description"] = content
+    return metadata
+
+
+def extract_main_text(tree) -> str:
+    etree.strip_elements(tree, *NON_CONTENT_TAGS, etree.Comment, with_tail=False)
+    candidates = []
+    for xpath in MAIN_CONTENT_XPATHS:
+        candidates = tree.xpath(xpath)
+        if candidates:
+            break
+    if not candidates:
+        candidates = [tree]
+    node = max(candidates, key=lambda element: len(element.text_content()))
+    for element in node.iter(*BLOCK_TAGS):
+        element.tail = "\n" + (element.tail or "")
+    text = etree.tostring(node, method="text", encoding="unicode")
+    lines = [line.strip() for line in text.splitlines()]
+    return "\n".join(line for line in lines if line)
+
+
+def extract_web_data(html: Union[str, bytes]) -> WebData:
+    if not html:
+        return {"raw_html": "", "metadata": extract_meta_tags_from_tree(lxml.html.fromstring("<html></html>"))}
+    tree = lxml.html.document_fromstring(html)
+    metadata = extract_meta_tags_from_tree(tree)
+    return {"raw_html": extract_main_text(tree), "metadata": metadata}
@@ -0,0 +1,367 @@
+import contextvars
+import io
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+from db.config import get_faiss_db_path, get_tracking_db_path
+from db.connection import execute_query
+from utils.load_api_keys import load_api_key
+
+DEFAULT_LOG_MAX_CHARS = 64 * 1024
+DEFAULT_POLL_INTERVAL = 15.0
+
+
+class CappedLog:
+    """Text sink that keeps the head and tail of a run's output and drops the middle past max_chars."""
+
+    def __init__(self, max_chars: int = DEFAULT_LOG_MAX_CHARS):
+        self.head_limit = max_chars // 2
+        self.tail_limit = max_chars - self.head_limit
+        self.head = io.StringIO()
+        self.head_size = 0
+        self.tail = deque()
+        self.tail_size = 0
+        self.dropped = 0
+        self.lock = threading.Lock()
+
+    def write(self, text: str) -> int:
+        with self.lock:
+            if self.head_size < self.head_limit:
+                part = text[: self.head_limit - self.head_size]
+                self.head.write(part)
+                self.head_size += len(part)
+                text = text[len(part) :]
+            if text:
+                self.tail.append(text)
+                self.tail_size += len(text)
+                while self.tail_size > self.tail_limit:
+                    overflow = self.tail_size - self.tail_limit
+                    first = self.tail[0]
+                    if len(first) <= overflow:
+                        self.tail.popleft()
+                        self.tail_size -= len(first)
+                        self.dropped += len(first)
+                    else:
+                        self.tail[0] = first[overflow:]
+                        self.tail_size -= overflow
+                        self.dropped += overflow
+        return len(text)
+
+    def getvalue(self) -> str:
+        with self.lock:
+            marker = f"\n... [{self.dropped} characters truncated] ...\n" if self.dropped else ""
+            return self.head.getvalue() + marker + "".join(self.tail)
+
+
+_capture: contextvars.ContextVar = contextvars.ContextVar("pipeline_log_capture", default=None)
+
+
+class OutputRouter(io.TextIOBase):
+    """sys.stdout replacement that streams prefixed lines to the console and copies them into the active stage's CappedLog."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.lock = threading.Lock()
+
+    def write(self, text: str) -> int:
+        capture = _capture.get()
+        if capture is None:
+            return self.stream.write(text)
+        log, prefix, state = capture
+        log.write(text)
+        lines = []
+        for line in text.splitlines(keepends=True):
+            lines.append(f"[{prefix}] {line}" if state["line_start"] else line)
+            state["line_start"] = line.endswith("\n")
+        with self.lock:
+            self.stream.write("".join(lines))
+        return len(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+_router_lock = threading.Lock()
+
+
+def install_output_router() -> None:
+    with _router_lock:
+        if not isinstance(sys.stdout, OutputRouter):
+            sys.stdout = OutputRouter(sys.stdout)
+        if not isinstance(sys.stderr, OutputRouter):
+            sys.stderr = OutputRouter(sys.stderr)
+
+
+@contextmanager
+def capture_output(log: CappedLog, prefix: str):
+    install_output_router()
+    token = _capture.set((log, prefix, {"line_start": True}))
+    try:
+        yield log
+    finally:
+        _capture.reset(token)
+
+
+class PipelineStage:
+    def __init__(
+        self,
+        name: str,
+        command: str,
+        run: Callable[[], dict],
+        backlog: Optional[Callable[[], int]] = None,
+        downstream: Optional[List[str]] = None,
+    ):
+        self.name = name
+        self.command = command
+        self.run = run
+        self.backlog = backlog
+        self.downstream = downstream or []
+        self.enabled = True
+        self.task_id = None
+        self.interval = None
+        self.last_run = 0.0
+        self.last_backlog = None
+        self.running = False
+        self.rerun = False
+
+    def pending_work(self) -> Optional[int]:
+        if self.backlog is None:
+            return None
+        try:
+            return self.backlog()
+        except Exception as e:
+            print(f"WARNING: Could not read backlog for stage {self.name}: {e}")
+            return None
+
+
+class PipelineScheduler:
+    """Runs pipeline stages on a warm in-process worker pool, starting downstream stages as soon as upstream ones produce work.
+
+    Stage output is routed to its CappedLog through a context variable. Threads a stage starts itself do not inherit it,
+    so stages must submit their work with contextvars.copy_context().run for that output to be captured.
+    """
+
+    def __init__(
+        self,
+        stages: List[PipelineStage],
+        max_workers: int = 5,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        log_max_chars: int = DEFAULT_LOG_MAX_CHARS,
+        start_execution: Optional[Callable[[PipelineStage], Optional[int]]] = None,
+        finish_execution: Optional[Callable[[PipelineStage, Optional[int], str, Optional[str], str], None]] = None,
+    ):
+        self.stages: Dict[str, PipelineStage] = {stage.name: stage for stage in stages}
+        self.poll_interval = poll_interval
+        self.log_max_chars = log_max_chars
+        self.start_execution = start_execution
+        self.finish_execution = finish_execution
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pipeline")
+        self.condition = threading.Condition()
+        self.triggered = set()
+        self.stopped = False
+        self.thread = None
+
+    def trigger(self, name: str) -> None:
+        if name not in self.stages:
+            return
+        with self.condition:
+            self.triggered.add(name)
+            self.condition.notify()
+
+    def start(self) -> None:
+        install_output_router()
+        self.thread = threading.Thread(target=self._loop, name="pipeline-scheduler", daemon=True)
+        self.thread.start()
+
+    def stop(self, wait: bool = True) -> None:
+        with self.condition:
+            self.stopped = True
+            self.condition.notify()
+        if self.thread:
+            self.thread.join()
+        self.executor.shutdown(wait=wait)
+
+    def _is_due(self, stage: PipelineStage, now: float) -> bool:
+        if stage.interval is not None and now - stage.last_run >= stage.interval:
+            return True
+        backlog = stage.pending_work()
+        return bool(backlog) and backlog != stage.last_backlog
+
+    def _loop(self) -> None:
+        next_poll = 0.0
+        while True:
+            with self.condition:
+                timeout = max(0.0, next_poll - time.monotonic())
+                if not self.triggered and not self.stopped:
+                    self.condition.wait(timeout)
+                if self.stopped:
+                    return
+                triggered, self.triggered = self.triggered, set()
+            now = time.monotonic()
+            poll = now >= next_poll
+            if poll:
+                next_poll = now + self.poll_interval
+            for stage in self.stages.values():
+                if stage.name in triggered:
+                    self._submit(stage, check_backlog=True)
+                elif poll and stage.enabled and not stage.running and self._is_due(stage, time.monotonic()):
+                    self._submit(stage, check_backlog=False)
+
+    def _submit(self, stage: PipelineStage, check_backlog: bool) -> None:
+        if not stage.enabled:
+            return
+        with self.condition:
+            if stage.running:
+                stage.rerun = True
+                return
+        if check_backlog and stage.backlog is not None and not stage.pending_work():
+            return
+        with self.condition:
+            stage.running = True
+            stage.last_run = time.monotonic()
+        self.executor.submit(self._run_stage, stage)
+
+    def _run_stage(self, stage: PipelineStage) -> None:
+        log = CappedLog(self.log_max_chars)
+        execution_id = None
+        status, error_message = "success", None
+        backlog_before = stage.pending_work()
+        start = time.monotonic()
+        try:
+            if self.start_execution:
+                execution_id = self.start_execution(stage)
+                if execution_id is None:
+                    status = "skipped"
+                    return
+            with capture_output(log, stage.name):
+                print(f"INFO: Starting stage {stage.name} (backlog: {backlog_before if backlog_before is not None else 'n/a'})")
+                try:
+                    stats = stage.run()
+                    print(f"INFO: Stage {stage.name} finished in {time.monotonic() - start:.1f}s: {stats}")
+                except Exception as e:
+                    status, error_message = "failed", str(e) or e.__class__.__name__
+                    print(f"ERROR: Stage {stage.name} failed: {error_message}")
+                    print(traceback.format_exc())
+        finally:
+            backlog_after = stage.pending_work()
+            stage.last_backlog = backlog_after
+            if self.finish_execution and execution_id is not None:
+                try:
+                    self.finish_execution(stage, execution_id, status, error_message, log.getvalue())
+                except Exception as e:
+                    print(f"ERROR: Could not record execution of stage {stage.name}: {e}")
+            with self.condition:
+                stage.running = False
+                rerun, stage.rerun = stage.rerun, False
+            if status == "success":
+                for name in stage.downstream:
+                    self.trigger(name)
+            made_progress = backlog_after is not None and (backlog_before is None or backlog_after < backlog_before)
+            if rerun or (backlog_after and made_progress):
+                self.trigger(stage.name)
+
+
+def count_rows(query: str, params=()) -> int:
+    try:
+        row = execute_query(get_tracking_db_path(), query, params, fetch=True, fetch_one=True)
+    except Exception as e:
+        if "no such table" in str(e):
+            return 0
+        raise
+    return row["count"] if row else 0
+
+
+def crawl_backlog(max_attempts=3) -> int:
+    return count_rows(
+        """
+        SELECT COUNT(*) AS count FROM feed_entries e
+        WHERE (e.crawl_status = 'pending' OR e.crawl_status = 'failed')
+          AND e.crawl_attempts < ? AND e.link IS NOT NULL AND e.link != ''
+          AND NOT EXISTS (SELECT 1 FROM crawled_articles ca WHERE ca.url = e.link)
+        """,
+        (max_attempts,),
+    )
+
+
+def analysis_backlog(max_attempts=1) -> int:
+    return count_rows(
+        """
+        SELECT COUNT(*) AS count FROM crawled_articles
+        WHERE (ai_status = 'pending' OR ai_status = 'error') AND ai_attempts < ? AND processed = 0
+        """,
+        (max_attempts,),
+    )
+
+
+def embedding_backlog() -> int:
+    if not count_rows("SELECT COUNT(*) AS count FROM sqlite_master WHERE type = 'table' AND name = 'article_embeddings'"):
+        return count_rows("SELECT COUNT(*) AS count FROM crawled_articles WHERE processed = 1 AND ai_status = 'success'")
+    return count_rows(
+        """
+        SELECT COUNT(*) AS count FROM crawled_articles ca
+        WHERE ca.processed = 1 AND ca.ai_status = 'success'
+          AND NOT EXISTS (SELECT 1 FROM article_embeddings ae WHERE ae.article_id = ca.id)
+        """
+    )
+
+
+def index_backlog() -> int:
+    return count_rows("SELECT COUNT(*) AS count FROM article_embeddings WHERE in_faiss_index = 0")
+
+
+def require_openai_key() -> str:
+    api_key = load_api_key("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("OpenAI API key not found")
+    return api_key
+
+
+def run_feed_stage():
+    from processors.feed_processor import fetch_and_process_feeds_async
+
+    return fetch_and_process_feeds_async()
+
+
+def run_crawl_stage():
+    from processors.url_processor import crawl_pending_entries_concurrent
+
+    return crawl_pending_entries_concurrent(batch_size=200)
+
+
+def run_analysis_stage():
+    from processors.ai_analysis_processor import analyze_articles_concurrent
+
+    return analyze_articles_concurrent(openai_api_key=require_openai_key(), batch_size=50)
+
+
+def run_embedding_stage():
+    from processors.embedding_processor import process_articles_for_embedding_batched
+
+    return process_articles_for_embedding_batched(openai_api_key=require_openai_key(), batch_size=500)
+
+
+def run_index_stage():
+    from processors.faiss_indexing_processor import process_embeddings_for_indexing
+
+    index_path, mapping_path = get_faiss_db_path()
+    return process_embeddings_for_indexing(index_path=index_path, mapping_path=mapping_path, batch_size=1000, index_type="hnsw")
+
+
+def build_default_stages() -> List[PipelineStage]:
+    """The article pipeline: feed -> crawl -> analyze -> embed -> index."""
+    return [
+        PipelineStage("feed_processor", "python -m processors.feed_processor", run_feed_stage, downstream=["url_crawler"]),
+        PipelineStage("url_crawler", "python -m processors.url_processor", run_crawl_stage, crawl_backlog, downstream=["ai_analyzer"]),
+        PipelineStage(
+            "ai_analyzer", "python -m processors.ai_analysis_processor", run_analysis_stage, analysis_backlog, downstream=["embedding_processor"]
+        ),
+        PipelineStage(
+            "embedding_processor", "python -m processors.embedding_processor", run_embedding_stage, embedding_backlog, downstream=["faiss_indexer"]
+        ),
+        PipelineStage("faiss_indexer", "python -m processors.faiss_indexing_processor", run_index_stage, index_backlog),
+    ]
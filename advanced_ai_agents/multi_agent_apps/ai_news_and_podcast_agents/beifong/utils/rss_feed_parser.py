@@ -19,6 +19,8 @@ def parse_feed_entries(entries: List[Dict[str, Any]]) -> List[Dict[str, str]]:
     parsed_entries = []
     for entry in entries:
         content = entry.get("content") or entry.get("description") or ""
+        if isinstance(content, list):
+            content = "".join(str(part.get("value", "")) for part in content)
         published = (
             entry.get("published")
             or entry.get("updated")
@@ -47,10 +49,7 @@ def is_rss_feed(feed_data: Any) -> bool:
     return feed_data.bozo and hasattr(feed_data, "bozo_exception")
 
 
-def get_feed_data(
-    feed_url: str, etag: Optional[str] = None, modified: Optional[Any] = None
-) -> Dict[str, Any]:
-    feed_data = feedparser.parse(feed_url, etag=etag, modified=modified)
+def build_feed_result(feed_data: Any) -> Dict[str, Any]:
     if is_rss_feed(feed_data):
         return {
             "is_rss_feed": False,
@@ -74,3 +73,23 @@ def get_feed_data(
         "etag": etag,
         "is_rss_feed": True,
     }
+
+
+def get_feed_data(
+    feed_url: str, etag: Optional[str] = None, modified: Optional[Any] = None
+) -> Dict[str, Any]:
+    feed_data = feedparser.parse(feed_url, etag=etag, modified=modified)
+    return build_feed_result(feed_data)
+
+
+def parse_feed_content(
+    content: bytes, response_headers: Optional[Dict[str, str]] = None, status: int = 200
+) -> Dict[str, Any]:
+    headers = {k.lower(): v for k, v in (response_headers or {}).items()}
+    feed_data = feedparser.parse(content, response_headers=headers)
+    feed_data["status"] = status
+    if "etag" in headers:
+        feed_data["etag"] = headers["etag"]
+    if "last-modified" in headers:
+        feed_data["modified"] = headers["last-modified"]
+    return build_feed_result(feed_data)
@@ -4,6 +4,7 @@ import tempfile
 import numpy as np
 import soundfile as sf
 from elevenlabs.client import ElevenLabs
+from utils.tts_cache import cached_tts
 
 TEXT_TO_SPEECH_MODEL = "eleven_multilingual_v2"
 
@@ -158,12 +159,20 @@ def create_podcast(
         else:
             speaker_id = entry["speaker"]
             entry_text = entry["text"]
-        result = text_to_speech_elevenlabs(
-            client=client,
-            text=entry_text,
-            speaker_id=speaker_id,
-            voice_map=voice_map,
-            model_id=elevenlabs_model,
+        result = cached_tts(
+            "elevenlabs",
+            voice_map.get(speaker_id, ""),
+            lang_code,
+            entry_text,
+            lambda: text_to_speech_elevenlabs(
+                client=client,
+                text=entry_text,
+                speaker_id=speaker_id,
+                voice_map=voice_map,
+                model_id=elevenlabs_model,
+            ),
+            model=elevenlabs_model,
+            dtype=np.float32,
         )
         if result:
             segment_audio, segment_rate = result
@@ -5,6 +5,7 @@ from typing import List, Any
 import numpy as np
 import soundfile as sf
 from .translate_podcast import translate_script
+from .tts_cache import cached_tts
 
 os.environ["PYTHONWARNINGS"] = "ignore"
 os.environ["TORCH_CPP_LOG_LEVEL"] = "ERROR"
@@ -24,12 +25,16 @@ def create_slience_audio(silence_duration: float, sampling_rate: int) -> np.ndar
     return np.zeros(int(sampling_rate * silence_duration), dtype=np.float32)
 
 
-def text_to_speech(pipeline: KPipeline, text: str, speaker_id: int, sampling_rate: int, lang_code: str) -> np.ndarray:
+def get_voice(speaker_id: int, lang_code: str) -> str:
     if lang_code == "h":
         voices = {1: "hf_alpha", 2: "hm_omega"}
     else:
         voices = {1: "af_heart", 2: "bm_lewis"}
-    voice = voices[speaker_id]
+    return voices[speaker_id]
+
+
+def text_to_speech(pipeline: KPipeline, text: str, speaker_id: int, sampling_rate: int, lang_code: str) -> np.ndarray:
+    voice = get_voice(speaker_id, lang_code)
     audio_chunks = []
     for _, _, audio in pipeline(text, voice=voice, speed=1.0):
         if audio is not None:
@@ -43,6 +48,11 @@ def text_to_speech(pipeline: KPipeline, text: str, speaker_id: int, sampling_rat
         return np.zeros(0, dtype=np.float32)
 
 
+def synthesize_entry(pipeline: KPipeline, text: str, speaker_id: int, sampling_rate: int, lang_code: str):
+    segment_audio = text_to_speech(pipeline, text, speaker_id, sampling_rate=sampling_rate, lang_code=lang_code)
+    return (segment_audio, sampling_rate) if len(segment_audio) > 0 else None
+
+
 def create_audio_segments(
     pipeline: KPipeline,
     script: Any,
@@ -56,13 +66,15 @@ def create_audio_segments(
     for entry in entries:
         text = entry["text"] if isinstance(entry, dict) else entry.text
         speaker = entry["speaker"] if isinstance(entry, dict) else entry.speaker
-        segment_audio = text_to_speech(
-            pipeline,
+        result = cached_tts(
+            "kokoro",
+            get_voice(speaker, lang_code),
+            lang_code,
             text,
-            speaker,
-            sampling_rate=sampling_rate,
-            lang_code=lang_code,
+            lambda: synthesize_entry(pipeline, text, speaker, sampling_rate, lang_code),
+            dtype=np.float32,
         )
+        segment_audio = result[0] if result else np.zeros(0, dtype=np.float32)
         if len(segment_audio) > 0:
             try:
                 audio_segments.append(segment_audio)
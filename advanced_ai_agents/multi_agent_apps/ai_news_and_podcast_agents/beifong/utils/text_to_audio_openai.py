@@ -5,6 +5,7 @@ import numpy as np
 import soundfile as sf
 from openai import OpenAI
 from utils.load_api_keys import load_api_key
+from utils.tts_cache import cached_tts
 
 OPENAI_VOICES = {1: "alloy", 2: "echo", 3: "fable", 4: "onyx", 5: "nova", 6: "shimmer"}
 DEFAULT_VOICE_MAP = {1: "alloy", 2: "nova"}
@@ -34,6 +35,18 @@ def combine_audio_segments(audio_segments: List[np.ndarray], silence_duration: f
     return combined
 
 
+def resolve_voice(speaker_id: int, voice_map: Dict[int, str] = None) -> str:
+    voice_map = voice_map or DEFAULT_VOICE_MAP
+    voice = voice_map.get(speaker_id)
+    if not voice:
+        if speaker_id in OPENAI_VOICES:
+            voice = OPENAI_VOICES[speaker_id]
+        else:
+            voice = next(iter(voice_map.values()), "alloy")
+        print(f"WARNING: No voice mapping for speaker {speaker_id}, using {voice}")
+    return voice
+
+
 def text_to_speech_openai(
     client: OpenAI,
     text: str,
@@ -44,14 +57,7 @@ def text_to_speech_openai(
     if not text.strip():
         print("WARNING: Empty text provided, skipping TTS generation")
         return None
-    voice_map = voice_map or DEFAULT_VOICE_MAP
-    voice = voice_map.get(speaker_id)
-    if not voice:
-        if speaker_id in OPENAI_VOICES:
-            voice = OPENAI_VOICES[speaker_id]
-        else:
-            voice = next(iter(voice_map.values()), "alloy")
-        print(f"WARNING: No voice mapping for speaker {speaker_id}, using {voice}")
+    voice = resolve_voice(speaker_id, voice_map)
     try:
         print(f"INFO: Generating TTS for speaker {speaker_id} using voice '{voice}'")
         response = client.audio.speech.create(
@@ -157,12 +163,20 @@ def create_podcast(
             speaker_id = entry["speaker"]
             entry_text = entry["text"]
         print(f"INFO: Processing entry {i + 1}/{len(entries)}: Speaker {speaker_id}")
-        result = text_to_speech_openai(
-            client=client,
-            text=entry_text,
-            speaker_id=speaker_id,
-            voice_map=voice_map,
+        result = cached_tts(
+            "openai",
+            resolve_voice(speaker_id, voice_map),
+            lang_code,
+            entry_text,
+            lambda: text_to_speech_openai(
+                client=client,
+                text=entry_text,
+                speaker_id=speaker_id,
+                voice_map=voice_map,
+                model=model_to_use,
+            ),
             model=model_to_use,
+            dtype=np.float32,
         )
         if result:
             segment_audio, segment_rate = result
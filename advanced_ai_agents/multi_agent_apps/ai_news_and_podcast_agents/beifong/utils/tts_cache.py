@@ -0,0 +1,179 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Callable, Optional, Tuple
+import numpy as np
+from db.config import get_tts_cache_db_path
+from db.connection import db_connection, execute_query
+
+DEFAULT_MAX_CACHE_MB = 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tts_utterances (
+    cache_key TEXT PRIMARY KEY,
+    engine TEXT NOT NULL,
+    voice TEXT NOT NULL,
+    language TEXT,
+    sample_rate INTEGER NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL
+)
+"""
+
+
+def convert_samples(audio: np.ndarray, dtype) -> np.ndarray:
+    if dtype is None or audio.dtype == np.dtype(dtype):
+        return audio
+    if np.dtype(dtype) == np.int16:
+        return np.clip(np.asarray(audio, dtype=np.float32) * 32767, -32768, 32767).astype(np.int16)
+    if audio.dtype == np.int16:
+        return audio.astype(dtype) / 32768.0
+    return audio.astype(dtype)
+
+
+class TTSCache:
+    """Content-addressed on-disk cache of synthesized utterances with least-recently-used size eviction."""
+
+    def __init__(self, index_path: Optional[str] = None, max_bytes: int = DEFAULT_MAX_CACHE_MB * 1024 * 1024):
+        self.index_path = index_path or get_tts_cache_db_path()
+        self.audio_dir = os.path.join(os.path.dirname(os.path.abspath(self.index_path)), "audio")
+        self.max_bytes = max_bytes
+        self._evict_lock = threading.Lock()
+        os.makedirs(self.audio_dir, exist_ok=True)
+        execute_query(self.index_path, SCHEMA)
+        execute_query(self.index_path, "CREATE INDEX IF NOT EXISTS idx_tts_utterances_last_access ON tts_utterances(last_access)")
+
+    @staticmethod
+    def make_key(engine: str, voice: str, language: str, text: str, model: Optional[str] = None) -> str:
+        payload = json.dumps([engine.lower(), str(voice), language or "", model or "", text.strip()], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _audio_path(self, key: str) -> str:
+        return os.path.join(self.audio_dir, key[:2], f"{key}.npy")
+
+    def get(
+        self, engine: str, voice: str, language: str, text: str, model: Optional[str] = None, dtype=None
+    ) -> Optional[Tuple[np.ndarray, int]]:
+        key = self.make_key(engine, voice, language, text, model)
+        row = execute_query(self.index_path, "SELECT sample_rate FROM tts_utterances WHERE cache_key = ?", (key,), fetch=True, fetch_one=True)
+        if not row:
+            return None
+        try:
+            audio = np.load(self._audio_path(key))
+        except (OSError, ValueError):
+            execute_query(self.index_path, "DELETE FROM tts_utterances WHERE cache_key = ?", (key,))
+            return None
+        execute_query(self.index_path, "UPDATE tts_utterances SET last_access = ? WHERE cache_key = ?", (time.time(), key))
+        return convert_samples(audio, dtype), row["sample_rate"]
+
+    def put(
+        self, engine: str, voice: str, language: str, text: str, audio: np.ndarray, sample_rate: int, model: Optional[str] = None
+    ) -> None:
+        key = self.make_key(engine, voice, language, text, model)
+        path = self._audio_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            np.save(f, np.asarray(audio))
+        os.replace(temp_path, path)
+        now = time.time()
+        execute_query(
+            self.index_path,
+            """
+            INSERT OR REPLACE INTO tts_utterances (cache_key, engine, voice, language, sample_rate, size_bytes, created_at, last_access)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (key, engine.lower(), str(voice), language or "", int(sample_rate), os.path.getsize(path), now, now),
+        )
+        self.evict()
+
+    def total_bytes(self) -> int:
+        row = execute_query(self.index_path, "SELECT COALESCE(SUM(size_bytes), 0) AS total FROM tts_utterances", fetch=True, fetch_one=True)
+        return row["total"]
+
+    def evict(self) -> int:
+        """Drop least recently used utterances until the cache fits in max_bytes, returning how many were removed."""
+        with self._evict_lock:
+            excess = self.total_bytes() - self.max_bytes
+            if excess <= 0:
+                return 0
+            removed = []
+            with db_connection(self.index_path) as conn:
+                for row in conn.execute("SELECT cache_key, size_bytes FROM tts_utterances ORDER BY last_access"):
+                    if excess <= 0:
+                        break
+                    removed.append(row["cache_key"])
+                    excess -= row["size_bytes"]
+                conn.executemany("DELETE FROM tts_utterances WHERE cache_key = ?", [(key,) for key in removed])
+                conn.commit()
+            for key in removed:
+                try:
+                    os.unlink(self._audio_path(key))
+                except FileNotFoundError:
+                    pass
+            return len(removed)
+
+    def synthesize(
+        self,
+        engine: str,
+        voice: str,
+        language: str,
+        text: str,
+        synthesize_fn: Callable[[], Optional[Tuple[np.ndarray, int]]],
+        model: Optional[str] = None,
+        dtype=None,
+    ) -> Optional[Tuple[np.ndarray, int]]:
+        """Return the cached utterance or call synthesize_fn on a miss and store its result."""
+        try:
+            cached = self.get(engine, voice, language, text, model=model, dtype=dtype)
+        except Exception as e:
+            print(f"TTS cache lookup failed: {e}")
+            cached = None
+        if cached is not None:
+            return cached
+        result = synthesize_fn()
+        if result:
+            audio, sample_rate = result
+            try:
+                self.put(engine, voice, language, text, audio, sample_rate, model=model)
+            except Exception as e:
+                print(f"Could not cache TTS utterance: {e}")
+        return result
+
+
+_tts_cache = None
+_tts_cache_lock = threading.Lock()
+
+
+def get_tts_cache() -> Optional[TTSCache]:
+    """Shared cache instance, or None when disabled with TTS_CACHE_MAX_MB=0."""
+    global _tts_cache
+    max_mb = float(os.environ.get("TTS_CACHE_MAX_MB", DEFAULT_MAX_CACHE_MB))
+    if max_mb <= 0:
+        return None
+    with _tts_cache_lock:
+        if _tts_cache is None:
+            try:
+                _tts_cache = TTSCache(max_bytes=int(max_mb * 1024 * 1024))
+            except Exception as e:
+                print(f"TTS cache unavailable: {e}")
+                return None
+        return _tts_cache
+
+
+def cached_tts(
+    engine: str,
+    voice: str,
+    language: str,
+    text: str,
+    synthesize_fn: Callable[[], Optional[Tuple[np.ndarray, int]]],
+    model: Optional[str] = None,
+    dtype=None,
+) -> Optional[Tuple[np.ndarray, int]]:
+    cache = get_tts_cache()
+    if cache is None:
+        return synthesize_fn()
+    return cache.synthesize(engine, voice, language, text, synthesize_fn, model=model, dtype=dtype)
@@ -10,51 +10,85 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any
 
 
+BASE_URL = "https://api.github.com/search/repositories"
+TIMEOUT_SECONDS = 10.0
+
+
+def _request_params(limit: int) -> Dict[str, Any]:
+    date_query = (datetime.utcnow() - timedelta(days=1)).strftime("%Y-%m-%d")
+    return {
+        "q": f"created:>{date_query} sort:stars",
+        "per_page": limit
+    }
+
+
+def _parse_signals(data: Dict[str, Any], signals: List[Dict[str, Any]]) -> None:
+    for item in data.get("items", []):
+        signal = {
+            "id": str(item["id"]),
+            "source": "github",
+            "title": item["full_name"],
+            "description": item.get("description") or "No description",
+            "url": item["html_url"],
+            "metadata": {
+                "stars": item["stargazers_count"],
+                "language": item.get("language"),
+                "topics": item.get("topics", [])
+            }
+        }
+        signals.append(signal)
+
+
 def fetch_github_trending(limit: int = 5) -> List[Dict[str, Any]]:
     """
     Fetch trending GitHub repositories created in the last 24 hours.
-    
+
     Args:
         limit: Maximum number of repositories to return.
-        
+
     Returns:
         List of signal dictionaries with standardized schema.
     """
-    base_url = "https://api.github.com/search/repositories"
-    date_query = (datetime.utcnow() - timedelta(days=1)).strftime("%Y-%m-%d")
-    
-    params = {
-        "q": f"created:>{date_query} sort:stars",
-        "per_page": limit
-    }
-    
     signals = []
-    
+
     try:
-        response = httpx.get(base_url, params=params, timeout=10.0)
+        response = httpx.get(BASE_URL, params=_request_params(limit), timeout=TIMEOUT_SECONDS)
         response.raise_for_status()
-        data = response.json()
-        
-        for item in data.get("items", []):
-            signal = {
-                "id": str(item["id"]),
-                "source": "github",
-                "title": item["full_name"],
-                "description": item.get("description") or "No description",
-                "url": item["html_url"],
-                "metadata": {
-                    "stars": item["stargazers_count"],
-                    "language": item.get("language"),
-                    "topics": item.get("topics", [])
-                }
-            }
-            signals.append(signal)
-            
+        _parse_signals(response.json(), signals)
+
+    except httpx.HTTPError as e:
+        print(f"[GitHub Adapter] HTTP error: {e}")
+    except Exception as e:
+        print(f"[GitHub Adapter] Error: {e}")
+
+    return signals
+
+
+async def fetch_github_trending_async(
+    client: httpx.AsyncClient, limit: int = 5
+) -> List[Dict[str, Any]]:
+    """
+    Async variant of fetch_github_trending that reuses a shared client.
+
+    Args:
+        client: Pooled client shared by all adapters in a collection run.
+        limit: Maximum number of repositories to return.
+
+    Returns:
+        List of signal dictionaries with standardized schema.
+    """
+    signals = []
+
+    try:
+        response = await client.get(BASE_URL, params=_request_params(limit), timeout=TIMEOUT_SECONDS)
+        response.raise_for_status()
+        _parse_signals(response.json(), signals)
+
     except httpx.HTTPError as e:
         print(f"[GitHub Adapter] HTTP error: {e}")
     except Exception as e:
         print(f"[GitHub Adapter] Error: {e}")
-    
+
     return signals
 
 
@@ -9,67 +9,102 @@ import httpx
 from typing import List, Dict, Any
 
 
+BASE_URL = "https://huggingface.co/api/models"
+TIMEOUT_SECONDS = 10.0
+
+
+def _request_params(limit: int) -> Dict[str, Any]:
+    return {
+        "sort": "likes",
+        "direction": "-1",
+        "limit": limit
+    }
+
+
+def _parse_signals(data: List[Dict[str, Any]], signals: List[Dict[str, Any]]) -> None:
+    for item in data:
+        model_id = item.get("modelId", item.get("id", "unknown"))
+
+        # Build description from model metadata
+        tags = item.get("tags", [])
+        pipeline = item.get("pipeline_tag", "")
+        description_parts = []
+
+        if pipeline:
+            description_parts.append(f"Pipeline: {pipeline}")
+        if tags:
+            description_parts.append(f"Tags: {', '.join(tags[:5])}")
+
+        description_parts.append(f"Downloads: {item.get('downloads', 0):,}")
+        description_parts.append(f"Likes: {item.get('likes', 0):,}")
+
+        signal = {
+            "id": model_id,
+            "source": "huggingface",
+            "title": f"HF Model: {model_id}",
+            "description": " | ".join(description_parts),
+            "url": f"https://huggingface.co/{model_id}",
+            "metadata": {
+                "downloads": item.get("downloads", 0),
+                "likes": item.get("likes", 0),
+                "pipeline_tag": pipeline,
+                "tags": tags[:10],
+                "author": item.get("author", "")
+            }
+        }
+        signals.append(signal)
+
+
 def fetch_huggingface_models(limit: int = 5) -> List[Dict[str, Any]]:
     """
     Fetch trending/popular models from HuggingFace Hub.
-    
+
     Args:
         limit: Maximum number of models to return.
-        
+
     Returns:
         List of signal dictionaries with standardized schema.
     """
-    base_url = "https://huggingface.co/api/models"
-    params = {
-        "sort": "likes",
-        "direction": "-1",
-        "limit": limit
-    }
-    
     signals = []
-    
+
     try:
-        response = httpx.get(base_url, params=params, timeout=10.0)
+        response = httpx.get(BASE_URL, params=_request_params(limit), timeout=TIMEOUT_SECONDS)
         response.raise_for_status()
-        data = response.json()
-        
-        for item in data:
-            model_id = item.get("modelId", item.get("id", "unknown"))
-            
-            # Build description from model metadata
-            tags = item.get("tags", [])
-            pipeline = item.get("pipeline_tag", "")
-            description_parts = []
-            
-            if pipeline:
-                description_parts.append(f"Pipeline: {pipeline}")
-            if tags:
-                description_parts.append(f"Tags: {', '.join(tags[:5])}")
-            
-            description_parts.append(f"Downloads: {item.get('downloads', 0):,}")
-            description_parts.append(f"Likes: {item.get('likes', 0):,}")
-            
-            signal = {
-                "id": model_id,
-                "source": "huggingface",
-                "title": f"HF Model: {model_id}",
-                "description": " | ".join(description_parts),
-                "url": f"https://huggingface.co/{model_id}",
-                "metadata": {
-                    "downloads": item.get("downloads", 0),
-                    "likes": item.get("likes", 0),
-                    "pipeline_tag": pipeline,
-                    "tags": tags[:10],
-                    "author": item.get("author", "")
-                }
-            }
-            signals.append(signal)
-            
+        _parse_signals(response.json(), signals)
+
     except httpx.HTTPError as e:
         print(f"[HuggingFace Adapter] HTTP error: {e}")
     except Exception as e:
         print(f"[HuggingFace Adapter] Error: {e}")
-    
+
+    return signals
+
+
+async def fetch_huggingface_models_async(
+    client: httpx.AsyncClient, limit: int = 5
+) -> List[Dict[str, Any]]:
+    """
+    Async variant of fetch_huggingface_models that reuses a shared client.
+
+    Args:
+        client: Pooled client shared by all adapters in a collection run.
+        limit: Maximum number of models to return.
+
+    Returns:
+        List of signal dictionaries with standardized schema.
+    """
+    signals = []
+
+    try:
+        response = await client.get(BASE_URL, params=_request_params(limit), timeout=TIMEOUT_SECONDS)
+        response.raise_for_status()
+        _parse_signals(response.json(), signals)
+
+    except httpx.HTTPError as e:
+        print(f"[HuggingFace Adapter] HTTP error: {e}")
+    except Exception as e:
+        print(f"[HuggingFace Adapter] Error: {e}")
+
     return signals
 
 
@@ -5,7 +5,11 @@ This is a simplified, stateless adapter for the DevPulseAI reference implementat
 Uses feedparser to fetch from RSS/Atom feeds.
 """
 
+import asyncio
+import re
+
 import feedparser
+import httpx
 from typing import List, Dict, Any
 
 
@@ -16,53 +20,95 @@ FEEDS = [
     "https://medium.com/feed/@netflixtechblog",
     "https://engineering.fb.com/feed/",
 ]
+TIMEOUT_SECONDS = 15.0
+
+
+def _parse_feed(feed: Any, feed_url: str, limit: int, signals: List[Dict[str, Any]]) -> None:
+    for entry in feed.entries[:limit]:
+        # Get summary or description
+        summary = getattr(entry, "summary", "") or getattr(entry, "description", "")
+
+        # Clean HTML tags from summary (simple approach)
+        if summary:
+            summary = re.sub(r'<[^>]+>', '', summary)[:500]
+
+        signal = {
+            "id": entry.get("id", entry.link),
+            "source": "medium",
+            "title": entry.title,
+            "description": summary,
+            "url": entry.link,
+            "metadata": {
+                "published": getattr(entry, "published", ""),
+                "author": getattr(entry, "author", "Unknown"),
+                "feed": feed_url
+            }
+        }
+        signals.append(signal)
 
 
 def fetch_medium_blogs(limit: int = 5) -> List[Dict[str, Any]]:
     """
     Fetch recent tech blogs from Medium and engineering blogs.
-    
+
     Args:
         limit: Maximum number of entries per feed.
-        
+
     Returns:
         List of signal dictionaries with standardized schema.
     """
     signals = []
-    
+
     for feed_url in FEEDS:
         try:
             feed = feedparser.parse(feed_url)
-            
-            for entry in feed.entries[:limit]:
-                # Get summary or description
-                summary = getattr(entry, "summary", "") or getattr(entry, "description", "")
-                
-                # Clean HTML tags from summary (simple approach)
-                if summary:
-                    import re
-                    summary = re.sub(r'<[^>]+>', '', summary)[:500]
-                
-                signal = {
-                    "id": entry.get("id", entry.link),
-                    "source": "medium",
-                    "title": entry.title,
-                    "description": summary,
-                    "url": entry.link,
-                    "metadata": {
-                        "published": getattr(entry, "published", ""),
-                        "author": getattr(entry, "author", "Unknown"),
-                        "feed": feed_url
-                    }
-                }
-                signals.append(signal)
-                
+            _parse_feed(feed, feed_url, limit, signals)
+
         except Exception as e:
             print(f"[Medium Adapter] Error fetching {feed_url}: {e}")
-    
+
+    return signals
+
+
+async def _fetch_feed(
+    client: httpx.AsyncClient, feed_url: str, limit: int
+) -> List[Dict[str, Any]]:
+    signals = []
+
+    try:
+        response = await client.get(feed_url, timeout=TIMEOUT_SECONDS, follow_redirects=True)
+        response.raise_for_status()
+        # feedparser is synchronous; parse off the event loop so the other
+        # sources keep streaming while a large feed is being read.
+        feed = await asyncio.to_thread(feedparser.parse, response.content)
+        _parse_feed(feed, feed_url, limit, signals)
+
+    except Exception as e:
+        print(f"[Medium Adapter] Error fetching {feed_url}: {e}")
+
     return signals
 
 
+async def fetch_medium_blogs_async(
+    client: httpx.AsyncClient, limit: int = 5
+) -> List[Dict[str, Any]]:
+    """
+    Async variant of fetch_medium_blogs: all feeds are fetched concurrently
+    over the shared client instead of one after another.
+
+    Args:
+        client: Pooled client shared by all adapters in a collection run.
+        limit: Maximum number of entries per feed.
+
+    Returns:
+        List of signal dictionaries with standardized schema, in FEEDS order.
+    """
+    per_feed = await asyncio.gather(
+        *(_fetch_feed(client, feed_url, limit) for feed_url in FEEDS)
+    )
+    return [signal for signals in per_feed for signal in signals]
+
+
 if __name__ == "__main__":
     # Quick test
     results = fetch_medium_blogs(limit=2)
@@ -6,6 +6,9 @@ This package contains the intelligence pipeline components:
 - SignalCollector: Pure utility (NOT an agent) — normalizes and deduplicates signals.
   Signal collection is deterministic and intentionally not agent-driven.
 
+- batch_scoring: Pure utility — batches, bounds, and caches the LLM calls made by
+  RelevanceAgent and RiskAgent. It decides what to ask, never how to judge.
+
 - RelevanceAgent: LLM agent — scores signals 0-100 for developer relevance.
   Uses fast model (gpt-4.1-mini) for high-throughput classification.
 
@@ -0,0 +1,152 @@
+"""
+Batch Scoring — Shared batching, concurrency, and verdict caching utility.
+
+Used by RelevanceAgent and RiskAgent. Not an agent: it only decides which
+signals still need an LLM verdict, groups them into structured-output
+requests, runs those requests concurrently under a bounded semaphore, and
+remembers the results.
+
+Cache keys follow the SignalCollector dedup key (source:id), extended with
+a hash of the content the LLM actually sees and the model that judged it,
+so an edited description or a model change is re-scored while an unchanged
+arXiv paper or repo is not.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# Scoring mode config — override via env vars
+DEFAULT_BATCH_SIZE = int(os.environ.get("DEVPULSE_SCORING_BATCH_SIZE", "1"))
+DEFAULT_CONCURRENCY = int(os.environ.get("DEVPULSE_SCORING_CONCURRENCY", "4"))
+DEFAULT_CACHE_PATH = os.environ.get("DEVPULSE_VERDICT_CACHE")
+
+# Chunk scorer: takes a list of signals, returns {position in list: verdict}.
+# Positions it leaves out fall back to the agent's heuristic.
+ChunkScorer = Callable[[List[Dict[str, Any]]], Awaitable[Dict[int, Dict[str, Any]]]]
+
+
+def verdict_key(signal: Dict[str, Any], kind: str, model_id: str) -> str:
+    """Cache key: dedup key + content hash + model + verdict kind."""
+    signal_id = f"{signal.get('source', 'unknown')}:{signal.get('id', '')}"
+    content = json.dumps(
+        [signal.get("title", ""), signal.get("description", "")[:500]],
+        ensure_ascii=False,
+    )
+    content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+    return f"{kind}|{model_id}|{signal_id}|{content_hash}"
+
+
+class VerdictCache:
+    """
+    JSON file of LLM verdicts keyed by verdict_key().
+
+    Only real LLM verdicts are stored — heuristic fallbacks are not, so a
+    run without an API key never poisons later runs.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path).expanduser() if path else None
+        self._verdicts: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        if self.path and self.path.is_file():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if isinstance(data, dict):
+                    self._verdicts = data
+            except (OSError, json.JSONDecodeError):
+                pass
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._verdicts.get(key)
+
+    def put(self, key: str, verdict: Dict[str, Any]) -> None:
+        self._verdicts[key] = verdict
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self.path or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(self._verdicts), encoding="utf-8")
+        tmp.replace(self.path)
+        self._dirty = False
+
+
+def format_signals(signals: List[Dict[str, Any]]) -> str:
+    """Render a numbered signal list for a batch prompt."""
+    return "\n\n".join(
+        f"[{index}]\n"
+        f"- Source: {signal.get('source', 'unknown')}\n"
+        f"- Title: {signal.get('title', 'Untitled')}\n"
+        f"- Description: {signal.get('description', '')[:500]}"
+        for index, signal in enumerate(signals)
+    )
+
+
+def score_cached_batches(
+    signals: List[Dict[str, Any]],
+    *,
+    kind: str,
+    model_id: str,
+    cache: Optional[VerdictCache],
+    batch_size: int,
+    max_concurrency: int,
+    score_chunk: ChunkScorer,
+    fallback: Callable[[Dict[str, Any], str], Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """
+    Return one verdict per signal, in order.
+
+    Cached verdicts are reused; the rest are split into chunks of batch_size
+    and scored concurrently, at most max_concurrency requests at a time.
+    """
+    keys = [verdict_key(signal, kind, model_id) for signal in signals]
+    verdicts: List[Optional[Dict[str, Any]]] = [
+        cache.get(key) if cache else None for key in keys
+    ]
+    pending = [i for i, verdict in enumerate(verdicts) if verdict is None]
+
+    if pending:
+        chunks = [
+            pending[start:start + max(1, batch_size)]
+            for start in range(0, len(pending), max(1, batch_size))
+        ]
+        results = asyncio.run(
+            _score_chunks(signals, chunks, max_concurrency, score_chunk)
+        )
+        for chunk, (scored, error) in zip(chunks, results):
+            for position, index in enumerate(chunk):
+                verdict = scored.get(position)
+                if verdict is None:
+                    verdicts[index] = fallback(signals[index], error or "Missing from batch response")
+                    continue
+                verdicts[index] = verdict
+                if cache:
+                    cache.put(keys[index], verdict)
+        if cache:
+            cache.save()
+
+    return verdicts
+
+
+async def _score_chunks(
+    signals: List[Dict[str, Any]],
+    chunks: List[List[int]],
+    max_concurrency: int,
+    score_chunk: ChunkScorer,
+) -> List[tuple]:
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run(chunk: List[int]) -> tuple:
+        async with semaphore:
+            try:
+                return await score_chunk([signals[i] for i in chunk]), None
+            except Exception as e:
+                return {}, str(e)
+
+    return await asyncio.gather(*(run(chunk) for chunk in chunks))
@@ -13,14 +13,41 @@ Model Selection:
 """
 
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from agno.agent import Agent
 from agno.models.openai import OpenAIChat
+from pydantic import BaseModel, Field
+
+from .batch_scoring import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CACHE_PATH,
+    DEFAULT_CONCURRENCY,
+    VerdictCache,
+    format_signals,
+    score_cached_batches,
+)
 
 # Central model config — override via MODEL_RELEVANCE env var
 import os
 DEFAULT_MODEL = os.environ.get("MODEL_RELEVANCE", "gpt-4.1-mini")
 
+INSTRUCTIONS = [
+    "Score each signal from 0-100 based on relevance.",
+    "Consider: novelty, impact, actionability, and timeliness.",
+    "Prioritize signals relevant to AI/ML engineers.",
+    "Provide brief reasoning for each score.",
+]
+
+
+class RelevanceVerdict(BaseModel):
+    index: int = Field(description="The [n] index of the signal being scored")
+    score: int = Field(ge=0, le=100)
+    reasoning: str = Field(description="One sentence")
+
+
+class RelevanceBatch(BaseModel):
+    verdicts: List[RelevanceVerdict]
+
 
 class RelevanceAgent:
     """
@@ -37,24 +64,32 @@ class RelevanceAgent:
     - Gracefully fall back to heuristics when LLM unavailable
     """
 
-    def __init__(self, model_id: str = None):
+    def __init__(
+        self,
+        model_id: str = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+    ):
         """
         Initialize the Relevance Agent.
 
         Args:
             model_id: OpenAI model to use. Defaults to gpt-4.1-mini (fast, cheap).
+            batch_size: Signals per structured-output request in score_batch.
+                1 (default) keeps one plain request per signal.
+            max_concurrency: Batch requests allowed in flight at once.
+            cache_path: JSON file of verdicts reused across runs.
         """
         self.model_id = model_id or DEFAULT_MODEL
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.cache = VerdictCache(cache_path) if cache_path else None
         self.agent = Agent(
             name="Relevance Scorer",
             model=OpenAIChat(id=self.model_id),
             role="Scores technical signals based on developer relevance",
-            instructions=[
-                "Score each signal from 0-100 based on relevance.",
-                "Consider: novelty, impact, actionability, and timeliness.",
-                "Prioritize signals relevant to AI/ML engineers.",
-                "Provide brief reasoning for each score.",
-            ],
+            instructions=INSTRUCTIONS,
             markdown=True,
         )
 
@@ -86,12 +121,60 @@ Respond with ONLY a JSON object:
             return self._fallback_score(signal, str(e))
 
     def score_batch(self, signals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Score multiple signals, returning each with a 'relevance' key."""
-        scored = []
-        for signal in signals:
-            result = self.score(signal)
-            scored.append({**signal, "relevance": result})
-        return scored
+        """
+        Score multiple signals, returning each with a 'relevance' key.
+
+        With batch_size > 1 or a verdict cache, cached verdicts are reused and
+        the remaining signals are scored batch_size per structured-output
+        request, up to max_concurrency requests at a time.
+        """
+        if self.batch_size <= 1 and self.cache is None:
+            results = [self.score(signal) for signal in signals]
+        else:
+            results = score_cached_batches(
+                signals,
+                kind="relevance",
+                model_id=self.model_id,
+                cache=self.cache,
+                batch_size=self.batch_size,
+                max_concurrency=self.max_concurrency,
+                score_chunk=self._score_chunk,
+                fallback=self._fallback_score,
+            )
+        return [
+            {**signal, "relevance": result}
+            for signal, result in zip(signals, results)
+        ]
+
+    async def _score_chunk(self, signals: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+        """Score several signals in one structured-output request."""
+        # A fresh Agent per request keeps concurrent runs from sharing state.
+        agent = Agent(
+            name="Relevance Scorer",
+            model=OpenAIChat(id=self.model_id),
+            role="Scores technical signals based on developer relevance",
+            instructions=INSTRUCTIONS,
+            output_schema=RelevanceBatch,
+        )
+        prompt = f"""Rate the relevance of each signal below for AI/ML developers.
+Score from 0-100 where:
+- 0-30: Low relevance (noise, off-topic)
+- 31-60: Moderate relevance (interesting but not urgent)
+- 61-80: High relevance (important for developers to know)
+- 81-100: Critical relevance (must-know, actionable)
+
+Return one verdict per signal, using its [n] index.
+
+{format_signals(signals)}"""
+
+        response = await agent.arun(prompt, stream=False)
+        if not isinstance(response.content, RelevanceBatch):
+            raise ValueError("Unstructured batch response")
+        return {
+            verdict.index: {"score": verdict.score, "reasoning": verdict.reasoning}
+            for verdict in response.content.verdicts
+            if 0 <= verdict.index < len(signals)
+        }
 
     def _parse_response(self, content: str, signal: Dict) -> Dict[str, Any]:
         """Parse LLM JSON response into structured output."""
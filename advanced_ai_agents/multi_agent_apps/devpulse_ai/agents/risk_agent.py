@@ -14,14 +14,42 @@ Model Selection:
 """
 
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Literal, Optional
 from agno.agent import Agent
 from agno.models.openai import OpenAIChat
+from pydantic import BaseModel, Field
+
+from .batch_scoring import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CACHE_PATH,
+    DEFAULT_CONCURRENCY,
+    VerdictCache,
+    format_signals,
+    score_cached_batches,
+)
 
 # Central model config — override via MODEL_RISK env var
 import os
 DEFAULT_MODEL = os.environ.get("MODEL_RISK", "gpt-4.1-mini")
 
+INSTRUCTIONS = [
+    "Analyze signals for security vulnerabilities.",
+    "Identify breaking changes that may affect developers.",
+    "Flag deprecation notices and migration requirements.",
+    "Rate risk level: LOW, MEDIUM, HIGH, or CRITICAL.",
+]
+
+
+class RiskVerdict(BaseModel):
+    index: int = Field(description="The [n] index of the signal being assessed")
+    risk_level: Literal["LOW", "MEDIUM", "HIGH", "CRITICAL"]
+    concerns: List[str]
+    breaking_changes: bool
+
+
+class RiskBatch(BaseModel):
+    verdicts: List[RiskVerdict]
+
 
 class RiskAgent:
     """
@@ -41,24 +69,32 @@ class RiskAgent:
 
     RISK_LEVELS = ["LOW", "MEDIUM", "HIGH", "CRITICAL"]
 
-    def __init__(self, model_id: str = None):
+    def __init__(
+        self,
+        model_id: str = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+    ):
         """
         Initialize the Risk Agent.
 
         Args:
             model_id: OpenAI model to use. Defaults to gpt-4.1-mini.
+            batch_size: Signals per structured-output request in assess_batch.
+                1 (default) keeps one plain request per signal.
+            max_concurrency: Batch requests allowed in flight at once.
+            cache_path: JSON file of verdicts reused across runs.
         """
         self.model_id = model_id or DEFAULT_MODEL
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.cache = VerdictCache(cache_path) if cache_path else None
         self.agent = Agent(
             name="Risk Assessor",
             model=OpenAIChat(id=self.model_id),
             role="Assesses security and breaking change risks in technical signals",
-            instructions=[
-                "Analyze signals for security vulnerabilities.",
-                "Identify breaking changes that may affect developers.",
-                "Flag deprecation notices and migration requirements.",
-                "Rate risk level: LOW, MEDIUM, HIGH, or CRITICAL.",
-            ],
+            instructions=INSTRUCTIONS,
             markdown=True,
         )
 
@@ -90,12 +126,58 @@ Respond with ONLY a JSON object:
             return self._fallback_assessment(signal, str(e))
 
     def assess_batch(self, signals: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Assess multiple signals, returning each with a 'risk' key."""
-        assessed = []
-        for signal in signals:
-            result = self.assess(signal)
-            assessed.append({**signal, "risk": result})
-        return assessed
+        """
+        Assess multiple signals, returning each with a 'risk' key.
+
+        With batch_size > 1 or a verdict cache, cached verdicts are reused and
+        the remaining signals are assessed batch_size per structured-output
+        request, up to max_concurrency requests at a time.
+        """
+        if self.batch_size <= 1 and self.cache is None:
+            results = [self.assess(signal) for signal in signals]
+        else:
+            results = score_cached_batches(
+                signals,
+                kind="risk",
+                model_id=self.model_id,
+                cache=self.cache,
+                batch_size=self.batch_size,
+                max_concurrency=self.max_concurrency,
+                score_chunk=self._assess_chunk,
+                fallback=self._fallback_assessment,
+            )
+        return [
+            {**signal, "risk": result}
+            for signal, result in zip(signals, results)
+        ]
+
+    async def _assess_chunk(self, signals: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+        """Assess several signals in one structured-output request."""
+        # A fresh Agent per request keeps concurrent runs from sharing state.
+        agent = Agent(
+            name="Risk Assessor",
+            model=OpenAIChat(id=self.model_id),
+            role="Assesses security and breaking change risks in technical signals",
+            instructions=INSTRUCTIONS,
+            output_schema=RiskBatch,
+        )
+        prompt = f"""Analyze each technical signal below for risks:
+1. Security vulnerabilities
+2. Breaking changes
+3. Deprecations
+
+Return one verdict per signal, using its [n] index.
+
+{format_signals(signals)}"""
+
+        response = await agent.arun(prompt, stream=False)
+        if not isinstance(response.content, RiskBatch):
+            raise ValueError("Unstructured batch response")
+        return {
+            verdict.index: verdict.model_dump(exclude={"index"})
+            for verdict in response.content.verdicts
+            if 0 <= verdict.index < len(signals)
+        }
 
     def _parse_response(self, content: str, signal: Dict) -> Dict[str, Any]:
         """Parse LLM JSON response into structured output."""
@@ -14,7 +14,7 @@ Design Decision:
     readers into thinking an LLM call is necessary here.
 """
 
-from typing import List, Dict, Any
+from typing import AsyncIterable, List, Dict, Any, Set
 from datetime import datetime, timezone
 
 
@@ -41,8 +41,33 @@ class SignalCollector:
         Returns:
             List of normalized, deduplicated signal dictionaries.
         """
+        return self._normalize(signals, set())
+
+    async def collect_stream(
+        self, batches: AsyncIterable[List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Normalize and deduplicate batches of raw signals as each source finishes.
+
+        Same output schema and dedup rules as collect(), but each adapter's batch
+        is processed the moment it arrives instead of after the slowest source.
+
+        Args:
+            batches: Async iterable yielding one list of raw signals per source.
+
+        Returns:
+            List of normalized, deduplicated signal dictionaries, in arrival order.
+        """
+        normalized = []
+        seen_ids: Set[str] = set()
+        async for batch in batches:
+            normalized.extend(self._normalize(batch, seen_ids))
+        return normalized
+
+    def _normalize(
+        self, signals: List[Dict[str, Any]], seen_ids: Set[str]
+    ) -> List[Dict[str, Any]]:
         normalized = []
-        seen_ids = set()
 
         for signal in signals:
             # Deterministic dedup key: source + external id
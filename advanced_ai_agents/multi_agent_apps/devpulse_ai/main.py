@@ -11,6 +11,8 @@ Architecture:
 
 Design Decisions:
     - Signal collection is a utility, not an agent (deterministic work).
+    - Sources are fetched concurrently over one pooled HTTP/2 client, so
+      collection takes as long as the slowest source, not the sum of all.
     - Agents are used only where reasoning is required.
     - Single provider (OpenAI) by default to reduce onboarding friction.
     - Models are chosen by role: fast for classification, strong for synthesis.
@@ -22,18 +24,27 @@ Usage:
     Without API key: agents fall back to heuristic scoring.
 """
 
+import asyncio
+import contextlib
+import importlib.util
 import os
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, Callable, List, Dict, Any, Optional, Tuple
+
+import httpx
 
 # Reduced default signal count for faster demo execution
 DEFAULT_SIGNAL_LIMIT = 5
 
+# A source that misses this deadline is dropped from the run instead of
+# holding up the others.
+SOURCE_TIMEOUT_SECONDS = 20.0
+
 # Import adapters
-from adapters.github import fetch_github_trending
-from adapters.arxiv import fetch_arxiv_papers
-from adapters.hackernews import fetch_hackernews_stories
-from adapters.medium import fetch_medium_blogs
-from adapters.huggingface import fetch_huggingface_models
+from adapters.github import fetch_github_trending_async
+from adapters.arxiv import fetch_arxiv_papers_async
+from adapters.hackernews import fetch_hackernews_stories_async
+from adapters.medium import fetch_medium_blogs_async
+from adapters.huggingface import fetch_huggingface_models_async
 
 # Import pipeline components
 from agents import (
@@ -44,36 +55,101 @@ from agents import (
 )
 
 
-def collect_signals(limit: Optional[int] = None) -> List[Dict[str, Any]]:
+# source key → (progress label, async adapter)
+SOURCES = {
+    "github": ("GitHub trending repos", fetch_github_trending_async),
+    "arxiv": ("ArXiv papers", fetch_arxiv_papers_async),
+    "hackernews": ("HackerNews stories", fetch_hackernews_stories_async),
+    "medium": ("Medium blogs", fetch_medium_blogs_async),
+    "huggingface": ("HuggingFace models", fetch_huggingface_models_async),
+}
+
+
+def _http_client() -> httpx.AsyncClient:
+    """One pooled client for every adapter; HTTP/2 when the h2 extra is installed."""
+    return httpx.AsyncClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+    )
+
+
+async def stream_signals(
+    limit: Optional[int] = None,
+    sources: Optional[List[str]] = None,
+    client: Optional[httpx.AsyncClient] = None,
+) -> AsyncIterator[Tuple[str, List[Dict[str, Any]]]]:
     """
-    Collect signals from all configured sources.
+    Fetch all sources concurrently and yield (source, signals) as each finishes.
 
-    This is pure data aggregation — no LLM involved.
+    Every adapter shares one client (a fresh pooled one unless `client` is
+    given), and each source gets its own SOURCE_TIMEOUT_SECONDS deadline.
     """
     fetch_limit = limit if limit is not None else DEFAULT_SIGNAL_LIMIT
-    print(f"\n📡 [1/4] Collecting Signals (limit: {fetch_limit} per source)...")
 
-    signals = []
+    async with contextlib.nullcontext(client) if client else _http_client() as client:
+        async def fetch(source: str) -> Tuple[str, List[Dict[str, Any]]]:
+            label, adapter = SOURCES[source]
+            source_limit = min(fetch_limit, 3) if source == "medium" else fetch_limit
+            try:
+                signals = await asyncio.wait_for(
+                    adapter(client, limit=source_limit), SOURCE_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                print(f"  ⚠️  {label} timed out after {SOURCE_TIMEOUT_SECONDS:.0f}s, skipped")
+                signals = []
+            return source, signals
+
+        for finished in asyncio.as_completed([fetch(source) for source in sources or SOURCES]):
+            yield await finished
+
+
+def collect_normalized(
+    collector: SignalCollector,
+    limit: Optional[int] = None,
+    sources: Optional[List[str]] = None,
+    on_batch: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None,
+    client: Optional[httpx.AsyncClient] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Collect from all sources and normalize each batch the moment it arrives.
+
+    on_batch is called with (source, raw signals) for progress reporting.
+    """
+    async def batches() -> AsyncIterator[List[Dict[str, Any]]]:
+        async for source, signals in stream_signals(limit, sources, client):
+            if on_batch is not None:
+                on_batch(source, signals)
+            yield signals
 
-    print("  → Fetching GitHub trending repos...")
-    signals.extend(fetch_github_trending(limit=fetch_limit))
+    return asyncio.run(collector.collect_stream(batches()))
 
-    print("  → Fetching ArXiv papers...")
-    signals.extend(fetch_arxiv_papers(limit=fetch_limit))
 
-    print("  → Fetching HackerNews stories...")
-    signals.extend(fetch_hackernews_stories(limit=fetch_limit))
+def collect_signals(limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Collect signals from all configured sources.
 
-    print("  → Fetching Medium blogs...")
-    signals.extend(fetch_medium_blogs(limit=min(fetch_limit, 3)))
+    This is pure data aggregation — no LLM involved. Sources are fetched
+    concurrently, so signals come back in the order the sources finish.
+    """
+    fetch_limit = limit if limit is not None else DEFAULT_SIGNAL_LIMIT
+    print(f"\n📡 [1/4] Collecting Signals (limit: {fetch_limit} per source)...")
 
-    print("  → Fetching HuggingFace models...")
-    signals.extend(fetch_huggingface_models(limit=fetch_limit))
+    async def gather() -> List[Dict[str, Any]]:
+        signals = []
+        async for source, batch in stream_signals(fetch_limit):
+            _print_batch(source, batch)
+            signals.extend(batch)
+        return signals
 
+    signals = asyncio.run(gather())
     print(f"  ✓ Collected {len(signals)} raw signals")
     return signals
 
 
+def _print_batch(source: str, signals: List[Dict[str, Any]]) -> None:
+    print(f"  → {SOURCES[source][0]}: {len(signals)} signals")
+
+
 def run_pipeline():
     """
     Execute the full signal intelligence pipeline.
@@ -94,13 +170,12 @@ def run_pipeline():
         print("\n⚠️  Warning: OPENAI_API_KEY not set.")
         print("   Agents will use fallback heuristics.\n")
 
-    # Stage 1: Collect raw signals from adapters
-    raw_signals = collect_signals()
-
-    # Stage 2: Normalize and deduplicate (utility — no LLM)
+    # Stages 1-2: Collect from adapters concurrently, normalizing and
+    # deduplicating each source's batch as it arrives (utility — no LLM)
     collector = SignalCollector()
+    print(f"\n📡 [1/4] Collecting Signals (limit: {DEFAULT_SIGNAL_LIMIT} per source)...")
+    normalized = collect_normalized(collector, on_batch=_print_batch)
     print("\n🔄 [2/4] Normalizing Signals...")
-    normalized = collector.collect(raw_signals)
     print(f"  ✓ {collector.summarize_collection(normalized)}")
 
     # Stage 3: Score for relevance (agent — gpt-4.1-mini)
@@ -3,7 +3,7 @@ import os
 from typing import List, Dict, Any
 
 # Import pipeline components from main.py and agents
-from main import collect_signals, DEFAULT_SIGNAL_LIMIT
+from main import collect_normalized, DEFAULT_SIGNAL_LIMIT, SOURCES
 from agents import (
     SignalCollector,
     RelevanceAgent,
@@ -110,35 +110,18 @@ if run_button:
         
         # Step 1: Collection
         with st.status("📡 Collecting and normalizing signals...", expanded=True) as status:
-            st.write("Fetching raw data from sources...")
-            
-            # Map selected sources to fetch calls (simplified reuse)
-            # We use the collect_signals logic but filter by selected sources
-            raw_signals = []
-            from adapters.github import fetch_github_trending
-            from adapters.arxiv import fetch_arxiv_papers
-            from adapters.hackernews import fetch_hackernews_stories
-            from adapters.medium import fetch_medium_blogs
-            from adapters.huggingface import fetch_huggingface_models
-            
-            if "GitHub" in sources:
-                st.write("Fetching GitHub trending...")
-                raw_signals.extend(fetch_github_trending(limit=signal_count))
-            if "ArXiv" in sources:
-                st.write("Fetching ArXiv papers...")
-                raw_signals.extend(fetch_arxiv_papers(limit=signal_count))
-            if "HackerNews" in sources:
-                st.write("Fetching HackerNews stories...")
-                raw_signals.extend(fetch_hackernews_stories(limit=signal_count))
-            if "Medium" in sources:
-                st.write("Fetching Medium blogs...")
-                raw_signals.extend(fetch_medium_blogs(limit=min(signal_count, 3)))
-            if "HuggingFace" in sources:
-                st.write("Fetching HuggingFace models...")
-                raw_signals.extend(fetch_huggingface_models(limit=signal_count))
-            
-            st.write(f"Normalizing {len(raw_signals)} raw signals...")
-            normalized = collector.collect(raw_signals)
+            st.write("Fetching raw data from all selected sources concurrently...")
+
+            # Same concurrent collection as main.py, restricted to the selected
+            # sources; each batch is normalized as soon as its source finishes.
+            normalized = collect_normalized(
+                collector,
+                limit=signal_count,
+                sources=[source.lower() for source in sources],
+                on_batch=lambda source, batch: st.write(
+                    f"Received {len(batch)} signals from {SOURCES[source][0]}"
+                ),
+            )
             status.update(label=f"✅ {len(normalized)} unique signals collected", state="complete")
         
         # Step 2: Analysis
@@ -13,6 +13,8 @@ Expected output:
 Runs in <1s on any machine.
 """
 
+import json
+import os
 import sys
 import time
 from typing import List, Dict, Any
@@ -70,7 +72,7 @@ MOCK_SIGNALS = [
 
 def verify_imports():
     """Verify all modules can be imported without errors."""
-    print("[1/5] Verifying imports...")
+    print("[1/6] Verifying imports...")
 
     from agents import SignalCollector, RelevanceAgent, RiskAgent, SynthesisAgent
     from adapters.github import fetch_github_trending
@@ -93,7 +95,7 @@ def verify_imports():
 
 def verify_signal_collector():
     """Verify SignalCollector normalizes and deduplicates correctly."""
-    print("[2/5] Verifying Signal Collector (utility)...")
+    print("[2/6] Verifying Signal Collector (utility)...")
 
     from agents import SignalCollector
 
@@ -115,9 +117,69 @@ def verify_signal_collector():
     return normalized
 
 
+MOCK_SOURCE_DELAY = 0.2  # seconds each mocked source takes to answer
+
+MOCK_RESPONSES = {
+    "api.github.com": json.dumps({"items": [{
+        "id": 1, "full_name": "mock/agent-kit", "description": "Agent toolkit",
+        "html_url": "https://github.com/mock/agent-kit", "stargazers_count": 42,
+    }]}),
+    "export.arxiv.org": (
+        '<feed xmlns="http://www.w3.org/2005/Atom"><entry>'
+        "<id>http://arxiv.org/abs/2401.00002</id><title>Mock Paper</title>"
+        "<summary>Agents all the way down.</summary></entry></feed>"
+    ),
+    "hn.algolia.com": json.dumps({"hits": [{
+        "objectID": "999", "title": "Mock HN story", "url": "https://example.com/hn",
+    }]}),
+    "huggingface.co": json.dumps([{"modelId": "mock/model", "likes": 7}]),
+    "medium.com": (
+        "<rss><channel><item><title>Mock post</title>"
+        "<link>https://medium.com/@mock/post</link></item></channel></rss>"
+    ),
+    "engineering.fb.com": (
+        "<rss><channel><item><title>Mock engineering post</title>"
+        "<link>https://engineering.fb.com/mock</link></item></channel></rss>"
+    ),
+}
+
+
+def verify_concurrent_collection():
+    """Verify all sources are fetched concurrently over one shared client."""
+    print("[3/6] Verifying concurrent collection (mock transport)...")
+
+    import asyncio
+    import httpx
+    from agents import SignalCollector
+    from main import SOURCES, collect_normalized
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(MOCK_SOURCE_DELAY)
+        return httpx.Response(200, text=MOCK_RESPONSES[request.url.host])
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+    arrivals = []
+    start = time.time()
+    normalized = collect_normalized(
+        SignalCollector(), client=client,
+        on_batch=lambda source, batch: arrivals.append(source),
+    )
+    elapsed = time.time() - start
+
+    assert sorted(arrivals) == sorted(SOURCES), "Not every source reported a batch"
+    # 5 sources, with Medium's 4 feeds fetched in parallel too: serial
+    # fetching would take 8 × the delay.
+    assert elapsed < 3 * MOCK_SOURCE_DELAY, f"Collection not concurrent ({elapsed:.2f}s)"
+    assert {s["source"] for s in normalized} == set(SOURCES), "Missing sources"
+
+    print(f"  ✓ {len(normalized)} signals from {len(arrivals)} sources in {elapsed:.2f}s "
+          f"(serial would be ≥{8 * MOCK_SOURCE_DELAY:.1f}s)")
+    return True
+
+
 def verify_relevance_agent(signals: List[Dict]):
     """Verify RelevanceAgent fallback scoring works without API key."""
-    print("[3/5] Verifying Relevance Agent (fallback mode)...")
+    print("[4/6] Verifying Relevance Agent (fallback mode)...")
 
     from agents import RelevanceAgent
 
@@ -135,12 +197,33 @@ def verify_relevance_agent(signals: List[Dict]):
     ), "Scores out of range"
 
     print(f"  ✓ Scored {len(scored)} signals (heuristic fallback)")
+
+    # Batched + cached mode, with the structured-output request stubbed out
+    import tempfile
+    requests = []
+
+    async def mock_chunk(chunk):
+        requests.append(len(chunk))
+        return {i: {"score": 60, "reasoning": "Mock batch verdict"} for i in range(len(chunk))}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "verdicts.json")
+        for _ in range(2):  # second run must be served from the cache
+            batched_agent = RelevanceAgent(batch_size=2, cache_path=cache_path)
+            batched_agent._score_chunk = mock_chunk
+            batched = batched_agent.score_batch(signals)
+
+    assert sorted(requests) == [1, 2, 2], f"Unexpected batch requests: {requests}"
+    assert all(s["relevance"]["score"] == 60 for s in batched), "Batch verdicts lost"
+
+    print(f"  ✓ Batched mode: {len(signals)} signals in {len(requests)} requests, "
+          "0 on the cached re-run")
     return scored
 
 
 def verify_risk_agent(signals: List[Dict]):
     """Verify RiskAgent fallback assessment works without API key."""
-    print("[4/5] Verifying Risk Agent (fallback mode)...")
+    print("[5/6] Verifying Risk Agent (fallback mode)...")
 
     from agents import RiskAgent
 
@@ -163,7 +246,7 @@ def verify_risk_agent(signals: List[Dict]):
 
 def verify_synthesis_agent(signals: List[Dict]):
     """Verify SynthesisAgent produces valid digest structure."""
-    print("[5/5] Verifying Synthesis Agent...")
+    print("[6/6] Verifying Synthesis Agent...")
 
     from agents import SynthesisAgent
 
@@ -198,6 +281,7 @@ def run_verification():
             raise AssertionError("Import verification failed")
 
         normalized = verify_signal_collector()
+        verify_concurrent_collection()
         scored = verify_relevance_agent(normalized)
         assessed = verify_risk_agent(scored)
         digest = verify_synthesis_agent(assessed)
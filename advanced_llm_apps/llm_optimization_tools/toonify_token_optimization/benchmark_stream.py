@@ -0,0 +1,108 @@
+"""
+Benchmark: streaming JSON -> TOON vs encode-everything-at-once
+Generates a large synthetic tabular payload and compares throughput and
+token totals. Run: python benchmark_stream.py --rows 200000
+"""
+
+import argparse
+import json
+import random
+import time
+from datetime import date, timedelta
+
+from toon import encode
+from toon_stream import encode_with_report, get_encoding, stream_json, stream_toon
+
+REGIONS = ["us-east", "us-west", "eu-central", "ap-south"]
+STATUSES = ["shipped", "pending", "returned", "cancelled"]
+
+
+def synthetic_orders(rows: int, seed: int = 7):
+    """Yield flat order records, one at a time."""
+    rng = random.Random(seed)
+    start = date(2024, 1, 1)
+    for i in range(rows):
+        yield {
+            "order_id": 100000 + i,
+            "customer": f"customer_{rng.randint(1, 50000)}",
+            "region": rng.choice(REGIONS),
+            "status": rng.choice(STATUSES),
+            "amount": round(rng.uniform(5, 2500), 2),
+            "quantity": rng.randint(1, 20),
+            "priority": rng.random() < 0.1,
+            "shipped_on": (start + timedelta(days=rng.randint(0, 365))).isoformat(),
+            "note": rng.choice(["", "gift, wrap", "leave at door", "call: front desk", None]),
+        }
+
+
+def check_parity():
+    """The stream must produce byte-identical output to toon.encode / json.dumps."""
+    samples = [
+        list(synthetic_orders(1)),
+        list(synthetic_orders(2500)),
+        [{"name": "a|b", "value": 1.5e-7, "flag": None}, {"name": " x", "value": 3.0, "flag": False}],
+        [],
+    ]
+    for records in samples:
+        payload = {"orders": records}
+        for delimiter in (",", "|", "\t"):
+            expected = encode(payload, {"delimiter": delimiter})
+            known = "".join(stream_toon(iter(records), "orders", count=len(records), delimiter=delimiter))
+            spooled = "".join(stream_toon(iter(records), "orders", delimiter=delimiter))
+            assert known == expected, f"count-known stream differs ({len(records)} rows, {delimiter!r})"
+            assert spooled == expected, f"spooled stream differs ({len(records)} rows, {delimiter!r})"
+        assert "".join(stream_json(iter(records), "orders")) == json.dumps(payload, indent=2)
+    # Non-tabular input is rejected rather than encoded differently from toon.encode
+    for records in ([{}], [{"a": 1}, {"b": 2}], [{"a": [1, 2]}]):
+        for count in (len(records), None):
+            try:
+                "".join(stream_toon(iter(records), "orders", count=count))
+            except ValueError:
+                continue
+            raise AssertionError(f"non-tabular records were streamed: {records!r} != {encode({'orders': records})!r}")
+    print("✅ Parity: streamed TOON/JSON identical to toon.encode / json.dumps")
+
+
+def run_all_at_once(rows: int, model: str):
+    """Old path: materialize the list, encode whole strings, tokenize whole strings."""
+    started = time.perf_counter()
+    payload = {"orders": list(synthetic_orders(rows))}
+    json_str = json.dumps(payload, indent=2)
+    toon_str = encode(payload)
+    encoding = get_encoding(model)
+    json_tokens = len(encoding.encode_ordinary(json_str))
+    toon_tokens = len(encoding.encode_ordinary(toon_str))
+    elapsed = time.perf_counter() - started
+    return elapsed, len(json_str.encode("utf-8")), json_tokens, toon_tokens
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--model", default="gpt-4")
+    args = parser.parse_args()
+
+    check_parity()
+    get_encoding(args.model)  # load the tokenizer outside the timed runs
+
+    print(f"\n📦 {args.rows:,} synthetic order records, tokenizer for {args.model}")
+    print("-" * 72)
+
+    elapsed, json_bytes, json_tokens, toon_tokens = run_all_at_once(args.rows, args.model)
+    print(f"{'all at once':<22}{elapsed:>8.2f}s  {json_bytes / elapsed / 1e6:>7.2f} MB/s  "
+          f"{json_tokens - toon_tokens:>12,} tokens saved")
+
+    for label, count in (("stream (count known)", args.rows), ("stream (spooled)", None)):
+        report = encode_with_report(synthetic_orders(args.rows), "orders", model=args.model, count=count)
+        print(f"{label:<22}{report.seconds:>8.2f}s  {report.bytes_per_sec / 1e6:>7.2f} MB/s  "
+              f"{report.tokens_saved:>12,} tokens saved")
+
+    print("-" * 72)
+    print(f"JSON tokens: {report.json_tokens:,} streamed vs {json_tokens:,} whole-string")
+    print(f"TOON tokens: {report.toon_tokens:,} streamed vs {toon_tokens:,} whole-string")
+    print(f"TOON bytes:  {report.toon_bytes:,} of {report.json_bytes:,} JSON bytes "
+          f"({report.token_reduction:.1f}% fewer tokens)")
+
+
+if __name__ == "__main__":
+    main()
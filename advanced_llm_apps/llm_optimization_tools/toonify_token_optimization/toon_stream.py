@@ -0,0 +1,285 @@
+"""
+Streaming JSON -> TOON encoder with token accounting
+Encode large tabular payloads from an iterator of records without building
+the whole list (or the whole JSON/TOON string) in memory.
+"""
+
+import json
+import tempfile
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import tiktoken
+from toon.utils import format_float, is_primitive, needs_quoting, quote_string
+
+DELIMITERS = {"comma": ",", "tab": "\t", "pipe": "|"}
+
+# Records per yielded chunk: large enough that tokenizer calls stay cheap,
+# small enough that memory stays flat on multi-million row exports.
+CHUNK_ROWS = 1000
+
+# Rows beyond this are spooled to disk while waiting for an unknown count.
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model: str = "gpt-4") -> tiktoken.Encoding:
+    """Load the tokenizer for a model once per process."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # tiktoken can't map non-OpenAI model names (e.g. claude-3-*); fall back
+        # to the modern OpenAI encoding so the token count still renders.
+        return tiktoken.get_encoding("cl100k_base")
+
+
+class TokenMeter:
+    """Running byte and token totals, fed one chunk at a time."""
+
+    def __init__(self, model: str = "gpt-4"):
+        self._encoding = get_encoding(model)
+        self.bytes = 0
+        self.tokens = 0
+
+    def feed(self, chunk: str) -> str:
+        self.bytes += len(chunk.encode("utf-8"))
+        self.tokens += len(self._encoding.encode_ordinary(chunk))
+        return chunk
+
+
+def _encode_cell(value: Any) -> str:
+    """Encode one tabular cell exactly like toon.encode does."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        if value != value or value in (float("inf"), float("-inf")):
+            return "null"
+        return format_float(value)
+    if isinstance(value, int):
+        return str(value)
+    if not isinstance(value, str):
+        # datetime / date
+        value = value.isoformat()
+    return quote_string(value) if needs_quoting(value) else value
+
+
+def _encode_rows(
+    records: Iterable[Dict[str, Any]], fields: List[str], delimiter: str
+) -> Iterator[str]:
+    expected = set(fields)
+    for index, record in enumerate(records):
+        if not isinstance(record, dict) or set(record) != expected:
+            raise ValueError(f"Record {index} does not have fields {fields}")
+        cells = []
+        for field in fields:
+            value = record[field]
+            if not is_primitive(value):
+                raise ValueError(
+                    f"Record {index} field '{field}' is not a primitive value"
+                )
+            cells.append(_encode_cell(value))
+        yield "  " + delimiter.join(cells)
+
+
+def _header(key: str, count: int, fields: List[str], delimiter: str) -> str:
+    indicator = "" if delimiter == "," else delimiter
+    return f"{key}[{count}{indicator}]{{{','.join(fields)}}}:"
+
+
+def _chunks(lines: Iterable[str], first: bool) -> Iterator[str]:
+    """Join lines into CHUNK_ROWS-sized chunks that concatenate losslessly."""
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= CHUNK_ROWS:
+            yield ("" if first else "\n") + "\n".join(batch)
+            first = False
+            batch = []
+    if batch:
+        yield ("" if first else "\n") + "\n".join(batch)
+
+
+def stream_toon(
+    records: Iterable[Dict[str, Any]],
+    key: str,
+    fields: Optional[List[str]] = None,
+    count: Optional[int] = None,
+    delimiter: str = ",",
+) -> Iterator[str]:
+    """
+    Yield the TOON encoding of {key: records} in chunks.
+
+    Records must be flat dicts sharing the same, non-empty fields (the
+    tabular case); anything else raises ValueError.
+    "".join(stream_toon(...)) equals toon.encode({key: list(records)}).
+
+    TOON puts the row count in the header, so pass count when it is known.
+    Otherwise rows are encoded into a spooled temp file (memory first, disk
+    past SPOOL_MAX_BYTES) and the header is emitted once the input ends.
+    """
+    delimiter = DELIMITERS.get(delimiter, delimiter)
+    records = iter(records)
+    first = next(records, None)
+    if first is None:
+        if count:
+            raise ValueError(f"Expected {count} records, got 0")
+        yield f"{key}: []"
+        return
+    if fields is None:
+        if not isinstance(first, dict):
+            raise ValueError("Record 0 is not an object")
+        fields = list(first)
+    if not fields:
+        # toon.encode falls back to list form ("- {}") here; there is no tabular header.
+        raise ValueError("Records have no fields, so they cannot be encoded as a table")
+
+    def all_records():
+        yield first
+        yield from records
+
+    rows = _encode_rows(all_records(), fields, delimiter)
+
+    if count is not None:
+        yield _header(key, count, fields, delimiter)
+        written = 0
+        for chunk in _chunks(rows, first=False):
+            written += chunk.count("\n")
+            if written > count:
+                raise ValueError(f"Expected {count} records, got more")
+            yield chunk
+        if written != count:
+            raise ValueError(f"Expected {count} records, got {written}")
+        return
+
+    with tempfile.SpooledTemporaryFile(
+        max_size=SPOOL_MAX_BYTES, mode="w+", encoding="utf-8", newline="\n"
+    ) as spool:
+        written = 0
+        for row in rows:
+            spool.write(row)
+            spool.write("\n")
+            written += 1
+        spool.seek(0)
+        yield _header(key, written, fields, delimiter)
+        yield from _chunks((line[:-1] for line in spool), first=False)
+
+
+def _json_chunk(batch: List[Dict[str, Any]], key: str, opened: bool) -> str:
+    """Indented-JSON text for a batch of records inside {key: [...]}."""
+    parts = []
+    for record in batch:
+        prefix = ",\n    " if opened else "{\n  " + json.dumps(key) + ": [\n    "
+        parts.append(prefix + json.dumps(record, indent=2).replace("\n", "\n    "))
+        opened = True
+    return "".join(parts)
+
+
+def _json_close(key: str, opened: bool) -> str:
+    return "\n  ]\n}" if opened else "{\n  " + json.dumps(key) + ": []\n}"
+
+
+def stream_json(records: Iterable[Dict[str, Any]], key: str) -> Iterator[str]:
+    """
+    Yield json.dumps({key: records}, indent=2) in chunks.
+
+    This is the baseline the TOON stream is compared against.
+    """
+    opened = False
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= CHUNK_ROWS:
+            yield _json_chunk(batch, key, opened)
+            opened = True
+            batch = []
+    if batch:
+        yield _json_chunk(batch, key, opened)
+        opened = True
+    yield _json_close(key, opened)
+
+
+@dataclass
+class StreamReport:
+    """Throughput and token totals for one streamed payload."""
+
+    records: int
+    seconds: float
+    json_bytes: int
+    toon_bytes: int
+    json_tokens: int
+    toon_tokens: int
+
+    @property
+    def bytes_per_sec(self) -> float:
+        """JSON-equivalent input bytes converted per second."""
+        return self.json_bytes / self.seconds if self.seconds else 0.0
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.json_tokens - self.toon_tokens
+
+    @property
+    def token_reduction(self) -> float:
+        return self.tokens_saved / self.json_tokens * 100 if self.json_tokens else 0.0
+
+
+def encode_with_report(
+    records: Iterable[Dict[str, Any]],
+    key: str,
+    model: str = "gpt-4",
+    count: Optional[int] = None,
+    delimiter: str = ",",
+    sink=None,
+) -> StreamReport:
+    """
+    Stream records through the TOON encoder once. Bytes and tokens are
+    counted for TOON and for the equivalent indented JSON as each chunk
+    is produced.
+
+    TOON chunks are written to sink (any object with .write) when given.
+    Tokens are counted per chunk, so totals can differ from tokenizing
+    the whole string by a token or two at chunk boundaries.
+    """
+    json_meter = TokenMeter(model)
+    toon_meter = TokenMeter(model)
+    total = 0
+    opened = False
+
+    def metered(items):
+        # Meter the JSON baseline from the same single pass over the iterator.
+        nonlocal total, opened
+        batch = []
+        for record in items:
+            batch.append(record)
+            if len(batch) >= CHUNK_ROWS:
+                json_meter.feed(_json_chunk(batch, key, opened))
+                opened = True
+                total += len(batch)
+                yield from batch
+                batch = []
+        if batch:
+            json_meter.feed(_json_chunk(batch, key, opened))
+            opened = True
+            total += len(batch)
+            yield from batch
+
+    started = time.perf_counter()
+    for chunk in stream_toon(metered(records), key, count=count, delimiter=delimiter):
+        toon_meter.feed(chunk)
+        if sink is not None:
+            sink.write(chunk)
+    json_meter.feed(_json_close(key, opened))
+    elapsed = time.perf_counter() - started
+
+    return StreamReport(
+        records=total,
+        seconds=elapsed,
+        json_bytes=json_meter.bytes,
+        toon_bytes=toon_meter.bytes,
+        json_tokens=json_meter.tokens,
+        toon_tokens=toon_meter.tokens,
+    )
@@ -6,19 +6,13 @@ Visualize token savings and test TOON format with your own data
 import streamlit as st
 import json
 from toon import encode, decode
-import tiktoken
+from toon_stream import get_encoding
 import pandas as pd
 
 
 def count_tokens(text: str, model: str = "gpt-4") -> int:
     """Count tokens in text."""
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        # tiktoken can't map non-OpenAI model names (e.g. claude-3-*); fall back
-        # to the modern OpenAI encoding so the token count still renders.
-        encoding = tiktoken.get_encoding("cl100k_base")
-    return len(encoding.encode(text))
+    return len(get_encoding(model).encode(text))
 
 
 def calculate_cost(tokens: int, model: str = "gpt-4") -> float:
@@ -5,20 +5,15 @@ Demonstrates how to reduce LLM API costs by 30-60% using TOON format
 
 import json
 from toon import encode, decode
-import tiktoken
+from toon_stream import get_encoding
 from openai import OpenAI
 from anthropic import Anthropic
 import os
 
 
 def count_tokens(text: str, model: str = "gpt-4") -> int:
-    """Count the number of tokens in a text string."""
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        # tiktoken can't map non-OpenAI model names (e.g. claude-3-*); fall back.
-        encoding = tiktoken.get_encoding("cl100k_base")
-    return len(encoding.encode(text))
+    """Count tokens in text."""
+    return len(get_encoding(model).encode(text))
 
 
 def format_comparison_demo():
@@ -2,7 +2,11 @@
 """Reconstruct why a file or line range exists from local git history.
 
 Usage:
-    python3 archaeologist.py REPO FILE [--lines A-B] [--json]
+    python3 archaeologist.py REPO FILE [--lines A-B] [--json] [--single-walk]
+
+--single-walk reads every commit's metadata and changed files from one
+streamed `git log` process instead of two git processes per commit, for
+files with thousands of commits.
 
 Python 3.8+, stdlib only. Read-only and offline.
 """
@@ -13,11 +17,16 @@ import os
 import re
 import subprocess
 import sys
+import threading
 from collections import Counter, defaultdict
 
 
 LINE_RANGE_RE = re.compile(r"^([1-9][0-9]*)-([1-9][0-9]*)$")
 ISSUE_RE = re.compile(r"(?<![\w/])(?:#[0-9]+|(?:pr|issue|gh)[\s:#-]*[0-9]+)", re.I)
+# One record per commit in a --single-walk stream: a record-separator byte, the
+# NUL-separated fields read_commit takes from `git show`, then --name-status.
+WALK_FORMAT = "%x1e%H%x00%an%x00%ae%x00%aI%x00%s%x00%b%x00"
+WALK_TIMEOUT = 300
 INTENT_PATTERNS = (
     ("revert", re.compile(r"\brevert(?:ed|s|ing)?\b", re.I)),
     ("workaround", re.compile(r"\bwork[ -]?around\b", re.I)),
@@ -145,14 +154,7 @@ def classify_message(subject, body):
     return "other"
 
 
-def changed_file_details(repo, commit_hash):
-    output = git(
-        repo,
-        [
-            "diff-tree", "--root", "--no-commit-id", "--name-status", "-r",
-            "-M", commit_hash, "--",
-        ],
-    )
+def parse_name_status(output):
     paths = set()
     renames = []
     for line in output.splitlines():
@@ -166,6 +168,17 @@ def changed_file_details(repo, commit_hash):
     return sorted(paths), renames
 
 
+def changed_file_details(repo, commit_hash):
+    output = git(
+        repo,
+        [
+            "diff-tree", "--root", "--no-commit-id", "--name-status", "-r",
+            "-M", commit_hash, "--",
+        ],
+    )
+    return parse_name_status(output)
+
+
 def intent_signals(commit_hash, subject, body):
     text = "%s\n%s" % (subject, body)
     signals = []
@@ -188,15 +201,8 @@ def intent_signals(commit_hash, subject, body):
     return signals
 
 
-def read_commit(repo, commit_hash):
-    fmt = "%H%x00%an%x00%ae%x00%aI%x00%s%x00%b"
-    raw = git(repo, ["show", "-s", "--format=%s" % fmt, commit_hash]).rstrip("\n")
-    parts = raw.split("\x00", 5)
-    if len(parts) != 6:
-        raise ArchaeologistError("could not parse commit metadata for %s" % commit_hash)
-    full_hash, author, email, date, subject, body = parts
+def commit_entry(full_hash, author, email, date, subject, body, files, renames):
     signals = intent_signals(full_hash, subject, body)
-    files, renames = changed_file_details(repo, full_hash)
     return {
         "hash": full_hash,
         "short_hash": full_hash[:12],
@@ -212,6 +218,75 @@ def read_commit(repo, commit_hash):
     }, signals
 
 
+def read_commit(repo, commit_hash):
+    fmt = "%H%x00%an%x00%ae%x00%aI%x00%s%x00%b"
+    raw = git(repo, ["show", "-s", "--format=%s" % fmt, commit_hash]).rstrip("\n")
+    parts = raw.split("\x00", 5)
+    if len(parts) != 6:
+        raise ArchaeologistError("could not parse commit metadata for %s" % commit_hash)
+    files, renames = changed_file_details(repo, parts[0])
+    return commit_entry(*parts, files, renames)
+
+
+def walk_commits(repo, hashes):
+    """Yield read_commit's (entry, signals) for every hash, in order, from one
+    `git log --no-walk --stdin` process that streams metadata and the same
+    first-parent rename-detecting --name-status diff-tree would report."""
+    try:
+        proc = subprocess.Popen(
+            [
+                "git", "-C", repo, "log", "--no-walk=unsorted", "--stdin", "--root",
+                "--name-status", "-M", "--format=" + WALK_FORMAT,
+            ],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            text=True, encoding="utf-8", errors="replace",
+        )
+    except FileNotFoundError as exc:
+        raise ArchaeologistError("git is not installed or is not on PATH") from exc
+    timed_out = []
+    timer = threading.Timer(WALK_TIMEOUT, lambda: (timed_out.append(True), proc.kill()))
+    timer.start()
+    stderr = []
+    drain = threading.Thread(target=lambda: stderr.append(proc.stderr.read()))
+    drain.start()
+    # git reads all of stdin before it writes anything, so this cannot deadlock
+    proc.stdin.write("".join(commit_hash + "\n" for commit_hash in hashes))
+    proc.stdin.close()
+
+    def parse(record):
+        parts = record.split("\x00", 6)
+        if len(parts) != 7:
+            raise ArchaeologistError("could not parse commit metadata in git log output")
+        files, renames = parse_name_status(parts[6])
+        return commit_entry(*parts[:5], parts[5].rstrip("\n"), files, renames)
+
+    count = 0
+    try:
+        record = None
+        for line in proc.stdout:
+            if line.startswith("\x1e"):
+                if record is not None:
+                    count += 1
+                    yield parse("".join(record))
+                record = [line[1:]]
+            elif record is not None:
+                record.append(line)
+        if record is not None:
+            count += 1
+            yield parse("".join(record))
+    finally:
+        proc.stdout.close()
+        proc.wait()
+        timer.cancel()
+        drain.join()
+    if timed_out:
+        raise ArchaeologistError("git command timed out")
+    if proc.returncode != 0:
+        raise ArchaeologistError("".join(stderr).strip() or "git command failed")
+    if count != len(hashes):
+        raise ArchaeologistError("git log returned %d of %d commits" % (count, len(hashes)))
+
+
 def blame_authors(repo, path, line_range):
     args = ["blame", "--line-porcelain"]
     if line_range:
@@ -295,12 +370,15 @@ def summarize_co_changes(path, timeline):
     )
 
 
-def build_report(repo, path, line_range):
+def build_report(repo, path, line_range, single_walk=False):
     hashes = history_hashes(repo, path, line_range)
     timeline = []
     signals = []
-    for commit_hash in hashes:
-        entry, commit_signals = read_commit(repo, commit_hash)
+    if single_walk:
+        commits = walk_commits(repo, hashes)
+    else:
+        commits = (read_commit(repo, commit_hash) for commit_hash in hashes)
+    for entry, commit_signals in commits:
         timeline.append(entry)
         signals.extend(commit_signals)
     threshold, co_changed, aliases = summarize_co_changes(path, timeline)
@@ -366,13 +444,16 @@ def main(argv=None):
     parser.add_argument("--lines", metavar="A-B", help="current line range to trace")
     parser.add_argument("--json", action="store_true", dest="as_json",
                         help="emit the structured dig report as JSON")
+    parser.add_argument("--single-walk", action="store_true",
+                        help="read all commits in one streamed git log instead of "
+                             "two git processes per commit (for long histories)")
     args = parser.parse_args(argv)
 
     try:
         repo, path = normalize_inputs(args.repo, args.file)
         line_range = parse_line_range(args.lines)
         validate_range(repo, path, line_range)
-        report = build_report(repo, path, line_range)
+        report = build_report(repo, path, line_range, args.single_walk)
     except ArchaeologistError as exc:
         print("error: %s" % exc, file=sys.stderr)
         return 2
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Benchmark the per-commit and --single-walk history readers on a long history.
+
+Builds a synthetic repository with git fast-import: one file edited in every
+commit (renamed halfway through), neighbours that co-change with it, and
+commit bodies carrying issue references and intent words. Then runs the
+skill's script in both modes, file-wide and on a line range, checks the JSON
+reports are identical, and prints the timings.
+
+    python3 agent_skills/evals/commit-archaeologist/bench_archaeologist.py --commits 2000
+
+Python stdlib plus git only. Everything lives in a temp directory.
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+
+SCRIPT = os.path.abspath(os.path.join(
+    os.path.dirname(__file__),
+    "..", "..", "commit-archaeologist", "scripts", "archaeologist.py",
+))
+OLD_PATH = "src/legacy/engine.py"
+NEW_PATH = "src/engine.py"
+NEIGHBOURS = ["src/config.py", "src/cli.py", "tests/test_engine.py", "docs/CHANGELOG.md", "src/util.py"]
+AUTHORS = [("Ada Lovelace", "ada@example.com"), ("Grace Hopper", "grace@example.com"),
+           ("Linus Pauling", "linus@example.com")]
+SUBJECTS = ["feat: add step %d", "fix: off-by-one in step %d", "refactor: tidy step %d",
+            "hotfix: guard step %d", "Revert \"tune step %d\"", "chore: bump step %d"]
+
+
+def data(text):
+    raw = text.encode("utf-8")
+    return b"data %d\n%s\n" % (len(raw), raw)
+
+
+def fast_import_stream(commits, lines):
+    content = ["value_%d = %d" % (index, index) for index in range(lines)]
+    chunks = []
+    for number in range(1, commits + 1):
+        name, email = AUTHORS[number % len(AUTHORS)]
+        timestamp = 1_700_000_000 + number * 3600
+        subject = SUBJECTS[number % len(SUBJECTS)] % number
+        body = "Context for step %d.\n\nRefs #%d.%s" % (
+            number, number, " Temporary workaround until upstream ships." if number % 7 == 0 else "")
+        path = OLD_PATH if number <= commits // 2 else NEW_PATH
+        content[number % lines] = "value_%d = %d  # step %d" % (number % lines, number, number)
+        chunks.append(b"commit refs/heads/main\nmark :%d\n" % number)
+        chunks.append(("author %s <%s> %d +0000\n" % (name, email, timestamp)).encode("utf-8"))
+        chunks.append(("committer %s <%s> %d +0000\n" % (name, email, timestamp)).encode("utf-8"))
+        chunks.append(data("%s\n\n%s" % (subject, body)))
+        if number > 1:
+            chunks.append(b"from :%d\n" % (number - 1))
+        if number == commits // 2 + 1:
+            chunks.append(("R %s %s\n" % (OLD_PATH, NEW_PATH)).encode("utf-8"))
+        chunks.append(("M 100644 inline %s\n" % path).encode("utf-8"))
+        chunks.append(data("\n".join(content) + "\n"))
+        for neighbour in NEIGHBOURS[: 1 + number % 3]:
+            chunks.append(("M 100644 inline %s\n" % neighbour).encode("utf-8"))
+            chunks.append(data("# %s touched in step %d\n" % (neighbour, number)))
+        chunks.append(b"\n")
+    return b"".join(chunks)
+
+
+def build_repo(root, commits, lines):
+    repo = os.path.join(root, "long-history")
+    os.makedirs(repo)
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+    subprocess.run(["git", "fast-import", "--quiet"], cwd=repo, check=True,
+                   input=fast_import_stream(commits, lines))
+    subprocess.run(["git", "checkout", "-q", "main"], cwd=repo, check=True)
+    return repo
+
+
+def timed(repo, *args):
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, SCRIPT, repo, NEW_PATH, "--json", *args],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip())
+    return time.perf_counter() - start, result.stdout
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-commit and --single-walk history reading.")
+    parser.add_argument("--commits", type=int, default=2000, help="commits touching the target file")
+    parser.add_argument("--lines", type=int, default=300, help="lines in the target file")
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="commit-archaeologist-bench-")
+    try:
+        start = time.perf_counter()
+        repo = build_repo(root, args.commits, args.lines)
+        print("built %d-commit history in %.1fs" % (args.commits, time.perf_counter() - start))
+
+        same = True
+        print("\n%-24s %12s %12s %8s" % ("", "per-commit", "single-walk", "speedup"))
+        for label, extra in (("file-wide (--follow)", []), ("lines 1-40 (-L)", ["--lines", "1-40"])):
+            per_commit, expected = timed(repo, *extra)
+            single_walk, walked = timed(repo, *extra, "--single-walk")
+            same = same and walked == expected
+            print("%-24s %11.2fs %11.2fs %7.1fx" % (label, per_commit, single_walk, per_commit / single_walk))
+        print("\nreports identical: %s" % same)
+        return 0 if same else 1
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -200,6 +200,12 @@ def main():
 
         repeat = run(repo, "--lines", "1-7", "--json")
         check("JSON output is deterministic", repeat.stdout == result.stdout)
+        walked = run(repo, "--lines", "1-7", "--json", "--single-walk")
+        check(
+            "single-walk line report matches the per-commit one",
+            walked.returncode == 0 and walked.stdout == result.stdout,
+            walked.stderr,
+        )
 
         print("file-wide rename and error behavior:")
         git(repo, "mv", "src/calculator.py", "src/arithmetic.py")
@@ -223,6 +229,13 @@ def main():
             str(file_report.get("co_changed")),
         )
 
+        walked = run(repo, "--json", "--single-walk", file_path="src/arithmetic.py")
+        check(
+            "single-walk file report matches the per-commit one, renames included",
+            walked.returncode == 0 and walked.stdout == file_result.stdout,
+            walked.stderr,
+        )
+
         invalid = run(
             repo, "--lines", "7-1", "--json", file_path="src/arithmetic.py",
         )
@@ -20,6 +20,7 @@ What it proves (each caught a real bug during development, or guards one):
   - --redact renames projects but keeps the kill-chain intact
   - --state + --mark-resurrected + relapse detection
   - --json report structure
+  - --cache reuses unchanged repos and re-reads only the one whose HEAD moved
 """
 
 import json
@@ -168,6 +169,19 @@ def main():
         check("dead entries carry causes and pulse",
               all("causes" in d and "pulse" in d for d in r["dead"]))
 
+        print("cache:")
+        cache = os.path.join(root, "cache.json")
+        baseline = run(root, "--days", "45", "--jobs", "1")
+        first = run(root, "--days", "45", "--cache", cache)
+        again = run(root, "--days", "45", "--cache", cache)
+        check("parallel cached scan matches a serial one", first == baseline, first)
+        check("unchanged repos come from the cache",
+              "(5 of 5 repos unchanged" in again and again.startswith(first), again)
+        commit(os.path.join(root, "pay-wall"), days_ago(1), "back on it", ["app/billing.py"])
+        out = run(root, "--days", "45", "--cache", cache)
+        check("a moved HEAD is re-read", "(4 of 5 repos unchanged" in out and "pay-wall" not in
+              out.split("THE DEAD")[-1].split("PATTERNS")[0], out)
+
         print()
         if all(checks):
             print("PASS — %d/%d checks" % (len(checks), len(checks)))
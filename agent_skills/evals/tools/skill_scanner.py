@@ -11,21 +11,31 @@ OWASP Agentic Skills Top 10 (AST01-AST10).
 Usage:
     python3 skill_scanner.py <path-to-skill-or-skills-dir>
     python3 skill_scanner.py <path> --json
+    python3 skill_scanner.py <path> --jobs 8 --cache .skillscan-cache.json
 
 Python 3.8+, stdlib only, makes no network calls, never executes scanned code.
 
 Exit codes: 0 = no CRITICAL findings, 1 = at least one CRITICAL, 2 = usage error.
 
+Large trees: skills are scanned in parallel (--jobs, default one per CPU), and
+--cache FILE keeps per-file results keyed by mtime, size and content hash so a
+re-scan only reads files that changed.
+
 Lines containing the marker "skillscan" + ":allow" (written as one word with a
 colon) are skipped, so scanners and docs that *describe* attack patterns can
 suppress self-matches.
 """
 
 import argparse
+import bisect
+import hashlib
+import itertools
 import json
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 VERSION = "1.0.0"
@@ -123,6 +133,87 @@ LURE_PROSE_RE = re.compile(
 
 NAME_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
 
+# ---------------------------------------------------------------------------
+# Prefilter. Every match of a per-line pattern contains at least one of that
+# pattern's trigger literals (compared lowercased), so one sweep of all the
+# triggers over the lowercased file finds each line's candidate patterns and
+# lines without a trigger are never matched at all. (str.find per literal is
+# measurably faster here than one big re alternation.) Keep these in step with
+# the tables above — a missing trigger silently hides findings.
+# ---------------------------------------------------------------------------
+
+PIPE_SHELL_TRIGGERS = [("curl", "wget"), ("iex",), ("iex",), ("base64",), ("base64",)]
+OBFUSCATION_EXEC_TRIGGERS = [("b64decode", "base64", "fromhex", "codecs.decode", "rot13"),
+                             ("atob", "buffer.from"), ("b64decode", "base64", "atob")]
+CRED_TRIGGERS = [(".ssh", "id_rsa", "id_ed25519"), (".aws/",),
+                 ("find-generic-password", "find-internet-password", "dump-keychain"),
+                 (".netrc", ".npmrc", ".pypirc"), ("gcloud/",), ("login data", "cookies", "browser"),
+                 ("exodus", "electrum", "phantom", "solana"), ("expanduser", "$home/", "~/."),
+                 ("os.environ",), ("process.env",), ("env",)]
+NET_TRIGGERS = [("requests", "httpx", "aiohttp", "urllib", "socket", "http"),
+                ("urllib.request", "http.client", "socket."),
+                ("fetch", "axios", "xmlhttprequest", "websocket"), ("curl", "wget"), ("nc", "netcat")]
+PIN_TRIGGERS = [("pip",), ("npm",)]
+
+
+def _build_rules():
+    """Number every per-line pattern and map each trigger to the rule ids it
+    gates. Each table keeps its own rule list so findings come out in the same
+    order as before."""
+    tables, trigger_rules, folding = [], {}, set()
+    rule_id = 0
+    for patterns, triggers in ((PIPE_SHELL_PATTERNS + OBFUSCATION_EXEC_PATTERNS,
+                                PIPE_SHELL_TRIGGERS + OBFUSCATION_EXEC_TRIGGERS),
+                               (CRED_PATTERNS, CRED_TRIGGERS), (NET_PATTERNS, NET_TRIGGERS),
+                               (PIN_PATTERNS, PIN_TRIGGERS)):
+        assert len(patterns) == len(triggers)
+        rules = []
+        for entry, trig in zip(patterns, triggers):
+            rules.append((rule_id,) + tuple(entry))
+            for t in trig:
+                trigger_rules.setdefault(t, set()).add(rule_id)
+            if entry[0].flags & re.I:
+                folding.add(rule_id)
+            rule_id += 1
+        tables.append(rules)
+    return tables, {t: frozenset(ids) for t, ids in trigger_rules.items()}, frozenset(folding)
+
+
+(EXEC_RULES, CRED_RULES, NET_RULES, PIN_RULES), TRIGGER_RULES, FOLDING_RULES = _build_rules()
+ALL_RULES = frozenset().union(*TRIGGER_RULES.values())
+# re.I also folds a few non-ASCII letters onto ASCII ones (e.g. U+017F onto "s")
+# that str.lower() leaves alone, so case-insensitive patterns always run on
+# non-ASCII lines.
+NON_ASCII_RE = re.compile(r"[^\x00-\x7f]")
+
+
+def line_candidates(content):
+    """Map 0-based line index -> ids of the rules worth running on that line."""
+    line_ends = list(itertools.accumulate(map(len, content.splitlines(True))))
+    lowered = content.lower()
+    if len(lowered) != len(content):
+        # lowercasing changed offsets (e.g. U+0130); check every rule on every line
+        return {index: ALL_RULES for index in range(len(line_ends))}, line_ends
+    candidates = {}
+    for trigger, rule_ids in TRIGGER_RULES.items():
+        pos = lowered.find(trigger)
+        while pos != -1:
+            index = bisect.bisect_right(line_ends, pos)
+            candidates[index] = candidates.get(index, frozenset()) | rule_ids
+            pos = lowered.find(trigger, line_ends[index])  # the rest of this line adds nothing new
+    if not content.isascii():
+        for m in NON_ASCII_RE.finditer(content):
+            index = bisect.bisect_right(line_ends, m.start())
+            candidates[index] = candidates.get(index, frozenset()) | FOLDING_RULES
+    return candidates, line_ends
+
+
+# Cached results are only reused by a scanner with identical rules.
+RULES_FINGERPRINT = hashlib.sha256(repr([
+    VERSION, [(rx.pattern, rest) for rx, *rest in PIPE_SHELL_PATTERNS + OBFUSCATION_EXEC_PATTERNS + CRED_PATTERNS
+              + NET_PATTERNS + PIN_PATTERNS], sorted(TRIGGER_RULES.items()), LONG_B64_RE.pattern, HEX_ONLY_RE.pattern,
+]).encode("utf-8")).hexdigest()[:16]
+
 
 class Finding:
     def __init__(self, skill, check, severity, file, line, message, evidence):
@@ -135,6 +226,12 @@ class Finding:
                 "file": self.file, "line": self.line, "message": self.message,
                 "evidence": self.evidence}
 
+    @classmethod
+    def from_dict(cls, d):
+        f = cls(d["skill"], d["check"], d["severity"], d["file"], d["line"], d["message"], "")
+        f.evidence = d["evidence"]
+        return f
+
 
 def read_text(path):
     try:
@@ -209,7 +306,93 @@ def network_declared(fm):
     return any(w in compat for w in NETWORK_DECLARE_WORDS), any(w in blob for w in NETWORK_DECLARE_WORDS)
 
 
-def scan_skill(skill_dir, include_fixtures=False):
+def scan_file(skill_name, path, rel, content, is_skill_md, net_declared):
+    """Pattern findings for one file's content (Checks 1, 3, 4, 5, 7)."""
+    findings = []
+
+    def add(check, sev, line, msg, evidence):
+        findings.append(Finding(skill_name, check, sev, rel, line, msg, evidence))
+
+    lines = content.splitlines()
+    candidates, line_ends = line_candidates(content)
+    b64_tokens = {}
+    for m in LONG_B64_RE.finditer(content):
+        b64_tokens.setdefault(bisect.bisect_right(line_ends, m.start()), []).append(m.group())
+    for index in b64_tokens:
+        candidates.setdefault(index, frozenset())
+
+    is_markdown = path.suffix.lower() in (".md", ".markdown")
+    fences = set()
+    if is_markdown:
+        pos = content.find("```")
+        while pos != -1:
+            index = bisect.bisect_right(line_ends, pos)
+            if lines[index].lstrip().startswith("```"):
+                fences.add(index)
+            pos = content.find("```", line_ends[index])
+    file_has_net = False
+    file_has_cred = False
+    in_doc_fence = False
+    # Only fence lines (to track code examples) and candidate lines are visited.
+    for index in sorted(fences.union(candidates)):
+        line = lines[index]
+        if index in fences:
+            in_doc_fence = not in_doc_fence
+            continue
+        if SUPPRESS_MARKER in line:
+            continue
+        i = index + 1
+        active = candidates[index]
+
+        # WARN-tier findings inside a markdown code example are usually
+        # illustrative snippets, not instructions — downgrade to INFO so
+        # documentation-heavy skills stay reviewable. CRITICAL patterns are
+        # NEVER downgraded here: ClawHavoc install lures lived precisely in
+        # fenced "Prerequisites" blocks.
+        def doc_sev(sev):
+            return "INFO" if (in_doc_fence and sev == "WARN") else sev
+
+        def doc_msg(sev, msg):
+            if in_doc_fence and sev == "WARN":
+                return msg + " (inside a documentation code example — verify it is illustrative, not an instruction to the agent)"
+            return msg
+
+        for rule_id, rx, check, sev, msg in EXEC_RULES:
+            if rule_id in active and rx.search(line):
+                add(check, doc_sev(sev), i, doc_msg(sev, msg), line)
+        for token in b64_tokens.get(index, ()):
+            if not HEX_ONLY_RE.match(token):
+                add("OBF01", doc_sev("WARN"), i,
+                    doc_msg("WARN", "Long base64-like literal (%d chars) — encoded payloads hide from review. Decode it before trusting this file." % len(token)), token[:60] + "...")
+        for rule_id, rx, check, sev, msg in CRED_RULES:
+            if rule_id in active and rx.search(line):
+                add(check, doc_sev(sev), i, doc_msg(sev, msg), line)
+                # Fenced commands are still executable instructions to an
+                # agent, so they count toward the EXFIL01 cross-signal.
+                file_has_cred = True
+        for rule_id, rx, sev_msg in NET_RULES:
+            if rule_id in active and rx.search(line):
+                file_has_net = True
+                if not is_skill_md:
+                    sev = "INFO" if (net_declared or in_doc_fence) else "WARN"
+                    extra = ("declared via 'compatibility'" if net_declared else
+                             ("inside a documentation code example" if in_doc_fence else
+                              "not declared in frontmatter 'compatibility'"))
+                    add("NET01", sev, i,
+                        "Script makes network calls (%s), %s." % (sev_msg, extra), line)
+        for rule_id, rx, check, sev, msg in PIN_RULES:
+            if rule_id in active and rx.search(line):
+                add(check, doc_sev(sev), i, doc_msg(sev, msg), line)
+    if file_has_net and file_has_cred:
+        add("EXFIL01", "CRITICAL", 0,
+            "Same file both touches credentials/environment and makes network calls — the standard exfiltration shape. Review it line by line.", "")
+    return findings
+
+
+def scan_skill(skill_dir, include_fixtures=False, cache=None):
+    """Findings for one skill. `cache` is this skill's entry from a --cache file
+    (a dict, possibly empty): files whose mtime and size, or failing that content
+    hash, match it are not rescanned, and the entry is rewritten in place."""
     skill_dir = Path(skill_dir).resolve()
     skill_name = skill_dir.name
     findings = []
@@ -267,64 +450,41 @@ def scan_skill(skill_dir, include_fixtures=False):
                 "Prose instructs running a command/script to 'initialize/activate/enable' — install-time execution lure pattern.", line)
 
     # --- Per-file pattern scans (Checks 1, 3, 4, 5, 7) ----------------------
+    files = {}
+    if cache is not None and cache.get("net_declared") != net_declared:
+        cache.clear()
+    cached_files = cache.get("files", {}) if cache is not None else {}
     for path in iter_scan_files(skill_dir, include_fixtures=include_fixtures):
+        rel = str(path.relative_to(skill_dir))
+        entry = cached_files.get(rel)
+        if entry is not None:
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            if entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+                files[rel] = entry
+                findings.extend(Finding.from_dict(d) for d in entry["findings"])
+                continue
         content = read_text(path)
         if content is None:
             continue
-        is_skill_md = path == skill_md
-        is_markdown = path.suffix.lower() in (".md", ".markdown")
-        file_has_net = False
-        file_has_cred = False
-        in_doc_fence = False
-        for i, line in enumerate(content.splitlines(), 1):
-            if is_markdown and line.lstrip().startswith("```"):
-                in_doc_fence = not in_doc_fence
-                continue
-            if SUPPRESS_MARKER in line:
+        digest = hashlib.sha256(content.encode("utf-8", "surrogatepass")).hexdigest()
+        if entry is not None and entry["sha256"] == digest:
+            file_findings = [Finding.from_dict(d) for d in entry["findings"]]
+        else:
+            file_findings = scan_file(skill_name, path, rel, content, path == skill_md, net_declared)
+        findings.extend(file_findings)
+        if cache is not None:
+            try:
+                st = path.stat()
+            except OSError:
                 continue
-
-            # WARN-tier findings inside a markdown code example are usually
-            # illustrative snippets, not instructions — downgrade to INFO so
-            # documentation-heavy skills stay reviewable. CRITICAL patterns are
-            # NEVER downgraded here: ClawHavoc install lures lived precisely in
-            # fenced "Prerequisites" blocks.
-            def doc_sev(sev):
-                return "INFO" if (in_doc_fence and sev == "WARN") else sev
-
-            def doc_msg(sev, msg):
-                if in_doc_fence and sev == "WARN":
-                    return msg + " (inside a documentation code example — verify it is illustrative, not an instruction to the agent)"
-                return msg
-
-            for rx, check, sev, msg in PIPE_SHELL_PATTERNS + OBFUSCATION_EXEC_PATTERNS:
-                if rx.search(line):
-                    add(check, doc_sev(sev), path, i, doc_msg(sev, msg), line)
-            for token in LONG_B64_RE.findall(line):
-                if not HEX_ONLY_RE.match(token):
-                    add("OBF01", doc_sev("WARN"), path, i,
-                        doc_msg("WARN", "Long base64-like literal (%d chars) — encoded payloads hide from review. Decode it before trusting this file." % len(token)), token[:60] + "...")
-            for rx, check, sev, msg in CRED_PATTERNS:
-                if rx.search(line):
-                    add(check, doc_sev(sev), path, i, doc_msg(sev, msg), line)
-                    # Fenced commands are still executable instructions to an
-                    # agent, so they count toward the EXFIL01 cross-signal.
-                    file_has_cred = True
-            for rx, sev_msg in NET_PATTERNS:
-                if rx.search(line):
-                    file_has_net = True
-                    if not is_skill_md:
-                        sev = "INFO" if (net_declared or in_doc_fence) else "WARN"
-                        extra = ("declared via 'compatibility'" if net_declared else
-                                 ("inside a documentation code example" if in_doc_fence else
-                                  "not declared in frontmatter 'compatibility'"))
-                        add("NET01", sev, path, i,
-                            "Script makes network calls (%s), %s." % (sev_msg, extra), line)
-            for rx, check, sev, msg in PIN_PATTERNS:
-                if rx.search(line):
-                    add(check, doc_sev(sev), path, i, doc_msg(sev, msg), line)
-        if file_has_net and file_has_cred:
-            add("EXFIL01", "CRITICAL", path, 0,
-                "Same file both touches credentials/environment and makes network calls — the standard exfiltration shape. Review it line by line.", "")
+            files[rel] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": digest,
+                          "findings": [f.as_dict() for f in file_findings]}
+    if cache is not None:
+        cache.clear()
+        cache.update({"net_declared": net_declared, "files": files})
 
     # Eval/test data is expected to quote attack-shaped text (trigger prompts,
     # rubric examples). It is not runtime content, so keep it visible but
@@ -345,6 +505,30 @@ def scan_skill(skill_dir, include_fixtures=False):
     return unique
 
 
+def _scan_job(skill_dir, cache, include_fixtures=False):
+    findings = scan_skill(skill_dir, include_fixtures=include_fixtures, cache=cache)
+    return findings, cache
+
+
+def load_cache(path):
+    """Read a --cache file, starting afresh if it is missing, unreadable or from other rules."""
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            cache = json.load(fh)
+    except (OSError, ValueError):
+        cache = None
+    if not isinstance(cache, dict) or cache.get("rules") != RULES_FINGERPRINT:
+        cache = {"rules": RULES_FINGERPRINT, "skills": {}}
+    return cache
+
+
+def save_cache(path, cache):
+    tmp = "%s.%d.tmp" % (path, os.getpid())
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(cache, fh, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
 def main(argv=None):
     ap = argparse.ArgumentParser(
         description="Static security scanner for agent skills (OWASP AST01-AST10 aligned).")
@@ -355,6 +539,11 @@ def main(argv=None):
                     help="Also scan evals/fixtures/ inside each skill (skipped by "
                          "default because fixtures may be deliberately malicious "
                          "test payloads).")
+    ap.add_argument("--jobs", type=int, default=0,
+                    help="Worker processes scanning skills in parallel (default: one per CPU; 1 scans in-process).")
+    ap.add_argument("--cache", metavar="FILE",
+                    help="Per-file result cache. Files whose mtime/size or content hash are unchanged "
+                         "since the last run with the same scanner rules are not rescanned.")
     args = ap.parse_args(argv)
 
     root = Path(args.path).expanduser()
@@ -371,9 +560,23 @@ def main(argv=None):
               file=sys.stderr)
         return 2
 
+    skills = sorted(skills)
+    cache = load_cache(args.cache) if args.cache else None
+    entries = [cache["skills"].get(str(sd), {}) if cache else None for sd in skills]
+    jobs = min(args.jobs or os.cpu_count() or 1, len(skills))
+    job = partial(_scan_job, include_fixtures=args.include_fixtures)
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(job, skills, entries, chunksize=max(1, len(skills) // (jobs * 8))))
+    else:
+        results = [job(sd, entry) for sd, entry in zip(skills, entries)]
+
     all_findings = []
-    for sd in sorted(skills):
-        all_findings.extend(scan_skill(sd, include_fixtures=args.include_fixtures))
+    for findings, _ in results:
+        all_findings.extend(findings)
+    if cache is not None:
+        cache["skills"] = {str(sd): entry for sd, (_, entry) in zip(skills, results)}
+        save_cache(args.cache, cache)
 
     counts = {"CRITICAL": 0, "WARN": 0, "INFO": 0}
     for f in all_findings:
@@ -14,6 +14,7 @@ Usage:
     python3 graveyard.py --json report.json           # full data for tooling
     python3 graveyard.py --days 90                    # custom "dead" threshold
     python3 graveyard.py --include-foreign             # include repos you didn't author
+    python3 graveyard.py --cache ~/.graveyard-cache.json  # re-read only repos whose HEAD, tags or remote changed
 
 Python 3.8+, stdlib only. Read-only: never writes inside scanned repos.
 """
@@ -24,6 +25,8 @@ import os
 import statistics
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -126,49 +129,89 @@ def find_unversioned(roots, repo_paths):
     return sorted(set(found))
 
 
+# A header line per commit in the history stream; NUL never appears in paths.
+LOG_FORMAT = "--format=%x00%P%x1f%at%x1f%ae%x1f%s"
+LOG_TIMEOUT = 30
+
+
+def read_history(path):
+    """One `git log --name-only` walk, parsed as it streams.
+
+    Returns (commits, touches, config_touches, last_touched) or None when git
+    fails. Merges are dropped from commits and touches, as before, but still
+    count toward "the last 3 commits" (they list no files of their own).
+    """
+    try:
+        proc = subprocess.Popen(["git", "log", "--name-only", LOG_FORMAT], cwd=path,
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                text=True, encoding="utf-8", errors="replace")
+    except OSError:
+        return None
+    timer = threading.Timer(LOG_TIMEOUT, proc.kill)
+    timer.start()
+    commits, last_files = [], []
+    touches = config_touches = seen = 0
+    merge = False
+    try:
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            if line.startswith("\0"):
+                seen += 1
+                parts = line[1:].split("\x1f", 3)
+                merge = len(parts[0].split()) > 1
+                if not merge and len(parts) == 4:
+                    try:
+                        commits.append({"at": int(parts[1]), "email": parts[2], "msg": parts[3]})
+                    except ValueError:
+                        pass
+            elif line.strip():
+                if seen <= 3:
+                    last_files.append(line)
+                if not merge:
+                    touches += 1
+                    config_touches += Path(line).name in CONFIG_FILES
+    finally:
+        proc.stdout.close()
+        proc.wait()
+        timer.cancel()
+    if proc.returncode != 0:
+        return None
+    return commits, touches, config_touches, "\n".join(last_files).lower()
+
+
+def origin_url(path):
+    return sh(["git", "remote", "get-url", "origin"], cwd=path)
+
+
+def first_tag(path):
+    return sh(["git", "for-each-ref", "--count=1", "--format=%(refname)", "refs/tags"], cwd=path)
+
+
 def read_repo(path, my_emails):
     """Pull the facts out of one repo. Fast git commands only, read-only."""
-    log = sh(["git", "log", "--format=%at|%ae|%s", "--no-merges"], cwd=path)
-    if not log:
+    history = read_history(path)
+    if not history:
         return None
-    commits = []
-    for line in log.splitlines():
-        parts = line.split("|", 2)
-        if len(parts) == 3:
-            try:
-                commits.append({"at": int(parts[0]), "email": parts[1], "msg": parts[2]})
-            except ValueError:
-                continue
+    commits, total_touches, config_touches, last_touched = history
     if not commits:
         return None
     commits.sort(key=lambda c: c["at"])
 
     mine = (sum(1 for c in commits if c["email"].lower() in my_emails)
             if my_emails else len(commits))
-    remote = sh(["git", "remote", "get-url", "origin"], cwd=path)
+    remote = origin_url(path)
 
     files = sh(["git", "ls-files"], cwd=path).splitlines()
     file_names = {Path(f).name for f in files}
     top_dirs = {f.split("/")[0] for f in files if "/" in f}
 
-    # files touched by the last 3 commits — where it died
-    last_touched = sh(["git", "log", "-3", "--name-only", "--format="], cwd=path).lower()
-
     has_deploy = any(
         m in files or any(f.startswith(m) for f in files) for m in DEPLOY_MARKERS
     )
     has_tests = any("test" in f.lower() or "spec" in f.lower() for f in files)
-    has_tags = bool(sh(["git", "tag", "--list"], cwd=path))
+    has_tags = bool(first_tag(path))
     has_readme = any(n.lower().startswith("readme") for n in file_names)
 
-    # how much of the history is config-shuffling vs actual code
-    # (--format= keeps the output to file paths only, one per touch)
-    touches = [l for l in
-               sh(["git", "log", "--name-only", "--format=", "--no-merges"], cwd=path).splitlines()
-               if l.strip()]
-    config_touches = sum(1 for l in touches if Path(l).name in CONFIG_FILES)
-    total_touches = len(touches)
-
     return {
         "path": str(path),
         "name": path.name,
@@ -185,11 +228,43 @@ def read_repo(path, my_emails):
         "has_tags": has_tags,
         "has_tests": has_tests,
         "has_readme": has_readme,
+        # how much of the history is config-shuffling vs actual code
         "config_ratio": (config_touches / total_touches) if total_touches else 0.0,
         "gaps": [b["at"] - a["at"] for a, b in zip(commits, commits[1:])],
     }
 
 
+def read_repos(paths, my_emails, jobs, cache=None):
+    """read_repo over many repos on a thread pool (the work is all git
+    subprocesses), in `paths` order. With a cache dict, a repo whose HEAD sha,
+    first tag ref, origin URL and identity emails match its entry is not read
+    again (tagging a release or adding a remote moves no HEAD but changes the
+    report); entries are refreshed in place and dropped for repos that no
+    longer read."""
+    emails = sorted(my_emails)
+
+    def one(path):
+        key = str(path)
+        state = None
+        if cache is not None:
+            state = [sh(["git", "rev-parse", "--verify", "-q", "HEAD"], cwd=path),
+                     first_tag(path), origin_url(path)]
+        entry = cache.get(key) if cache is not None else None
+        if entry and state[0] and entry.get("state") == state and entry.get("emails") == emails:
+            return entry["repo"], True
+        r = read_repo(path, my_emails)
+        if cache is not None:
+            if r is not None and state[0]:
+                cache[key] = {"state": state, "emails": emails, "repo": dict(r)}
+            else:
+                cache.pop(key, None)
+        return r, False
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        results = list(pool.map(one, paths))
+    return [r for r, _ in results], sum(hit for _, hit in results)
+
+
 def lifespan_days(r):
     return max(1, (r["last"] - r["first"]) // 86400)
 
@@ -329,6 +404,11 @@ def main(argv=None):
     ap.add_argument("--mark-resurrected", metavar="PATH",
                     help="record that PATH was resurrected today (requires --state); "
                          "future scans call it out if it starts dying again.")
+    ap.add_argument("--jobs", type=int, default=8,
+                    help="repos read in parallel (default 8; 1 reads them one at a time)")
+    ap.add_argument("--cache", metavar="FILE",
+                    help="keep what was read from each repo in FILE, keyed by its HEAD commit, tags and origin; "
+                         "later scans re-read only repos whose HEAD, tags or remote changed.")
     args = ap.parse_args(argv)
 
     state = {"resurrections": [], "last_scan": None}
@@ -377,9 +457,30 @@ def main(argv=None):
     if len(paths) > 15:
         print("reading %d repos (a few seconds each on big histories)..." % len(paths),
               file=sys.stderr)
+    cache = None
+    if args.cache:
+        cache = {}
+        if os.path.exists(args.cache):
+            try:
+                with open(args.cache) as f:
+                    cache = json.load(f)
+            except (OSError, ValueError):
+                print("warning: could not read cache file %s; reading every repo" % args.cache,
+                      file=sys.stderr)
+            if not isinstance(cache, dict):
+                print("warning: cache file %s is not a JSON object; reading every repo" % args.cache,
+                      file=sys.stderr)
+                cache = {}
+    results, cached = read_repos(paths, my_emails, args.jobs, cache)
+    if cache is not None:
+        with open(args.cache, "w") as f:
+            json.dump(cache, f)
+        if cached:
+            print("(%d of %d repos unchanged since the last scan; taken from %s)"
+                  % (cached, len(paths), args.cache), file=sys.stderr)
+
     repos, skipped = [], []
-    for p in paths:
-        r = read_repo(p, my_emails)
+    for r in results:
         if r is None:
             continue
         if not args.include_foreign and my_emails and r["mine"] / r["commits"] < 0.2:
@@ -15,10 +15,10 @@ from fastapi import FastAPI, Request
 
 try:
     from .delivery import send_brief
-    from .scout import run_ambient_scout
+    from .scout import record_delivery, run_ambient_scout
 except ImportError:
     from delivery import send_brief
-    from scout import run_ambient_scout
+    from scout import record_delivery, run_ambient_scout
 
 app = FastAPI(
     title="AgentScout Scheduler API",
@@ -55,6 +55,9 @@ def run_scheduled_scout(payload: dict[str, Any] | None = None) -> dict[str, Any]
         dry_run: defaults to true. Set false to call configured delivery.
         live: optional override for live Hacker News mode.
         top_n: number of stories, clamped to 1-10.
+
+    When AGENTSCOUT_STATE_PATH is set, the brief only carries new or changed
+    stories, an empty delta is not delivered, and sent stories are recorded.
     """
 
     payload = payload if isinstance(payload, dict) else {}
@@ -69,8 +72,17 @@ def run_scheduled_scout(payload: dict[str, Any] | None = None) -> dict[str, Any]
         "status": "dry_run",
         "detail": "Set dry_run=false to use configured Gmail or webhook delivery.",
     }
-    if dry_run is False:
+    if dry_run is False and "delta" in brief and not brief["stories"]:
+        delivery = {
+            "attempted": False,
+            "sent": False,
+            "status": "skipped_no_changes",
+            "detail": "No new or changed stories since the last delivered brief.",
+        }
+    elif dry_run is False:
         delivery = {"attempted": True, **send_brief(brief)}
+        if delivery.get("sent"):
+            record_delivery(brief)
 
     return {
         "dry_run": dry_run,
@@ -9,12 +9,14 @@ from __future__ import annotations
 
 import datetime as dt
 import html
+import json
 import os
 import re
 import urllib.error
 import urllib.request
 from dataclasses import asdict, dataclass
 from html.parser import HTMLParser
+from pathlib import Path
 from typing import Any
 from zoneinfo import ZoneInfo
 
@@ -37,6 +39,15 @@ AGENT_KEYWORDS = {
 
 NOISE_WORDS = {"ask hn: who is hiring", "freelance", "hiring"}
 
+# Incremental runs: how much observation history to keep, and how far a
+# delivered story has to move before it is briefed again.
+STATE_HISTORY_LIMIT = 96
+STATE_RETENTION = dt.timedelta(days=7)
+RESURFACE_POINTS = 100
+RESURFACE_COMMENTS = 50
+NO_STORIES_MESSAGE = "No high-signal agent-building stories found."
+NO_CHANGES_MESSAGE = "No new or changed agent-building stories since the last delivered brief."
+
 
 @dataclass(frozen=True)
 class Story:
@@ -137,6 +148,127 @@ class HNFrontPageParser(HTMLParser):
             self._subtext_link_text += data
 
 
+class ScoutState:
+    """Seen stories, their point and comment trajectories, and delivered briefs.
+
+    Persisted as JSON so a scout scheduled every few minutes only summarizes
+    stories it has not seen and only briefs stories that are new or have moved
+    noticeably since they were last delivered.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path).expanduser() if path else None
+        self.stories: dict[str, dict[str, Any]] = {}
+        self.delivered: dict[str, dict[str, Any]] = {}
+        if self.path is None or not self.path.is_file():
+            return
+        try:
+            document = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(document, dict):
+            if isinstance(document.get("stories"), dict):
+                self.stories = document["stories"]
+            if isinstance(document.get("delivered"), dict):
+                self.delivered = document["delivered"]
+
+    @classmethod
+    def from_env(cls) -> ScoutState | None:
+        path = os.environ.get("AGENTSCOUT_STATE_PATH")
+        return cls(path) if path else None
+
+    def known_summaries(self) -> dict[tuple[str, str], str]:
+        return {
+            (story_id, str(entry.get("title"))): str(entry["summary"])
+            for story_id, entry in self.stories.items()
+            if entry.get("summary")
+        }
+
+    def observe(self, stories: list[Story], now: dt.datetime) -> None:
+        """Record the current points, comments, and rank of every front-page story."""
+
+        stamp = now.isoformat(timespec="seconds")
+        for story in stories:
+            entry = self.stories.setdefault(
+                _story_id(story), {"first_seen": stamp, "history": []}
+            )
+            entry.update(title=story.title, summary=story.summary, last_seen=stamp)
+            history = entry["history"]
+            signal = [story.points, story.comments, story.rank]
+            if not history or history[-1][1:] != signal:
+                history.append([stamp, *signal])
+                del history[:-STATE_HISTORY_LIMIT]
+
+        cutoff = (now - STATE_RETENTION).isoformat(timespec="seconds")
+        self.stories = {
+            story_id: entry
+            for story_id, entry in self.stories.items()
+            if str(entry.get("last_seen", "")) >= cutoff
+        }
+        self.delivered = {
+            story_id: entry
+            for story_id, entry in self.delivered.items()
+            if str(entry.get("delivered_at", "")) >= cutoff
+        }
+
+    def changes(self, stories: list[Story]) -> tuple[list[Story], dict[str, str]]:
+        """Keep stories that are new or have moved since delivery, with trend notes."""
+
+        changed: list[Story] = []
+        trends: dict[str, str] = {}
+        for story in stories:
+            story_id = _story_id(story)
+            sent = self.delivered.get(story_id)
+            if sent is None:
+                changed.append(story)
+                history = self.stories.get(story_id, {}).get("history") or []
+                if len(history) > 1:
+                    first_stamp, first_points, first_comments, _ = history[0]
+                    trends[story_id] = (
+                        f"+{story.points - first_points} points, "
+                        f"+{story.comments - first_comments} comments since first seen "
+                        f"{first_stamp}"
+                    )
+                continue
+            gained_points = story.points - int(sent.get("points", 0))
+            gained_comments = story.comments - int(sent.get("comments", 0))
+            if gained_points >= RESURFACE_POINTS or gained_comments >= RESURFACE_COMMENTS:
+                changed.append(story)
+                trends[story_id] = (
+                    f"+{gained_points} points, +{gained_comments} comments since it was "
+                    f"briefed {sent.get('delivered_at')}"
+                )
+        return changed, trends
+
+    def mark_delivered(self, stories: list[dict[str, Any]], now: dt.datetime) -> None:
+        stamp = now.isoformat(timespec="seconds")
+        for story in stories:
+            self.delivered[_story_id_from_url(str(story.get("hn_url", "")))] = {
+                "points": int(story.get("points", 0)),
+                "comments": int(story.get("comments", 0)),
+                "delivered_at": stamp,
+            }
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self.path.with_name(self.path.name + ".tmp")
+        partial.write_text(
+            json.dumps({"stories": self.stories, "delivered": self.delivered}),
+            encoding="utf-8",
+        )
+        partial.replace(self.path)
+
+
+def _story_id_from_url(hn_url: str) -> str:
+    return hn_url.rsplit("id=", 1)[-1]
+
+
+def _story_id(story: Story) -> str:
+    return _story_id_from_url(story.hn_url)
+
+
 def _absolute_hn_url(url: str) -> str:
     if url.startswith("item?id="):
         return f"https://news.ycombinator.com/{url}"
@@ -228,8 +360,16 @@ def sample_stories() -> list[Story]:
     ]
 
 
-def fetch_hn_front_page(timeout_seconds: int = 15) -> list[Story]:
-    """Fetch and parse current Hacker News front-page stories."""
+def fetch_hn_front_page(
+    timeout_seconds: int = 15,
+    *,
+    known_summaries: dict[tuple[str, str], str] | None = None,
+) -> list[Story]:
+    """Fetch and parse current Hacker News front-page stories.
+
+    known_summaries maps (story id, title) to a summary from an earlier run,
+    so unchanged stories are not summarized again.
+    """
 
     request = urllib.request.Request(
         "https://news.ycombinator.com/news",
@@ -254,6 +394,7 @@ def fetch_hn_front_page(timeout_seconds: int = 15) -> list[Story]:
             rank=int(raw_story["rank"]),
             summary="",
         )
+        summary = (known_summaries or {}).get((_story_id(story), story.title))
         stories.append(
             Story(
                 title=story.title,
@@ -262,30 +403,37 @@ def fetch_hn_front_page(timeout_seconds: int = 15) -> list[Story]:
                 points=story.points,
                 comments=story.comments,
                 rank=story.rank,
-                summary=_summarize_story(story),
+                summary=summary or _summarize_story(story),
             )
         )
     return stories
 
 
-def curate_stories(
-    *,
-    live: bool | None = None,
-    top_n: int = 5,
-) -> list[Story]:
-    """Select the highest-signal agent-building stories."""
+def _live_mode_enabled(live: bool | None) -> bool:
+    if live is not None:
+        return live
+    return os.environ.get("AGENTSCOUT_LIVE_HN", "").lower() in {"1", "true", "yes"}
 
-    if live is None:
-        live = os.environ.get("AGENTSCOUT_LIVE_HN", "").lower() in {"1", "true", "yes"}
 
-    stories = fetch_hn_front_page() if live else sample_stories()
+def _rank_candidates(stories: list[Story]) -> list[Story]:
     candidates = [
         story
         for story in stories
         if not _is_noise(story.title)
         and (_keyword_hits(story.title) or "agent" in story.summary.lower())
     ]
-    return sorted(candidates, key=_score_story, reverse=True)[:top_n]
+    return sorted(candidates, key=_score_story, reverse=True)
+
+
+def curate_stories(
+    *,
+    live: bool | None = None,
+    top_n: int = 5,
+) -> list[Story]:
+    """Select the highest-signal agent-building stories."""
+
+    stories = fetch_hn_front_page() if _live_mode_enabled(live) else sample_stories()
+    return _rank_candidates(stories)[:top_n]
 
 
 def render_brief(
@@ -293,8 +441,13 @@ def render_brief(
     *,
     watch_mode: str = "sample",
     now: dt.datetime | None = None,
+    trends: dict[str, str] | None = None,
+    empty_message: str = NO_STORIES_MESSAGE,
 ) -> Brief:
-    """Render a Hacker News daily brief in text and HTML."""
+    """Render a Hacker News daily brief in text and HTML.
+
+    trends maps story ids to a trajectory note shown under the signal line.
+    """
 
     now = now or dt.datetime.now(PACIFIC)
     date_label = now.strftime("%Y-%m-%d")
@@ -321,11 +474,13 @@ def render_brief(
 
     for index, story in enumerate(stories, start=1):
         signal = f"{story.points} points, {story.comments} comments, front-page rank {story.rank}"
+        trend = (trends or {}).get(_story_id(story))
         text_lines.extend(
             [
                 f"{index}. {story.title}",
                 f"   Why it matters: {story.summary}",
                 f"   Signal: {signal}",
+                *([f"   Trend: {trend}"] if trend else []),
                 f"   Link: {story.url}",
                 f"   HN: {story.hn_url}",
                 "",
@@ -337,6 +492,7 @@ def render_brief(
                 f"<strong>{html.escape(story.title)}</strong>",
                 f"<p>{html.escape(story.summary)}</p>",
                 f"<p><strong>Signal:</strong> {html.escape(signal)}<br>",
+                *([f"<strong>Trend:</strong> {html.escape(trend)}<br>"] if trend else []),
                 f'<a href="{html.escape(story.url)}">source</a> | ',
                 f'<a href="{html.escape(story.hn_url)}">HN discussion</a></p>',
                 "</li>",
@@ -344,8 +500,8 @@ def render_brief(
         )
 
     if not stories:
-        text_lines.append("No high-signal agent-building stories found.")
-        html_lines.append("<li>No high-signal agent-building stories found.</li>")
+        text_lines.append(empty_message)
+        html_lines.append(f"<li>{html.escape(empty_message)}</li>")
 
     text_lines.extend(["Next actions:", *[f"- {action}" for action in next_actions]])
     html_lines.extend(
@@ -368,21 +524,63 @@ def render_brief(
     )
 
 
-def run_ambient_scout(*, live: bool | None = None, top_n: int = 5) -> dict[str, Any]:
-    """Run the complete Hacker News briefing pipeline."""
-
-    stories = curate_stories(live=live, top_n=top_n)
-    inferred_live = live
-    if inferred_live is None:
-        inferred_live = os.environ.get("AGENTSCOUT_LIVE_HN", "").lower() in {
-            "1",
-            "true",
-            "yes",
+def run_ambient_scout(
+    *,
+    live: bool | None = None,
+    top_n: int = 5,
+    state: ScoutState | None = None,
+) -> dict[str, Any]:
+    """Run the complete Hacker News briefing pipeline.
+
+    With a state store (passed in, or AGENTSCOUT_STATE_PATH), the brief is a
+    delta: only stories that were never delivered, or that gained enough points
+    or comments since delivery, are included.
+    """
+
+    live = _live_mode_enabled(live)
+    watch_mode = "live_hn" if live else "sample"
+    state = state or ScoutState.from_env()
+    if state is None:
+        brief = render_brief(curate_stories(live=live, top_n=top_n), watch_mode=watch_mode)
+        payload = brief.to_dict()
+    else:
+        now = dt.datetime.now(PACIFIC)
+        stories = (
+            fetch_hn_front_page(known_summaries=state.known_summaries())
+            if live
+            else sample_stories()
+        )
+        state.observe(stories, now)
+        candidates = _rank_candidates(stories)
+        changed, trends = state.changes(candidates)
+        selected = changed[:top_n]
+        brief = render_brief(
+            selected,
+            watch_mode=watch_mode,
+            now=now,
+            trends=trends,
+            empty_message=NO_CHANGES_MESSAGE,
+        )
+        state.save()
+        payload = brief.to_dict()
+        selected_ids = [_story_id(story) for story in selected]
+        payload["delta"] = {
+            "new": [story_id for story_id in selected_ids if story_id not in state.delivered],
+            "resurfaced": [story_id for story_id in selected_ids if story_id in state.delivered],
+            "already_delivered": len(candidates) - len(changed),
         }
-    brief = render_brief(stories, watch_mode="live_hn" if inferred_live else "sample")
-    payload = brief.to_dict()
     payload["delivery_note"] = (
         "This demo renders the Hacker News digest and handoff text. Wire the "
         "returned text/html to your email, Slack, or ticketing sender when you deploy it."
     )
     return payload
+
+
+def record_delivery(payload: dict[str, Any], state: ScoutState | None = None) -> None:
+    """Mark a delivered brief's stories so later delta briefs skip them."""
+
+    state = state or ScoutState.from_env()
+    if state is None:
+        return
+    state.mark_delivered(payload.get("stories") or [], dt.datetime.now(PACIFIC))
+    state.save()
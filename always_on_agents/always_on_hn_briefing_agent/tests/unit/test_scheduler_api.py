@@ -1,5 +1,6 @@
 import base64
 import json
+from unittest.mock import patch
 
 from fastapi.testclient import TestClient
 
@@ -84,3 +85,19 @@ def test_explicit_gmail_delivery_reports_missing_config(monkeypatch):
 
     assert result["delivery"]["provider"] == "gmail"
     assert result["delivery"]["status"] == "skipped_missing_gmail_config"
+
+
+def test_incremental_schedule_skips_delivery_when_nothing_changed(monkeypatch, tmp_path):
+    monkeypatch.setenv("AGENTSCOUT_STATE_PATH", str(tmp_path / "scout_state.json"))
+    sent = {"configured": True, "sent": True, "status": "sent"}
+
+    with patch(
+        "always_on_hn_briefing_agent.scheduler_api.send_brief", return_value=sent
+    ) as send:
+        first = run_scheduled_scout({"dry_run": False, "top_n": 5, "live": False})
+        second = run_scheduled_scout({"dry_run": False, "top_n": 5, "live": False})
+
+    assert first["delivery"]["status"] == "sent"
+    assert second["delivery"]["status"] == "skipped_no_changes"
+    assert second["brief"]["stories"] == []
+    send.assert_called_once()
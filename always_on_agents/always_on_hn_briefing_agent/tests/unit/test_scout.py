@@ -1,11 +1,18 @@
+import dataclasses
 import datetime as dt
+import json
+from unittest.mock import patch
 
 from always_on_hn_briefing_agent.scout import (
     AGENT_KEYWORDS,
+    NO_CHANGES_MESSAGE,
     PACIFIC,
+    ScoutState,
     curate_stories,
+    record_delivery,
     render_brief,
     run_ambient_scout,
+    sample_stories,
 )
 
 
@@ -40,3 +47,41 @@ def test_run_ambient_scout_returns_delivery_handoff_payload():
     assert "text" in payload
     assert "html" in payload
     assert "delivery_note" in payload
+
+
+def test_state_store_turns_repeat_runs_into_delta_briefs(tmp_path):
+    state_path = tmp_path / "scout_state.json"
+
+    first = run_ambient_scout(live=False, top_n=5, state=ScoutState(state_path))
+    record_delivery(first, ScoutState(state_path))
+    second = run_ambient_scout(live=False, top_n=5, state=ScoutState(state_path))
+
+    assert len(first["stories"]) == 5
+    assert len(first["delta"]["new"]) == 5
+    assert second["stories"] == []
+    assert second["delta"] == {"new": [], "resurfaced": [], "already_delivered": 5}
+    assert NO_CHANGES_MESSAGE in second["text"]
+    saved = json.loads(state_path.read_text(encoding="utf-8"))
+    assert set(saved["delivered"]) == set(saved["stories"])
+
+
+def test_delivered_story_resurfaces_when_discussion_takes_off(tmp_path):
+    state_path = tmp_path / "scout_state.json"
+    stories = sample_stories()
+    busier = [
+        dataclasses.replace(story, comments=story.comments + 60) if index == 2 else story
+        for index, story in enumerate(stories)
+    ]
+    module = "always_on_hn_briefing_agent.scout.fetch_hn_front_page"
+
+    with patch(module, return_value=stories):
+        first = run_ambient_scout(live=True, top_n=5, state=ScoutState(state_path))
+    record_delivery(first, ScoutState(state_path))
+    with patch(module, return_value=busier) as fetch:
+        second = run_ambient_scout(live=True, top_n=5, state=ScoutState(state_path))
+
+    assert [story["title"] for story in second["stories"]] == [stories[2].title]
+    assert second["delta"]["resurfaced"] == ["40100003"]
+    assert "Trend: +0 points, +60 comments since it was briefed" in second["text"]
+    known = fetch.call_args.kwargs["known_summaries"]
+    assert known[("40100003", stories[2].title)] == stories[2].summary
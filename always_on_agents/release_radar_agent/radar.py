@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import http.client
 import json
 import os
 import re
-import urllib.error
-import urllib.request
+import threading
+import time
+import urllib.parse
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import asdict, dataclass
 from pathlib import Path
@@ -32,6 +34,14 @@ GITHUB_PATTERN = re.compile(
     r"(?:github\.com/|github:)([A-Za-z0-9_.-]+)/([A-Za-z0-9_.-]+)", re.IGNORECASE
 )
 
+GITHUB_API_HOST = "api.github.com"
+GRAPHQL_BATCH_SIZE = 50
+GRAPHQL_RELEASE_FIELDS = "tagName name description url publishedAt isDraft isPrerelease"
+REDIRECT_STATUSES = {301, 302, 307, 308}
+MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+CACHE_VERSION = 1
+DEFAULT_CACHE_PATH = "~/.cache/release-radar/github-releases.json"
+
 
 @dataclass(frozen=True)
 class Dependency:
@@ -250,32 +260,330 @@ def sample_release_data() -> dict[str, list[dict[str, Any]]]:
     }
 
 
-def fetch_github_releases(
-    github_repo: str, *, timeout_seconds: int = 15, per_page: int = 5
-) -> list[dict[str, Any]]:
-    """Fetch recent releases for one owner/repository pair."""
-
-    request = urllib.request.Request(
-        f"https://api.github.com/repos/{github_repo}/releases?per_page={per_page}",
-        headers={
-            "Accept": "application/vnd.github+json",
-            "User-Agent": "release-radar-agent",
-            "X-GitHub-Api-Version": "2022-11-28",
-        },
-    )
+class GitHubConnectionPool:
+    """Keep one HTTPS connection per worker thread so a scan reuses TLS sessions."""
+
+    def __init__(self, *, timeout_seconds: int = 15) -> None:
+        self.timeout_seconds = timeout_seconds
+        self._local = threading.local()
+        self._connections: list[http.client.HTTPSConnection] = []
+        self._lock = threading.Lock()
+
+    def _connection(self) -> http.client.HTTPSConnection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = http.client.HTTPSConnection(
+                GITHUB_API_HOST, timeout=self.timeout_seconds
+            )
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def _discard(self, connection: http.client.HTTPSConnection) -> None:
+        connection.close()
+        self._local.connection = None
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: dict[str, str],
+        body: bytes | None = None,
+    ) -> tuple[int, str, dict[str, str], bytes]:
+        """Send one request and return status, reason, lowercased headers, and body."""
+
+        connection = self._connection()
+        reused = connection.sock is not None
+        try:
+            response = self._send(connection, method, path, headers, body)
+        except (http.client.HTTPException, OSError):
+            self._discard(connection)
+            if not reused:
+                raise
+            # GitHub closes idle keep-alive connections; retry once on a fresh one.
+            connection = self._connection()
+            try:
+                response = self._send(connection, method, path, headers, body)
+            except (http.client.HTTPException, OSError):
+                self._discard(connection)
+                raise
+        return response
+
+    @staticmethod
+    def _send(
+        connection: http.client.HTTPSConnection,
+        method: str,
+        path: str,
+        headers: dict[str, str],
+        body: bytes | None,
+    ) -> tuple[int, str, dict[str, str], bytes]:
+        connection.request(method, path, body=body, headers=headers)
+        response = connection.getresponse()
+        payload = response.read()
+        response_headers = {name.lower(): value for name, value in response.getheaders()}
+        return response.status, response.reason, response_headers, payload
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+
+
+class ReleaseCache:
+    """ETag-validated GitHub release lists persisted as JSON between runs."""
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path).expanduser() if path else None
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._changed = False
+        self._lock = threading.Lock()
+        if self.path is None or not self.path.is_file():
+            return
+        try:
+            document = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return
+        if isinstance(document, dict) and document.get("version") == CACHE_VERSION:
+            entries = document.get("entries")
+            if isinstance(entries, dict):
+                self._entries = entries
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+        if isinstance(entry, dict) and isinstance(entry.get("releases"), list):
+            return entry
+        return None
+
+    def store(
+        self, key: str, *, etag: str | None, max_age: int, releases: list[dict[str, Any]]
+    ) -> None:
+        with self._lock:
+            self._entries[key] = {
+                "etag": etag,
+                "expires_at": time.time() + max_age,
+                "releases": releases,
+            }
+            self._changed = True
+
+    def revalidated(self, key: str, max_age: int) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._entries[key]["expires_at"] = time.time() + max_age
+                self._changed = True
+
+    def save(self) -> None:
+        """Write the cache if anything changed; a failed write only costs a warm start."""
+
+        if self.path is None or not self._changed:
+            return
+        with self._lock:
+            document = {"version": CACHE_VERSION, "entries": self._entries}
+            self._changed = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            partial = self.path.with_name(self.path.name + ".tmp")
+            partial.write_text(json.dumps(document), encoding="utf-8")
+            partial.replace(self.path)
+        except OSError:
+            pass
+
+
+def _github_headers() -> dict[str, str]:
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "User-Agent": "release-radar-agent",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
     token = os.environ.get("RELEASE_RADAR_GITHUB_TOKEN")
     if token:
-        request.add_header("Authorization", f"Bearer {token}")
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
+
+
+def _max_age(headers: dict[str, str]) -> int:
+    match = MAX_AGE_PATTERN.search(headers.get("cache-control", ""))
+    return int(match.group(1)) if match else 0
+
+
+def fetch_github_releases(
+    github_repo: str,
+    *,
+    timeout_seconds: int = 15,
+    per_page: int = 5,
+    connections: GitHubConnectionPool | None = None,
+    cache: ReleaseCache | None = None,
+) -> list[dict[str, Any]]:
+    """Fetch recent releases for one owner/repository pair.
+
+    With a cache, entries still inside GitHub's max-age are returned without a
+    request, and older ones are revalidated with If-None-Match; a 304 reuses
+    the stored releases and does not count against the REST rate limit.
+    """
+
+    key = f"{github_repo}?per_page={per_page}"
+    cached = cache.get(key) if cache else None
+    if cached and cached.get("expires_at", 0) > time.time():
+        return cached["releases"]
+    headers = _github_headers()
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+
+    pool = connections or GitHubConnectionPool(timeout_seconds=timeout_seconds)
+    path = f"/repos/{github_repo}/releases?per_page={per_page}"
     try:
-        with urllib.request.urlopen(request, timeout=timeout_seconds) as response:
-            payload = json.loads(response.read().decode("utf-8"))
-    except (urllib.error.HTTPError, urllib.error.URLError, TimeoutError) as exc:
+        # Renamed or transferred repositories answer with a redirect.
+        for _ in range(3):
+            status, reason, response_headers, body = pool.request(
+                "GET", path, headers=headers
+            )
+            location = urllib.parse.urlsplit(response_headers.get("location", ""))
+            if status not in REDIRECT_STATUSES or location.netloc != GITHUB_API_HOST:
+                break
+            path = f"{location.path}?{location.query}" if location.query else location.path
+    except (http.client.HTTPException, OSError) as exc:
         raise RuntimeError(f"Could not fetch releases for {github_repo}: {exc}") from exc
-    except json.JSONDecodeError as exc:
+    finally:
+        if connections is None:
+            pool.close()
+
+    if status == 304 and cache and cached:
+        cache.revalidated(key, _max_age(response_headers))
+        return cached["releases"]
+    if status != 200:
+        raise RuntimeError(
+            f"Could not fetch releases for {github_repo}: HTTP Error {status}: {reason}"
+        )
+    try:
+        payload = json.loads(body.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
         raise RuntimeError(f"GitHub returned invalid JSON for {github_repo}.") from exc
     if not isinstance(payload, list):
         raise RuntimeError(f"GitHub returned an unexpected response for {github_repo}.")
-    return [release for release in payload if isinstance(release, dict)]
+    releases = [release for release in payload if isinstance(release, dict)]
+    if cache:
+        cache.store(
+            key,
+            etag=response_headers.get("etag"),
+            max_age=_max_age(response_headers),
+            releases=releases,
+        )
+    return releases
+
+
+def _graphql_query(repositories: list[str], per_page: int) -> str:
+    fields = []
+    for index, repository in enumerate(repositories):
+        owner, name = repository.split("/", 1)
+        fields.append(
+            f"r{index}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) "
+            f"{{ releases(first: {per_page}, orderBy: {{field: CREATED_AT, direction: DESC}}) "
+            f"{{ nodes {{ {GRAPHQL_RELEASE_FIELDS} }} }} }}"
+        )
+    return "query { " + " ".join(fields) + " }"
+
+
+def _rest_release(node: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "tag_name": node.get("tagName"),
+        "name": node.get("name"),
+        "body": node.get("description"),
+        "html_url": node.get("url"),
+        "published_at": node.get("publishedAt"),
+        "draft": bool(node.get("isDraft")),
+        "prerelease": bool(node.get("isPrerelease")),
+    }
+
+
+def _fetch_graphql_batch(
+    repositories: list[str], *, per_page: int, connections: GitHubConnectionPool
+) -> tuple[dict[str, list[dict[str, Any]]], list[str]]:
+    body = json.dumps({"query": _graphql_query(repositories, per_page)}).encode("utf-8")
+    headers = {**_github_headers(), "Content-Type": "application/json"}
+    try:
+        status, reason, _, payload = connections.request(
+            "POST", "/graphql", headers=headers, body=body
+        )
+        if status != 200:
+            raise RuntimeError(f"HTTP Error {status}: {reason}")
+        document = json.loads(payload.decode("utf-8"))
+        if not isinstance(document, dict):
+            raise ValueError("unexpected GraphQL response")
+        if not isinstance(document.get("data"), dict):
+            # Rate limits and malformed queries fail the whole batch.
+            messages = [
+                str(error.get("message"))
+                for error in document.get("errors") or []
+                if isinstance(error, dict)
+            ]
+            raise RuntimeError("; ".join(messages) or "unexpected GraphQL response")
+    except (http.client.HTTPException, OSError, RuntimeError, ValueError) as exc:
+        return {}, [
+            f"Could not fetch releases for {repository}: {exc}" for repository in repositories
+        ]
+
+    messages_by_alias: dict[str, str] = {}
+    for error in document.get("errors") or []:
+        if isinstance(error, dict) and error.get("path"):
+            messages_by_alias.setdefault(str(error["path"][0]), str(error.get("message")))
+
+    release_data: dict[str, list[dict[str, Any]]] = {}
+    errors: list[str] = []
+    for index, repository in enumerate(repositories):
+        alias = f"r{index}"
+        result = document["data"].get(alias)
+        if not isinstance(result, dict):
+            message = messages_by_alias.get(alias, "repository not found")
+            errors.append(f"Could not fetch releases for {repository}: {message}")
+            continue
+        nodes = (result.get("releases") or {}).get("nodes") or []
+        release_data[repository] = [
+            _rest_release(node) for node in nodes if isinstance(node, dict)
+        ]
+    return release_data, errors
+
+
+def fetch_github_releases_graphql(
+    repositories: list[str],
+    *,
+    per_page: int = 5,
+    batch_size: int = GRAPHQL_BATCH_SIZE,
+    timeout_seconds: int = 30,
+    connections: GitHubConnectionPool | None = None,
+) -> tuple[dict[str, list[dict[str, Any]]], list[str]]:
+    """Fetch recent releases for many repositories, batch_size per GraphQL query.
+
+    Releases come back in the REST shape used by build_release_candidates.
+    GitHub's GraphQL API requires RELEASE_RADAR_GITHUB_TOKEN.
+    """
+
+    batches = [
+        repositories[start : start + batch_size]
+        for start in range(0, len(repositories), batch_size)
+    ]
+    release_data: dict[str, list[dict[str, Any]]] = {}
+    errors: list[str] = []
+    if not batches:
+        return release_data, errors
+    pool = connections or GitHubConnectionPool(timeout_seconds=timeout_seconds)
+    try:
+        # A few concurrent queries stay well inside GitHub's secondary rate limits.
+        with ThreadPoolExecutor(max_workers=min(4, len(batches))) as executor:
+            for batch_data, batch_errors in executor.map(
+                lambda batch: _fetch_graphql_batch(
+                    batch, per_page=per_page, connections=pool
+                ),
+                batches,
+            ):
+                release_data.update(batch_data)
+                errors.extend(batch_errors)
+    finally:
+        if connections is None:
+            pool.close()
+    return release_data, sorted(errors)
 
 
 def build_release_candidates(
@@ -331,20 +639,56 @@ def _live_release_data(
     if not repositories:
         return release_data, errors
 
-    with ThreadPoolExecutor(max_workers=min(8, len(repositories))) as executor:
-        requests = {
-            executor.submit(fetch_github_releases, repository): repository
-            for repository in repositories
-        }
-        for request in as_completed(requests):
-            repository = requests[request]
-            try:
-                release_data[repository] = request.result()
-            except RuntimeError as exc:
-                errors.append(str(exc))
+    connections = GitHubConnectionPool()
+    try:
+        if _graphql_mode_enabled():
+            if os.environ.get("RELEASE_RADAR_GITHUB_TOKEN"):
+                return fetch_github_releases_graphql(
+                    repositories, connections=connections
+                )
+            errors.append(
+                "RELEASE_RADAR_GITHUB_GRAPHQL needs RELEASE_RADAR_GITHUB_TOKEN; "
+                "used REST requests instead."
+            )
+
+        cache = _release_cache()
+        with ThreadPoolExecutor(max_workers=min(8, len(repositories))) as executor:
+            requests = {
+                executor.submit(
+                    fetch_github_releases,
+                    repository,
+                    connections=connections,
+                    cache=cache,
+                ): repository
+                for repository in repositories
+            }
+            for request in as_completed(requests):
+                repository = requests[request]
+                try:
+                    release_data[repository] = request.result()
+                except RuntimeError as exc:
+                    errors.append(str(exc))
+        cache.save()
+    finally:
+        connections.close()
     return release_data, sorted(errors)
 
 
+def _release_cache() -> ReleaseCache:
+    configured = os.environ.get("RELEASE_RADAR_CACHE_PATH", DEFAULT_CACHE_PATH)
+    if configured.strip().lower() in {"", "0", "false", "no", "off"}:
+        return ReleaseCache()
+    return ReleaseCache(configured)
+
+
+def _graphql_mode_enabled() -> bool:
+    return os.environ.get("RELEASE_RADAR_GITHUB_GRAPHQL", "").lower() in {
+        "1",
+        "true",
+        "yes",
+    }
+
+
 def _live_mode_enabled() -> bool:
     return os.environ.get("RELEASE_RADAR_LIVE_GITHUB", "").lower() in {
         "1",
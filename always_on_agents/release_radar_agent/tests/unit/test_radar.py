@@ -1,7 +1,14 @@
 import json
+import os
+import re
+from unittest.mock import patch
 
 from always_on_agents.release_radar_agent.radar import (
+    GitHubConnectionPool,
+    ReleaseCache,
     build_release_candidates,
+    fetch_github_releases,
+    fetch_github_releases_graphql,
     parse_manifest,
     run_release_radar,
     sample_dependencies,
@@ -90,3 +97,142 @@ def test_sample_run_renders_text_and_html_without_patch_noise():
         for reason in release["reasons"]
     }
     assert {"breaking change", "deprecation", "security fix", "major version"} <= reasons
+
+
+class FakeResponse:
+    def __init__(self, status, headers=None, body=b""):
+        self.status = status
+        self.reason = {200: "OK", 304: "Not Modified", 404: "Not Found"}[status]
+        self._headers = headers or {}
+        self._body = body
+
+    def getheaders(self):
+        return list(self._headers.items())
+
+    def read(self):
+        return self._body
+
+
+class FakeGitHub:
+    """Stands in for http.client.HTTPSConnection and records every request."""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.requests = []
+        self.connections = 0
+
+    def __call__(self, host, timeout=None):
+        self.connections += 1
+        github = self
+
+        class Connection:
+            sock = None
+
+            def request(self, method, path, body=None, headers=None):
+                github.requests.append((method, path, body, dict(headers or {})))
+                self.response = github.respond(method, path, body, headers or {})
+                self.sock = object()
+
+            def getresponse(self):
+                return self.response
+
+            def close(self):
+                self.sock = None
+
+        return Connection()
+
+
+def test_rest_cache_persists_etags_and_reuses_one_connection(tmp_path):
+    releases = sample_release_data()["psf/requests"]
+
+    def respond(method, path, body, headers):
+        if headers.get("If-None-Match") == '"v1"':
+            return FakeResponse(304, {"Cache-Control": "private, max-age=60"})
+        return FakeResponse(
+            200,
+            {"ETag": '"v1"', "Cache-Control": "private, max-age=0"},
+            json.dumps(releases).encode("utf-8"),
+        )
+
+    github = FakeGitHub(respond)
+    cache_path = tmp_path / "github-releases.json"
+    with patch("http.client.HTTPSConnection", github):
+        connections = GitHubConnectionPool()
+        cache = ReleaseCache(cache_path)
+        first = fetch_github_releases("psf/requests", connections=connections, cache=cache)
+        cache.save()
+
+        restarted = ReleaseCache(cache_path)
+        second = fetch_github_releases("psf/requests", connections=connections, cache=restarted)
+        # The 304 refreshed max-age, so a third call needs no request at all.
+        third = fetch_github_releases("psf/requests", connections=connections, cache=restarted)
+        connections.close()
+
+    assert first == second == third == releases
+    assert len(github.requests) == 2
+    assert github.requests[1][3]["If-None-Match"] == '"v1"'
+    assert github.connections == 1
+
+
+def graphql_responder(release_data, missing=()):
+    def respond(method, path, body, headers):
+        query = json.loads(body)["query"]
+        data, errors = {}, []
+        for alias, owner, name in re.findall(
+            r'(r\d+): repository\(owner: "([^"]+)", name: "([^"]+)"\)', query
+        ):
+            repository = f"{owner}/{name}"
+            if repository in missing:
+                data[alias] = None
+                errors.append({"path": [alias], "message": f"Could not resolve {repository}."})
+                continue
+            nodes = [
+                {
+                    "tagName": release["tag_name"],
+                    "name": release["name"],
+                    "description": release["body"],
+                    "url": release["html_url"],
+                    "publishedAt": release["published_at"],
+                    "isDraft": release["draft"],
+                    "isPrerelease": release["prerelease"],
+                }
+                for release in release_data.get(repository, [])
+            ]
+            data[alias] = {"releases": {"nodes": nodes}}
+        return FakeResponse(
+            200, {}, json.dumps({"data": data, "errors": errors}).encode("utf-8")
+        )
+
+    return respond
+
+
+def test_graphql_batches_many_repositories_into_few_queries():
+    repositories = [f"acme/lib-{index:03d}" for index in range(120)]
+    release_data = {repository: [] for repository in repositories}
+    release_data["acme/lib-007"] = sample_release_data()["psf/requests"]
+    github = FakeGitHub(graphql_responder(release_data, missing={"acme/lib-042"}))
+
+    with patch("http.client.HTTPSConnection", github):
+        fetched, errors = fetch_github_releases_graphql(repositories, batch_size=50)
+
+    assert [request[:2] for request in github.requests] == [("POST", "/graphql")] * 3
+    assert fetched["acme/lib-007"] == sample_release_data()["psf/requests"]
+    assert len(fetched) == 119
+    assert errors == ["Could not fetch releases for acme/lib-042: Could not resolve acme/lib-042."]
+
+
+def test_live_graphql_run_matches_the_rest_shaped_sample_brief():
+    github = FakeGitHub(graphql_responder(sample_release_data()))
+    environment = {
+        "RELEASE_RADAR_GITHUB_TOKEN": "test-token",
+        "RELEASE_RADAR_GITHUB_GRAPHQL": "true",
+    }
+
+    with patch.dict(os.environ, environment), patch("http.client.HTTPSConnection", github):
+        live = run_release_radar(live=True, top_n=10)
+    sample = run_release_radar(live=False, top_n=10)
+
+    assert len(github.requests) == 1
+    assert github.requests[0][3]["Authorization"] == "Bearer test-token"
+    assert live["errors"] == sample["errors"] == []
+    assert live["releases"] == sample["releases"]
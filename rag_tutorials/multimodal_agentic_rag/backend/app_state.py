@@ -1,4 +1,6 @@
+import os
+
 from rag_store import MultimodalRagStore
 
 
-RAG_STORE = MultimodalRagStore()
+RAG_STORE = MultimodalRagStore(data_dir=os.getenv("RAG_DATA_DIR", os.path.join(os.path.dirname(__file__), ".rag_data")))
@@ -0,0 +1,236 @@
+"""Offline benchmark for MultimodalRagStore search, PCA projection and on-disk persistence.
+
+Synthetic clustered embeddings and a counting stand-in for the Gemini client replace the API, so no key is needed:
+
+    python benchmark_store.py --chunks 100000
+"""
+
+import argparse
+import hashlib
+import math
+import os
+import tempfile
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from rag_store import MultimodalRagStore, RackChunk, RackSource
+
+
+def legacy_cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(y * y for y in b))
+    if not norm_a or not norm_b:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+def legacy_search(chunks: list[tuple[str, list[float]]], query: list[float], top_k: int) -> list[tuple[str, float]]:
+    """The previous pure-Python scan: cosine against every chunk, best chunk per source."""
+    best: dict[str, float] = {}
+    for source_id, vector in chunks:
+        score = round(legacy_cosine(query, vector), 4)
+        if source_id not in best or score > best[source_id]:
+            best[source_id] = score
+    return sorted(best.items(), key=lambda item: item[1], reverse=True)[:top_k]
+
+
+def legacy_dot(left: list[float], right: list[float]) -> float:
+    return sum(a * b for a, b in zip(left, right))
+
+
+def legacy_normalize(vector: list[float]) -> list[float]:
+    norm = math.sqrt(sum(value * value for value in vector))
+    if norm < 1e-12:
+        return [0.0] * len(vector)
+    return [value / norm for value in vector]
+
+
+def legacy_orthogonalize(vector: list[float], components: list[list[float]]) -> list[float]:
+    adjusted = vector[:]
+    for component in components:
+        projection = legacy_dot(adjusted, component)
+        adjusted = [value - projection * component[index] for index, value in enumerate(adjusted)]
+    return adjusted
+
+
+def legacy_pca(rows: list[list[float]], dimensions: int) -> list[list[float]]:
+    """The previous projection basis: three components from 24 rounds of power iteration in Python loops."""
+    means = [sum(row[index] for row in rows) / len(rows) for index in range(dimensions)]
+    centered = [[row[index] - means[index] for index in range(dimensions)] for row in rows]
+    components: list[list[float]] = []
+    for component_index in range(3):
+        candidate = [
+            math.sin((index + 1) * (component_index + 1) * 0.017) + math.cos((index + 1) * (component_index + 2) * 0.013)
+            for index in range(dimensions)
+        ]
+        candidate = legacy_normalize(legacy_orthogonalize(candidate, components))
+        for _ in range(24):
+            scores = [legacy_dot(row, candidate) for row in centered]
+            next_candidate = [0.0] * dimensions
+            for score, row in zip(scores, centered):
+                for index, value in enumerate(row):
+                    next_candidate[index] += score * value
+            next_candidate = legacy_normalize(legacy_orthogonalize(next_candidate, components))
+            if not any(next_candidate):
+                break
+            candidate = next_candidate
+        components.append(candidate)
+    return components
+
+
+def synthetic_vectors(count: int, dimensions: int, clusters: int, rng: np.random.Generator) -> np.ndarray:
+    centers = rng.normal(size=(clusters, dimensions)).astype(np.float32)
+    vectors = centers[rng.integers(clusters, size=count)] + 0.6 * rng.normal(size=(count, dimensions)).astype(np.float32)
+    return vectors * rng.uniform(0.5, 2.0, size=(count, 1)).astype(np.float32)
+
+
+def build_store(vectors: np.ndarray, chunks_per_source: int) -> MultimodalRagStore:
+    store = MultimodalRagStore(dimensions=vectors.shape[1])
+    for start in range(0, len(vectors), chunks_per_source):
+        source_id = f"s{start // chunks_per_source}"
+        block = vectors[start : start + chunks_per_source]
+        source = RackSource(id=source_id, title=source_id, modality="text", summary="", chunks=len(block))
+        chunks = [
+            RackChunk(id=f"{source_id}-{index + 1}", source_id=source_id, title=source_id, modality="text", text="", metadata={})
+            for index in range(len(block))
+        ]
+        store._add_source(source, chunks, block)
+    return store
+
+
+def time_searches(store: MultimodalRagStore, queries: np.ndarray, top_k: int) -> tuple[float, list[dict]]:
+    pending = iter(queries)
+    store._embed_text = lambda text, task_prefix, persist=True: next(pending)
+    results = []
+    start = time.perf_counter()
+    for _ in queries:
+        results.append(store.search("benchmark query", top_k=top_k))
+    return (time.perf_counter() - start) / len(queries), results
+
+
+class CountingEmbedClient:
+    """Answers embed_content with deterministic vectors derived from each content string, counting the calls made."""
+
+    def __init__(self, dimensions: int):
+        self.dimensions = dimensions
+        self.calls = 0
+        self.models = self
+
+    def embed_content(self, model: str, contents: list[str], config: object) -> SimpleNamespace:
+        self.calls += 1
+        embeddings = []
+        for content in contents:
+            seed = int.from_bytes(hashlib.sha256(content.encode("utf-8")).digest()[:8], "little")
+            embeddings.append(SimpleNamespace(values=np.random.default_rng(seed).normal(size=self.dimensions).tolist()))
+        return SimpleNamespace(embeddings=embeddings)
+
+
+def persisted_store(data_dir: str, dimensions: int) -> tuple[MultimodalRagStore, CountingEmbedClient]:
+    store = MultimodalRagStore(dimensions=dimensions, data_dir=data_dir)
+    store.client = CountingEmbedClient(dimensions)
+    return store, store.client
+
+
+def time_persistence(documents: int, words: int, dimensions: int, searches: int) -> None:
+    rng = np.random.default_rng(11)
+    vocabulary = [f"term{index}" for index in range(5000)]
+    texts = [" ".join(rng.choice(vocabulary, size=words)) for _ in range(documents)]
+    data_dir = tempfile.mkdtemp(prefix="rag_store_bench_")
+
+    store, client = persisted_store(data_dir, dimensions)
+    start = time.perf_counter()
+    for index, text in enumerate(texts):
+        store.add_text_source(f"doc {index}", text)
+    ingest_seconds = time.perf_counter() - start
+    chunks = len(store.chunks)
+    expected_calls = sum(math.ceil(source.chunks / 100) for source in store.sources)
+    assert client.calls == expected_calls, (client.calls, expected_calls)
+    before = store.search(texts[0][:400])
+    disk_rows = store.disk.conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+    vector_bytes = os.path.getsize(store.disk.vectors_path)
+    for index in range(searches):
+        store.search(f"unique question {index}: {texts[index % documents][:200]}")
+    assert store.disk.conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0] == disk_rows, "search queries were persisted"
+    assert os.path.getsize(store.disk.vectors_path) == vector_bytes, "search queries grew the vector file"
+    client.calls = 0
+    store.search(texts[0][:400])
+    assert client.calls == 0, "a repeated query was embedded again"
+    store.disk.conn.close()
+
+    start = time.perf_counter()
+    reopened, client = persisted_store(data_dir, dimensions)
+    restart_seconds = time.perf_counter() - start
+    assert [source.id for source in reopened.sources] == [source.id for source in store.sources]
+    assert np.array_equal(reopened._vectors[: reopened._size], store._vectors[: store._size])
+    client.calls = 0
+    after = reopened.search(texts[0][:400])
+    assert [(match["id"], match["score"]) for match in after["matches"]] == [(match["id"], match["score"]) for match in before["matches"]]
+    assert client.calls == 1, "query vectors are in memory only, so a restart re-embeds the query once"
+    client.calls = 0
+    reopened.add_text_source("doc 0 again", texts[0])
+    assert client.calls == 0, "re-adding identical text called the API"
+
+    print(f"\nPersistence ({documents:,} documents, {chunks:,} chunks):")
+    print(f"  ingest: {ingest_seconds:.2f}s, {expected_calls:,} embed_content calls (one per chunk before batching: {chunks:,})")
+    print(f"  restart from disk: {restart_seconds * 1000:.0f}ms and 0 API calls (re-embedding all chunks before)")
+    print(f"  {searches} unique searches: 0 rows added to the disk store; repeated query served from the in-memory LRU")
+    print("  re-added identical text: 0 API calls; search results unchanged after restart")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the NumPy store with the previous pure-Python search and PCA")
+    parser.add_argument("--chunks", type=int, default=100_000, help="Chunks in the store")
+    parser.add_argument("--chunks_per_source", type=int, default=10, help="Chunks per source")
+    parser.add_argument("--dimensions", type=int, default=768, help="Embedding dimensions")
+    parser.add_argument("--legacy_chunks", type=int, default=2000, help="Chunks the pure-Python baseline is timed on (it scales linearly)")
+    parser.add_argument("--queries", type=int, default=20, help="Timed searches")
+    parser.add_argument("--top_k", type=int, default=6)
+    parser.add_argument("--documents", type=int, default=200, help="Documents ingested for the persistence run")
+    parser.add_argument("--words", type=int, default=3000, help="Words per persisted document")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(3)
+    vectors = synthetic_vectors(args.chunks, args.dimensions, 64, rng)
+    queries = synthetic_vectors(args.queries, args.dimensions, 64, rng)
+
+    subset = vectors[: args.legacy_chunks]
+    subset_store = build_store(subset, args.chunks_per_source)
+    _, subset_results = time_searches(subset_store, queries[:3], args.top_k)
+    legacy_chunks = [(f"s{index // args.chunks_per_source}", row) for index, row in enumerate(subset.tolist())]
+    start = time.perf_counter()
+    for query, result in zip(queries[:3], subset_results):
+        expected = legacy_search(legacy_chunks, query.tolist(), args.top_k)
+        found = [(match["id"], match["score"]) for match in result["matches"]]
+        assert [score for _, score in found] == [score for _, score in expected], (found, expected)
+    legacy_search_seconds = (time.perf_counter() - start) / 3
+    source_rows = subset_store._source_index()[1].tolist()
+    start = time.perf_counter()
+    legacy_pca(source_rows, args.dimensions)
+    legacy_pca_seconds = time.perf_counter() - start
+    scale = args.chunks / args.legacy_chunks
+
+    started = time.perf_counter()
+    store = build_store(vectors, args.chunks_per_source)
+    print(f"Loaded {args.chunks:,} chunks in {len(store.sources):,} sources in {time.perf_counter() - started:.2f}s")
+    search_seconds, _ = time_searches(store, queries, args.top_k)
+    start = time.perf_counter()
+    store.snapshot()
+    pca_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    store.snapshot()
+    cached_seconds = time.perf_counter() - start
+
+    print(f"\n{'':<26} {'pure Python':>14} {'NumPy':>10}")
+    print(f"{'search (incl. projection)':<26} {legacy_search_seconds * scale + legacy_pca_seconds * scale:>12.1f}s* {search_seconds * 1000:>8.1f}ms")
+    print(f"{'PCA projection':<26} {legacy_pca_seconds * scale:>12.1f}s* {pca_seconds * 1000:>8.1f}ms")
+    print(f"{'snapshot, unchanged store':<26} {'':>14} {cached_seconds * 1000:>8.2f}ms")
+    print(f"\n* measured on {args.legacy_chunks:,} chunks and scaled linearly to {args.chunks:,}; rankings matched on the shared subset")
+
+    time_persistence(args.documents, args.words, args.dimensions, args.queries)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+from typing import Any
+
+import numpy as np
+
+
+QUERY_BATCH = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    dimensions INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    row INTEGER NOT NULL,
+    PRIMARY KEY (model, dimensions, content_hash)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sources (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    modality TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    chunks INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chunks (
+    source_id TEXT NOT NULL REFERENCES sources(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    modality TEXT NOT NULL,
+    text TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    embedding_key TEXT NOT NULL,
+    PRIMARY KEY (source_id, position)
+);
+"""
+
+
+def content_key(*parts: bytes | str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8") if isinstance(part, str) else part)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class DiskStore:
+    """Embeddings and source records that survive restarts.
+
+    Vectors are appended to one flat float32 file per model and dimension and read back through a memmap. SQLite maps each
+    content hash to its row there and keeps the sources and chunks, so nothing is embedded twice.
+    """
+
+    def __init__(self, directory: str, model: str, dimensions: int):
+        os.makedirs(directory, exist_ok=True)
+        self.model = model
+        self.dimensions = dimensions
+        self.vectors_path = os.path.join(directory, f"{re.sub(r'[^A-Za-z0-9_.-]', '_', model)}-{dimensions}.f32")
+        self.conn = sqlite3.connect(os.path.join(directory, "rag_store.db"), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+
+        row_bytes = 4 * dimensions
+        size = os.path.getsize(self.vectors_path) if os.path.exists(self.vectors_path) else 0
+        if size % row_bytes:
+            # a write interrupted mid-row; its key was never committed, so the partial row is dropped
+            with open(self.vectors_path, "r+b") as handle:
+                handle.truncate(size - size % row_bytes)
+        self._rows = size // row_bytes
+        self._map: np.ndarray | None = None
+
+    def _matrix(self) -> np.ndarray:
+        if self._map is None or len(self._map) != self._rows:
+            if self._rows:
+                self._map = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(self._rows, self.dimensions))
+            else:
+                self._map = np.zeros((0, self.dimensions), dtype=np.float32)
+        return self._map
+
+    def vectors(self, rows: np.ndarray) -> np.ndarray:
+        return np.asarray(self._matrix()[rows], dtype=np.float32)
+
+    def get_vectors(self, keys: list[str]) -> dict[str, np.ndarray]:
+        found: dict[str, int] = {}
+        for start in range(0, len(keys), QUERY_BATCH):
+            batch = keys[start : start + QUERY_BATCH]
+            cursor = self.conn.execute(
+                f"SELECT content_hash, row FROM embeddings WHERE model = ? AND dimensions = ? AND content_hash IN ({', '.join('?' * len(batch))})",
+                (self.model, self.dimensions, *batch),
+            )
+            found.update((row["content_hash"], row["row"]) for row in cursor)
+        if not found:
+            return {}
+        matrix = self.vectors(np.array(list(found.values()), dtype=np.intp))
+        return dict(zip(found, matrix))
+
+    def put_vectors(self, vectors: dict[str, np.ndarray]) -> None:
+        if not vectors:
+            return
+        block = np.ascontiguousarray(np.vstack(list(vectors.values())), dtype=np.float32)
+        with open(self.vectors_path, "ab") as handle:
+            handle.write(block.tobytes())
+        start = self._rows
+        self._rows += len(block)
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO embeddings (model, dimensions, content_hash, row) VALUES (?, ?, ?, ?)",
+            [(self.model, self.dimensions, key, start + index) for index, key in enumerate(vectors)],
+        )
+        self.conn.commit()
+
+    def save_source(self, source: dict[str, Any], chunks: list[dict[str, Any]], embedding_keys: list[str]) -> None:
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO sources (id, title, modality, summary, chunks, created_at, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    source["id"],
+                    source["title"],
+                    source["modality"],
+                    source["summary"],
+                    source["chunks"],
+                    source["created_at"],
+                    json.dumps(source["metadata"]),
+                ),
+            )
+            self.conn.executemany(
+                "INSERT INTO chunks (source_id, position, id, title, modality, text, metadata, created_at, embedding_key) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        chunk["source_id"],
+                        position,
+                        chunk["id"],
+                        chunk["title"],
+                        chunk["modality"],
+                        chunk["text"],
+                        json.dumps(chunk["metadata"]),
+                        chunk["created_at"],
+                        key,
+                    )
+                    for position, (chunk, key) in enumerate(zip(chunks, embedding_keys))
+                ],
+            )
+
+    def delete_source(self, source_id: str) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM sources WHERE id = ?", (source_id,))
+
+    def load_sources(self) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Sources in insertion order and their chunks in source order, each chunk carrying its vector row (None if missing)."""
+        sources = [
+            {**dict(row), "metadata": json.loads(row["metadata"])}
+            for row in self.conn.execute("SELECT id, title, modality, summary, chunks, created_at, metadata FROM sources ORDER BY seq")
+        ]
+        chunks = [
+            {**dict(row), "metadata": json.loads(row["metadata"])}
+            for row in self.conn.execute(
+                """
+                SELECT c.id, c.source_id, c.title, c.modality, c.text, c.metadata, c.created_at, e.row
+                FROM chunks c
+                JOIN sources s ON s.id = c.source_id
+                LEFT JOIN embeddings e ON e.model = ? AND e.dimensions = ? AND e.content_hash = c.embedding_key
+                ORDER BY s.seq, c.position
+                """,
+                (self.model, self.dimensions),
+            )
+        ]
+        return sources, chunks
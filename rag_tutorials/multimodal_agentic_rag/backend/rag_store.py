@@ -1,17 +1,19 @@
-import math
 import os
 import re
 import tempfile
 import threading
 import time
 import uuid
+from collections import Counter, OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 from google import genai
 from google.genai import types
 
+from disk_store import DiskStore, content_key
 
 EMBED_MODEL = "gemini-embedding-2"
 DEFAULT_DIMENSIONS = 768
@@ -20,6 +22,9 @@ CHUNK_OVERLAP = 35
 INLINE_MEDIA_LIMIT_BYTES = 18 * 1024 * 1024
 FILE_API_POLL_SECONDS = 2
 FILE_API_MAX_WAIT_SECONDS = 90
+EXACT_SVD_MAX_RANK = 256
+EMBED_BATCH_SIZE = 100
+QUERY_CACHE_SIZE = 256
 
 
 MODALITY_COLORS = {
@@ -40,7 +45,6 @@ class RackChunk:
     title: str
     modality: str
     text: str
-    vector: list[float]
     metadata: dict[str, Any] = field(default_factory=dict)
     created_at: float = field(default_factory=time.time)
 
@@ -56,15 +60,6 @@ class RackSource:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-def _cosine(a: list[float], b: list[float]) -> float:
-    dot = sum(x * y for x, y in zip(a, b))
-    norm_a = math.sqrt(sum(x * x for x in a))
-    norm_b = math.sqrt(sum(y * y for y in b))
-    if not norm_a or not norm_b:
-        return 0.0
-    return dot / (norm_a * norm_b)
-
-
 def _clean_text(text: str) -> str:
     text = re.sub(r"\s+", " ", text or "").strip()
     return text
@@ -86,45 +81,51 @@ def _chunk_text(text: str) -> list[str]:
     return chunks
 
 
-def _blend_vectors(primary: list[float], secondary: list[float], secondary_weight: float = 0.32) -> list[float]:
-    primary_weight = 1.0 - secondary_weight
-    blended = [
-        (left * primary_weight) + (right * secondary_weight)
-        for left, right in zip(primary, secondary)
-    ]
-    norm = math.sqrt(sum(value * value for value in blended)) or 1.0
-    return [value / norm for value in blended]
-
+def _blend_vectors(primary: np.ndarray, secondary: np.ndarray, secondary_weight: float = 0.32) -> np.ndarray:
+    blended = primary * (1.0 - secondary_weight) + secondary * secondary_weight
+    return blended / (np.linalg.norm(blended) or 1.0)
 
-def _dot(left: list[float], right: list[float]) -> float:
-    return sum(a * b for a, b in zip(left, right))
 
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 1e-12)
 
-def _normalize(vector: list[float]) -> list[float]:
-    norm = math.sqrt(sum(value * value for value in vector))
-    if norm < 1e-12:
-        return [0.0] * len(vector)
-    return [value / norm for value in vector]
 
-
-def _orthogonalize(vector: list[float], components: list[list[float]]) -> list[float]:
-    adjusted = vector[:]
-    for component in components:
-        projection = _dot(adjusted, component)
-        adjusted = [value - projection * component[index] for index, value in enumerate(adjusted)]
-    return adjusted
+def _principal_axes(centered: np.ndarray, count: int) -> np.ndarray:
+    """Leading right singular vectors. Large source sets use a seeded randomized SVD, which costs a few thin matmuls."""
+    if min(centered.shape) <= EXACT_SVD_MAX_RANK:
+        return np.linalg.svd(centered, full_matrices=False)[2][:count]
+    rng = np.random.default_rng(0)
+    sketch = centered @ rng.standard_normal((centered.shape[1], count + 10)).astype(centered.dtype)
+    for _ in range(4):
+        sketch, _ = np.linalg.qr(sketch)
+        sketch = centered @ (centered.T @ sketch)
+    basis, _ = np.linalg.qr(sketch)
+    return np.linalg.svd(basis.T @ centered, full_matrices=False)[2][:count]
 
 
 class MultimodalRagStore:
-    def __init__(self, dimensions: int = DEFAULT_DIMENSIONS):
+    def __init__(self, dimensions: int = DEFAULT_DIMENSIONS, data_dir: str | None = None):
         self.dimensions = dimensions
         self.api_key = os.getenv("GOOGLE_API_KEY", "")
         self.client = genai.Client(api_key=self.api_key) if self.api_key else None
         self.sources: list[RackSource] = []
         self.chunks: list[RackChunk] = []
         self.events: list[dict[str, Any]] = []
+        # unit-length chunk embeddings (row i belongs to self.chunks[i]) and their original norms
+        self._vectors = np.zeros((0, dimensions), dtype=np.float32)
+        self._norms = np.zeros(0, dtype=np.float32)
+        self._size = 0
+        self._source_rows: dict[str, tuple[int, int]] = {}
+        self._source_embeddings: list[np.ndarray] = []
+        self._source_cache: tuple[list[str], np.ndarray, np.ndarray] | None = None
+        self._projection_cache: dict[str, dict[str, float]] | None = None
         self._lock = threading.RLock()
+        self._query_vectors: OrderedDict[str, np.ndarray] = OrderedDict()
         self.embedding_provider = "gemini-embedding-2"
+        self.disk = DiskStore(data_dir, EMBED_MODEL, dimensions) if data_dir else None
+        if self.disk:
+            self._load_from_disk()
 
     def _require_client(self) -> genai.Client:
         if not self.client:
@@ -135,16 +136,43 @@ class MultimodalRagStore:
         self.events.append({"type": event_type, "at": time.time(), **payload})
         self.events = self.events[-80:]
 
-    def _embed_text(self, text: str, task_prefix: str) -> list[float]:
-        content = f"{task_prefix}: {text}"
-        client = self._require_client()
-
-        result = client.models.embed_content(
-            model=EMBED_MODEL,
-            contents=[content],
-            config=types.EmbedContentConfig(output_dimensionality=self.dimensions),
-        )
-        return result.embeddings[0].values
+    def _embed_texts(self, texts: list[str], task_prefix: str, persist: bool = True) -> tuple[np.ndarray, list[str]]:
+        """Embed texts, reading content embedded before from disk and sending the rest to Gemini in batched calls.
+
+        Only source content is persisted. With persist=False (search queries) vectors live in a small in-memory LRU
+        instead, so unique questions never grow the on-disk vector file.
+        """
+        contents = [f"{task_prefix}: {text}" for text in texts]
+        keys = [content_key(content) for content in contents]
+        if persist:
+            vectors = self.disk.get_vectors(list(dict.fromkeys(keys))) if self.disk else {}
+        else:
+            vectors = {key: self._query_vectors[key] for key in keys if key in self._query_vectors}
+            for key in vectors:
+                self._query_vectors.move_to_end(key)
+        missing = list({key: content for key, content in zip(keys, contents) if key not in vectors}.items())
+        if missing:
+            client = self._require_client()
+            fresh: dict[str, np.ndarray] = {}
+            for start in range(0, len(missing), EMBED_BATCH_SIZE):
+                batch = missing[start : start + EMBED_BATCH_SIZE]
+                result = client.models.embed_content(
+                    model=EMBED_MODEL,
+                    contents=[content for _, content in batch],
+                    config=types.EmbedContentConfig(output_dimensionality=self.dimensions),
+                )
+                fresh.update((key, self._as_vector(embedding.values)) for (key, _), embedding in zip(batch, result.embeddings))
+            if not persist:
+                self._query_vectors.update(fresh)
+                while len(self._query_vectors) > QUERY_CACHE_SIZE:
+                    self._query_vectors.popitem(last=False)
+            elif self.disk:
+                self.disk.put_vectors(fresh)
+            vectors.update(fresh)
+        return np.vstack([vectors[key] for key in keys]), keys
+
+    def _embed_text(self, text: str, task_prefix: str, persist: bool = True) -> np.ndarray:
+        return self._embed_texts([text], task_prefix, persist)[0][0]
 
     def _embed_uploaded_file(self, data: bytes, mime_type: str, title: str) -> list[float]:
         client = self._require_client()
@@ -186,7 +214,19 @@ class MultimodalRagStore:
                 except Exception as exc:
                     self._emit("file_cleanup_failed", {"name": uploaded_name, "error": str(exc)})
 
-    def _embed_file(self, data: bytes, mime_type: str, title: str, notes: str) -> tuple[list[float], str]:
+    def _embed_file(self, data: bytes, mime_type: str, title: str, notes: str) -> tuple[np.ndarray, str, str]:
+        key = content_key(mime_type, data)
+        if self.disk:
+            cached = self.disk.get_vectors([key])
+            if key in cached:
+                return cached[key], "disk-cache", key
+        vector, embedding_path = self._embed_file_remote(data, mime_type, title)
+        vector = self._as_vector(vector)
+        if self.disk:
+            self.disk.put_vectors({key: vector})
+        return vector, embedding_path, key
+
+    def _embed_file_remote(self, data: bytes, mime_type: str, title: str) -> tuple[list[float], str]:
         client = self._require_client()
 
         use_file_api = (
@@ -210,78 +250,95 @@ class MultimodalRagStore:
                 return self._embed_uploaded_file(data, mime_type, title), "gemini-file-api"
             raise
 
-    def _pca_projection(self, vectors: dict[str, list[float]]) -> dict[str, dict[str, float]]:
-        if not vectors:
+    def _as_vector(self, values: Any) -> np.ndarray:
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        values = np.asarray(values, dtype=np.float32)[: self.dimensions]
+        vector[: len(values)] = values
+        return vector
+
+    def _append_rows(self, vectors: np.ndarray) -> tuple[int, int]:
+        start, stop = self._size, self._size + len(vectors)
+        if stop > len(self._vectors):
+            capacity = max(stop, 2 * len(self._vectors), 256)
+            grown = np.zeros((capacity, self.dimensions), dtype=np.float32)
+            grown[:start] = self._vectors[:start]
+            norms = np.zeros(capacity, dtype=np.float32)
+            norms[:start] = self._norms[:start]
+            self._vectors, self._norms = grown, norms
+        self._vectors[start:stop] = _normalize_rows(vectors)
+        self._norms[start:stop] = np.linalg.norm(vectors, axis=1)
+        self._size = stop
+        return start, stop
+
+    def _add_source(self, source: RackSource, chunks: list[RackChunk], vectors: np.ndarray, embedding_keys: list[str] | None = None) -> None:
+        if self.disk and embedding_keys:
+            self.disk.save_source(source.__dict__, [chunk.__dict__ for chunk in chunks], embedding_keys)
+        start, stop = self._append_rows(vectors)
+        self._source_rows[source.id] = (start, stop)
+        total = vectors.sum(axis=0)
+        self._source_embeddings.append(total / (np.linalg.norm(total) or 1.0))
+        self.sources.append(source)
+        self.chunks.extend(chunks)
+        self._source_cache = None
+        self._projection_cache = None
+
+    def _load_from_disk(self) -> None:
+        sources, chunks = self.disk.load_sources()
+        incomplete = {chunk["source_id"] for chunk in chunks if chunk["row"] is None}
+        if incomplete:
+            sources = [source for source in sources if source["id"] not in incomplete]
+            chunks = [chunk for chunk in chunks if chunk["source_id"] not in incomplete]
+            self._emit("sources_skipped", {"count": len(incomplete), "reason": f"no {EMBED_MODEL} embeddings at {self.dimensions} dimensions"})
+        if not chunks:
+            return
+
+        vectors = self.disk.vectors(np.array([chunk.pop("row") for chunk in chunks], dtype=np.intp))
+        self._append_rows(vectors)
+        counts = Counter(chunk["source_id"] for chunk in chunks)
+        starts = np.cumsum([0] + [counts[source["id"]] for source in sources[:-1]])
+        for source, start in zip(sources, starts.tolist()):
+            self._source_rows[source["id"]] = (start, start + counts[source["id"]])
+        self._source_embeddings = list(_normalize_rows(np.add.reduceat(vectors, starts)))
+        self.sources = [RackSource(**source) for source in sources]
+        self.chunks = [RackChunk(**chunk) for chunk in chunks]
+
+    def _source_index(self) -> tuple[list[str], np.ndarray, np.ndarray]:
+        """Source ids, their normalized embeddings and the first chunk row of each, rebuilt only after the source set changes."""
+        if self._source_cache is None:
+            ids = [source.id for source in self.sources]
+            matrix = np.vstack(self._source_embeddings) if ids else np.zeros((0, self.dimensions), dtype=np.float32)
+            starts = np.array([self._source_rows[source_id][0] for source_id in ids], dtype=np.intp)
+            self._source_cache = (ids, matrix, starts)
+        return self._source_cache
+
+    def _pca_projection(self, ids: list[str], vectors: np.ndarray) -> dict[str, dict[str, float]]:
+        if not ids:
             return {}
-
-        ids = list(vectors)
-        rows = [vectors[item_id][: self.dimensions] for item_id in ids]
-        if len(rows) == 1:
+        if len(ids) == 1:
             return {ids[0]: {"x": 0.0, "y": 0.0, "z": 0.0}}
 
-        means = [sum(row[index] for row in rows) / len(rows) for index in range(self.dimensions)]
-        centered = [[row[index] - means[index] for index in range(self.dimensions)] for row in rows]
-        components: list[list[float]] = []
+        centered = vectors - vectors.mean(axis=0)
+        basis = _principal_axes(centered, 3)
+        components = np.zeros((3, self.dimensions), dtype=np.float32)
+        components[: min(3, len(basis))] = basis[:3]
+        # singular vectors have no fixed sign; pin each so the rendered space does not mirror between requests
+        pivots = np.abs(components).argmax(axis=1)
+        components *= np.where(components[np.arange(3), pivots] < 0, -1.0, 1.0)[:, None]
 
-        for component_index in range(3):
-            candidate = [
-                math.sin((index + 1) * (component_index + 1) * 0.017)
-                + math.cos((index + 1) * (component_index + 2) * 0.013)
-                for index in range(self.dimensions)
-            ]
-            candidate = _normalize(_orthogonalize(candidate, components))
-
-            for _ in range(24):
-                scores = [_dot(row, candidate) for row in centered]
-                next_candidate = [0.0] * self.dimensions
-                for score, row in zip(scores, centered):
-                    for index, value in enumerate(row):
-                        next_candidate[index] += score * value
-                next_candidate = _normalize(_orthogonalize(next_candidate, components))
-                if not any(next_candidate):
-                    break
-                candidate = next_candidate
-
-            if not any(candidate):
-                candidate = [0.0] * self.dimensions
-                candidate[min(component_index, self.dimensions - 1)] = 1.0
-            components.append(candidate)
-
-        raw = {
-            item_id: [_dot(row, component) for component in components]
-            for item_id, row in zip(ids, centered)
-        }
-        max_radius = max(
-            math.sqrt(values[0] * values[0] + values[1] * values[1] + values[2] * values[2])
-            for values in raw.values()
-        ) or 1.0
-        scale = 2.65 / max_radius
-        return {
-            item_id: {
-                "x": round(values[0] * scale, 4),
-                "y": round(values[1] * scale, 4),
-                "z": round(values[2] * scale, 4),
-            }
-            for item_id, values in raw.items()
-        }
+        raw = centered @ components.T
+        max_radius = float(np.linalg.norm(raw, axis=1).max()) or 1.0
+        scaled = np.round(raw * (2.65 / max_radius), 4).tolist()
+        return {item_id: {"x": values[0], "y": values[1], "z": values[2]} for item_id, values in zip(ids, scaled)}
 
     def _chunks_for_source(self, source_id: str) -> list[RackChunk]:
-        return [chunk for chunk in self.chunks if chunk.source_id == source_id]
-
-    def _source_vector(self, source_id: str) -> list[float]:
-        chunks = self._chunks_for_source(source_id)
-        if not chunks:
-            return [0.0] * self.dimensions
+        start, stop = self._source_rows.get(source_id, (0, 0))
+        return self.chunks[start:stop]
 
-        vector = [0.0] * self.dimensions
-        for chunk in chunks:
-            for index, value in enumerate(chunk.vector[: self.dimensions]):
-                vector[index] += value
-        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
-        return [value / norm for value in vector]
-
-    def _source_vectors(self) -> dict[str, list[float]]:
-        return {source.id: self._source_vector(source.id) for source in self.sources}
+    def _source_projections(self) -> dict[str, dict[str, float]]:
+        if self._projection_cache is None:
+            ids, matrix, _ = self._source_index()
+            self._projection_cache = self._pca_projection(ids, matrix)
+        return self._projection_cache
 
     def _source_point(self, source: RackSource, projection: dict[str, float]) -> dict[str, Any]:
         return {
@@ -308,20 +365,19 @@ class MultimodalRagStore:
                 summary=_clean_text(text)[:220],
                 chunks=len(chunks),
             )
-            self.sources.append(source)
-
-            for index, chunk_text in enumerate(chunks):
-                vector = self._embed_text(chunk_text, "task: retrieval document")
-                chunk = RackChunk(
+            vectors, embedding_keys = self._embed_texts(chunks, "task: retrieval document")
+            rack_chunks = [
+                RackChunk(
                     id=f"{source_id}-{index + 1}",
                     source_id=source_id,
                     title=source.title,
                     modality=modality,
                     text=chunk_text,
-                    vector=vector,
                     metadata={"chunk_index": index + 1},
                 )
-                self.chunks.append(chunk)
+                for index, chunk_text in enumerate(chunks)
+            ]
+            self._add_source(source, rack_chunks, vectors, embedding_keys)
 
             if not seed:
                 self._emit("source_added", {"source_id": source_id, "title": source.title, "chunks": len(chunks)})
@@ -332,10 +388,13 @@ class MultimodalRagStore:
             modality = self._modality_from_mime(mime_type)
             source_id = uuid.uuid4().hex[:10]
             display_text = _clean_text(notes) or f"{title} ({mime_type}) embedded natively in Gemini Embedding 2."
-            media_vector, embedding_path = self._embed_file(data, mime_type, title, display_text)
+            media_vector, embedding_path, media_key = self._embed_file(data, mime_type, title, display_text)
             annotation_text = _clean_text(f"{title}. {display_text}")
-            annotation_vector = self._embed_text(annotation_text, "task: retrieval document")
-            vector = _blend_vectors(media_vector, annotation_vector)
+            annotation_vectors, annotation_keys = self._embed_texts([annotation_text], "task: retrieval document")
+            vector = _blend_vectors(media_vector, annotation_vectors[0])
+            blend_key = content_key("blend", media_key, annotation_keys[0])
+            if self.disk and not self.disk.get_vectors([blend_key]):
+                self.disk.put_vectors({blend_key: vector})
             source = RackSource(
                 id=source_id,
                 title=title.strip() or "Uploaded source",
@@ -355,7 +414,6 @@ class MultimodalRagStore:
                 title=source.title,
                 modality=modality,
                 text=display_text,
-                vector=vector,
                 metadata={
                     "mime_type": mime_type,
                     "bytes": len(data),
@@ -364,28 +422,40 @@ class MultimodalRagStore:
                     "annotation_blended": True,
                 },
             )
-            self.sources.append(source)
-            self.chunks.append(chunk)
+            self._add_source(source, [chunk], vector[None, :], [blend_key])
             self._emit("source_added", {"source_id": source_id, "title": source.title, "chunks": 1})
             return source
 
     def remove_source(self, source_id: str) -> bool:
         with self._lock:
-            source = next((item for item in self.sources if item.id == source_id), None)
-            if not source:
+            position = next((index for index, item in enumerate(self.sources) if item.id == source_id), None)
+            if position is None:
                 return False
 
-            self.sources = [item for item in self.sources if item.id != source_id]
-            self.chunks = [chunk for chunk in self.chunks if chunk.source_id != source_id]
+            source = self.sources.pop(position)
+            self._source_embeddings.pop(position)
+            start, stop = self._source_rows.pop(source_id)
+            removed = stop - start
+            self._vectors[start : self._size - removed] = self._vectors[stop : self._size]
+            self._norms[start : self._size - removed] = self._norms[stop : self._size]
+            self._size -= removed
+            del self.chunks[start:stop]
+            for later in self.sources[position:]:
+                later_start, later_stop = self._source_rows[later.id]
+                self._source_rows[later.id] = (later_start - removed, later_stop - removed)
+            self._source_cache = None
+            self._projection_cache = None
+            if self.disk:
+                self.disk.delete_source(source_id)
             self._emit("source_removed", {"source_id": source_id, "title": source.title})
             return True
 
     def search(self, query: str, top_k: int = 6) -> dict[str, Any]:
         with self._lock:
-            query_vector = self._embed_text(query, "task: question answering | query")
+            query_vector = self._as_vector(self._embed_text(query, "task: question answering | query", persist=False))
             query_id = f"query-{uuid.uuid4().hex[:8]}"
-            source_vectors = self._source_vectors()
-            projections = self._pca_projection({**source_vectors, query_id: query_vector})
+            source_ids, source_matrix, starts = self._source_index()
+            projections = self._pca_projection([*source_ids, query_id], np.vstack([source_matrix, query_vector]))
             query_point = {
                 "id": query_id,
                 "source_id": "query",
@@ -396,27 +466,30 @@ class MultimodalRagStore:
                 "score": 1,
                 "preview": "Query embedding projected with the active source set.",
             }
-            source_by_id = {source.id: source for source in self.sources}
-            source_matches: dict[str, dict[str, Any]] = {}
-            for chunk in self.chunks:
-                score = round(_cosine(query_vector, chunk.vector), 4)
-                current = source_matches.get(chunk.source_id)
-                if not current or score > current["score"]:
-                    source = source_by_id.get(chunk.source_id)
-                    if not source:
-                        continue
-                    source_matches[chunk.source_id] = {
-                        "id": source.id,
-                        "source_id": source.id,
-                        "title": source.title,
-                        "modality": source.modality,
-                        "text": chunk.text,
-                        "score": score,
-                        "projection": projections.get(source.id, {"x": 0.0, "y": 0.0, "z": 0.0}),
-                        "metadata": {"best_chunk": chunk.id, **chunk.metadata},
-                    }
-
-            matches = sorted(source_matches.values(), key=lambda item: item["score"], reverse=True)[:top_k]
+            matches = []
+            if source_ids:
+                # chunks are stored as unit rows grouped by source, so one matrix-vector product scores every chunk
+                # and reduceat takes each source's best chunk
+                scores = self._vectors[: self._size] @ (query_vector / (np.linalg.norm(query_vector) or 1.0))
+                best = np.maximum.reduceat(scores, starts)
+                for position in np.argsort(-best, kind="stable")[:top_k]:
+                    source = self.sources[position]
+                    start, stop = self._source_rows[source.id]
+                    row = start + int(np.argmax(scores[start:stop]))
+                    chunk = self.chunks[row]
+                    matches.append(
+                        {
+                            "id": source.id,
+                            "source_id": source.id,
+                            "title": source.title,
+                            "modality": source.modality,
+                            "text": chunk.text,
+                            "score": round(float(scores[row]), 4),
+                            "projection": projections.get(source.id, {"x": 0.0, "y": 0.0, "z": 0.0}),
+                            "metadata": {"best_chunk": chunk.id, **chunk.metadata},
+                        }
+                    )
+
             self._emit("query_embedded", {"query": query, "matches": [m["id"] for m in matches]})
             return {
                 "query_point": query_point,
@@ -426,8 +499,7 @@ class MultimodalRagStore:
 
     def snapshot(self, projections: dict[str, dict[str, float]] | None = None) -> dict[str, Any]:
         with self._lock:
-            source_vectors = self._source_vectors()
-            projection_map = projections or self._pca_projection(source_vectors)
+            projection_map = projections or self._source_projections()
             points = [
                 self._source_point(source, projection_map.get(source.id, {"x": 0.0, "y": 0.0, "z": 0.0}))
                 for source in self.sources